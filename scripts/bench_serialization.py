@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Compare payload encodings used by the daemon and IPC layers.
+
+Encodes and decodes typical issue and telemetry payloads with stdlib json,
+orjson and msgpack (whichever are installed) and reports per-call timings and
+encoded sizes.
+"""
+
+import json
+import sys
+import timeit
+from datetime import UTC, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from glorious_agents.core import serialization  # noqa: E402
+
+
+def issue_payload(count: int) -> dict:
+    """Build an issue-list response like the issues daemon returns."""
+    now = datetime.now(UTC)
+    return {
+        "result": [
+            {
+                "id": f"issue-{i:06x}",
+                "title": f"Fix flaky test number {i}",
+                "description": "Steps to reproduce:\n1. Run the suite\n2. Observe failure" * 3,
+                "status": "open",
+                "priority": i % 5,
+                "type": "bug",
+                "assignee": None,
+                "labels": ["tests", "ci"],
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def telemetry_payload(count: int) -> dict:
+    """Build a batch of telemetry events."""
+    return {
+        "events": [
+            {
+                "category": "skill",
+                "event": "call",
+                "skill": "notes",
+                "duration_ms": 1.25 * i,
+                "success": True,
+                "timestamp": 1_700_000_000 + i,
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def bench(name: str, payload: dict, number: int = 200) -> None:
+    """Print encode/decode timings for each available encoding."""
+    print(f"\n{name}")
+    print(f"{'encoding':<12}{'encode us':>12}{'decode us':>12}{'bytes':>10}")
+
+    encoders = {
+        "json": (
+            lambda: json.dumps(payload, default=serialization._default).encode(),
+            json.loads,
+        ),
+    }
+    if serialization.ORJSON_AVAILABLE:
+        encoders["orjson"] = (lambda: serialization.dumps_json(payload), serialization.loads_json)
+    if serialization.MSGPACK_AVAILABLE:
+        encoders["msgpack"] = (
+            lambda: serialization.dumps_msgpack(payload),
+            serialization.loads_msgpack,
+        )
+
+    for label, (dump, load) in encoders.items():
+        data = dump()
+        encode_us = timeit.timeit(dump, number=number) / number * 1e6
+        decode_us = timeit.timeit(lambda: load(data), number=number) / number * 1e6  # noqa: B023
+        print(f"{label:<12}{encode_us:>12.1f}{decode_us:>12.1f}{len(data):>10}")
+
+
+def main() -> int:
+    bench("issues (100 rows)", issue_payload(100))
+    bench("issues (1000 rows)", issue_payload(1000), number=50)
+    bench("telemetry (500 events)", telemetry_payload(500))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
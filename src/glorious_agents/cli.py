@@ -39,19 +39,26 @@ def init_app() -> None:
     """
     try:
         load_all_skills()
-
-        # Mount loaded skills as subcommands
-        registry = get_registry()
-        for manifest in registry.list_all():
-            skill_app = registry.get_app(manifest.name)
-            if skill_app:
-                app.add_typer(skill_app, name=manifest.name)
+        mount_loaded_skills()
     except Exception as e:
         logger.error(f"Error initializing skills: {e}", exc_info=True)
         console.print(f"[red]Error initializing skills:[/red] {e}")
         raise
 
 
+def mount_loaded_skills() -> None:
+    """Mount the skills already in the registry as subcommands.
+
+    Does not load anything; the daemon uses this after its own startup
+    loaded the skills.
+    """
+    registry = get_registry()
+    for manifest in registry.list_all():
+        skill_app = registry.get_app(manifest.name)
+        if skill_app:
+            app.add_typer(skill_app, name=manifest.name)
+
+
 @app.command()
 def version() -> None:
     """Show version information for Glorious Agents.
@@ -198,6 +205,9 @@ def init() -> None:
 def daemon(
     host: str = typer.Option(config.DAEMON_HOST, help="Host to bind to"),
     port: int = typer.Option(config.DAEMON_PORT, help="Port to bind to"),
+    uds: Path | None = typer.Option(
+        config.DAEMON_UDS, help="Unix socket to bind to instead of host/port"
+    ),
 ) -> None:
     """Start the FastAPI daemon for RPC access.
 
@@ -208,9 +218,11 @@ def daemon(
 
     Available Endpoints:
         GET  /skills - List all loaded skills
+        GET  /metrics - Request latency, throughput and resource metrics
         POST /rpc/{skill}/{method} - Call a skill method with JSON params
         POST /events/{topic} - Publish an event to the event bus
         GET  /events/topics - List all active event topics
+        POST /cli - Run a forwarded 'agent' command in the warm daemon
         GET  /cache/{key} - Retrieve a cached value
         PUT  /cache/{key} - Store a value in the cache
         DELETE /cache/{key} - Delete a cache entry
@@ -221,18 +233,24 @@ def daemon(
             the value from GLORIOUS_DAEMON_HOST config (typically '127.0.0.1').
         port: The port number to bind the server to. Defaults to the value
             from GLORIOUS_DAEMON_PORT config (typically 8765).
+        uds: Optional Unix domain socket path. When set (or configured via
+            GLORIOUS_DAEMON_UDS) the daemon serves on the socket instead of TCP,
+            falling back to host/port on platforms without Unix sockets.
 
     Example:
         $ agent daemon --host 0.0.0.0 --port 8080
         # Starts daemon accessible on all interfaces at port 8080
 
+        $ agent daemon --uds .agent/daemon.sock
+        $ curl --unix-socket .agent/daemon.sock http://localhost/skills
+
         # Access the API:
         $ curl http://localhost:8765/skills
         $ curl -X POST http://localhost:8765/rpc/notes/list_notes -H "Content-Type: application/json" -d '{}'
     """
     from glorious_agents.core.daemon_rpc import run_daemon
 
-    run_daemon(host, port)
+    run_daemon(host, port, uds)
 
 
 @app.command()
@@ -407,19 +425,59 @@ def search(
         console.print(table)
 
 
+_commands_registered = False
+_skills_mounted = False
+
+
+def prepare_app(mount_skills: bool = True, load_skills: bool = True) -> typer.Typer:
+    """Register management commands and mount skills on the CLI app.
+
+    Safe to call repeatedly; each step runs at most once per process. The
+    daemon calls this once at startup, with the skills it already loaded,
+    to run forwarded commands against a warm app.
+
+    Args:
+        mount_skills: Whether to mount skills as subcommands.
+        load_skills: Whether to load skills first; False mounts the skills
+            already in the registry.
+
+    Returns:
+        The fully prepared Typer application.
+    """
+    global _commands_registered, _skills_mounted
+
+    if not _commands_registered:
+        # Import management CLIs
+        from glorious_agents import identity_cli, skills_cli
+
+        # Add management commands
+        app.add_typer(skills_cli.app, name="skills")
+        app.add_typer(identity_cli.app, name="identity")
+        _commands_registered = True
+
+    if mount_skills and not _skills_mounted:
+        if load_skills:
+            # Initialize and load skills
+            init_app()
+        else:
+            mount_loaded_skills()
+        _skills_mounted = True
+
+    return app
+
+
 def main() -> None:
     """Main entry point for the Glorious Agents CLI.
 
-    This function is the primary entry point invoked when running the 'agent'
-    command. It performs the following initialization steps:
+    This function runs the CLI in-process. The 'agent' console script first
+    tries to forward the invocation to a running daemon (see
+    glorious_agents.forwarding) and only calls this when none is available.
+    It performs the following initialization steps:
 
     1. Imports and registers management CLI modules (skills, identity)
     2. Loads and mounts all discovered skills as subcommands
     3. Starts the Typer CLI application to process user commands
 
-    The function is typically called automatically when the package is installed
-    and invoked via the 'agent' console script entry point.
-
     Example:
         $ agent --help
         $ agent skills list
@@ -427,22 +485,13 @@ def main() -> None:
     """
     import sys
 
-    # Import management CLIs
-    from glorious_agents import identity_cli, skills_cli
-
-    # Add management commands
-    app.add_typer(skills_cli.app, name="skills")
-    app.add_typer(identity_cli.app, name="identity")
-
     # Skip skill initialization for commands that don't need it
     skip_init_commands = {"version"}
     # Only skip if --help/-h is the first or only argument
     help_requested = len(sys.argv) <= 2 and any(arg in ["--help", "-h"] for arg in sys.argv[1:])
     should_skip = any(cmd in sys.argv for cmd in skip_init_commands) or help_requested
 
-    if not should_skip:
-        # Initialize and load skills
-        init_app()
+    prepare_app(mount_skills=not should_skip)
 
     # Run CLI
     app()
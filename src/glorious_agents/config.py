@@ -32,7 +32,7 @@ class Config:
         If `env_file` is None, the project root is located and `<project_root>/.env` is used when present.
         When a .env file exists at the chosen path, its values are loaded into the environment before reading
         configuration values. The constructor then reads environment variables to populate attributes such
-        as `DB_NAME`, `DB_SHARED_NAME`, `DB_MASTER_NAME`, `DAEMON_HOST`, `DAEMON_PORT`, `DAEMON_API_KEY`,
+        as `DB_NAME`, `DB_SHARED_NAME`, `DB_MASTER_NAME`, `DAEMON_HOST`, `DAEMON_PORT`, `DAEMON_API_KEY`, `DAEMON_UDS`,
         `SKILLS_DIR`, and `DATA_FOLDER`. If `DATA_FOLDER` is not set in the environment, it defaults to
         `<project_root>/.agent`.
 
@@ -59,6 +59,21 @@ class Config:
         self.DAEMON_HOST: str = os.getenv("GLORIOUS_DAEMON_HOST", "127.0.0.1")
         self.DAEMON_PORT: int = int(os.getenv("GLORIOUS_DAEMON_PORT", "8765"))
         self.DAEMON_API_KEY: str | None = os.getenv("GLORIOUS_DAEMON_API_KEY")
+        # Optional Unix domain socket for the daemon (TCP host/port used when unset)
+        daemon_uds = os.getenv("GLORIOUS_DAEMON_UDS")
+        self.DAEMON_UDS: Path | None = Path(daemon_uds) if daemon_uds else None
+        # Max entries in the read-through cache for cacheable RPC methods (0 disables it)
+        self.DAEMON_RPC_CACHE_SIZE: int = int(os.getenv("GLORIOUS_DAEMON_RPC_CACHE_SIZE", "1000"))
+
+        # Optional bound in bytes on values held in the shared skill cache (0 means unbounded)
+        self.CACHE_MAX_BYTES: int = int(os.getenv("GLORIOUS_CACHE_MAX_BYTES", "0"))
+
+        # Event bus dispatch: "sync" runs handlers on the publisher's thread, "async" queues
+        # events for worker threads (overflow policy: block, drop_oldest or spill)
+        self.EVENT_DISPATCH: str = os.getenv("GLORIOUS_EVENT_DISPATCH", "sync")
+        self.EVENT_WORKERS: int = int(os.getenv("GLORIOUS_EVENT_WORKERS", "1"))
+        self.EVENT_QUEUE_SIZE: int = int(os.getenv("GLORIOUS_EVENT_QUEUE_SIZE", "1000"))
+        self.EVENT_OVERFLOW: str = os.getenv("GLORIOUS_EVENT_OVERFLOW", "block")
 
         # Skills directory
         self.SKILLS_DIR: Path = Path(os.getenv("GLORIOUS_SKILLS_DIR", "skills"))
@@ -1,46 +1,174 @@
 """TTL-aware process-local cache for skills."""
 
+import heapq
+import sys
 import threading
 import time
 from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
 from typing import Any
 
+# Entry layout: (value, expires_at, size_in_bytes). expires_at is a
+# time.monotonic() deadline, None means no expiration.
+_VALUE = 0
+_EXPIRES = 1
+_SIZE = 2
 
-@dataclass
-class CacheEntry:
-    """Cache entry with value and expiration."""
+_MISSING = object()
 
-    value: Any
-    expires_at: float | None  # Unix timestamp, None means no expiration
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of cache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    bytes: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups that were hits (0.0 when there were none)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory footprint of a cached value in bytes."""
+    if isinstance(value, bytes | bytearray | memoryview):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8", errors="replace"))
+    return sys.getsizeof(value)
+
+
+class _Flight:
+    """A computation in progress for get_or_compute()."""
+
+    __slots__ = ("done", "value", "error", "stale")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+        # Set when the key is deleted mid-computation; the result is then not cached
+        self.stale = False
 
 
 class TTLCache:
-    """Thread-safe LRU cache with time-to-live support."""
+    """Thread-safe LRU cache with time-to-live support.
+
+    Entries are plain tuples. Expiry deadlines use the monotonic clock and are
+    kept in a min-heap, so expired entries are dropped in O(log n) each as the
+    cache is written to instead of by scanning every entry. Deadlines left in
+    the heap by overwritten or deleted keys are skipped lazily.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        max_bytes: int | None = None,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ) -> None:
+        """Create a cache.
 
-    def __init__(self, max_size: int = 1000) -> None:
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        Args:
+            max_size: Maximum number of entries.
+            max_bytes: Optional bound on the summed size of cached values.
+            sizeof: Function estimating a value's size in bytes; only used when
+                max_bytes is set.
+        """
+        self._cache: OrderedDict[str, tuple[Any, float | None, int]] = OrderedDict()
         self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
         self._lock = threading.Lock()
+        self._expiry: list[tuple[float, str]] = []
+        self._flights: dict[str, _Flight] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
 
-    def get(self, key: str) -> Any:
+    def _lookup(self, key: str, now: float) -> Any:
+        """Return the live value for key or _MISSING. Caller holds the lock."""
+        entry = self._cache.get(key)
+        if entry is None:
+            self._misses += 1
+            return _MISSING
+        expires_at = entry[_EXPIRES]
+        if expires_at is not None and expires_at <= now:
+            self._remove(key)
+            self._expirations += 1
+            self._misses += 1
+            return _MISSING
+        self._cache.move_to_end(key)
+        self._hits += 1
+        return entry[_VALUE]
+
+    def get(self, key: str, default: Any = None) -> Any:
         """Get a value from the cache.
 
-        Returns None if the key doesn't exist or has expired.
+        Returns default (None) if the key doesn't exist or has expired.
         """
         with self._lock:
-            entry = self._cache.get(key)
-            if entry is None:
-                return None
+            value = self._lookup(key, time.monotonic())
+        return default if value is _MISSING else value
 
-            if entry.expires_at is not None and time.time() > entry.expires_at:
-                del self._cache[key]
-                return None
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Get several values at once, omitting missing or expired keys."""
+        found: dict[str, Any] = {}
+        with self._lock:
+            now = time.monotonic()
+            for key in keys:
+                value = self._lookup(key, now)
+                if value is not _MISSING:
+                    found[key] = value
+        return found
+
+    def _store(self, key: str, value: Any, ttl: float | None, now: float) -> None:
+        """Insert or replace an entry. Caller holds the lock.
 
-            self._cache.move_to_end(key)
-            return entry.value
+        A value larger than max_bytes is not cached, since making room for it
+        would evict every other entry; any previous value for the key is dropped.
+        """
+        if key in self._cache:
+            self._remove(key)
+        size = self._sizeof(value) if self._max_bytes is not None else 0
+        if self._max_bytes is not None and size > self._max_bytes:
+            return
+        expires_at = now + ttl if ttl is not None else None
+        self._cache[key] = (value, expires_at, size)
+        self._bytes += size
+        if expires_at is not None:
+            heapq.heappush(self._expiry, (expires_at, key))
 
-    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+    def _enforce_bounds(self, now: float) -> None:
+        """Drop expired entries, then evict LRU entries over the bounds. Caller holds the lock."""
+        self._expire(now)
+        while len(self._cache) > self._max_size or (
+            self._max_bytes is not None and self._bytes > self._max_bytes and self._cache
+        ):
+            _, entry = self._cache.popitem(last=False)
+            self._bytes -= entry[_SIZE]
+            self._evictions += 1
+        # Keep stale heap deadlines from piling up under heavy overwriting
+        if len(self._expiry) > 2 * len(self._cache) + 64:
+            self._expiry = [
+                (entry[_EXPIRES], key)
+                for key, entry in self._cache.items()
+                if entry[_EXPIRES] is not None
+            ]
+            heapq.heapify(self._expiry)
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
         """Set a value in the cache.
 
         Args:
@@ -49,35 +177,113 @@ class TTLCache:
             ttl: Time-to-live in seconds. None means no expiration.
         """
         with self._lock:
-            expires_at = time.time() + ttl if ttl is not None else None
-            entry = CacheEntry(value=value, expires_at=expires_at)
+            now = time.monotonic()
+            self._store(key, value, ttl, now)
+            self._enforce_bounds(now)
 
-            if key in self._cache:
-                del self._cache[key]
-            self._cache[key] = entry
+    def set_many(self, items: Mapping[str, Any], ttl: float | None = None) -> None:
+        """Set several values with the same time-to-live."""
+        with self._lock:
+            now = time.monotonic()
+            for key, value in items.items():
+                self._store(key, value, ttl, now)
+            self._enforce_bounds(now)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any], ttl: float | None = None) -> Any:
+        """Return the cached value for key, computing and caching it on a miss.
+
+        Concurrent misses for the same key run compute() once; the other
+        callers wait for its result (or its exception). If the key is deleted
+        while compute() runs, its result is returned but not cached, since it
+        may predate whatever prompted the delete.
+
+        Args:
+            key: Cache key.
+            compute: Called without arguments to produce the value.
+            ttl: Time-to-live in seconds for the computed value.
+
+        Raises:
+            Exception: Whatever compute() raises; nothing is cached.
+        """
+        with self._lock:
+            value = self._lookup(key, time.monotonic())
+            if value is not _MISSING:
+                return value
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
 
-            while len(self._cache) > self._max_size:
-                self._cache.popitem(last=False)
+        try:
+            flight.value = compute()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                if flight.error is None and not flight.stale:
+                    now = time.monotonic()
+                    self._store(key, flight.value, ttl, now)
+                    self._enforce_bounds(now)
+            flight.done.set()
+        return flight.value
 
     def has(self, key: str) -> bool:
         """Check if a key exists in cache and is not expired."""
         return self.get(key) is not None
 
+    def _remove(self, key: str) -> None:
+        """Remove an entry; its heap deadline goes stale. Caller holds the lock."""
+        self._bytes -= self._cache.pop(key)[_SIZE]
+
+    def _drop_flight(self, key: str) -> None:
+        """Keep an in-flight get_or_compute() from caching its result. Caller holds the lock."""
+        flight = self._flights.pop(key, None)
+        if flight is not None:
+            flight.stale = True
+
     def delete(self, key: str) -> bool:
         """Delete a key from the cache.
 
         Returns True if key was found and deleted, False otherwise.
         """
         with self._lock:
+            self._drop_flight(key)
             if key in self._cache:
-                del self._cache[key]
+                self._remove(key)
                 return True
             return False
 
     def clear(self) -> None:
         """Clear all entries from the cache."""
         with self._lock:
+            for key in list(self._flights):
+                self._drop_flight(key)
             self._cache.clear()
+            self._expiry.clear()
+            self._bytes = 0
+
+    def _expire(self, now: float) -> int:
+        """Pop heap deadlines that have passed. Caller holds the lock."""
+        removed = 0
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= now:
+            expires_at, key = heapq.heappop(expiry)
+            entry = self._cache.get(key)
+            # Skip deadlines of entries that were since overwritten or deleted
+            if entry is not None and entry[_EXPIRES] == expires_at:
+                self._remove(key)
+                removed += 1
+        self._expirations += removed
+        return removed
 
     def prune_expired(self) -> int:
         """Remove expired entries from the cache.
@@ -85,14 +291,16 @@ class TTLCache:
         Returns the number of entries removed.
         """
         with self._lock:
-            now = time.time()
-            expired_keys = [
-                key
-                for key, entry in self._cache.items()
-                if entry.expires_at is not None and now > entry.expires_at
-            ]
+            return self._expire(time.monotonic())
 
-            for key in expired_keys:
-                del self._cache[key]
-
-            return len(expired_keys)
+    def stats(self) -> CacheStats:
+        """Return hit/miss/eviction counters and current size."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._cache),
+                bytes=self._bytes,
+            )
@@ -1,19 +1,30 @@
 """Event bus and skill context for inter-skill communication."""
 
+import functools
 import logging
 import sqlite3
 import threading
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Iterable, Mapping
 from enum import Enum
+from pathlib import Path
 from typing import Any, Protocol
 
 from sqlalchemy import Engine
 
-from glorious_agents.core.cache import TTLCache
+from glorious_agents.core.cache import CacheStats, TTLCache
+from glorious_agents.core.event_batching import BatchSubscription, FlushScheduler
+from glorious_agents.core.event_dispatch import AsyncDispatcher, DispatchMode, OverflowPolicy
+from glorious_agents.core.metrics import CACHED_CALLS, EVENTS_PUBLISHED
+from glorious_agents.core.topics import TopicTrie, is_pattern
 
 logger = logging.getLogger(__name__)
 
+# Errors kept for get_last_errors() in async COLLECT mode
+_MAX_COLLECTED_ERRORS = 100
+# Resolved subscriber lists cached per published topic
+_MAX_RESOLVED_TOPICS = 4096
+
 
 class ErrorHandlingMode(Enum):
     """Error handling modes for event bus."""
@@ -30,29 +41,143 @@ class EventBus:
     - SILENT (default): Logs errors but continues processing other handlers
     - FAIL_FAST: Raises the first error encountered
     - COLLECT: Collects all errors and makes them available via get_last_errors()
+
+    In ASYNC dispatch mode publish() only queues the event and handlers run on
+    worker threads; events on the same topic are still delivered in publish
+    order. Use drain() to wait for delivery and close() on shutdown.
+
+    Subscriptions may use dot-separated wildcard patterns: ``*`` matches one
+    segment and ``#`` matches zero or more (``issue.*``, ``#``). Exact-topic
+    subscribers run first, then pattern subscribers, each in subscription order.
+
+    subscribe_batch() delivers lists of events to handlers that prefer one bulk
+    operation per burst over one call per event.
     """
 
-    def __init__(self, error_mode: ErrorHandlingMode = ErrorHandlingMode.SILENT) -> None:
-        """Initialize EventBus with specified error handling mode.
+    def __init__(
+        self,
+        error_mode: ErrorHandlingMode = ErrorHandlingMode.SILENT,
+        dispatch_mode: DispatchMode = DispatchMode.SYNC,
+        workers: int = 1,
+        queue_size: int = 1000,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        spill_dir: Path | None = None,
+    ) -> None:
+        """Initialize EventBus with specified error handling and dispatch modes.
 
         Args:
             error_mode: How to handle errors in event handlers (default: SILENT)
+            dispatch_mode: Whether handlers run on the publisher's thread (default: SYNC)
+            workers: Async mode only - number of topic-sharded queues and worker threads
+            queue_size: Async mode only - maximum queued events per worker
+            overflow: Async mode only - what publish() does when a queue is full
+            spill_dir: Async mode only - where SPILL writes overflowing events
+
+        Raises:
+            ValueError: If FAIL_FAST is combined with ASYNC dispatch
         """
+        if dispatch_mode == DispatchMode.ASYNC and error_mode == ErrorHandlingMode.FAIL_FAST:
+            raise ValueError("FAIL_FAST error handling requires SYNC dispatch")
         self._subscribers: dict[str, list[Callable[[dict[str, Any]], None]]] = defaultdict(list)
+        self._patterns = TopicTrie()
+        self._resolved: dict[str, tuple[Callable[[dict[str, Any]], None], ...]] = {}
         self._lock = threading.Lock()
         self._error_mode = error_mode
         self._last_errors: list[tuple[str, Exception]] = []
+        self._batches: list[BatchSubscription] = []
+        self._flusher: FlushScheduler | None = None
+        self._dispatcher: AsyncDispatcher | None = None
+        if dispatch_mode == DispatchMode.ASYNC:
+            self._dispatcher = AsyncDispatcher(
+                self._deliver,
+                workers=workers,
+                queue_size=queue_size,
+                overflow=overflow,
+                spill_dir=spill_dir,
+            )
 
     def subscribe(self, topic: str, callback: Callable[[dict[str, Any]], None]) -> None:
         """
         Subscribe to a topic.
 
         Args:
-            topic: Event topic name.
+            topic: Event topic name or wildcard pattern.
             callback: Function to call when event is published.
         """
         with self._lock:
             self._subscribers[topic].append(callback)
+            if is_pattern(topic):
+                self._patterns.add(topic, callback)
+            self._resolved.clear()
+
+    def unsubscribe(self, topic: str, callback: Callable[[dict[str, Any]], None]) -> bool:
+        """
+        Remove a subscription added with subscribe().
+
+        Args:
+            topic: Event topic name or wildcard pattern it was subscribed with.
+            callback: The subscribed function.
+
+        Returns:
+            True if the subscription was found and removed, False otherwise
+        """
+        with self._lock:
+            callbacks = self._subscribers.get(topic)
+            if not callbacks or callback not in callbacks:
+                return False
+            callbacks.remove(callback)
+            if not callbacks:
+                del self._subscribers[topic]
+            if is_pattern(topic):
+                self._patterns.remove(topic, callback)
+            self._resolved.clear()
+            if isinstance(callback, BatchSubscription) and callback in self._batches:
+                self._batches.remove(callback)
+        if isinstance(callback, BatchSubscription):
+            callback.flush()
+        return True
+
+    def subscribe_batch(
+        self,
+        topic: str,
+        handler: Callable[[list[dict[str, Any]]], None],
+        max_items: int = 100,
+        max_delay_ms: int = 50,
+        key: str | Callable[[dict[str, Any]], Hashable] | None = None,
+    ) -> BatchSubscription:
+        """
+        Subscribe to a topic with batched delivery.
+
+        The handler receives a list of event payloads once max_items events
+        are buffered or max_delay_ms after the first one, whichever is sooner.
+
+        Args:
+            topic: Event topic name or wildcard pattern.
+            handler: Function called with each batch of payloads, oldest first.
+            max_items: Maximum events per batch.
+            max_delay_ms: Maximum time an event waits in the buffer.
+            key: Payload field or function to coalesce events by; only the
+                latest event per key is delivered (e.g. "id" for updates).
+
+        Returns:
+            The subscription; pass it to unsubscribe() to remove it.
+        """
+        with self._lock:
+            if self._flusher is None:
+                self._flusher = FlushScheduler()
+            flusher = self._flusher
+
+        def guarded(batch: list[dict[str, Any]]) -> None:
+            try:
+                handler(batch)
+            except Exception as e:
+                self._handle_error(topic, e)
+
+        subscription = BatchSubscription(guarded, flusher, max_items, max_delay_ms, key)
+        with self._lock:
+            self._batches.append(subscription)
+        self.subscribe(topic, subscription)
+        return subscription
 
     def publish(self, topic: str, data: dict[str, Any]) -> None:
         """
@@ -65,32 +190,105 @@ class EventBus:
         Raises:
             Exception: If error_mode is FAIL_FAST and a handler raises
         """
+        EVENTS_PUBLISHED.labels(topic).inc()
+
+        # A closed async dispatcher falls back to delivering on this thread
+        if self._dispatcher is not None and self._dispatcher.submit(topic, data):
+            return
+
         with self._lock:
-            callbacks = self._subscribers.get(topic, [])
             self._last_errors.clear()
+        self._deliver(topic, data)
+
+    def _resolve(self, topic: str) -> tuple[Callable[[dict[str, Any]], None], ...]:
+        """Return the handlers for a published topic, caching the result."""
+        callbacks = self._resolved.get(topic)
+        if callbacks is not None:
+            return callbacks
+        with self._lock:
+            # Pattern subscriptions live in the trie; only plain topics match exactly
+            exact = () if is_pattern(topic) else self._subscribers.get(topic, ())
+            if not len(self._patterns):
+                callbacks = tuple(exact)
+            else:
+                callbacks = (*exact, *self._patterns.match(topic))
+            if len(self._resolved) >= _MAX_RESOLVED_TOPICS:
+                self._resolved.clear()
+            self._resolved[topic] = callbacks
+        return callbacks
+
+    def _deliver(self, topic: str, data: dict[str, Any]) -> None:
+        """Run the topic's handlers for one event."""
+        callbacks = self._resolve(topic)
 
         # Execute callbacks outside lock to avoid deadlocks
         for callback in callbacks:
             try:
                 callback(data)
             except Exception as e:
-                # Log error
-                logger.error(f"Error in event handler for {topic}: {e}", exc_info=True)
+                self._handle_error(topic, e)
+
+    def _handle_error(self, topic: str, error: Exception) -> None:
+        """Log a handler error and apply the error handling mode."""
+        logger.error(f"Error in event handler for {topic}: {error}", exc_info=error)
 
-                # Handle based on mode
-                if self._error_mode == ErrorHandlingMode.FAIL_FAST:
-                    raise
-                elif self._error_mode == ErrorHandlingMode.COLLECT:
-                    self._last_errors.append((topic, e))
-                # SILENT mode: just log (default behavior)
+        # Handle based on mode
+        if self._error_mode == ErrorHandlingMode.FAIL_FAST:
+            raise error
+        elif self._error_mode == ErrorHandlingMode.COLLECT:
+            with self._lock:
+                self._last_errors.append((topic, error))
+                del self._last_errors[:-_MAX_COLLECTED_ERRORS]
+        # SILENT mode: just log (default behavior)
 
     def get_last_errors(self) -> list[tuple[str, Exception]]:
         """Get errors from last publish operation (if error_mode is COLLECT).
 
+        In ASYNC dispatch mode this returns the most recent handler errors
+        across all deliveries instead.
+
         Returns:
             List of (topic, exception) tuples from the last publish call
         """
-        return self._last_errors.copy()
+        with self._lock:
+            return self._last_errors.copy()
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait until all queued events have been delivered and flush pending batches.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if every queued event was delivered, False on timeout
+        """
+        if self._dispatcher is not None and not self._dispatcher.drain(timeout):
+            return False
+        self._flush_batches()
+        # Batch handlers may have published follow-up events
+        return self._dispatcher is None or self._dispatcher.drain(timeout)
+
+    def _flush_batches(self) -> None:
+        with self._lock:
+            batches = list(self._batches)
+        for batch in batches:
+            batch.flush()
+
+    def close(self, timeout: float | None = None) -> None:
+        """Deliver queued events and pending batches, then stop background threads.
+
+        Events published afterwards are delivered synchronously.
+
+        Args:
+            timeout: Maximum seconds to wait for queued events, or None to wait indefinitely
+        """
+        if self._dispatcher is not None:
+            self._dispatcher.close(timeout)
+        with self._lock:
+            flusher = self._flusher
+        if flusher is not None:
+            flusher.close()
+        self._flush_batches()
 
     def get_subscriber_count(self, topic: str) -> int:
         """Get number of subscribers for a topic.
@@ -114,6 +312,84 @@ class EventBus:
             return list(self._subscribers.keys())
 
 
+# Maps an event payload to the memoization key it invalidates (None: every key)
+InvalidationKey = Callable[[dict[str, Any]], Hashable | None]
+
+
+class CachedFunction:
+    """Skill read function memoized in the SkillContext cache.
+
+    Created by :meth:`SkillContext.cached`. Entries live under a namespace
+    with a generation number, so invalidating the whole namespace is a
+    counter bump; stale entries are never read again and age out of the
+    cache's LRU/TTL bounds.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        cache: TTLCache,
+        ttl: float | None,
+        key: Callable[..., Hashable] | None,
+    ) -> None:
+        functools.update_wrapper(self, func)
+        self._func = func
+        self._cache = cache
+        self._ttl = ttl
+        self._key = key
+        self.namespace = f"{func.__module__}.{func.__qualname__}"
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _make_key(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+        if self._key is not None:
+            return self._key(*args, **kwargs)
+        return (args, tuple(sorted(kwargs.items())))
+
+    def _cache_key(self, key: Hashable) -> str:
+        return f"cached:{self.namespace}:{self._generation}:{key!r}"
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        computed = False
+
+        def compute() -> Any:
+            nonlocal computed
+            computed = True
+            return self._func(*args, **kwargs)
+
+        result = self._cache.get_or_compute(
+            self._cache_key(self._make_key(args, kwargs)), compute, self._ttl
+        )
+        with self._lock:
+            if computed:
+                self._misses += 1
+            else:
+                self._hits += 1
+        CACHED_CALLS.labels(self.namespace, "miss" if computed else "hit").inc()
+        return result
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Evict the entry for one key (as returned by the key function), or all entries."""
+        if key is None:
+            with self._lock:
+                self._generation += 1
+        else:
+            self._cache.delete(self._cache_key(key))
+
+    def cache_info(self) -> dict[str, Any]:
+        """Return hit and miss counts for this function."""
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        calls = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / calls if calls else 0.0,
+        }
+
+
 class SkillApp(Protocol):
     """Protocol for skill Typer apps."""
 
@@ -135,6 +411,7 @@ class SkillContext:
         event_bus: EventBus,
         cache_max_size: int = 1000,
         engine: Engine | None = None,
+        cache_max_bytes: int | None = None,
     ) -> None:
         """
         Initialize a SkillContext with a shared database connection, an event bus, and a TTL-backed in-process cache.
@@ -144,12 +421,14 @@ class SkillContext:
                 event_bus (EventBus): In-process event bus for inter-skill publish/subscribe.
                 cache_max_size (int): Maximum number of entries the internal TTL cache will hold (default 1000).
                 engine (Engine | None): Optional SQLAlchemy engine for modern ORM-based skills.
+                cache_max_bytes (int | None): Optional bound on the summed size of cached values.
         """
         self._conn = conn
         self._event_bus = event_bus
         self._engine = engine
         self._skills: dict[str, SkillApp] = {}
-        self._cache = TTLCache(max_size=cache_max_size)
+        self._cache = TTLCache(max_size=cache_max_size, max_bytes=cache_max_bytes)
+        self._cached_functions: dict[str, CachedFunction] = {}
         self._closed = False
 
     def __enter__(self) -> "SkillContext":
@@ -183,9 +462,11 @@ class SkillContext:
         """
         Close the shared database connection and mark the context as closed.
 
-        Any exceptions raised while closing the connection are ignored.
+        Queued events are delivered first so that handlers can still use the
+        connection. Any exceptions raised while closing the connection are ignored.
         """
         if not self._closed:
+            self._event_bus.close()
             try:
                 self._conn.close()
             except Exception:
@@ -222,6 +503,11 @@ class SkillContext:
             raise RuntimeError("Cannot use engine after context is closed")
         return self._engine
 
+    @property
+    def event_bus(self) -> EventBus:
+        """The shared in-process event bus."""
+        return self._event_bus
+
     def publish(self, topic: str, data: dict[str, Any]) -> None:
         """
         Publish an event to the shared in-process event bus for subscribers of the given topic.
@@ -236,6 +522,10 @@ class SkillContext:
         """Subscribe to an event topic."""
         self._event_bus.subscribe(topic, callback)
 
+    def unsubscribe(self, topic: str, callback: Callable[[dict[str, Any]], None]) -> bool:
+        """Remove an event topic subscription."""
+        return self._event_bus.unsubscribe(topic, callback)
+
     def register_skill(self, name: str, app: SkillApp) -> None:
         """Register a skill app."""
         self._skills[name] = app
@@ -248,10 +538,24 @@ class SkillContext:
         """Get a value from the process-local cache."""
         return self._cache.get(key)
 
-    def cache_set(self, key: str, value: Any, ttl: int | None = None) -> None:
+    def cache_set(self, key: str, value: Any, ttl: float | None = None) -> None:
         """Set a value in the process-local cache."""
         self._cache.set(key, value, ttl)
 
+    def cache_get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Get several values from the cache, omitting missing or expired keys."""
+        return self._cache.get_many(keys)
+
+    def cache_set_many(self, items: Mapping[str, Any], ttl: float | None = None) -> None:
+        """Set several values in the process-local cache."""
+        self._cache.set_many(items, ttl)
+
+    def cache_get_or_compute(
+        self, key: str, compute: Callable[[], Any], ttl: float | None = None
+    ) -> Any:
+        """Get a cached value, computing it once on a miss even under concurrent callers."""
+        return self._cache.get_or_compute(key, compute, ttl)
+
     def cache_has(self, key: str) -> bool:
         """Check if a key exists in cache and is not expired."""
         return self._cache.has(key)
@@ -268,6 +572,67 @@ class SkillContext:
         """Remove expired entries from the cache."""
         return self._cache.prune_expired()
 
+    def cache_stats(self) -> CacheStats:
+        """Get hit, miss, eviction and expiration counters for the cache."""
+        return self._cache.stats()
+
+    def cached(
+        self,
+        ttl: float | None = None,
+        invalidate_on: Iterable[str] | Mapping[str, InvalidationKey | None] = (),
+        key: Callable[..., Hashable] | None = None,
+    ) -> Callable[[Callable[..., Any]], CachedFunction]:
+        """Memoize a skill read function in the context cache.
+
+        Example:
+            ```python
+            get_note = ctx.cached(
+                ttl=60,
+                invalidate_on={
+                    TOPIC_NOTE_UPDATED: lambda event: event["id"],
+                    TOPIC_NOTE_DELETED: lambda event: event["id"],
+                },
+                key=lambda note_id: note_id,
+            )(_load_note)
+            ```
+
+        Args:
+            ttl: Time-to-live in seconds; None keeps entries until invalidated or evicted.
+            invalidate_on: Event topics that evict cached results. A list of topics
+                clears the function's whole namespace; a mapping from topic to a
+                function of the event payload evicts only the key it returns
+                (or everything when it returns None or is None itself).
+            key: Builds the cache key from the call arguments. Defaults to the
+                arguments themselves, which must then be hashable and have a
+                stable repr.
+
+        Returns:
+            A decorator returning a :class:`CachedFunction`.
+
+        Raises:
+            ValueError: If ttl is not positive.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        topics: dict[str, InvalidationKey | None] = (
+            dict(invalidate_on)
+            if isinstance(invalidate_on, Mapping)
+            else dict.fromkeys(invalidate_on)
+        )
+
+        def decorator(func: Callable[..., Any]) -> CachedFunction:
+            cached_func = CachedFunction(func, self._cache, ttl, key)
+            for topic, derive in topics.items():
+                self._event_bus.subscribe(topic, _invalidator(cached_func, derive))
+            self._cached_functions[cached_func.namespace] = cached_func
+            return cached_func
+
+        return decorator
+
+    def cached_function_stats(self) -> dict[str, dict[str, Any]]:
+        """Get hit ratios of every function memoized with cached(), by namespace."""
+        return {name: func.cache_info() for name, func in self._cached_functions.items()}
+
     def _load_skill_config(self, skill_name: str, config_key: str) -> None:
         """Load skill configuration from TOML file."""
         from pathlib import Path
@@ -326,8 +691,21 @@ class SkillContext:
         return self._get_nested_value(skill_config, key, default)
 
 
+def _invalidator(
+    cached_func: CachedFunction, derive: InvalidationKey | None
+) -> Callable[[dict[str, Any]], None]:
+    """Build the event handler that evicts a cached function's entries."""
+
+    def handler(data: dict[str, Any]) -> None:
+        cached_func.invalidate(derive(data) if derive is not None else None)
+
+    return handler
+
+
 # Canonical event topics
 TOPIC_NOTE_CREATED = "note_created"
+TOPIC_NOTE_UPDATED = "note_updated"
+TOPIC_NOTE_DELETED = "note_deleted"
 TOPIC_ISSUE_CREATED = "issue_created"
 TOPIC_ISSUE_UPDATED = "issue_updated"
 TOPIC_PLAN_ENQUEUED = "plan_enqueued"
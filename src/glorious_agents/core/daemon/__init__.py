@@ -2,7 +2,7 @@
 
 Provides reusable components for creating background daemons:
 - BaseDaemonService: Core lifecycle management
-- IPCServer/IPCClient: HTTP-based inter-process communication
+- IPCServer/IPCClient: HTTP-based IPC over Unix sockets or localhost TCP
 - PIDFileManager: Process tracking and cleanup
 - BaseWatcher: File system monitoring
 - PeriodicTask: Background task scheduling
@@ -13,6 +13,7 @@ from typing import Any
 from glorious_agents.core.daemon.config import DaemonConfig
 from glorious_agents.core.daemon.ipc import IPCServer
 from glorious_agents.core.daemon.pid import PIDFileManager
+from glorious_agents.core.metrics import get_metrics, process_rss_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +33,11 @@ class BaseDaemonService(ABC):
     - on_shutdown(): Cleanup daemon-specific resources
     - get_health_info(): Return daemon-specific health data
     - handle_command(): Handle daemon-specific IPC commands
+    - get_cli_app(): Optionally accept CLI commands forwarded by clients
     """
 
+    cli_prog_name: str | None = None
+
     def __init__(self, config: DaemonConfig) -> None:
         """Initialize daemon service.
 
@@ -47,7 +51,9 @@ class BaseDaemonService(ABC):
 
         # Core components
         self.pid_manager = PIDFileManager(config.get_pid_path())
-        self.ipc_server = IPCServer(config.get_socket_path(), self._handle_ipc_request)
+        self.ipc_server = IPCServer(
+            config.get_socket_path(), self._handle_ipc_request, transport=config.ipc_transport
+        )
 
         # Background tasks managed by subclass
         self._tasks: list[asyncio.Task[Any]] = []
@@ -91,6 +97,10 @@ class BaseDaemonService(ABC):
             return self._get_health()
         elif method == "status":
             return self._get_status()
+        elif method == "metrics":
+            return get_metrics().snapshot()
+        elif method == "cli":
+            return self._run_cli(request)
         elif method == "stop":
             # Schedule shutdown in event loop
             if self._loop:
@@ -113,6 +123,7 @@ class BaseDaemonService(ABC):
             "uptime_seconds": uptime,
             "workspace": str(self.workspace_path),
             "pid": os.getpid(),
+            "rss_bytes": process_rss_bytes(),
         }
 
         # Add subclass-specific health info
@@ -139,6 +150,23 @@ class BaseDaemonService(ABC):
             "config": self.config.to_dict(),
         }
 
+    def _run_cli(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Run a CLI invocation forwarded by a client.
+
+        Args:
+            request: Request dictionary with 'argv' and optional 'cwd'
+
+        Returns:
+            Captured output and exit code, or forwarded=False if unsupported
+        """
+        app = self.get_cli_app()
+        if app is None:
+            return {"forwarded": False, "reason": "Daemon does not accept CLI commands"}
+
+        from glorious_agents.core.daemon.cli_runner import run_cli
+
+        return run_cli(app, list(request.get("argv", [])), request.get("cwd"), self.cli_prog_name)
+
     def _setup_signal_handlers(self) -> None:
         """Setup graceful shutdown signal handlers."""
 
@@ -252,11 +280,22 @@ class BaseDaemonService(ABC):
         """
         pass
 
+    def get_cli_app(self) -> Any:
+        """Get the Typer app that forwarded CLI commands run against.
+
+        Override this to let clients run commands in the warm daemon
+        process instead of starting a new interpreter.
+
+        Returns:
+            Typer application, or None if CLI forwarding is not supported
+        """
+        return None
+
     def handle_command(self, request: dict[str, Any]) -> dict[str, Any]:
         """Handle daemon-specific IPC commands.
 
         Override this to add custom commands beyond the standard ones
-        (health, status, stop).
+        (health, status, metrics, cli, stop).
 
         Args:
             request: Request dictionary
@@ -0,0 +1,69 @@
+"""In-daemon execution of forwarded CLI invocations.
+
+A CLI client that finds a running daemon sends its argv instead of starting a
+fresh interpreter; the daemon runs the command against its already-loaded
+Typer app and returns the captured output and exit code.
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any
+
+import typer
+
+logger = logging.getLogger(__name__)
+
+# Capturing swaps sys.stdout/sys.stderr process-wide, so commands run one at a time
+_cli_lock = threading.Lock()
+
+
+def _make_runner() -> Any:
+    """Create a CliRunner that keeps stderr separate from stdout."""
+    from typer.testing import CliRunner
+
+    try:
+        return CliRunner(mix_stderr=False)  # type: ignore[call-arg]
+    except TypeError:
+        # Click >= 8.2 always captures stderr separately
+        return CliRunner()
+
+
+def run_cli(
+    app: typer.Typer,
+    argv: list[str],
+    cwd: str | None = None,
+    prog_name: str | None = None,
+) -> dict[str, Any]:
+    """Run a CLI command in-process and capture its result.
+
+    The command is only run when the client's working directory matches the
+    daemon's, since commands resolve relative paths and the project root from
+    the current directory. Otherwise the request is declined so the client
+    falls back to local execution.
+
+    Args:
+        app: Typer application to invoke
+        argv: Command-line arguments (without the program name)
+        cwd: Client working directory
+        prog_name: Program name used in usage/help output
+
+    Returns:
+        Dictionary with exit_code, stdout and stderr, or forwarded=False and
+        a reason when the command was not run
+    """
+    if cwd is not None and Path(cwd).resolve() != Path.cwd().resolve():
+        return {"forwarded": False, "reason": f"Daemon serves {Path.cwd()}, not {cwd}"}
+
+    runner = _make_runner()
+    with _cli_lock:
+        result = runner.invoke(app, argv, prog_name=prog_name)
+
+    stderr = result.stderr
+    exit_code = result.exit_code
+    if result.exception is not None and not isinstance(result.exception, SystemExit):
+        logger.error(f"Forwarded command {argv} failed", exc_info=result.exc_info)
+        stderr += f"Error: {result.exception}\n"
+        exit_code = exit_code or 1
+
+    return {"forwarded": True, "exit_code": exit_code, "stdout": result.stdout, "stderr": stderr}
@@ -6,6 +6,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal
 
+from glorious_agents.core.daemon.ipc import DEFAULT_TIMEOUT, IPCTransport
+from glorious_agents.forwarding import DAEMON_PID_FILE, DAEMON_SOCKET_FILE
+
 
 @dataclass
 class DaemonConfig:
@@ -19,6 +22,8 @@ class DaemonConfig:
     daemon_mode: Literal["poll", "events"] = "poll"
     auto_start: bool = True
     log_level: str = "INFO"
+    ipc_transport: IPCTransport = "auto"
+    ipc_timeout: float = DEFAULT_TIMEOUT
 
     def get_pid_path(self) -> Path:
         """Get path to PID file.
@@ -28,7 +33,7 @@ class DaemonConfig:
         """
         from glorious_agents.config import config as glorious_config
 
-        return glorious_config.DATA_FOLDER / "daemon.pid"
+        return glorious_config.DATA_FOLDER / DAEMON_PID_FILE
 
     def get_log_path(self) -> Path:
         """Get path to log file.
@@ -44,11 +49,11 @@ class DaemonConfig:
         """Get path to IPC socket/port file.
 
         Returns:
-            Path to daemon.port file (contains HTTP port number)
+            Path to daemon.port (a Unix socket, or a file containing the HTTP port)
         """
         from glorious_agents.config import config as glorious_config
 
-        return glorious_config.DATA_FOLDER / "daemon.port"
+        return glorious_config.DATA_FOLDER / DAEMON_SOCKET_FILE
 
     def get_config_path(self) -> Path:
         """Get path to config file.
@@ -75,6 +80,8 @@ class DaemonConfig:
             daemon_mode=os.environ.get("DAEMON_MODE", "poll"),  # type: ignore[arg-type]
             auto_start=os.environ.get("AUTO_START_DAEMON", "true").lower() == "true",
             log_level=os.environ.get("DAEMON_LOG_LEVEL", "INFO"),
+            ipc_transport=os.environ.get("DAEMON_IPC_TRANSPORT", "auto"),  # type: ignore[arg-type]
+            ipc_timeout=float(os.environ.get("DAEMON_IPC_TIMEOUT", str(DEFAULT_TIMEOUT))),
         )
 
     @classmethod
@@ -103,6 +110,12 @@ class DaemonConfig:
                     == "true"
                 )
                 config.log_level = os.environ.get("DAEMON_LOG_LEVEL", data.get("log_level", "INFO"))
+                config.ipc_transport = os.environ.get(  # type: ignore[assignment]
+                    "DAEMON_IPC_TRANSPORT", data.get("ipc_transport", "auto")
+                )
+                config.ipc_timeout = float(
+                    os.environ.get("DAEMON_IPC_TIMEOUT", data.get("ipc_timeout", DEFAULT_TIMEOUT))
+                )
             except (json.JSONDecodeError, OSError) as e:
                 logger = __import__("logging").getLogger(__name__)
                 logger.warning(f"Failed to load config from {config_path}: {e}")
@@ -118,6 +131,8 @@ class DaemonConfig:
             "daemon_mode": self.daemon_mode,
             "auto_start": self.auto_start,
             "log_level": self.log_level,
+            "ipc_transport": self.ipc_transport,
+            "ipc_timeout": self.ipc_timeout,
         }
 
         config_path.write_text(json.dumps(data, indent=2))
@@ -135,6 +150,8 @@ class DaemonConfig:
             "daemon_mode": self.daemon_mode,
             "auto_start": self.auto_start,
             "log_level": self.log_level,
+            "ipc_transport": self.ipc_transport,
+            "ipc_timeout": self.ipc_timeout,
             "pid_path": str(self.get_pid_path()),
             "log_path": str(self.get_log_path()),
             "socket_path": str(self.get_socket_path()),
@@ -1,46 +1,135 @@
 """HTTP-based inter-process communication for daemons.
 
 Provides aiohttp-based IPC server and client for daemon communication.
-Uses HTTP over a dynamically assigned port to avoid socket file issues.
+Payloads are content-negotiated (MessagePack when available, otherwise JSON).
+On platforms with Unix domain sockets the server binds a socket file directly
+at the configured path; elsewhere (or when requested) it falls back to HTTP
+over a dynamically assigned localhost port written to that path.
 """
 
 import asyncio
-import json
 import logging
+import os
+import socket
+import stat
+import sys
+import time
 from collections.abc import Callable
 from pathlib import Path
-from typing import Any
-
-from aiohttp import ClientSession, ClientTimeout, web
+from typing import Any, Literal
+
+from aiohttp import (
+    ClientConnectorError,
+    ClientSession,
+    ClientTimeout,
+    ServerDisconnectedError,
+    TCPConnector,
+    UnixConnector,
+    web,
+)
+
+from glorious_agents.core.metrics import (
+    IPC_QUEUE_DEPTH,
+    REQUEST_DURATION,
+    REQUESTS_IN_FLIGHT,
+    REQUESTS_TOTAL,
+)
+from glorious_agents.core.serialization import (
+    JSON_CONTENT_TYPE,
+    UnsupportedContentTypeError,
+    accept_header,
+    decode,
+    dumps_json,
+    encode,
+    negotiate,
+    preferred_content_type,
+)
 
 logger = logging.getLogger(__name__)
 
+IPCTransport = Literal["auto", "unix", "tcp"]
+
+DEFAULT_TIMEOUT = 5.0
+DEFAULT_CONNECT_TIMEOUT = 1.0
+KEEPALIVE_TIMEOUT = 60.0
+
+# sun_path is 108 bytes on Linux and 104 on macOS/BSD, including the NUL terminator
+_MAX_UNIX_PATH = 103
+
+
+def supports_unix_sockets() -> bool:
+    """Check whether Unix domain sockets are usable on this platform.
+
+    Returns:
+        True if AF_UNIX is available and the platform is not Windows
+    """
+    return hasattr(socket, "AF_UNIX") and sys.platform != "win32"
+
+
+def _use_unix_transport(transport: IPCTransport, path: Path) -> bool:
+    """Decide whether a server should bind a Unix socket at path.
+
+    Args:
+        transport: Requested transport
+        path: Socket path
+
+    Returns:
+        True for Unix socket transport, False for TCP
+
+    Raises:
+        ValueError: If unix transport is forced but unavailable for this path
+    """
+    if transport == "tcp":
+        return False
+
+    usable = supports_unix_sockets() and len(os.fsencode(path)) <= _MAX_UNIX_PATH
+    if transport == "unix" and not usable:
+        raise ValueError(f"Unix socket transport not available for {path}")
+    if not usable:
+        logger.debug(f"Unix socket transport not available for {path}, using TCP")
+    return usable
+
 
 class IPCServer:
     """HTTP-based IPC server using aiohttp.
 
-    Runs on a random available port and writes the port number to a file
-    for client discovery. This avoids Unix socket limitations on Windows.
+    With the Unix socket transport the socket file itself lives at
+    socket_path. With the TCP transport the server runs on a random available
+    port and writes the port number to socket_path for client discovery.
     """
 
+    route_path = "/"
+
     def __init__(
-        self, socket_path: Path, handler: Callable[[dict[str, Any]], dict[str, Any]]
+        self,
+        socket_path: Path,
+        handler: Callable[[dict[str, Any]], dict[str, Any]],
+        transport: IPCTransport = "auto",
     ) -> None:
         """Initialize IPC server.
 
         Args:
-            socket_path: Path to write port number (not an actual socket)
+            socket_path: Path of the Unix socket, or of the port file for TCP
             handler: Synchronous function to handle requests
+            transport: "unix", "tcp", or "auto" (Unix socket where supported)
         """
         self.socket_path = socket_path
         self.handler = handler
+        self.transport = transport
         self.app = web.Application()
         self.runner: web.AppRunner | None = None
-        self.site: web.TCPSite | None = None
+        self.site: web.BaseSite | None = None
         self.port: int | None = None
 
         # Setup routes
-        self.app.router.add_post("/", self._handle_request)
+        self.app.router.add_post(self.route_path, self._handle_request)
+
+    @staticmethod
+    def _error_response(message: str, status: int) -> web.Response:
+        """Build a JSON error response (errors are always JSON for readability)."""
+        return web.Response(
+            body=dumps_json({"error": message}), status=status, content_type=JSON_CONTENT_TYPE
+        )
 
     async def _handle_request(self, request: web.Request) -> web.Response:
         """Handle incoming HTTP request.
@@ -49,35 +138,70 @@ class IPCServer:
             request: aiohttp request object
 
         Returns:
-            JSON response
+            Response encoded as negotiated by the Accept header
         """
         try:
-            data = await request.json()
+            data = decode(await request.read(), request.headers.get("Content-Type"))
+        except UnsupportedContentTypeError as e:
+            logger.error(f"Unsupported request encoding: {e}")
+            return self._error_response(str(e), status=415)
+        except ValueError as e:
+            logger.error(f"Invalid request body: {e}")
+            return self._error_response("Invalid request body", status=400)
 
+        method = str(data.get("method", "")) if isinstance(data, dict) else ""
+        status = 500
+        start = time.perf_counter()
+        REQUESTS_IN_FLIGHT.inc()
+        try:
             # Run synchronous handler in executor to avoid blocking event loop
             loop = asyncio.get_running_loop()
-            response = await loop.run_in_executor(None, self.handler, data)
+            IPC_QUEUE_DEPTH.inc()
+            response = await loop.run_in_executor(None, self._run_handler, data)
 
-            return web.json_response(response)
+            content_type = negotiate(request.headers.get("Accept"))
+            body = encode(response, content_type)
+            status = 200
+            return web.Response(body=body, content_type=content_type)
         except Exception as e:
             logger.error(f"Error handling request: {e}", exc_info=True)
-            return web.json_response({"error": str(e)}, status=500)
+            return self._error_response(str(e), status=500)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            REQUESTS_TOTAL.labels("ipc", "", method, status).inc()
+            REQUEST_DURATION.labels("ipc", "", method).observe(time.perf_counter() - start)
+
+    def _run_handler(self, data: Any) -> Any:
+        """Run the handler on a worker thread, tracking how long requests queue."""
+        IPC_QUEUE_DEPTH.dec()
+        return self.handler(data)
 
     async def start(self) -> None:
-        """Start the IPC server on a random available port."""
+        """Start the IPC server on a Unix socket or a random available port."""
         self.runner = web.AppRunner(self.app)
         await self.runner.setup()
 
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # Remove a stale socket or port file left by a crashed daemon
+        self.socket_path.unlink(missing_ok=True)
+
+        if _use_unix_transport(self.transport, self.socket_path):
+            self.site = web.UnixSite(self.runner, str(self.socket_path))
+            await self.site.start()
+            os.chmod(self.socket_path, 0o600)
+            logger.info(f"IPC server started on unix socket {self.socket_path}")
+            return
+
         # Bind to random port (port=0 means any available)
-        self.site = web.TCPSite(self.runner, "127.0.0.1", 0)
-        await self.site.start()
+        tcp_site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await tcp_site.start()
+        self.site = tcp_site
 
         # Get actual port and write to file
         # Access underlying server to get the actual port
-        assert self.site._server is not None
-        self.port = self.site._server.sockets[0].getsockname()[1]  # type: ignore[attr-defined]
+        assert tcp_site._server is not None
+        self.port = tcp_site._server.sockets[0].getsockname()[1]  # type: ignore[attr-defined]
 
-        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
         self.socket_path.write_text(str(self.port))
 
         logger.info(f"IPC server started on port {self.port}")
@@ -88,8 +212,7 @@ class IPCServer:
             await self.runner.cleanup()
             self.runner = None
 
-        if self.socket_path.exists():
-            self.socket_path.unlink()
+        self.socket_path.unlink(missing_ok=True)
 
         logger.info("IPC server stopped")
 
@@ -97,33 +220,101 @@ class IPCServer:
 class IPCClient:
     """HTTP-based IPC client for daemon communication.
 
-    Discovers daemon port from file and sends requests over HTTP.
+    Resolves the daemon endpoint (Unix socket or TCP port file) once, then
+    reuses a keep-alive session for subsequent requests. The endpoint is
+    re-resolved only after a connection failure, e.g. when the daemon restarts.
     """
 
-    def __init__(self, socket_path: Path) -> None:
+    route_path = "/"
+
+    def __init__(
+        self,
+        socket_path: Path,
+        timeout: float = DEFAULT_TIMEOUT,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        content_type: str | None = None,
+    ) -> None:
         """Initialize IPC client.
 
         Args:
-            socket_path: Path to port file
+            socket_path: Path to the daemon's Unix socket or port file
+            timeout: Total timeout in seconds for a single request
+            connect_timeout: Timeout in seconds for establishing a connection
+            content_type: Request encoding (defaults to the most compact available)
         """
         self.socket_path = socket_path
+        self.timeout = ClientTimeout(total=timeout, connect=connect_timeout)
+        self.content_type = content_type or preferred_content_type()
+        self._headers = {"Content-Type": self.content_type, "Accept": accept_header()}
         self._session: ClientSession | None = None
+        self._url: str | None = None
 
-    async def _get_session(self) -> ClientSession:
-        """Get or create a reusable ClientSession.
+    def _resolve_endpoint(self) -> tuple[str, UnixConnector | TCPConnector]:
+        """Resolve the daemon endpoint from socket_path.
 
         Returns:
-            ClientSession instance
+            Tuple of (request URL, connector bound to the endpoint)
+
+        Raises:
+            ConnectionError: If the daemon is not running or the port file is invalid
+        """
+        try:
+            mode = self.socket_path.stat().st_mode
+        except FileNotFoundError as e:
+            raise ConnectionError(
+                f"Daemon not running (no socket or port file at {self.socket_path})"
+            ) from e
+
+        if stat.S_ISSOCK(mode):
+            connector: UnixConnector | TCPConnector = UnixConnector(
+                path=str(self.socket_path), keepalive_timeout=KEEPALIVE_TIMEOUT
+            )
+            return f"http://localhost{self.route_path}", connector
+
+        try:
+            port = int(self.socket_path.read_text().strip())
+        except ValueError as e:
+            raise ConnectionError(f"Invalid port file: {e}") from e
+        connector = TCPConnector(keepalive_timeout=KEEPALIVE_TIMEOUT)
+        return f"http://127.0.0.1:{port}{self.route_path}", connector
+
+    async def _get_session(self) -> tuple[ClientSession, str]:
+        """Get or create the keep-alive session for the cached endpoint.
+
+        Returns:
+            Tuple of (ClientSession instance, request URL)
         """
-        if self._session is None:
-            self._session = ClientSession()
-        return self._session
+        if self._session is None or self._session.closed or self._url is None:
+            url, connector = self._resolve_endpoint()
+            self._session = ClientSession(connector=connector, timeout=self.timeout)
+            self._url = url
+        return self._session, self._url
 
     async def close(self) -> None:
         """Close the client session and cleanup resources."""
-        if self._session:
+        if self._session and not self._session.closed:
             await self._session.close()
-            self._session = None
+        self._session = None
+        self._url = None
+
+    async def _post(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Post a request to the cached endpoint.
+
+        Args:
+            request: Request dictionary
+
+        Returns:
+            Response dictionary from daemon
+        """
+        session, url = await self._get_session()
+        body = encode(request, self.content_type)
+        async with session.post(url, data=body, headers=self._headers) as resp:
+            if resp.status != 200:
+                error_text = await resp.text()
+                raise ConnectionError(f"Daemon returned error {resp.status}: {error_text}")
+
+            result: dict[str, Any] = decode(await resp.read(), resp.headers.get("Content-Type"))
+            return result
 
     async def send_request(self, request: dict[str, Any]) -> dict[str, Any]:
         """Send request to daemon and return response.
@@ -137,24 +328,15 @@ class IPCClient:
         Raises:
             ConnectionError: If cannot connect to daemon
         """
-        if not self.socket_path.exists():
-            raise ConnectionError(f"Daemon not running (no port file at {self.socket_path})")
-
         try:
-            port = int(self.socket_path.read_text().strip())
-            url = f"http://127.0.0.1:{port}/"
-
-            session = await self._get_session()
-            async with session.post(url, json=request, timeout=ClientTimeout(total=5)) as resp:
-                if resp.status != 200:
-                    error_text = await resp.text()
-                    raise ConnectionError(f"Daemon returned error {resp.status}: {error_text}")
-
-                result: dict[str, Any] = await resp.json()
-                return result
-
-        except ValueError as e:
-            raise ConnectionError(f"Invalid port file: {e}") from e
+            try:
+                return await self._post(request)
+            except (ClientConnectorError, ServerDisconnectedError):
+                # Stale endpoint or pooled connection (daemon restarted); resolve again once
+                await self.close()
+                return await self._post(request)
+        except ConnectionError:
+            raise
         except TimeoutError as e:
             raise ConnectionError("Request to daemon timed out") from e
         except Exception as e:
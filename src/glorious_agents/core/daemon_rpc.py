@@ -1,20 +1,48 @@
-"""FastAPI daemon for RPC access to skills."""
+"""FastAPI daemon for RPC access to skills.
+
+The /rpc and /events endpoints negotiate payload encoding: clients may send
+and accept MessagePack (application/msgpack) when msgpack is installed, and
+JSON is encoded with orjson when available.
+"""
 
 import importlib
 import inspect
+import json
 import logging
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+import os
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
 from typing import Any
 
+import anyio.to_thread
 import uvicorn
-from fastapi import Depends, FastAPI, Header, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, ValidationError
 
 from glorious_agents.config import config
 from glorious_agents.core.loader import load_all_skills
+from glorious_agents.core.maintenance import find_maintenance_jobs
+from glorious_agents.core.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    REQUEST_DURATION,
+    REQUESTS_IN_FLIGHT,
+    REQUESTS_TOTAL,
+    get_metrics,
+)
 from glorious_agents.core.registry import get_registry
+from glorious_agents.core.rpc_cache import get_cache_policy, get_rpc_cache, reset_rpc_cache
 from glorious_agents.core.runtime import get_ctx, reset_ctx
+from glorious_agents.core.serialization import (
+    JSON_CONTENT_TYPE,
+    UnsupportedContentTypeError,
+    decode,
+    encode,
+    negotiate,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +80,13 @@ def verify_api_key(x_api_key: str | None = Header(None)) -> None:
     logger.debug("API key verified")
 
 
+class CLIRequest(BaseModel):
+    """Request model for CLI invocations forwarded by the 'agent' client."""
+
+    argv: list[str] = Field(default_factory=list, description="Command-line arguments")
+    cwd: str | None = Field(None, description="Client working directory")
+
+
 class RPCRequest(BaseModel):
     """Request model for RPC calls with validation."""
 
@@ -61,6 +96,38 @@ class RPCRequest(BaseModel):
         json_schema_extra = {"example": {"params": {"key": "value", "count": 5}}}
 
 
+async def _decode_body(request: Request) -> Any:
+    """Decode a request body according to its Content-Type.
+
+    Returns:
+        Decoded payload, or an empty dict for an empty body.
+
+    Raises:
+        HTTPException: 415 for unsupported encodings, 400 for malformed bodies.
+    """
+    body = await request.body()
+    if not body:
+        return {}
+    try:
+        return decode(body, request.headers.get("content-type"))
+    except UnsupportedContentTypeError as e:
+        raise HTTPException(status_code=415, detail=str(e)) from e
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid request body: {e}") from e
+
+
+def _encoded_response(request: Request, payload: Any) -> Response:
+    """Encode a payload in the content type negotiated from the Accept header."""
+    content_type = negotiate(request.headers.get("accept"))
+    return Response(content=encode(payload, content_type), media_type=content_type)
+
+
+_BODY_CONTENT = {
+    "application/json": {"schema": {"type": "object"}},
+    "application/msgpack": {"schema": {"type": "string", "format": "binary"}},
+}
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     """
@@ -69,13 +136,28 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     Handles:
     - Loading all skills on startup
     - Initializing shared context
+    - Running skill maintenance jobs in the background
     - Cleaning up resources on shutdown
     """
+    # Imported here: the daemon package re-exports this module
+    from glorious_agents.core.daemon.tasks import PeriodicTask
+
     # Startup
     logger.info("Starting Glorious Agents daemon...")
+    maintenance_tasks: list[PeriodicTask] = []
     try:
         load_all_skills()
         get_ctx()  # Initialize shared context
+
+        # CLI app for forwarded commands, mounting the skills loaded above
+        from glorious_agents.cli import prepare_app
+
+        app.state.cli_app = prepare_app(load_skills=False)
+
+        for job in find_maintenance_jobs():
+            task = PeriodicTask(job.interval, job.func, name=f"{job.skill}.{job.name}")
+            await task.start()
+            maintenance_tasks.append(task)
         logger.info("Daemon startup complete")
     except Exception as e:
         logger.error(f"Error during daemon startup: {e}", exc_info=True)
@@ -86,7 +168,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     # Shutdown
     logger.info("Shutting down Glorious Agents daemon...")
     try:
+        for task in maintenance_tasks:
+            await task.stop()
         reset_ctx()
+        reset_rpc_cache()
         logger.info("Daemon shutdown complete")
     except Exception as e:
         logger.error(f"Error during daemon shutdown: {e}", exc_info=True)
@@ -95,12 +180,78 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
 daemon_app = FastAPI(title="Glorious Agents Daemon", lifespan=lifespan)
 
 
+@daemon_app.middleware("http")
+async def record_request_metrics(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Record request counts, latency and in-flight requests for /metrics."""
+    REQUESTS_IN_FLIGHT.inc()
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        elapsed = time.perf_counter() - start
+        REQUESTS_IN_FLIGHT.dec()
+        # Label by route template, not raw path, to keep cardinality bounded
+        route = getattr(request.scope.get("route"), "path", "unmatched")
+        params = request.scope.get("path_params") or {}
+        skill = params.get("skill", "")
+        method = params.get("method", "")
+        REQUESTS_TOTAL.labels(route, skill, method, status).inc()
+        REQUEST_DURATION.labels(route, skill, method).observe(elapsed)
+
+
+def _collect_threadpool() -> list[tuple[dict[str, str], float]]:
+    """Report worker-thread usage of the threadpool used for blocking calls."""
+    stats = anyio.to_thread.current_default_thread_limiter().statistics()
+    return [
+        ({"state": "busy"}, float(stats.borrowed_tokens)),
+        ({"state": "queued"}, float(stats.tasks_waiting)),
+    ]
+
+
 @daemon_app.get("/health")
 async def health_check() -> dict[str, str]:
     """Health check endpoint (no authentication required)."""
     return {"status": "healthy", "service": "glorious-agents-daemon"}
 
 
+@daemon_app.get("/metrics")
+async def metrics(
+    request: Request,
+    output_format: str | None = Query(None, alias="format"),
+    _auth: None = Depends(verify_api_key),
+) -> Response:
+    """
+    Export daemon metrics.
+
+    Returns Prometheus text format by default; JSON when ``?format=json`` is
+    given or the Accept header asks for application/json.
+
+    Returns:
+        Request counts and latency histograms per skill/method, in-flight
+        requests, threadpool usage, event-bus publish counts, SQLite busy
+        errors and process RSS.
+    """
+    registry = get_metrics()
+    # The threadpool limiter is bound to the running event loop, so it is
+    # registered per export rather than at import time
+    registry.register_collector(
+        "glorious_daemon_threadpool_threads",
+        "Threadpool workers busy running blocking calls, and calls queued for one",
+        _collect_threadpool,
+    )
+    accept = request.headers.get("accept", "")
+    if output_format == "json" or (
+        output_format is None and JSON_CONTENT_TYPE in accept and "text/plain" not in accept
+    ):
+        return _encoded_response(request, registry.snapshot())
+    return Response(content=registry.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 @daemon_app.get("/skills")
 async def list_skills() -> list[dict[str, Any]]:
     """List all loaded skills."""
@@ -119,30 +270,40 @@ async def list_skills() -> list[dict[str, Any]]:
     ]
 
 
-@daemon_app.post("/rpc/{skill}/{method}")
+@daemon_app.post(
+    "/rpc/{skill}/{method}",
+    openapi_extra={"requestBody": {"content": _BODY_CONTENT, "required": False}},
+)
 async def call_skill_method(
     skill: str,
     method: str,
-    request: RPCRequest = RPCRequest(),
+    request: Request,
     _auth: None = Depends(verify_api_key),
-) -> dict[str, Any]:
+) -> Response:
     """
     Call a skill method via RPC.
 
     Dynamically invokes a callable function from a skill module. The method must
     be a module-level function (not a Typer command) and must be callable.
+    Methods marked with ``@cacheable`` are served from the RPC response cache
+    when an identical call is still fresh; the X-Cache header reports hit/miss.
 
     Args:
         skill: Skill name.
         method: Method name to call.
-        request: Validated RPC request with parameters.
+        request: HTTP request whose body is an RPCRequest (JSON or MessagePack).
 
     Returns:
-        Result dictionary with status and data.
+        Result dictionary with status and data, encoded per the Accept header.
 
     Raises:
         HTTPException: If skill not found, method not found, or call fails.
     """
+    try:
+        rpc_request = RPCRequest.model_validate(await _decode_body(request))
+    except ValidationError as e:
+        raise RequestValidationError(e.errors()) from e
+
     registry = get_registry()
     manifest = registry.get_manifest(skill)
 
@@ -173,20 +334,22 @@ async def call_skill_method(
             detail=f"'{method}' in skill '{skill}' is not callable",
         )
 
+    policy = get_cache_policy(func)
+    rpc_cache = get_rpc_cache() if policy is not None else None
+    cache_key: str | None = None
+    if rpc_cache is not None and policy is not None:
+        rpc_cache.bind(get_ctx().event_bus)
+        cache_key, hit, cached = rpc_cache.lookup(skill, method, rpc_request.params, policy)
+        if hit:
+            return _rpc_response(request, skill, method, cached, cache_status="hit")
+
     # Call the function
     try:
         # Handle both sync and async functions
         if inspect.iscoroutinefunction(func):
-            result = await func(**request.params)
+            result = await func(**rpc_request.params)
         else:
-            result = func(**request.params)
-
-        return {
-            "status": "success",
-            "skill": skill,
-            "method": method,
-            "result": result,
-        }
+            result = func(**rpc_request.params)
     except TypeError as e:
         raise HTTPException(
             status_code=400,
@@ -196,34 +359,70 @@ async def call_skill_method(
         logger.error(f"Error calling {skill}.{method}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Method execution failed: {e}") from e
 
+    response = _rpc_response(
+        request, skill, method, result, cache_status="miss" if cache_key else None
+    )
+    if rpc_cache is not None and cache_key is not None and policy is not None:
+        rpc_cache.store(cache_key, result, policy)
+    return response
+
+
+def _rpc_response(
+    request: Request, skill: str, method: str, result: Any, cache_status: str | None = None
+) -> Response:
+    """Encode a successful RPC result, tagging it with the response cache status."""
+    try:
+        response = _encoded_response(
+            request,
+            {
+                "status": "success",
+                "skill": skill,
+                "method": method,
+                "result": result,
+            },
+        )
+    except TypeError as e:
+        logger.error(f"Cannot serialize result of {skill}.{method}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Result not serializable: {e}") from e
+    if cache_status is not None:
+        response.headers["X-Cache"] = cache_status
+    return response
+
 
-@daemon_app.post("/events/{topic}")
+@daemon_app.post(
+    "/events/{topic}",
+    openapi_extra={"requestBody": {"content": _BODY_CONTENT, "required": True}},
+)
 async def publish_event(
     topic: str,
-    data: dict[str, Any],
+    request: Request,
     _auth: None = Depends(verify_api_key),
-) -> dict[str, str]:
+) -> Response:
     """
     Publish an event to the event bus.
 
     Args:
         topic: Event topic name.
-        data: Event data dictionary.
+        request: HTTP request whose body is the event data (JSON or MessagePack).
 
     Returns:
         Status message.
     """
+    data = await _decode_body(request)
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=422, detail="Event data must be an object")
+
     ctx = get_ctx()
     try:
         ctx.publish(topic, data)
-        return {"status": "published", "topic": topic}
     except Exception as e:
         logger.error(f"Error publishing event to {topic}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to publish event: {e}") from e
+    return _encoded_response(request, {"status": "published", "topic": topic})
 
 
 @daemon_app.get("/events/topics")
-async def list_topics() -> dict[str, list[str]]:
+async def list_topics(request: Request) -> Response:
     """
     List all active event topics with subscribers.
 
@@ -233,7 +432,7 @@ async def list_topics() -> dict[str, list[str]]:
     ctx = get_ctx()
     # Access the event bus's subscriber dictionary
     topics = list(ctx._event_bus._subscribers.keys())
-    return {"topics": topics}
+    return _encoded_response(request, {"topics": topics})
 
 
 @daemon_app.get("/cache/{key:path}")
@@ -337,16 +536,85 @@ async def cache_stats(_auth: None = Depends(verify_api_key)) -> dict[str, Any]:
     }
 
 
-def run_daemon(host: str | None = None, port: int | None = None) -> None:
+@daemon_app.post(
+    "/cli",
+    openapi_extra={"requestBody": {"content": _BODY_CONTENT, "required": True}},
+)
+async def run_cli_command(request: Request, _auth: None = Depends(verify_api_key)) -> Response:
+    """
+    Run a forwarded 'agent' CLI invocation against the warm daemon process.
+
+    Returns:
+        Captured stdout/stderr and exit code, or forwarded=False when the
+        daemon serves a different working directory.
+    """
+    try:
+        cli_request = CLIRequest.model_validate(await _decode_body(request))
+    except ValidationError as e:
+        raise RequestValidationError(e.errors()) from e
+
+    cli_app = getattr(request.app.state, "cli_app", None)
+    if cli_app is None:
+        return _encoded_response(
+            request, {"forwarded": False, "reason": "Daemon CLI app not ready"}
+        )
+
+    from glorious_agents.core.daemon.cli_runner import run_cli
+
+    result = await run_in_threadpool(run_cli, cli_app, cli_request.argv, cli_request.cwd, "agent")
+    return _encoded_response(request, result)
+
+
+@contextmanager
+def _daemon_info_file(info: dict[str, Any]) -> Iterator[None]:
+    """Advertise the running daemon so 'agent' invocations can forward to it."""
+    from glorious_agents.forwarding import AGENT_DAEMON_INFO_FILE
+
+    info_path = config.DATA_FOLDER / AGENT_DAEMON_INFO_FILE
+    try:
+        info_path.parent.mkdir(parents=True, exist_ok=True)
+        info_path.write_text(json.dumps({"pid": os.getpid(), **info}))
+    except OSError as e:
+        logger.warning(f"Could not write daemon info file {info_path}: {e}")
+    try:
+        yield
+    finally:
+        info_path.unlink(missing_ok=True)
+
+
+def run_daemon(host: str | None = None, port: int | None = None, uds: Path | None = None) -> None:
     """
     Run the FastAPI daemon.
 
+    Serves on a Unix domain socket when one is configured and supported by the
+    platform, avoiding TCP overhead for local clients; otherwise binds host/port.
+    While running, the endpoint is recorded in the data folder so the 'agent'
+    CLI can forward commands to this process instead of starting cold.
+
     Args:
         host: Host to bind to. Uses config.DAEMON_HOST if None.
         port: Port to bind to. Uses config.DAEMON_PORT if None.
+        uds: Unix socket path to bind to. Uses config.DAEMON_UDS if None.
     """
     if host is None:
         host = config.DAEMON_HOST
     if port is None:
         port = config.DAEMON_PORT
-    uvicorn.run(daemon_app, host=host, port=port)
+    if uds is None:
+        uds = config.DAEMON_UDS
+
+    # Imported lazily: glorious_agents.core.daemon re-exports run_daemon from this module
+    from glorious_agents.core.daemon.ipc import supports_unix_sockets
+
+    if uds is not None and supports_unix_sockets():
+        uds.parent.mkdir(parents=True, exist_ok=True)
+        uds.unlink(missing_ok=True)
+        logger.info(f"Daemon listening on unix socket {uds}")
+        with _daemon_info_file({"uds": str(uds.resolve())}):
+            uvicorn.run(daemon_app, uds=str(uds))
+        return
+
+    if uds is not None:
+        logger.warning("Unix domain sockets not supported on this platform, using TCP")
+    with _daemon_info_file({"host": host, "port": port}):
+        uvicorn.run(daemon_app, host=host, port=port)
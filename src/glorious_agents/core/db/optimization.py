@@ -3,16 +3,20 @@
 import sqlite3
 
 from glorious_agents.core.db.connection import get_connection
+from glorious_agents.core.outbox import compact
 
 
 def optimize_database() -> None:
     """
     Perform periodic maintenance to optimize the SQLite database.
 
-    Runs ANALYZE to update query planner statistics, attempts to compact FTS5 indexes (ignoring sqlite3 errors for tables that do not support optimize), and commits the changes. The connection is always closed when finished. The VACUUM operation is intentionally not run by default because it requires no active transactions and can be time-consuming; run it separately during maintenance windows if desired.
+    Deletes event outbox rows every consumer has acknowledged, runs ANALYZE to update query planner statistics, attempts to compact FTS5 indexes (ignoring sqlite3 errors for tables that do not support optimize), and commits the changes. The connection is always closed when finished. The VACUUM operation is intentionally not run by default because it requires no active transactions and can be time-consuming; run it separately during maintenance windows if desired.
     """
     conn = get_connection()
     try:
+        # Drop acknowledged outbox events before gathering statistics
+        compact(conn)
+
         # Update statistics for query optimizer
         conn.execute("ANALYZE;")
 
@@ -9,6 +9,8 @@ from typing import Any
 
 from sqlalchemy import Engine, create_engine
 
+from glorious_agents.core.metrics import track_sqlite_busy
+
 logger = logging.getLogger(__name__)
 
 # Global registry of engine instances keyed by database URL
@@ -68,6 +70,7 @@ def get_engine(
             connect_args=connect_args,
             pool_pre_ping=pool_pre_ping,
         )
+        track_sqlite_busy(engine)
     else:
         # PostgreSQL/MySQL/other databases
         engine = create_engine(
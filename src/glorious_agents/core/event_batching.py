@@ -0,0 +1,165 @@
+"""Batched delivery for high-frequency event topics.
+
+``EventBus.subscribe_batch()`` registers a :class:`BatchSubscription`: an
+ordinary subscriber that buffers events and passes its handler a list once
+``max_items`` events have arrived or ``max_delay_ms`` has passed since the
+first buffered one, whichever comes first. With a coalescing key only the
+latest event per key is kept, so a burst of updates to one issue reaches the
+handler once and the handler can apply the whole batch in one DB write.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+BatchHandler = Callable[[list[dict[str, Any]]], None]
+KeyFunc = Callable[[dict[str, Any]], Hashable]
+
+
+class FlushScheduler:
+    """Runs delayed batch flushes on a single shared thread."""
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, Callable[[], None]]] = []
+        self._order = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> bool:
+        """Run callback after delay seconds. Returns False once the scheduler is closed."""
+        with self._cond:
+            if self._closed:
+                return False
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._order), callback))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="eventbus-batch-flusher", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+            return True
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if self._heap:
+                        wait = self._heap[0][0] - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._cond.wait(wait)
+                    else:
+                        self._cond.wait()
+                if self._closed:
+                    return
+                _, _, callback = heapq.heappop(self._heap)
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in scheduled batch flush: {e}", exc_info=True)
+
+    def close(self) -> None:
+        """Stop the scheduler thread, discarding pending timers."""
+        with self._cond:
+            self._closed = True
+            self._heap.clear()
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+
+class BatchSubscription:
+    """Subscriber that buffers events and delivers them to a handler in batches."""
+
+    def __init__(
+        self,
+        handler: BatchHandler,
+        scheduler: FlushScheduler,
+        max_items: int = 100,
+        max_delay_ms: int = 50,
+        key: str | KeyFunc | None = None,
+    ) -> None:
+        """Create a batch subscription.
+
+        Args:
+            handler: Called with each batch of event payloads, oldest first.
+            scheduler: Scheduler used to flush partial batches after max_delay_ms.
+            max_items: Flush as soon as this many events are buffered.
+            max_delay_ms: Flush at most this long after the first buffered event.
+            key: Payload field name or function identifying events to coalesce; only
+                the latest event per key is delivered. Events whose key is None are
+                never coalesced.
+
+        Raises:
+            ValueError: If max_items is not positive or max_delay_ms is negative.
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be positive")
+        if max_delay_ms < 0:
+            raise ValueError("max_delay_ms must not be negative")
+        self._handler = handler
+        self._scheduler = scheduler
+        self._max_items = max_items
+        self._delay = max_delay_ms / 1000
+        if isinstance(key, str):
+            field = key
+            self._key: KeyFunc | None = lambda data: data.get(field)
+        else:
+            self._key = key
+        self._pending: dict[Hashable, dict[str, Any]] = {}
+        # Bumped on every flush so timers for already-flushed batches do nothing
+        self._window = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.RLock()
+
+    def __call__(self, data: dict[str, Any]) -> None:
+        """Buffer one event, flushing if the batch is full."""
+        with self._lock:
+            key = self._key(data) if self._key is not None else None
+            if key is None:
+                key = object()
+            else:
+                # Re-insert so coalesced events keep the position of their latest update
+                self._pending.pop(key, None)
+            self._pending[key] = data
+            size = len(self._pending)
+            window = self._window
+
+        if size >= self._max_items:
+            self.flush()
+        elif size == 1 and not self._scheduler.schedule(
+            self._delay, lambda: self._flush_window(window)
+        ):
+            self.flush()
+
+    def _flush_window(self, window: int) -> None:
+        if window == self._window:
+            self.flush()
+
+    def flush(self) -> None:
+        """Deliver buffered events now.
+
+        Raises:
+            Exception: Whatever the handler raises.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                batch = list(self._pending.values())
+                self._pending.clear()
+                self._window += 1
+            self._handler(batch)
+
+    def pending(self) -> int:
+        """Number of buffered events."""
+        with self._lock:
+            return len(self._pending)
@@ -0,0 +1,283 @@
+"""Asynchronous event delivery for the event bus.
+
+In async mode the EventBus hands each published event to an
+:class:`AsyncDispatcher`, which appends it to one of a fixed number of bounded
+shard queues and returns immediately. Every shard is drained by its own worker
+thread and a topic always maps to the same shard, so events on a topic are
+delivered in publish order while different shards are delivered in parallel.
+With a single worker (the default) all events share one global queue.
+"""
+
+import logging
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+import zlib
+from collections import deque
+from collections.abc import Callable
+from enum import Enum
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from glorious_agents.core.metrics import EVENTS_DROPPED, EVENTS_SPILLED
+
+logger = logging.getLogger(__name__)
+
+Deliver = Callable[[str, dict[str, Any]], None]
+
+# Marks dispatcher worker threads; events published from a handler never block,
+# since a worker waiting for room in a queue that only workers drain would deadlock.
+_worker = threading.local()
+
+
+class DispatchMode(Enum):
+    """Dispatch modes for event bus."""
+
+    SYNC = "sync"  # Handlers run on the publisher's thread (default behavior)
+    ASYNC = "async"  # Handlers run on dispatcher worker threads
+
+
+class OverflowPolicy(Enum):
+    """What publishing does when an async dispatch queue is full."""
+
+    BLOCK = "block"  # Wait until the worker makes room
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued event
+    SPILL = "spill"  # Write events to a file and deliver them later, in order
+
+
+class _Shard:
+    """One bounded queue and the worker thread draining it."""
+
+    def __init__(
+        self,
+        name: str,
+        deliver: Deliver,
+        maxsize: int,
+        overflow: OverflowPolicy,
+        spill_path: Path | None,
+    ) -> None:
+        self._deliver = deliver
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._spill_path = spill_path
+        self._spill_file: BinaryIO | None = None
+        self._queue: deque[tuple[str, dict[str, Any]]] = deque()
+        self._spilled = 0
+        # Events queued, spilled or being delivered
+        self._pending = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def put(self, topic: str, data: dict[str, Any]) -> bool:
+        """Queue an event, applying the overflow policy. Returns False once closed."""
+        in_worker = getattr(_worker, "active", False)
+        with self._cond:
+            if self._closed:
+                return False
+            full = len(self._queue) >= self._maxsize
+            # Once anything is spilled, later events follow it to disk to keep ordering
+            if self._overflow is OverflowPolicy.SPILL and (full or self._spilled):
+                if self._spill(topic, data):
+                    self._pending += 1
+                    self._cond.notify_all()
+                    return True
+            elif full and self._overflow is OverflowPolicy.DROP_OLDEST:
+                dropped_topic, _ = self._queue.popleft()
+                self._pending -= 1
+                EVENTS_DROPPED.labels(dropped_topic).inc()
+                full = False
+
+            while (full or self._spilled) and not in_worker:
+                self._cond.wait()
+                if self._closed:
+                    return False
+                full = len(self._queue) >= self._maxsize
+            self._queue.append((topic, data))
+            self._pending += 1
+            self._cond.notify_all()
+            return True
+
+    def _spill(self, topic: str, data: dict[str, Any]) -> bool:
+        """Append an event to the spill file. Returns False if it cannot be pickled."""
+        try:
+            record = pickle.dumps((topic, data), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Cannot spill event for {topic}, waiting for queue room: {e}")
+            return False
+        if self._spill_file is None:
+            assert self._spill_path is not None
+            self._spill_file = open(self._spill_path, "w+b")  # noqa: SIM115
+        self._spill_file.write(record)
+        self._spilled += 1
+        EVENTS_SPILLED.labels(topic).inc()
+        return True
+
+    def _load_spill(self) -> list[tuple[str, dict[str, Any]]]:
+        """Read back and reset the spill file. Caller holds the lock."""
+        assert self._spill_file is not None
+        events = []
+        self._spill_file.flush()
+        self._spill_file.seek(0)
+        for _ in range(self._spilled):
+            events.append(pickle.load(self._spill_file))
+        self._spill_file.seek(0)
+        self._spill_file.truncate()
+        self._spilled = 0
+        return events
+
+    def _run(self) -> None:
+        _worker.active = True
+        while True:
+            with self._cond:
+                while not self._queue and not self._spilled and not self._closed:
+                    self._cond.wait()
+                if self._queue:
+                    # Queued events are always older than spilled ones
+                    batch = list(self._queue)
+                    self._queue.clear()
+                elif self._spilled:
+                    batch = self._load_spill()
+                else:
+                    # Closed and empty; only the worker touches the spill file from here
+                    if self._spill_file is not None:
+                        self._spill_file.close()
+                        self._spill_file = None
+                    return
+                self._cond.notify_all()
+
+            for topic, data in batch:
+                try:
+                    self._deliver(topic, data)
+                except Exception as e:
+                    logger.error(f"Error delivering event for {topic}: {e}", exc_info=True)
+
+            with self._cond:
+                self._pending -= len(batch)
+                if not self._pending:
+                    self._cond.notify_all()
+
+    def wait_idle(self, deadline: float | None) -> bool:
+        """Wait until every accepted event has been delivered."""
+        with self._cond:
+            while self._pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def depth(self) -> int:
+        """Number of events not yet delivered."""
+        with self._cond:
+            return self._pending
+
+    def close(self, deadline: float | None) -> bool:
+        """Stop accepting events and stop the worker once the queue is empty.
+
+        Returns:
+            True if the worker exited, False if it is still delivering events.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        if self._thread.is_alive():
+            logger.warning(
+                f"{self._thread.name} still has {self.depth()} undelivered events after close"
+            )
+            return False
+        return True
+
+
+class AsyncDispatcher:
+    """Delivers events on worker threads through bounded, topic-sharded queues."""
+
+    def __init__(
+        self,
+        deliver: Deliver,
+        workers: int = 1,
+        queue_size: int = 1000,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        spill_dir: Path | None = None,
+    ) -> None:
+        """Start the dispatcher's worker threads.
+
+        Args:
+            deliver: Called on a worker thread with each (topic, data) event.
+            workers: Number of shards, each with its own queue and worker thread.
+            queue_size: Maximum events held in memory per shard.
+            overflow: What to do when a shard's queue is full.
+            spill_dir: Directory for spill files (a temporary directory if omitted).
+
+        Raises:
+            ValueError: If workers or queue_size is not positive.
+        """
+        if workers < 1 or queue_size < 1:
+            raise ValueError("workers and queue_size must be positive")
+        self._spill_root: Path | None = None
+        if overflow is OverflowPolicy.SPILL:
+            if spill_dir is not None:
+                spill_dir.mkdir(parents=True, exist_ok=True)
+            self._spill_root = Path(tempfile.mkdtemp(prefix="eventbus-", dir=spill_dir))
+        self._shards = [
+            _Shard(
+                f"eventbus-worker-{i}",
+                deliver,
+                queue_size,
+                overflow,
+                self._spill_root / f"shard-{i}.spill" if self._spill_root else None,
+            )
+            for i in range(workers)
+        ]
+
+    def _shard_for(self, topic: str) -> _Shard:
+        if len(self._shards) == 1:
+            return self._shards[0]
+        return self._shards[zlib.crc32(topic.encode()) % len(self._shards)]
+
+    def submit(self, topic: str, data: dict[str, Any]) -> bool:
+        """Queue an event for delivery. Returns False if the dispatcher is closed."""
+        return self._shard_for(topic).put(topic, data)
+
+    def depth(self) -> int:
+        """Number of accepted events not yet delivered."""
+        return sum(shard.depth() for shard in self._shards)
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait until every accepted event has been delivered.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            True if all events were delivered, False on timeout.
+
+        Raises:
+            RuntimeError: If called from an event handler.
+        """
+        if getattr(_worker, "active", False):
+            raise RuntimeError("Cannot drain the event bus from an event handler")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        return all(shard.wait_idle(deadline) for shard in self._shards)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Deliver outstanding events, then stop the workers and remove spill files.
+
+        Workers still delivering when the timeout runs out keep running in the
+        background; their spill files are left in place so no event is lost.
+        """
+        if getattr(_worker, "active", False):
+            raise RuntimeError("Cannot close the event bus from an event handler")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        stopped = [shard.close(deadline) for shard in self._shards]
+        if self._spill_root is not None:
+            if all(stopped):
+                shutil.rmtree(self._spill_root, ignore_errors=True)
+            else:
+                logger.warning(
+                    f"Leaving spill files in {self._spill_root}: events are still undelivered"
+                )
@@ -2,7 +2,7 @@
 
 import logging
 import sqlite3
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping
 from enum import Enum
 from typing import Any
 
@@ -228,6 +228,11 @@ class RestrictedEventBus:
         self._permissions.require(Permission.EVENT_SUBSCRIBE)
         self._event_bus.subscribe(topic, callback)
 
+    def unsubscribe(self, topic: str, callback: Callable[[dict[str, Any]], None]) -> bool:
+        """Unsubscribe from event with permission check."""
+        self._permissions.require(Permission.EVENT_SUBSCRIBE)
+        return self._event_bus.unsubscribe(topic, callback)
+
 
 class RestrictedSkillContext:
     """Restricted context provided to skills with permission enforcement."""
@@ -251,6 +256,10 @@ class RestrictedSkillContext:
         """Subscribe to event."""
         self._restricted_event_bus.subscribe(topic, callback)
 
+    def unsubscribe(self, topic: str, callback: Callable[[dict[str, Any]], None]) -> bool:
+        """Unsubscribe from event."""
+        return self._restricted_event_bus.unsubscribe(topic, callback)
+
     def get_skill(self, name: str) -> Any:
         """Get a skill app."""
         self._permissions.require(Permission.SKILL_CALL)
@@ -260,10 +269,25 @@ class RestrictedSkillContext:
         """Get value from cache."""
         return self._ctx.cache_get(key)
 
-    def cache_set(self, key: str, value: Any, ttl: int | None = None) -> None:
+    def cache_set(self, key: str, value: Any, ttl: float | None = None) -> None:
         """Set value in cache."""
         self._ctx.cache_set(key, value, ttl)
 
+    def cache_get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Get several values from cache."""
+        result: dict[str, Any] = self._ctx.cache_get_many(keys)
+        return result
+
+    def cache_set_many(self, items: Mapping[str, Any], ttl: float | None = None) -> None:
+        """Set several values in cache."""
+        self._ctx.cache_set_many(items, ttl)
+
+    def cache_get_or_compute(
+        self, key: str, compute: Callable[[], Any], ttl: float | None = None
+    ) -> Any:
+        """Get value from cache, computing it once on a miss."""
+        return self._ctx.cache_get_or_compute(key, compute, ttl)
+
     def cache_has(self, key: str) -> bool:
         """Check if key exists in cache."""
         result: bool = self._ctx.cache_has(key)
@@ -283,6 +307,21 @@ class RestrictedSkillContext:
         result: int = self._ctx.cache_prune_expired()
         return result
 
+    def cache_stats(self) -> Any:
+        """Get cache statistics."""
+        return self._ctx.cache_stats()
+
+    def cached(
+        self,
+        ttl: float | None = None,
+        invalidate_on: Any = (),
+        key: Callable[..., Any] | None = None,
+    ) -> Callable[[Callable[..., Any]], Any]:
+        """Memoize a function in the cache; event invalidation requires subscribe permission."""
+        if invalidate_on:
+            self._permissions.require(Permission.EVENT_SUBSCRIBE)
+        return self._ctx.cached(ttl, invalidate_on, key)
+
     def get_config(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
         return self._ctx.get_config(key, default)
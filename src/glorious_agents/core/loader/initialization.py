@@ -4,10 +4,11 @@ import importlib
 import importlib.util
 import logging
 import sys
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from glorious_agents.config import config
-from glorious_agents.core.db import init_skill_schema
+from glorious_agents.core.migrations import apply_skill_schemas
 from glorious_agents.core.runtime import get_ctx
 
 if TYPE_CHECKING:
@@ -17,7 +18,8 @@ logger = logging.getLogger(__name__)
 
 
 def init_schemas(sorted_skills: list[str], skills_data: dict[str, dict[str, Any]]) -> None:
-    """Initialize database schemas for all skills."""
+    """Initialize database schemas for all skills in one pass."""
+    schemas: dict[str, Path] = {}
     for skill_name in sorted_skills:
         manifest = skills_data[skill_name]
         schema_file = manifest.get("schema_file")
@@ -34,10 +36,13 @@ def init_schemas(sorted_skills: list[str], skills_data: dict[str, dict[str, Any]
         schema_path = skill_path / schema_file
 
         if schema_path.exists():
-            init_skill_schema(skill_name, schema_path)
+            schemas[skill_name] = schema_path
         else:
             logger.debug(f"Schema file {schema_path} not found for skill {skill_name}")
 
+    if schemas:
+        apply_skill_schemas(schemas)
+
 
 def load_skill_entry(entry_point: str, skill_name: str, is_local: bool = False) -> "typer.Typer":
     """Load a skill's Typer app from its entry point."""
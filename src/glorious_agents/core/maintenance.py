@@ -0,0 +1,83 @@
+"""Periodic maintenance jobs declared by skills.
+
+Skills mark module-level functions that keep their data in shape - pruning
+expired rows, compacting tables - with :func:`maintenance`::
+
+    @maintenance(interval=300)
+    def prune_expired() -> int: ...
+
+The daemon runs every marked function in the background on its interval, so
+this work stays off the request path. Marked functions take no arguments.
+"""
+
+import importlib
+import inspect
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from glorious_agents.core.registry import get_registry
+
+logger = logging.getLogger(__name__)
+
+MAINTENANCE_ATTR = "__maintenance_interval__"
+
+
+@dataclass(frozen=True)
+class MaintenanceJob:
+    """A skill function the daemon runs periodically."""
+
+    skill: str
+    name: str
+    interval: float
+    func: Callable[[], Any]
+
+
+def maintenance[F: Callable[..., Any]](interval: float) -> Callable[[F], F]:
+    """Mark a skill function to be run periodically by the daemon.
+
+    Args:
+        interval: Seconds between runs.
+
+    Returns:
+        Decorator that records the interval on the function and returns it unchanged.
+
+    Raises:
+        ValueError: If interval is not positive.
+    """
+    if interval <= 0:
+        raise ValueError("interval must be a positive number of seconds")
+
+    def decorator(func: F) -> F:
+        setattr(func, MAINTENANCE_ATTR, interval)
+        return func
+
+    return decorator
+
+
+def get_maintenance_interval(func: Any) -> float | None:
+    """Return the interval of a maintenance function, or None if it is not one."""
+    interval = getattr(func, MAINTENANCE_ATTR, None)
+    return interval if isinstance(interval, int | float) else None
+
+
+def find_maintenance_jobs() -> list[MaintenanceJob]:
+    """Collect the maintenance functions of all registered skills.
+
+    Skills whose module cannot be imported are skipped.
+    """
+    jobs: list[MaintenanceJob] = []
+    for manifest in get_registry().list_all():
+        module_path = manifest.entry_point.split(":")[0]
+        try:
+            module = importlib.import_module(module_path)
+        except ImportError as e:
+            logger.warning(f"Skipping maintenance jobs of skill '{manifest.name}': {e}")
+            continue
+        for name, func in inspect.getmembers(module, callable):
+            interval = get_maintenance_interval(func)
+            # Only functions defined by the skill, not ones it imported
+            if interval is not None and getattr(func, "__module__", None) == module.__name__:
+                jobs.append(MaintenanceJob(manifest.name, name, interval, func))
+    return jobs
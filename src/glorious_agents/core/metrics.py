@@ -0,0 +1,485 @@
+"""Process-wide metrics with Prometheus text and JSON export.
+
+Counters, gauges and histograms are sharded per thread: each thread only
+updates its own slots, so recording takes no locks and never contends with
+other request threads. Readers sum the shards when exporting, which may lag
+in-progress updates by a sample but never loses them.
+
+Example:
+    ```python
+    from glorious_agents.core.metrics import get_metrics
+
+    requests = get_metrics().counter("my_requests_total", "Requests handled", ["kind"])
+    requests.labels("read").inc()
+    print(get_metrics().render_prometheus())
+    ```
+"""
+
+import logging
+import math
+import os
+import sys
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from sub-millisecond cache hits to slow syncs
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Shards:
+    """Per-thread arrays of floats that are summed on read."""
+
+    __slots__ = ("_size", "_local", "_shards", "_lock")
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._local = threading.local()
+        self._shards: list[list[float]] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> list[float]:
+        """Return the calling thread's shard, creating it on first use."""
+        try:
+            shard: list[float] = self._local.shard
+        except AttributeError:
+            shard = [0.0] * self._size
+            # Only taken once per thread, never on the recording path
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def totals(self) -> list[float]:
+        """Sum all shards column-wise."""
+        with self._lock:
+            shards = list(self._shards)
+        totals = [0.0] * self._size
+        for shard in shards:
+            for i, value in enumerate(shard):
+                totals[i] += value
+        return totals
+
+
+class _CounterChild:
+    """A single labelled counter series."""
+
+    __slots__ = ("_shards",)
+
+    def __init__(self) -> None:
+        self._shards = _Shards(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the counter."""
+        self._shards.get()[0] += amount
+
+    def value(self) -> float:
+        """Return the current total."""
+        return self._shards.totals()[0]
+
+
+class _GaugeChild(_CounterChild):
+    """A single labelled gauge series (tracked as a sum of per-thread deltas)."""
+
+    __slots__ = ()
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrement the gauge."""
+        self._shards.get()[0] -= amount
+
+
+class _HistogramChild:
+    """A single labelled histogram series."""
+
+    __slots__ = ("_buckets", "_shards")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self._buckets = buckets
+        # One slot per bucket, then +Inf, sum and count
+        self._shards = _Shards(len(buckets) + 3)
+
+    def observe(self, value: float) -> None:
+        """Record an observation."""
+        shard = self._shards.get()
+        # First bucket whose upper bound is >= value (the +Inf slot if none)
+        shard[bisect_left(self._buckets, value)] += 1
+        shard[-2] += value
+        shard[-1] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return cumulative bucket counts, sum and count."""
+        totals = self._shards.totals()
+        cumulative: dict[str, float] = {}
+        running = 0.0
+        for bound, count in zip(self._buckets, totals, strict=False):
+            running += count
+            cumulative[_format_value(bound)] = running
+        cumulative["+Inf"] = totals[-1]
+        return {"buckets": cumulative, "sum": totals[-2], "count": totals[-1]}
+
+
+class _Metric(ABC):
+    """Base class for a metric family with optional labels."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], Any] = {}
+
+    @abstractmethod
+    def _new_child(self) -> Any:
+        """Create the series for one set of label values."""
+
+    def labels(self, *values: Any) -> Any:
+        """Get the series for the given label values (in labelnames order)."""
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            # dict.setdefault is atomic, so racing threads end up with one child
+            child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _unlabelled(self) -> Any:
+        if self.labelnames:
+            raise ValueError(f"{self.name} requires labels {self.labelnames}")
+        return self.labels()
+
+    def series(self) -> list[tuple[dict[str, str], Any]]:
+        """List (labels, child) pairs for export."""
+        return [
+            (dict(zip(self.labelnames, key, strict=True)), child)
+            for key, child in list(self._children.items())
+        ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment an unlabelled counter."""
+        self._unlabelled().inc(amount)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down (e.g. in-flight requests)."""
+
+    type_name = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment an unlabelled gauge."""
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrement an unlabelled gauge."""
+        self._unlabelled().dec(amount)
+
+
+class Histogram(_Metric):
+    """Distribution of observations (e.g. latencies in seconds)."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record an observation on an unlabelled histogram."""
+        self._unlabelled().observe(value)
+
+
+# A collector returns gauge samples computed at export time: label dicts and values
+Collector = Callable[[], Iterable[tuple[dict[str, str], float]]]
+
+
+class MetricsRegistry:
+    """Registry of metric families and export-time collectors."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: dict[str, tuple[str, Collector]] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} already registered differently")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        result: Counter = self._register(Counter(name, documentation, labelnames))
+        return result
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        result: Gauge = self._register(Gauge(name, documentation, labelnames))
+        return result
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        result: Histogram = self._register(Histogram(name, documentation, labelnames, buckets))
+        return result
+
+    def register_collector(self, name: str, documentation: str, collector: Collector) -> None:
+        """Register a gauge whose samples are computed when metrics are exported.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            collector: Callable returning (labels, value) pairs
+        """
+        with self._lock:
+            self._collectors[name] = (documentation, collector)
+
+    def unregister_collector(self, name: str) -> None:
+        """Remove a collector registered with register_collector()."""
+        with self._lock:
+            self._collectors.pop(name, None)
+
+    def _collect(self) -> list[tuple[str, str, list[tuple[dict[str, str], float]]]]:
+        with self._lock:
+            collectors = list(self._collectors.items())
+        results = []
+        for name, (documentation, collector) in collectors:
+            try:
+                results.append((name, documentation, list(collector())))
+            except Exception as e:
+                logger.debug(f"Metrics collector {name} failed: {e}")
+        return results
+
+    def snapshot(self) -> dict[str, Any]:
+        """Export all metrics as a JSON-serializable dictionary."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        result: dict[str, Any] = {}
+        for metric in metrics:
+            samples = []
+            for labels, child in metric.series():
+                if isinstance(metric, Histogram):
+                    samples.append({"labels": labels, **child.snapshot()})
+                else:
+                    samples.append({"labels": labels, "value": child.value()})
+            result[metric.name] = {
+                "type": metric.type_name,
+                "help": metric.documentation,
+                "samples": samples,
+            }
+        for name, documentation, collected in self._collect():
+            result[name] = {
+                "type": "gauge",
+                "help": documentation,
+                "samples": [{"labels": labels, "value": value} for labels, value in collected],
+            }
+        return result
+
+    def render_prometheus(self) -> str:
+        """Export all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for name, family in self.snapshot().items():
+            lines.append(f"# HELP {name} {_escape_help(family['help'])}")
+            lines.append(f"# TYPE {name} {family['type']}")
+            for sample in family["samples"]:
+                labels = sample["labels"]
+                if family["type"] == "histogram":
+                    for bound, count in sample["buckets"].items():
+                        bucket_labels = _format_labels({**labels, "le": bound})
+                        lines.append(f"{name}_bucket{bucket_labels} {_format_value(count)}")
+                    label_text = _format_labels(labels)
+                    lines.append(f"{name}_sum{label_text} {_format_value(sample['sum'])}")
+                    lines.append(f"{name}_count{label_text} {_format_value(sample['count'])}")
+                else:
+                    value = _format_value(sample["value"])
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def process_rss_bytes() -> float | None:
+    """Return the resident set size of this process, if it can be determined."""
+    try:
+        import psutil
+
+        return float(psutil.Process().memory_info().rss)
+    except ImportError:
+        pass
+
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm") as f:
+                return float(int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE"))
+        except (OSError, ValueError, IndexError):
+            return None
+    return None
+
+
+def track_sqlite_busy(engine: Any) -> None:
+    """Count "database is locked/busy" errors raised through a SQLAlchemy engine.
+
+    Args:
+        engine: SQLAlchemy engine to instrument
+    """
+    from sqlalchemy import event
+
+    def handle_error(context: Any) -> None:
+        message = str(context.original_exception).lower()
+        if "database is locked" in message or "database is busy" in message:
+            SQLITE_BUSY.inc()
+
+    event.listen(engine, "handle_error", handle_error)
+
+
+def _collect_rss() -> Iterable[tuple[dict[str, str], float]]:
+    rss = process_rss_bytes()
+    return [] if rss is None else [({}, rss)]
+
+
+# Global registry instance
+_registry: MetricsRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Get the global metrics registry.
+
+    Returns:
+        Global MetricsRegistry instance
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = MetricsRegistry()
+                _registry.register_collector(
+                    "glorious_process_resident_memory_bytes",
+                    "Resident set size of the process in bytes",
+                    _collect_rss,
+                )
+    return _registry
+
+
+# Well-known metrics shared by the daemons, event bus and database layer
+REQUESTS_TOTAL = get_metrics().counter(
+    "glorious_daemon_requests_total",
+    "Daemon requests handled",
+    ["route", "skill", "method", "status"],
+)
+REQUEST_DURATION = get_metrics().histogram(
+    "glorious_daemon_request_duration_seconds",
+    "Daemon request latency in seconds",
+    ["route", "skill", "method"],
+)
+REQUESTS_IN_FLIGHT = get_metrics().gauge(
+    "glorious_daemon_requests_in_flight", "Daemon requests currently being handled"
+)
+IPC_QUEUE_DEPTH = get_metrics().gauge(
+    "glorious_daemon_ipc_queue_depth", "IPC requests waiting for a worker thread"
+)
+EVENTS_PUBLISHED = get_metrics().counter(
+    "glorious_eventbus_published_total", "Events published on the event bus", ["topic"]
+)
+RPC_CACHE_REQUESTS = get_metrics().counter(
+    "glorious_daemon_rpc_cache_requests_total",
+    "Lookups in the daemon RPC response cache",
+    ["skill", "method", "result"],
+)
+RPC_CACHE_INVALIDATIONS = get_metrics().counter(
+    "glorious_daemon_rpc_cache_invalidations_total",
+    "RPC response cache invalidations triggered by event topics",
+    ["topic"],
+)
+EVENTS_DROPPED = get_metrics().counter(
+    "glorious_eventbus_dropped_total",
+    "Events discarded because an async dispatch queue was full",
+    ["topic"],
+)
+EVENTS_SPILLED = get_metrics().counter(
+    "glorious_eventbus_spilled_total",
+    "Events written to disk because an async dispatch queue was full",
+    ["topic"],
+)
+SQLITE_BUSY = get_metrics().counter(
+    "glorious_sqlite_busy_total",
+    "SQLite operations that failed because the database was locked or busy",
+)
+CACHED_CALLS = get_metrics().counter(
+    "glorious_skill_cached_calls_total",
+    "Calls to skill functions memoized with SkillContext.cached()",
+    ["function", "result"],
+)
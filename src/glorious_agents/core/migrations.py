@@ -1,30 +1,63 @@
-"""Database migration system for schema versioning."""
+"""Database migration system for schema versioning.
+
+Startup goes through :func:`apply_skill_schemas`, which handles every skill
+on one connection: it reads the ``_migrations`` and ``_skill_schemas`` state
+once, applies each skill's pending SQL in a single transaction, and stores a
+fingerprint of all schema and migration files. When the files have not
+changed since, startup costs a single query.
+"""
 
 import hashlib
+import logging
+import sqlite3
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from glorious_agents.core.db import get_connection
 
+logger = logging.getLogger(__name__)
+
+# Bump to force one full pass on every database, e.g. when the fingerprint inputs change
+SCHEMA_RUNNER_VERSION = 1
+
+_STATE_SQL = """
+    CREATE TABLE IF NOT EXISTS _migrations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        skill_name TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        migration_file TEXT NOT NULL,
+        checksum TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(skill_name, version)
+    );
+    CREATE INDEX IF NOT EXISTS idx_migrations_skill ON _migrations(skill_name);
+    CREATE TABLE IF NOT EXISTS _skill_schemas (
+        skill_name TEXT PRIMARY KEY,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE IF NOT EXISTS _schema_state (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+"""
+
+
+def _init_state_tables(conn: sqlite3.Connection) -> None:
+    """Create the tracking tables, adding the legacy schema checksum column if missing."""
+    conn.executescript(_STATE_SQL)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(_skill_schemas)")}
+    if "checksum" not in columns:
+        conn.execute("ALTER TABLE _skill_schemas ADD COLUMN checksum TEXT")
+    conn.commit()
+
 
 def init_migrations_table() -> None:
     """Initialize the migrations tracking table."""
     conn = get_connection()
     try:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS _migrations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                skill_name TEXT NOT NULL,
-                version INTEGER NOT NULL,
-                migration_file TEXT NOT NULL,
-                checksum TEXT NOT NULL,
-                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(skill_name, version)
-            )
-        """)
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_migrations_skill ON _migrations(skill_name)")
-        conn.commit()
+        _init_state_tables(conn)
     finally:
         conn.close()
 
@@ -109,6 +142,9 @@ def run_migrations(skill_name: str, migrations_dir: Path) -> list[int]:
     Migration files should be named: {version}_{description}.sql
     Example: 001_initial_schema.sql, 002_add_index.sql
 
+    All pending migrations are applied in a single transaction, so either
+    all of them are recorded or none is.
+
     Args:
         skill_name: Name of the skill.
         migrations_dir: Directory containing migration files.
@@ -119,26 +155,217 @@ def run_migrations(skill_name: str, migrations_dir: Path) -> list[int]:
     if not migrations_dir.exists():
         return []
 
-    init_migrations_table()
-    current_version = get_current_version(skill_name)
+    conn = get_connection()
+    try:
+        _init_state_tables(conn)
+        applied = _load_applied(conn, skill_name).get(skill_name, {})
+        return _apply_migrations(conn, skill_name, migrations_dir, applied)
+    finally:
+        conn.close()
 
-    # Find migration files
-    migration_files = sorted(migrations_dir.glob("*.sql"))
-    applied_versions = []
 
-    for migration_file in migration_files:
+def _migration_files(migrations_dir: Path) -> list[tuple[int, Path]]:
+    """List (version, path) of migration files, skipping names without a version prefix."""
+    files = []
+    for migration_file in sorted(migrations_dir.glob("*.sql")):
         # Parse version from filename (e.g., "001_initial.sql" -> 1)
         try:
-            version_str = migration_file.stem.split("_")[0]
-            version = int(version_str)
+            version = int(migration_file.stem.split("_")[0])
         except (ValueError, IndexError):
             continue  # Skip files that don't match pattern
+        files.append((version, migration_file))
+    return files
+
+
+def _load_applied(
+    conn: sqlite3.Connection, skill_name: str | None = None
+) -> dict[str, dict[int, str]]:
+    """Load applied migration checksums by skill and version."""
+    if skill_name:
+        rows = conn.execute(
+            "SELECT skill_name, version, checksum FROM _migrations WHERE skill_name = ?",
+            (skill_name,),
+        )
+    else:
+        rows = conn.execute("SELECT skill_name, version, checksum FROM _migrations")
+    applied: dict[str, dict[int, str]] = {}
+    for name, version, checksum in rows:
+        applied.setdefault(name, {})[version] = checksum
+    return applied
+
+
+def _run_in_transaction(
+    conn: sqlite3.Connection, scripts: list[str], records: list[tuple[str, tuple[Any, ...]]]
+) -> None:
+    """Execute SQL scripts and tracking inserts in one transaction, rolling back on error."""
+    try:
+        # executescript() commits any open transaction first, so BEGIN is part of the script;
+        # the ";" separators keep a file without a trailing semicolon from merging into the next
+        conn.executescript("BEGIN;\n" + "\n;\n".join(scripts) + "\n;")
+        for sql, params in records:
+            conn.execute(sql, params)
+        conn.commit()
+    except BaseException:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+
+
+def _apply_migrations(
+    conn: sqlite3.Connection,
+    skill_name: str,
+    migrations_dir: Path,
+    applied: dict[int, str],
+    base_schema: str | None = None,
+) -> list[int]:
+    """Apply a skill's pending migrations, preceded by base_schema if given, in one transaction."""
+    current_version = max(applied, default=0)
+    scripts = [base_schema] if base_schema is not None else []
+    records: list[tuple[str, tuple[Any, ...]]] = []
+    versions = []
+
+    for version, migration_file in _migration_files(migrations_dir):
+        content = migration_file.read_text()
+        checksum = get_migration_checksum(content)
+        if version <= current_version:
+            if version in applied and applied[version] != checksum:
+                logger.warning(
+                    f"Migration {skill_name} v{version} checksum mismatch: "
+                    f"recorded {applied[version]}, file has {checksum}. Do not modify applied migrations."
+                )
+            continue
+        scripts.append(content)
+        records.append(
+            (
+                "INSERT INTO _migrations (skill_name, version, migration_file, checksum) VALUES (?, ?, ?, ?)",
+                (skill_name, version, migration_file.name, checksum),
+            )
+        )
+        versions.append(version)
+
+    if scripts:
+        _run_in_transaction(conn, scripts, records)
+        if versions:
+            logger.info(f"Applied migrations {versions} for skill '{skill_name}'")
+    return versions
+
+
+def schema_fingerprint(schemas: Mapping[str, Path]) -> str:
+    """
+    Fingerprint a set of skill schema files and their migrations.
+
+    Uses each file's path, size and modification time rather than its
+    content, so computing it needs no reads. A file that is touched without
+    changes only costs one full (idempotent) pass.
 
-        if version > current_version:
-            apply_migration(skill_name, version, migration_file)
-            applied_versions.append(version)
+    Args:
+        schemas: Mapping of skill name to schema file path.
+
+    Returns:
+        Hex digest that changes whenever any of the files changes.
+    """
+    digest = hashlib.sha256(f"runner:{SCHEMA_RUNNER_VERSION}".encode())
+    for skill_name in sorted(schemas):
+        schema_path = schemas[skill_name]
+        paths = [schema_path]
+        migrations_dir = schema_path.parent / "migrations"
+        if migrations_dir.is_dir():
+            paths.extend(path for _, path in _migration_files(migrations_dir))
+        digest.update(f"\0skill:{skill_name}".encode())
+        for path in paths:
+            try:
+                stat = path.stat()
+                digest.update(f"\0{path}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+            except OSError:
+                digest.update(f"\0{path}:missing".encode())
+    return digest.hexdigest()
+
+
+def _stored_fingerprint(conn: sqlite3.Connection) -> str | None:
+    """Return the fingerprint of the last full pass, or None on a fresh database."""
+    try:
+        row = conn.execute("SELECT value FROM _schema_state WHERE key = 'fingerprint'").fetchone()
+    except sqlite3.OperationalError:
+        return None  # State table not created yet
+    return row[0] if row else None
+
+
+def apply_skill_schemas(
+    schemas: Mapping[str, Path], use_fingerprint: bool = True
+) -> dict[str, list[int]]:
+    """
+    Bring the schemas of several skills up to date on one connection.
+
+    Skills with a ``migrations`` directory next to their schema file get the
+    base schema (on first run) plus all pending migrations; other skills get
+    their legacy schema file executed when its checksum differs from the one
+    recorded in ``_skill_schemas``. Each skill's work runs in one transaction.
+
+    Args:
+        schemas: Mapping of skill name to schema file path; missing files are skipped.
+        use_fingerprint: Skip everything when the files match the last full
+            pass, and record the fingerprint afterwards. Pass False when only
+            some skills are given, e.g. when reloading one skill.
+
+    Returns:
+        Mapping of skill name to the migration versions applied, for skills that applied any.
 
-    return applied_versions
+    Raises:
+        sqlite3.Error: If a schema or migration fails; that skill's transaction is rolled back.
+    """
+    fingerprint = schema_fingerprint(schemas) if use_fingerprint else None
+    conn = get_connection()
+    try:
+        if fingerprint is not None and _stored_fingerprint(conn) == fingerprint:
+            return {}
+
+        _init_state_tables(conn)
+        applied = _load_applied(conn)
+        legacy_checksums = dict(
+            conn.execute("SELECT skill_name, checksum FROM _skill_schemas").fetchall()
+        )
+
+        results: dict[str, list[int]] = {}
+        for skill_name, schema_path in schemas.items():
+            if not schema_path.exists():
+                continue
+            schema_sql = schema_path.read_text()
+            migrations_dir = schema_path.parent / "migrations"
+            if migrations_dir.exists():
+                skill_applied = applied.get(skill_name, {})
+                # Only apply the base schema if no migrations have been run yet
+                base_schema = None if skill_applied else schema_sql
+                versions = _apply_migrations(
+                    conn, skill_name, migrations_dir, skill_applied, base_schema
+                )
+                if versions:
+                    results[skill_name] = versions
+            else:
+                checksum = get_migration_checksum(schema_sql)
+                if legacy_checksums.get(skill_name) == checksum:
+                    continue
+                _run_in_transaction(
+                    conn,
+                    [schema_sql],
+                    [
+                        (
+                            "INSERT INTO _skill_schemas (skill_name, checksum) VALUES (?, ?) "
+                            "ON CONFLICT(skill_name) DO UPDATE SET checksum = excluded.checksum",
+                            (skill_name, checksum),
+                        )
+                    ],
+                )
+
+        if fingerprint is not None:
+            conn.execute(
+                "INSERT INTO _schema_state (key, value) VALUES ('fingerprint', ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (fingerprint,),
+            )
+            conn.commit()
+        return results
+    finally:
+        conn.close()
 
 
 def create_migration_file(skill_name: str, migrations_dir: Path, description: str) -> Path:
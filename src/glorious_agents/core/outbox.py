@@ -0,0 +1,213 @@
+"""Durable event outbox in the unified database.
+
+Events appended with :func:`append` are written through the caller's own
+connection or session, so they commit or roll back together with the domain
+change that produced them. Consumers - possibly in another process - read
+them in order with an :class:`OutboxConsumer`, whose position is stored in
+the database so it resumes where it left off. :func:`compact` deletes events
+every registered consumer has acknowledged.
+
+Example:
+    ```python
+    with uow:
+        issue_repo.add(issue)
+        uow.record_event("issue_created", {"id": issue.id})
+
+    consumer = OutboxConsumer(get_connection(), "search-indexer")
+    for event in consumer.poll():
+        index(event.data)
+    consumer.ack()
+    ```
+"""
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from glorious_agents.core.serialization import dumps_json, loads_json
+
+OUTBOX_TABLE = "core_event_outbox"
+CURSOR_TABLE = "core_event_cursors"
+
+_SCHEMA = f"""
+    CREATE TABLE IF NOT EXISTS {OUTBOX_TABLE} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        topic TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        created_at REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS {CURSOR_TABLE} (
+        consumer TEXT PRIMARY KEY,
+        position INTEGER NOT NULL,
+        updated_at REAL NOT NULL
+    );
+"""
+
+
+@dataclass(frozen=True)
+class OutboxEvent:
+    """An event read from the outbox."""
+
+    id: int
+    topic: str
+    data: dict[str, Any]
+    created_at: float
+
+
+def _execute(target: Any, sql: str, params: tuple[Any, ...] = ()) -> Any:
+    """Run SQL on a sqlite3 connection, SQLAlchemy connection or SQLModel session."""
+    if hasattr(target, "exec_driver_sql"):
+        return target.exec_driver_sql(sql, params)
+    if hasattr(target, "connection") and not isinstance(target, sqlite3.Cursor):
+        return target.connection().exec_driver_sql(sql, params)
+    return target.execute(sql, params)
+
+
+def init_outbox(target: Any) -> None:
+    """Create the outbox and cursor tables if they do not exist."""
+    for statement in _SCHEMA.split(";"):
+        if statement.strip():
+            _execute(target, statement)
+
+
+def append(target: Any, topic: str, data: dict[str, Any]) -> int:
+    """Append an event to the outbox inside the caller's transaction.
+
+    The caller commits; nothing is written if its transaction rolls back.
+
+    Args:
+        target: sqlite3 connection, SQLAlchemy connection or SQLModel session.
+        topic: Event topic name.
+        data: JSON-serializable event payload.
+
+    Returns:
+        The event's outbox id.
+    """
+    sql = f"INSERT INTO {OUTBOX_TABLE} (topic, payload, created_at) VALUES (?, ?, ?)"
+    params = (topic, dumps_json(data).decode("utf-8"), time.time())
+    try:
+        result = _execute(target, sql, params)
+    except Exception as e:
+        if "no such table" not in str(e):
+            raise
+        init_outbox(target)
+        result = _execute(target, sql, params)
+    return int(result.lastrowid)
+
+
+def compact(conn: sqlite3.Connection, max_age_seconds: float | None = None) -> int:
+    """Delete events that every registered consumer has acknowledged.
+
+    Args:
+        conn: Database connection; the deletion is committed.
+        max_age_seconds: Also delete events older than this, acknowledged or not,
+            so an abandoned consumer cannot make the outbox grow forever.
+
+    Returns:
+        Number of events deleted.
+    """
+    init_outbox(conn)
+    row = conn.execute(f"SELECT MIN(position) FROM {CURSOR_TABLE}").fetchone()
+    deleted = 0
+    if row and row[0] is not None:
+        deleted += conn.execute(f"DELETE FROM {OUTBOX_TABLE} WHERE id <= ?", (row[0],)).rowcount
+    if max_age_seconds is not None:
+        cutoff = time.time() - max_age_seconds
+        deleted += conn.execute(
+            f"DELETE FROM {OUTBOX_TABLE} WHERE created_at < ?", (cutoff,)
+        ).rowcount
+    conn.commit()
+    return deleted
+
+
+class OutboxConsumer:
+    """Reads outbox events in order and persists how far it has got.
+
+    A consumer name identifies one logical subscriber; any process that opens
+    a consumer with the same name continues from the last acknowledged event.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, name: str, from_end: bool = False) -> None:
+        """Open or register a consumer.
+
+        Args:
+            conn: Connection owned by the consumer; acknowledgements are committed on it.
+            name: Consumer name.
+            from_end: For a new consumer, skip events already in the outbox
+                instead of starting from the oldest one.
+        """
+        self._conn = conn
+        self.name = name
+        init_outbox(conn)
+        row = conn.execute(
+            f"SELECT position FROM {CURSOR_TABLE} WHERE consumer = ?", (name,)
+        ).fetchone()
+        if row is not None:
+            self._position = int(row[0])
+        else:
+            start = 0
+            if from_end:
+                start = conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {OUTBOX_TABLE}").fetchone()[
+                    0
+                ]
+            self._position = int(start)
+            self._save(self._position)
+        self._last_seen = self._position
+
+    @property
+    def position(self) -> int:
+        """Id of the last acknowledged event."""
+        return self._position
+
+    def poll(self, limit: int = 100) -> list[OutboxEvent]:
+        """Return up to limit events after the last one returned, oldest first.
+
+        Polling again without acknowledging continues after the events already
+        returned; unacknowledged events are redelivered only to a new consumer
+        instance (e.g. after a restart).
+        """
+        rows = self._conn.execute(
+            f"SELECT id, topic, payload, created_at FROM {OUTBOX_TABLE} "
+            "WHERE id > ? ORDER BY id LIMIT ?",
+            (self._last_seen, limit),
+        ).fetchall()
+        events = [OutboxEvent(row[0], row[1], loads_json(row[2]), row[3]) for row in rows]
+        if events:
+            self._last_seen = events[-1].id
+        return events
+
+    def ack(self, event_id: int | None = None) -> None:
+        """Acknowledge events up to and including event_id (default: all polled events)."""
+        position = self._last_seen if event_id is None else event_id
+        if position <= self._position:
+            return
+        self._position = position
+        self._last_seen = max(self._last_seen, position)
+        self._save(position)
+
+    def seek(self, event_id: int) -> None:
+        """Move the consumer to just after event_id, e.g. to replay older events."""
+        self._position = self._last_seen = event_id
+        self._save(event_id)
+
+    def lag(self) -> int:
+        """Number of events after the acknowledged position."""
+        row = self._conn.execute(
+            f"SELECT COUNT(*) FROM {OUTBOX_TABLE} WHERE id > ?", (self._position,)
+        ).fetchone()
+        return int(row[0])
+
+    def _save(self, position: int) -> None:
+        self._conn.execute(
+            f"INSERT INTO {CURSOR_TABLE} (consumer, position, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(consumer) DO UPDATE SET position = excluded.position, "
+            "updated_at = excluded.updated_at",
+            (self.name, position, time.time()),
+        )
+        self._conn.commit()
+
+    def delete(self) -> None:
+        """Unregister the consumer so it no longer holds back compaction."""
+        self._conn.execute(f"DELETE FROM {CURSOR_TABLE} WHERE consumer = ?", (self.name,))
+        self._conn.commit()
@@ -4,12 +4,71 @@ This module provides a base repository implementation that eliminates
 boilerplate CRUD code across skills while maintaining full type safety.
 """
 
-from typing import Any, Generic, TypeVar
+from collections.abc import Iterable, Iterator
+from typing import Any, Generic, TypeVar, cast
 
+from sqlalchemy import delete, insert, inspect, tuple_, update
+from sqlalchemy.engine import CursorResult
 from sqlmodel import Session, SQLModel, select
+from sqlmodel.sql.expression import Select, SelectOfScalar
 
 T = TypeVar("T", bound=SQLModel)
 
+# Rows or IDs per statement in bulk operations, well below SQLite's
+# bound-parameter limit
+BULK_BATCH_SIZE = 500
+
+
+def _batches(items: list[Any], size: int) -> Iterator[list[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def iter_keyset(
+    session: Session,
+    statement: Select[Any] | SelectOfScalar[Any],
+    order_by: Any,
+    key: Any,
+    batch_size: int = BULK_BATCH_SIZE,
+) -> Iterator[list[Any]]:
+    """Page through a SELECT with keyset (seek) pagination.
+
+    Each page continues after the last row of the previous one with
+    ``WHERE (order_by, key) > (last_order_by, last_key)`` instead of OFFSET,
+    so deep pages cost the same as the first. Model instances loaded for a
+    page are expunged from the session unless it already held them, so
+    memory stays flat however many rows are walked.
+
+    Args:
+        session: Session to query with
+        statement: SELECT of a single model, or of columns that include
+            order_by and key, with any filters applied
+        order_by: Column attribute to order by; should be indexed and NOT NULL
+        key: Unique column attribute that breaks ties, usually the primary key
+        batch_size: Rows per page
+
+    Yields:
+        Pages of up to batch_size model instances or rows, in ascending order
+    """
+    columns = [order_by] if order_by is key else [order_by, key]
+    last: list[Any] | None = None
+    while True:
+        page = statement.order_by(*columns).limit(batch_size)
+        if last is not None:
+            page = page.where(tuple_(*columns) > tuple_(*last))
+        known = set(session.identity_map.keys())
+        rows = list(session.exec(page))
+        if not rows:
+            return
+        for row in rows:
+            state = inspect(row, raiseerr=False)  # None for plain column rows
+            if state is not None and state.identity_key not in known:
+                session.expunge(row)
+        last = [getattr(rows[-1], column.key) for column in columns]
+        yield rows
+        if len(rows) < batch_size:
+            return
+
 
 class BaseRepository[T: SQLModel]:
     """Generic repository for CRUD operations.
@@ -56,6 +115,41 @@ class BaseRepository[T: SQLModel]:
         self.session.refresh(entity)
         return entity
 
+    def add_many(
+        self,
+        entities: Iterable[T],
+        return_ids: bool = True,
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> list[T]:
+        """Add many entities with batched multi-row INSERTs.
+
+        Unlike add(), entities are not refreshed after the insert.
+
+        Args:
+            entities: Entity instances to add
+            return_ids: If True, entities are added to the session and their
+                generated IDs are populated (INSERT ... RETURNING). If False,
+                rows are inserted with executemany and the entities are left
+                detached and untouched, which is faster for large imports.
+            batch_size: Entities per flush or statement
+
+        Returns:
+            The entities, in the order given
+
+        Note:
+            Caller must commit via UnitOfWork or session.
+        """
+        entities = list(entities)
+        for batch in _batches(entities, batch_size):
+            if return_ids:
+                self.session.add_all(batch)
+                self.session.flush()
+            else:
+                # Omit unset values so column and server defaults apply
+                rows = [entity.model_dump(exclude_none=True) for entity in batch]
+                self.session.execute(insert(self.model_class), rows)
+        return entities
+
     def get(self, id: int | str) -> T | None:
         """Get entity by ID.
 
@@ -80,6 +174,47 @@ class BaseRepository[T: SQLModel]:
         statement = select(self.model_class).limit(limit).offset(offset)
         return list(self.session.exec(statement))
 
+    def iter_all(
+        self,
+        batch_size: int = BULK_BATCH_SIZE,
+        order_by: str | None = None,
+        **filters: Any,
+    ) -> Iterator[T]:
+        """Iterate over all matching entities without loading them at once.
+
+        Pages with keyset predicates rather than OFFSET and yields detached
+        entities, so walking very large tables uses constant memory.
+
+        Args:
+            batch_size: Rows fetched per query
+            order_by: Field to order by (default: primary key); it should be
+                indexed and non-null. Ties are broken by primary key.
+            **filters: Field name to value mappings, as in search()
+
+        Yields:
+            Entities in ascending order_by order
+
+        Raises:
+            ValueError: If order_by is not a field of the model
+
+        Example:
+            ```python
+            for note in repo.iter_all(batch_size=1000, importance=2):
+                index(note)
+            ```
+        """
+        if order_by is not None and not hasattr(self.model_class, order_by):
+            raise ValueError(f"Unknown field for {self.model_class.__name__}: {order_by}")
+        pk = self._primary_key()
+        order_column = getattr(self.model_class, order_by) if order_by else pk
+
+        statement = select(self.model_class)
+        for key, value in filters.items():
+            if hasattr(self.model_class, key):
+                statement = statement.where(getattr(self.model_class, key) == value)
+        for page in iter_keyset(self.session, statement, order_column, pk, batch_size):
+            yield from page
+
     def update(self, entity: T) -> T:
         """Update entity.
 
@@ -98,6 +233,66 @@ class BaseRepository[T: SQLModel]:
         self.session.refresh(entity)
         return entity
 
+    def update_many(
+        self, ids: Iterable[int | str], batch_size: int = BULK_BATCH_SIZE, **values: Any
+    ) -> int:
+        """Set the same field values on many entities with set-based UPDATEs.
+
+        Args:
+            ids: Primary key values
+            batch_size: IDs per statement
+            **values: Field name to new value mappings
+
+        Returns:
+            Number of rows updated
+
+        Raises:
+            ValueError: If a field does not exist on the model
+
+        Example:
+            ```python
+            repo.update_many([1, 2, 3], active=False)
+            ```
+        """
+        unknown = [key for key in values if not hasattr(self.model_class, key)]
+        if unknown:
+            raise ValueError(f"Unknown fields for {self.model_class.__name__}: {unknown}")
+        if not values:
+            return 0
+
+        pk = self._primary_key()
+        updated = 0
+        for batch in _batches(list(ids), batch_size):
+            statement = update(self.model_class).where(pk.in_(batch)).values(**values)
+            result = cast(CursorResult[Any], self.session.execute(statement))
+            updated += result.rowcount
+        return updated
+
+    def delete_many(self, ids: Iterable[int | str], batch_size: int = BULK_BATCH_SIZE) -> int:
+        """Delete many entities by ID with set-based DELETEs.
+
+        Args:
+            ids: Primary key values
+            batch_size: IDs per statement
+
+        Returns:
+            Number of rows deleted
+
+        Note:
+            ORM cascades and delete events do not run. Caller must commit.
+        """
+        pk = self._primary_key()
+        deleted = 0
+        for batch in _batches(list(ids), batch_size):
+            statement = delete(self.model_class).where(pk.in_(batch))
+            result = cast(CursorResult[Any], self.session.execute(statement))
+            deleted += result.rowcount
+        return deleted
+
+    def _primary_key(self) -> Any:
+        """Return the primary key column attribute of the model."""
+        return getattr(self.model_class, inspect(self.model_class).primary_key[0].name)
+
     def delete(self, id: int | str) -> bool:
         """Delete entity by ID.
 
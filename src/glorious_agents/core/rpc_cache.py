@@ -0,0 +1,192 @@
+"""Read-through response cache for idempotent skill RPC methods.
+
+Skills opt individual module-level methods into caching with :func:`cacheable`,
+declaring a TTL and the event topics whose publication makes results stale::
+
+    @cacheable(ttl=30, invalidate_on=[TOPIC_NOTE_CREATED, TOPIC_NOTE_UPDATED])
+    def search_notes(query: str) -> list[dict[str, Any]]: ...
+
+The daemon answers repeated calls with identical parameters from a
+:class:`~glorious_agents.core.cache.TTLCache` keyed by (skill, method,
+canonical params). Writes published on the daemon's event bus invalidate
+dependent methods immediately; writes made by other processes only become
+visible once the TTL runs out, so keep TTLs short.
+"""
+
+import json
+import logging
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from glorious_agents.core.cache import TTLCache
+from glorious_agents.core.context import EventBus
+from glorious_agents.core.metrics import RPC_CACHE_INVALIDATIONS, RPC_CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+CACHE_POLICY_ATTR = "__rpc_cache_policy__"
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Caching policy attached to an RPC method by :func:`cacheable`."""
+
+    ttl: int
+    invalidate_on: tuple[str, ...] = ()
+
+
+def cacheable[F: Callable[..., Any]](
+    ttl: int, invalidate_on: Iterable[str] = ()
+) -> Callable[[F], F]:
+    """Mark a skill RPC method as safe to serve from the daemon's response cache.
+
+    Only use this on methods without side effects whose result depends solely
+    on their parameters and on data covered by ``invalidate_on``.
+
+    Args:
+        ttl: Seconds a cached result stays valid.
+        invalidate_on: Event topics that invalidate all cached results of the method.
+
+    Returns:
+        Decorator that records the policy on the function and returns it unchanged.
+
+    Raises:
+        ValueError: If ttl is not positive.
+    """
+    if ttl <= 0:
+        raise ValueError("ttl must be a positive number of seconds")
+    policy = CachePolicy(ttl=ttl, invalidate_on=tuple(invalidate_on))
+
+    def decorator(func: F) -> F:
+        setattr(func, CACHE_POLICY_ATTR, policy)
+        return func
+
+    return decorator
+
+
+def get_cache_policy(func: Any) -> CachePolicy | None:
+    """Return the caching policy of an RPC method, or None if it is not cacheable."""
+    policy = getattr(func, CACHE_POLICY_ATTR, None)
+    return policy if isinstance(policy, CachePolicy) else None
+
+
+def canonical_params(params: dict[str, Any]) -> str:
+    """Serialize RPC parameters so that equal parameters produce equal keys."""
+    return json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class RPCResponseCache:
+    """Caches RPC results and invalidates them from event bus topics.
+
+    Invalidation bumps a per-method generation that is part of every key, so
+    results computed before an invalidation can never be served after it, and
+    stale entries simply age out of the underlying LRU.
+    """
+
+    def __init__(self, max_size: int = 1000) -> None:
+        self._cache = TTLCache(max_size=max_size)
+        self._lock = threading.Lock()
+        self._generations: dict[tuple[str, str], int] = defaultdict(int)
+        self._dependents: dict[str, set[tuple[str, str]]] = defaultdict(set)
+        self._event_bus: EventBus | None = None
+
+    def bind(self, event_bus: EventBus) -> None:
+        """Attach to the event bus whose topics drive invalidation.
+
+        Rebinding to a different bus (e.g. after the context was reset) drops
+        all cached results, since events on the old bus are no longer seen.
+        """
+        with self._lock:
+            if event_bus is self._event_bus:
+                return
+            self._event_bus = event_bus
+            self._dependents.clear()
+            self._generations.clear()
+            self._cache.clear()
+
+    def _watch(self, skill: str, method: str, policy: CachePolicy) -> None:
+        """Subscribe to the method's invalidation topics the first time it is seen."""
+        new_topics = []
+        with self._lock:
+            bus = self._event_bus
+            for topic in policy.invalidate_on:
+                if topic not in self._dependents:
+                    new_topics.append(topic)
+                self._dependents[topic].add((skill, method))
+        if bus is not None:
+            for topic in new_topics:
+                bus.subscribe(topic, lambda _data, topic=topic: self.invalidate_topic(topic))
+
+    def _key(self, skill: str, method: str, params: dict[str, Any]) -> str:
+        with self._lock:
+            generation = self._generations[(skill, method)]
+        return f"{skill}:{method}:{generation}:{canonical_params(params)}"
+
+    def lookup(
+        self, skill: str, method: str, params: dict[str, Any], policy: CachePolicy
+    ) -> tuple[str, bool, Any]:
+        """Look up a cached result.
+
+        Args:
+            skill: Skill name.
+            method: Method name.
+            params: Call parameters.
+            policy: The method's caching policy.
+
+        Returns:
+            Tuple of (key to store a fresh result under, whether it was a hit, cached result).
+        """
+        self._watch(skill, method, policy)
+        key = self._key(skill, method, params)
+        # Results are boxed so that cached None is distinguishable from a miss
+        entry = self._cache.get(key)
+        RPC_CACHE_REQUESTS.labels(skill, method, "miss" if entry is None else "hit").inc()
+        if entry is None:
+            return key, False, None
+        return key, True, entry[0]
+
+    def store(self, key: str, result: Any, policy: CachePolicy) -> None:
+        """Store a freshly computed result under a key returned by :meth:`lookup`."""
+        self._cache.set(key, (result,), ttl=policy.ttl)
+
+    def invalidate_topic(self, topic: str) -> None:
+        """Invalidate every method that declared a dependency on the topic."""
+        with self._lock:
+            for dependent in self._dependents.get(topic, ()):
+                self._generations[dependent] += 1
+        RPC_CACHE_INVALIDATIONS.labels(topic).inc()
+        logger.debug(f"Invalidated cached RPC results for topic {topic}")
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._cache.clear()
+
+
+_rpc_cache: RPCResponseCache | None = None
+_rpc_cache_lock = threading.Lock()
+
+
+def get_rpc_cache() -> RPCResponseCache | None:
+    """Get the daemon's RPC response cache, or None if disabled by configuration."""
+    global _rpc_cache
+
+    from glorious_agents.config import get_config
+
+    max_size = get_config().DAEMON_RPC_CACHE_SIZE
+    if max_size <= 0:
+        return None
+    if _rpc_cache is None:
+        with _rpc_cache_lock:
+            if _rpc_cache is None:
+                _rpc_cache = RPCResponseCache(max_size=max_size)
+    return _rpc_cache
+
+
+def reset_rpc_cache() -> None:
+    """Discard the RPC response cache (useful for testing and shutdown)."""
+    global _rpc_cache
+    with _rpc_cache_lock:
+        _rpc_cache = None
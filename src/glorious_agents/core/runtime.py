@@ -5,6 +5,7 @@ import threading
 
 from glorious_agents.core.context import EventBus, SkillContext
 from glorious_agents.core.db import get_connection
+from glorious_agents.core.event_dispatch import DispatchMode, OverflowPolicy
 
 _context: SkillContext | None = None
 _lock = threading.Lock()
@@ -25,14 +26,32 @@ def get_ctx() -> SkillContext:
         with _lock:
             # Check again inside lock to prevent race condition
             if _context is None:
+                from glorious_agents.config import get_config
+
                 conn = get_connection(check_same_thread=False)
-                event_bus = EventBus()
-                _context = SkillContext(conn, event_bus)
+                event_bus = _create_event_bus()
+                _context = SkillContext(
+                    conn, event_bus, cache_max_bytes=get_config().CACHE_MAX_BYTES or None
+                )
                 # Register cleanup on exit
                 atexit.register(_cleanup_context)
     return _context
 
 
+def _create_event_bus() -> EventBus:
+    """Create the shared event bus using the configured dispatch mode."""
+    from glorious_agents.config import get_config
+
+    config = get_config()
+    return EventBus(
+        dispatch_mode=DispatchMode(config.EVENT_DISPATCH),
+        workers=config.EVENT_WORKERS,
+        queue_size=config.EVENT_QUEUE_SIZE,
+        overflow=OverflowPolicy(config.EVENT_OVERFLOW),
+        spill_dir=config.DATA_FOLDER / "events",
+    )
+
+
 def reset_ctx() -> None:
     """
     Reset the module-level SkillContext singleton and release its resources.
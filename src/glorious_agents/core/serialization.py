@@ -0,0 +1,221 @@
+"""Content-negotiated payload encoding for daemon and IPC traffic.
+
+JSON is encoded with orjson when installed (falling back to the standard
+library), and MessagePack is offered as a binary alternative when msgpack is
+installed. Both encoders handle datetimes and bytes: msgpack carries bytes
+natively, while JSON encodes them as base64 strings.
+"""
+
+import base64
+import dataclasses
+import json
+from collections.abc import Callable
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+# orjson and msgpack are optional speedups - fall back to stdlib json
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+_MSGPACK_ALIASES = {MSGPACK_CONTENT_TYPE, "application/x-msgpack", "application/vnd.msgpack"}
+
+
+class UnsupportedContentTypeError(ValueError):
+    """Raised when a payload uses an encoding this process cannot handle."""
+
+
+def _default(obj: Any) -> Any:
+    """Convert values the encoders do not support natively.
+
+    Args:
+        obj: Value to convert
+
+    Returns:
+        JSON/msgpack-compatible representation
+
+    Raises:
+        TypeError: If the value has no known representation
+    """
+    if isinstance(obj, datetime | date):
+        return obj.isoformat()
+    if isinstance(obj, bytes | bytearray | memoryview):
+        return base64.b64encode(bytes(obj)).decode("ascii")
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, set | frozenset | tuple):
+        return list(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Like _default, but leave bytes-like values to msgpack's bin type."""
+    if isinstance(obj, bytearray | memoryview):
+        return bytes(obj)
+    return _default(obj)
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Encode a value as UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Decode JSON bytes or text."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_msgpack(obj: Any) -> bytes:
+    """Encode a value as MessagePack bytes.
+
+    Raises:
+        UnsupportedContentTypeError: If msgpack is not installed
+    """
+    if not MSGPACK_AVAILABLE:
+        raise UnsupportedContentTypeError("msgpack is not installed")
+    result: bytes = msgpack.packb(obj, default=_msgpack_default, use_bin_type=True)
+    return result
+
+
+def loads_msgpack(data: bytes) -> Any:
+    """Decode MessagePack bytes.
+
+    Raises:
+        UnsupportedContentTypeError: If msgpack is not installed
+    """
+    if not MSGPACK_AVAILABLE:
+        raise UnsupportedContentTypeError("msgpack is not installed")
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+def _media_type(content_type: str | None) -> str:
+    """Strip parameters (e.g. charset) from a content type and normalise aliases."""
+    if not content_type:
+        return JSON_CONTENT_TYPE
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type in _MSGPACK_ALIASES:
+        return MSGPACK_CONTENT_TYPE
+    return media_type
+
+
+def supported_content_types() -> list[str]:
+    """List the content types this process can encode, in order of preference."""
+    if MSGPACK_AVAILABLE:
+        return [MSGPACK_CONTENT_TYPE, JSON_CONTENT_TYPE]
+    return [JSON_CONTENT_TYPE]
+
+
+def preferred_content_type() -> str:
+    """Return the most compact encoding available in this process."""
+    return supported_content_types()[0]
+
+
+def accept_header() -> str:
+    """Build an Accept header advertising every supported encoding."""
+    if MSGPACK_AVAILABLE:
+        return f"{MSGPACK_CONTENT_TYPE}, {JSON_CONTENT_TYPE};q=0.9"
+    return JSON_CONTENT_TYPE
+
+
+def negotiate(accept: str | None) -> str:
+    """Pick the response content type for an Accept header.
+
+    Falls back to JSON when the header is missing, accepts anything, or only
+    lists encodings this process cannot produce.
+
+    Args:
+        accept: Value of the request's Accept header
+
+    Returns:
+        Content type to encode the response with
+    """
+    if not accept:
+        return JSON_CONTENT_TYPE
+
+    candidates: list[tuple[float, int, str]] = []
+    for index, media_range in enumerate(accept.split(",")):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            candidates.append((-quality, index, _media_type(media_type)))
+
+    supported = supported_content_types()
+    for _, _, media_type in sorted(candidates):
+        if media_type in supported:
+            return media_type
+    return JSON_CONTENT_TYPE
+
+
+_ENCODERS: dict[str, Callable[[Any], bytes]] = {
+    JSON_CONTENT_TYPE: dumps_json,
+    MSGPACK_CONTENT_TYPE: dumps_msgpack,
+}
+
+_DECODERS: dict[str, Callable[[bytes], Any]] = {
+    JSON_CONTENT_TYPE: loads_json,
+    MSGPACK_CONTENT_TYPE: loads_msgpack,
+}
+
+
+def encode(obj: Any, content_type: str | None = JSON_CONTENT_TYPE) -> bytes:
+    """Encode a value using the given content type.
+
+    Raises:
+        UnsupportedContentTypeError: If the content type is not supported
+    """
+    encoder = _ENCODERS.get(_media_type(content_type))
+    if encoder is None:
+        raise UnsupportedContentTypeError(f"Unsupported content type: {content_type}")
+    return encoder(obj)
+
+
+def decode(data: bytes, content_type: str | None = JSON_CONTENT_TYPE) -> Any:
+    """Decode a payload using the given content type.
+
+    A missing content type is treated as JSON.
+
+    Raises:
+        UnsupportedContentTypeError: If the content type is not supported
+        ValueError: If the payload is malformed
+    """
+    decoder = _DECODERS.get(_media_type(content_type))
+    if decoder is None:
+        raise UnsupportedContentTypeError(f"Unsupported content type: {content_type}")
+    try:
+        return decoder(data)
+    except UnsupportedContentTypeError:
+        raise
+    except Exception as e:
+        raise ValueError(f"Malformed {_media_type(content_type)} payload: {e}") from e
@@ -101,9 +101,10 @@ class BaseSkill[T: SQLModel](ABC):
             with skill.create_unit_of_work() as uow:
                 repo = uow.get_repository("notes", Note)
                 note = repo.add(Note(content="test"))
+                uow.record_event("note_created", {"id": note.id})
             ```
         """
-        return UnitOfWork(self.session)
+        return UnitOfWork(self.session, self.event_bus)
 
     def commit(self) -> None:
         """Commit current transaction.
@@ -0,0 +1,124 @@
+"""Hierarchical topic patterns for the event bus.
+
+Topics are dot-separated names such as ``issue.created``. Subscription
+patterns may use ``*`` to match exactly one segment and ``#`` to match zero
+or more segments, so ``issue.*`` matches ``issue.created`` and ``#`` matches
+every topic. Patterns are kept in a trie so matching a topic only walks the
+branches that can match it.
+"""
+
+import itertools
+from collections.abc import Callable
+from typing import Any
+
+SEPARATOR = "."
+SINGLE_WILDCARD = "*"
+MULTI_WILDCARD = "#"
+
+Callback = Callable[[dict[str, Any]], None]
+
+
+def is_pattern(topic: str) -> bool:
+    """Return True if the topic contains a wildcard segment."""
+    return any(segment in (SINGLE_WILDCARD, MULTI_WILDCARD) for segment in topic.split(SEPARATOR))
+
+
+class _Node:
+    """Trie node keyed by topic segment."""
+
+    __slots__ = ("children", "callbacks")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        # (subscription order, callback)
+        self.callbacks: list[tuple[int, Callback]] = []
+
+
+class TopicTrie:
+    """Wildcard subscriptions indexed by pattern segment.
+
+    Not thread-safe; the event bus serializes access with its own lock.
+    """
+
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._order = itertools.count()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, pattern: str, callback: Callback) -> None:
+        """Register a callback for a wildcard pattern."""
+        node = self._root
+        for segment in pattern.split(SEPARATOR):
+            node = node.children.setdefault(segment, _Node())
+        node.callbacks.append((next(self._order), callback))
+        self._size += 1
+
+    def remove(self, pattern: str, callback: Callback) -> bool:
+        """Remove one registration of a callback. Returns False if it was not registered."""
+        path = [self._root]
+        for segment in pattern.split(SEPARATOR):
+            child = path[-1].children.get(segment)
+            if child is None:
+                return False
+            path.append(child)
+
+        callbacks = path[-1].callbacks
+        for i, (_, registered) in enumerate(callbacks):
+            if registered == callback:
+                del callbacks[i]
+                break
+        else:
+            return False
+        self._size -= 1
+
+        # Prune branches left without subscribers
+        segments = pattern.split(SEPARATOR)
+        for depth in range(len(segments), 0, -1):
+            node = path[depth]
+            if node.children or node.callbacks:
+                break
+            del path[depth - 1].children[segments[depth - 1]]
+        return True
+
+    def match(self, topic: str) -> list[Callback]:
+        """Return callbacks of all patterns matching the topic, in subscription order."""
+        found: list[tuple[int, Callback]] = []
+        self._collect(self._root, topic.split(SEPARATOR), 0, found, set())
+        found.sort(key=lambda entry: entry[0])
+        return [callback for _, callback in found]
+
+    def _collect(
+        self,
+        node: _Node,
+        segments: list[str],
+        index: int,
+        found: list[tuple[int, Callback]],
+        visited: set[tuple[int, int]],
+    ) -> None:
+        # Patterns with several '#' reach the same node through different splits
+        state = (id(node), index)
+        if state in visited:
+            return
+        visited.add(state)
+
+        if index == len(segments):
+            found.extend(node.callbacks)
+        else:
+            segment = segments[index]
+            # Wildcard branches are visited below; visiting them here would match twice
+            if segment not in (SINGLE_WILDCARD, MULTI_WILDCARD):
+                child = node.children.get(segment)
+                if child is not None:
+                    self._collect(child, segments, index + 1, found, visited)
+            child = node.children.get(SINGLE_WILDCARD)
+            if child is not None:
+                self._collect(child, segments, index + 1, found, visited)
+
+        multi = node.children.get(MULTI_WILDCARD)
+        if multi is not None:
+            # '#' swallows zero or more of the remaining segments
+            for end in range(index, len(segments) + 1):
+                self._collect(multi, segments, end, found, visited)
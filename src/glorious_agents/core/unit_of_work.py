@@ -8,6 +8,8 @@ from typing import Any
 
 from sqlmodel import Session, SQLModel
 
+from glorious_agents.core import outbox
+from glorious_agents.core.context import EventBus
 from glorious_agents.core.repository import BaseRepository
 
 
@@ -30,14 +32,18 @@ class UnitOfWork:
         ```
     """
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: Session, event_bus: EventBus | None = None) -> None:
         """Initialize UnitOfWork.
 
         Args:
             session: SQLModel session to manage
+            event_bus: Optional bus on which events recorded with
+                record_event() are published once the transaction commits
         """
         self.session = session
+        self.event_bus = event_bus
         self._repositories: dict[str, BaseRepository[Any]] = {}
+        self._pending_events: list[tuple[str, dict[str, Any]]] = []
 
     def get_repository(self, name: str, model_class: type[SQLModel]) -> BaseRepository[Any]:
         """Get or create repository for model.
@@ -57,13 +63,37 @@ class UnitOfWork:
             self._repositories[name] = BaseRepository(self.session, model_class)
         return self._repositories[name]
 
+    def record_event(self, topic: str, data: dict[str, Any]) -> int:
+        """Record a domain event in the durable outbox.
+
+        The event is written in the current transaction, so it is stored if
+        and only if the surrounding changes commit.
+
+        Args:
+            topic: Event topic name
+            data: JSON-serializable event payload
+
+        Returns:
+            The event's outbox id
+        """
+        event_id = outbox.append(self.session, topic, data)
+        self._pending_events.append((topic, data))
+        return event_id
+
     def commit(self) -> None:
         """Commit all changes in current transaction.
 
+        Events recorded with record_event() are then published on the
+        event bus, if one was given.
+
         Raises:
             Exception: If commit fails
         """
         self.session.commit()
+        events, self._pending_events = self._pending_events, []
+        if self.event_bus is not None:
+            for topic, data in events:
+                self.event_bus.publish(topic, data)
 
     def rollback(self) -> None:
         """Rollback all changes in current transaction.
@@ -72,6 +102,7 @@ class UnitOfWork:
         within a context manager block.
         """
         self.session.rollback()
+        self._pending_events.clear()
 
     def close(self) -> None:
         """Close the session and release resources.
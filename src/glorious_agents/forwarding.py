@@ -0,0 +1,279 @@
+"""Forward CLI invocations to a running daemon for warm execution.
+
+Starting ``agent`` or ``issues`` normally pays for interpreter startup, skill
+discovery, schema checks and engine creation on every call. When a daemon is
+already running for the project, the client sends its argv over IPC instead
+and prints the captured output, so a typical command costs little more than
+interpreter startup. When no daemon is reachable the command runs in-process
+as before.
+
+This module is imported before anything else on the CLI hot path, so it must
+only use the standard library (plus the lightweight config module).
+
+Environment variables:
+    GLORIOUS_FORWARD: Set to "0"/"false" to always run commands in-process.
+    GLORIOUS_FORWARD_TIMEOUT: Seconds to wait for a forwarded command (default 120).
+"""
+
+import http.client
+import json
+import os
+import socket
+import stat
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+FORWARD_ENV = "GLORIOUS_FORWARD"
+TIMEOUT_ENV = "GLORIOUS_FORWARD_TIMEOUT"
+DEFAULT_TIMEOUT = 120.0
+CONNECT_TIMEOUT = 0.5
+
+# Files written by running daemons in the data folder
+AGENT_DAEMON_INFO_FILE = "agent_daemon.json"
+DAEMON_PID_FILE = "daemon.pid"
+DAEMON_SOCKET_FILE = "daemon.port"
+
+# Commands that must run in the calling process (they manage daemons themselves)
+AGENT_LOCAL_COMMANDS = frozenset({"daemon", "version"})
+
+# Commands (at any level) that ask for confirmation unless a confirm flag is
+# given; forwarded runs have no terminal to answer, so they run in-process
+PROMPTING_COMMANDS = frozenset({"template-delete"})
+CONFIRM_FLAGS = frozenset({"--force", "--yes", "-y"})
+
+
+@dataclass(frozen=True)
+class DaemonEndpoint:
+    """Where to send forwarded commands.
+
+    Attributes:
+        path: HTTP request path
+        unix_socket: Unix socket path (TCP is used when None)
+        host: TCP host
+        port: TCP port
+        headers: Extra request headers (e.g. authentication)
+        body: Extra fields merged into the request body
+    """
+
+    path: str
+    unix_socket: str | None = None
+    host: str = "127.0.0.1"
+    port: int = 0
+    headers: dict[str, str] = field(default_factory=dict)
+    body: dict[str, Any] = field(default_factory=dict)
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, socket_path: str, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self._socket_path)
+        self.sock = sock
+
+
+def forwarding_enabled() -> bool:
+    """Check whether CLI forwarding is enabled via the environment."""
+    return os.environ.get(FORWARD_ENV, "true").lower() not in ("0", "false", "no", "off")
+
+
+def should_forward(
+    argv: list[str],
+    local_commands: frozenset[str] = frozenset(),
+    prompting_commands: frozenset[str] = PROMPTING_COMMANDS,
+) -> bool:
+    """Decide whether an invocation is eligible for forwarding.
+
+    Args:
+        argv: Command-line arguments (without the program name)
+        local_commands: Top-level commands that must run in-process
+        prompting_commands: Commands that prompt unless a confirm flag is given
+
+    Returns:
+        True if the command may be sent to a daemon
+    """
+    if not argv or not forwarding_enabled():
+        return False
+    if argv[0] in local_commands:
+        return False
+    if prompting_commands.intersection(argv) and not CONFIRM_FLAGS.intersection(argv):
+        return False
+    # "-" means read from stdin, which the daemon cannot see
+    return "-" not in argv
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process exists without importing psutil."""
+    if sys.platform == "win32":
+        # No cheap check; a refused connection triggers the fallback instead
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def ipc_endpoint(pid_path: Path, socket_path: Path, path: str = "/") -> DaemonEndpoint | None:
+    """Locate a daemon served by the core IPC transport.
+
+    Args:
+        pid_path: Daemon PID file
+        socket_path: Unix socket, or file containing the TCP port
+        path: HTTP request path served by the IPC server
+
+    Returns:
+        Endpoint, or None if no live daemon was found
+    """
+    try:
+        pid = int(pid_path.read_text().strip())
+        mode = socket_path.stat().st_mode
+    except (OSError, ValueError):
+        return None
+    if not _pid_alive(pid):
+        return None
+
+    body = {"method": "cli"}
+    if stat.S_ISSOCK(mode):
+        return DaemonEndpoint(path, unix_socket=str(socket_path), body=body)
+    try:
+        port = int(socket_path.read_text().strip())
+    except (OSError, ValueError):
+        return None
+    return DaemonEndpoint(path, port=port, body=body)
+
+
+def agent_daemon_endpoint(data_folder: Path, api_key: str | None = None) -> DaemonEndpoint | None:
+    """Locate a running ``agent daemon`` from the info file it writes on startup.
+
+    Args:
+        data_folder: Project data folder
+        api_key: Daemon API key, if authentication is enabled
+
+    Returns:
+        Endpoint, or None if no live daemon was found
+    """
+    try:
+        info = json.loads((data_folder / AGENT_DAEMON_INFO_FILE).read_text())
+        pid = int(info["pid"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if not _pid_alive(pid):
+        return None
+
+    headers = {"X-API-Key": api_key} if api_key else {}
+    if info.get("uds"):
+        return DaemonEndpoint("/cli", unix_socket=info["uds"], headers=headers)
+    host = info.get("host") or "127.0.0.1"
+    if host in ("0.0.0.0", "::"):
+        host = "127.0.0.1"
+    try:
+        port = int(info["port"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return DaemonEndpoint("/cli", host=host, port=port, headers=headers)
+
+
+def _write(stream: Any, text: str) -> None:
+    """Write captured output, tolerating consoles that cannot encode it."""
+    if not text:
+        return
+    try:
+        stream.write(text)
+    except UnicodeEncodeError:
+        stream.buffer.write(text.encode("utf-8", errors="replace"))
+    stream.flush()
+
+
+def forward(endpoint: DaemonEndpoint, argv: list[str]) -> int | None:
+    """Run a command in the daemon and replay its output locally.
+
+    Falls back (returns None) only when the command cannot have run: the
+    daemon is unreachable, rejects the request, or declines it (e.g. it
+    serves a different working directory). Once the request has been
+    delivered, failures are reported instead so a command is never run twice.
+
+    Args:
+        endpoint: Daemon to forward to
+        argv: Command-line arguments (without the program name)
+
+    Returns:
+        The command's exit code, or None to run the command in-process
+    """
+    payload = json.dumps({**endpoint.body, "argv": argv, "cwd": os.getcwd()}).encode("utf-8")
+    headers = {"Content-Type": "application/json", "Accept": "application/json", **endpoint.headers}
+
+    conn: http.client.HTTPConnection
+    if endpoint.unix_socket is not None:
+        conn = _UnixHTTPConnection(endpoint.unix_socket, CONNECT_TIMEOUT)
+    else:
+        conn = http.client.HTTPConnection(endpoint.host, endpoint.port, timeout=CONNECT_TIMEOUT)
+
+    try:
+        try:
+            conn.connect()
+            # Connect quickly, but give the command itself time to finish
+            conn.sock.settimeout(float(os.environ.get(TIMEOUT_ENV, DEFAULT_TIMEOUT)))  # type: ignore[union-attr]
+            conn.request("POST", endpoint.path, body=payload, headers=headers)
+        except (OSError, ValueError, http.client.HTTPException):
+            return None
+
+        try:
+            response = conn.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            _write(sys.stderr, f"Error: lost connection to daemon: {e}\n")
+            return 1
+    finally:
+        conn.close()
+
+    if 400 <= response.status < 500:
+        return None
+    try:
+        result = json.loads(data)
+    except ValueError:
+        result = {}
+    if response.status != 200:
+        error = result.get("error") or result.get("detail") or response.reason
+        _write(sys.stderr, f"Error: daemon failed to run command: {error}\n")
+        return 1
+    if not result.get("forwarded"):
+        return None
+
+    _write(sys.stdout, result.get("stdout", ""))
+    _write(sys.stderr, result.get("stderr", ""))
+    return int(result.get("exit_code", 0))
+
+
+def main() -> None:
+    """Entry point for the ``agent`` command.
+
+    Forwards the invocation to a running ``agent daemon`` when possible and
+    otherwise runs the full CLI in-process.
+    """
+    argv = sys.argv[1:]
+    if should_forward(argv, AGENT_LOCAL_COMMANDS):
+        from glorious_agents.config import config
+
+        endpoint = agent_daemon_endpoint(config.DATA_FOLDER, config.DAEMON_API_KEY)
+        if endpoint is not None:
+            exit_code = forward(endpoint, argv)
+            if exit_code is not None:
+                sys.exit(exit_code)
+
+    from glorious_agents.cli import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
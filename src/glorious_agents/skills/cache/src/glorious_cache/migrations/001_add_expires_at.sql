@@ -0,0 +1,18 @@
+-- Migration: Store expiry as an indexed epoch timestamp
+-- Skill: cache
+-- Version: 1
+-- Purpose: Let reads and pruning check expiry in SQL instead of parsing created_at in Python
+
+-- Absolute expiry time in Unix epoch seconds (NULL = never expires)
+ALTER TABLE cache_entries ADD COLUMN expires_at INTEGER;
+
+-- Backfill from the ISO created_at timestamp and TTL of existing rows
+UPDATE cache_entries
+SET expires_at = CAST(strftime('%s', created_at) AS INTEGER) + ttl_seconds
+WHERE ttl_seconds IS NOT NULL;
+
+-- Index for expiry checks and pruning
+CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache_entries(expires_at);
+
+-- Superseded by idx_cache_expires
+DROP INDEX IF EXISTS idx_cache_ttl;
@@ -0,0 +1,7 @@
+-- Migration: Record how each cached value is encoded
+-- Skill: cache
+-- Version: 2
+-- Purpose: Support bytes values and transparent compression
+
+-- "text" or "bytes", optionally suffixed with "+zlib" or "+lz4" (NULL = legacy UTF-8 text)
+ALTER TABLE cache_entries ADD COLUMN encoding TEXT;
@@ -0,0 +1,31 @@
+-- Migration: Track entry sizes and access times for byte-budgeted eviction
+-- Skill: cache
+-- Version: 3
+-- Purpose: Evict least recently used entries once the cache exceeds its byte budget
+
+-- Stored size of value in bytes (after compression)
+ALTER TABLE cache_entries ADD COLUMN size_bytes INTEGER NOT NULL DEFAULT 0;
+
+-- Last read or write in Unix epoch seconds, updated in coarse batches
+ALTER TABLE cache_entries ADD COLUMN last_access INTEGER;
+
+-- Backfill existing rows; they count as last used when created
+UPDATE cache_entries
+SET size_bytes = length(value),
+    last_access = CAST(strftime('%s', created_at) AS INTEGER);
+
+-- Indexes for global and per-kind LRU eviction
+CREATE INDEX IF NOT EXISTS idx_cache_last_access ON cache_entries(last_access);
+CREATE INDEX IF NOT EXISTS idx_cache_kind_last_access ON cache_entries(kind, last_access);
+
+-- Byte budgets; kind '*' is the budget for the whole cache
+CREATE TABLE IF NOT EXISTS cache_budgets (
+  kind TEXT PRIMARY KEY,
+  max_bytes INTEGER NOT NULL
+);
+
+-- Cumulative counters: hits, misses, evictions, evicted_bytes
+CREATE TABLE IF NOT EXISTS cache_stats (
+  name TEXT PRIMARY KEY,
+  value INTEGER NOT NULL DEFAULT 0
+);
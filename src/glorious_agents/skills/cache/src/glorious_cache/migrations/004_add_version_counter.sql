@@ -0,0 +1,32 @@
+-- Migration: Count writes to cache entries
+-- Skill: cache
+-- Version: 4
+-- Purpose: Let processes detect changes by others and invalidate their in-memory cache tier
+
+-- Single-row counter bumped by every change to a cached value
+CREATE TABLE IF NOT EXISTS cache_version (
+  id INTEGER PRIMARY KEY CHECK (id = 1),
+  version INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO cache_version (id, version) VALUES (1, 0);
+
+-- Triggers cover every writer, including older code and other tools.
+-- last_access updates are not changes to the value and are ignored.
+CREATE TRIGGER IF NOT EXISTS cache_entries_version_insert
+AFTER INSERT ON cache_entries
+BEGIN
+  UPDATE cache_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS cache_entries_version_delete
+AFTER DELETE ON cache_entries
+BEGIN
+  UPDATE cache_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS cache_entries_version_update
+AFTER UPDATE OF key, value, encoding, expires_at ON cache_entries
+BEGIN
+  UPDATE cache_version SET version = version + 1 WHERE id = 1;
+END;
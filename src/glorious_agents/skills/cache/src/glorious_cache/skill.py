@@ -3,7 +3,14 @@ from __future__ import annotations
 """Cache skill - short-term ephemeral storage with TTL."""
 
 import json
-from datetime import datetime, timedelta
+import logging
+import math
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import datetime
 from typing import Any
 
 import typer
@@ -11,19 +18,95 @@ from pydantic import Field
 from rich.console import Console
 from rich.table import Table
 
+from glorious_agents.core.cache import TTLCache
 from glorious_agents.core.context import SkillContext
+from glorious_agents.core.maintenance import maintenance
 from glorious_agents.core.search import SearchResult
 from glorious_agents.core.validation import SkillInput, ValidationException, validate_input
 
+# lz4 is an optional, faster alternative to zlib compression
+try:
+    import lz4.frame as lz4_frame
+
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 app = typer.Typer(help="Cache management with TTL")
 console = Console()
 _ctx: SkillContext | None = None
 
+# Seconds between background prune runs in the daemon
+PRUNE_INTERVAL = 300
+# Rows deleted per transaction when pruning, to keep write locks short
+PRUNE_BATCH_SIZE = 1000
+# Values at least this many bytes long are compressed before storage
+COMPRESS_THRESHOLD = 4096
+# Compression used for large values: "zlib", "lz4" or None
+DEFAULT_COMPRESSION: str | None = "zlib"
+# Keys per statement in bulk operations, well below SQLite's parameter limit
+_KEY_CHUNK_SIZE = 500
+_MAX_KEY_LENGTH = 500
+# Byte budget for the whole cache unless one is set with set_budget()
+MAX_BYTES = 256 * 1024 * 1024
+# cache_budgets key of the global budget
+GLOBAL_BUDGET = "*"
+# Seconds between background eviction runs in the daemon
+EVICT_INTERVAL = 60
+# Rows examined per eviction transaction
+EVICT_BATCH_SIZE = 500
+# last_access is only rewritten when older than this many seconds
+ACCESS_RESOLUTION = 60
+# Buffered access updates are written once this many are pending...
+ACCESS_FLUSH_SIZE = 256
+# ...or this many seconds after the previous write
+ACCESS_FLUSH_INTERVAL = 30.0
+# Entries kept in the in-process L1 tier (0 disables it)
+L1_MAX_SIZE = 1024
+# Bound on the summed size of L1 values
+L1_MAX_BYTES = 16 * 1024 * 1024
+# Seconds between checks for writes by other connections; bounds stale L1 reads
+L1_CHECK_INTERVAL = 1.0
+
+# Reads buffer last_access updates and hit/miss counts here instead of
+# writing on every lookup; flush_access() writes them in one transaction.
+_access_lock = threading.Lock()
+_pending_access: dict[str, int] = {}
+_pending_hits = 0
+_pending_misses = 0
+_last_flush = 0.0
+
+# In-process L1 tier in front of cache_entries. Writes through this module
+# update it directly; writes by other connections are detected with
+# PRAGMA data_version and the cache_version counter, which clear it.
+_l1: TTLCache | None = None
+_l1_lock = threading.Lock()
+_l1_checked_at = 0.0
+_l1_data_version: int | None = None
+_l1_version: int | None = None
+
 
 def init_context(ctx: SkillContext) -> None:
     """Initialize skill context."""
-    global _ctx
+    global _ctx, _pending_hits, _pending_misses, _last_flush
+    global _l1, _l1_checked_at, _l1_data_version, _l1_version
     _ctx = ctx
+    with _access_lock:
+        _pending_access.clear()
+        _pending_hits = _pending_misses = 0
+        _last_flush = time.monotonic()
+    with _l1_lock:
+        _l1 = TTLCache(max_size=L1_MAX_SIZE, max_bytes=L1_MAX_BYTES) if L1_MAX_SIZE else None
+        _l1_checked_at = time.monotonic()
+        _l1_data_version = _l1_version = None
+        if _l1 is not None:
+            try:
+                _l1_data_version = ctx.conn.execute("PRAGMA data_version").fetchone()[0]
+                _l1_version = _read_version(ctx.conn)
+            except sqlite3.Error as e:
+                logger.debug(f"Cache version not available yet: {e}")
 
 
 class SetCacheInput(SkillInput):
@@ -41,6 +124,209 @@ class GetCacheInput(SkillInput):
     key: str = Field(..., min_length=1, max_length=500, description="Cache key")
 
 
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == "zlib":
+        return zlib.compress(data)
+    if compression == "lz4":
+        if not LZ4_AVAILABLE:
+            raise ValueError("lz4 compression requires the 'lz4' package")
+        return lz4_frame.compress(data)
+    raise ValueError(f"Unknown compression: {compression}")
+
+
+def _encode_value(value: str | bytes, compression: str | None) -> tuple[bytes, str]:
+    """Convert a value to its stored BLOB and encoding tag.
+
+    The tag is "text" or "bytes", suffixed with "+zlib" or "+lz4" when the
+    BLOB is compressed. Values below COMPRESS_THRESHOLD, or that do not
+    shrink, are stored uncompressed.
+    """
+    if isinstance(value, str):
+        data, encoding = value.encode("utf-8"), "text"
+    else:
+        data, encoding = bytes(value), "bytes"
+    if compression and len(data) >= COMPRESS_THRESHOLD:
+        packed = _compress(data, compression)
+        if len(packed) < len(data):
+            return packed, f"{encoding}+{compression}"
+    return data, encoding
+
+
+def _decode_value(blob: bytes, encoding: str | None) -> str | bytes:
+    """Reverse _encode_value. Rows without an encoding tag hold UTF-8 text."""
+    value_type, _, compression = (encoding or "text").partition("+")
+    data = bytes(blob)
+    if compression == "zlib":
+        data = zlib.decompress(data)
+    elif compression == "lz4":
+        data = lz4_frame.decompress(data)
+    return data.decode("utf-8") if value_type == "text" else data
+
+
+def _entry_row(
+    key: str,
+    value: str | bytes,
+    ttl_seconds: int | None,
+    kind: str,
+    compression: str | None,
+    now: float,
+) -> tuple[Any, ...]:
+    """Build the cache_entries row for a value, in _INSERT_SQL column order."""
+    blob, encoding = _encode_value(value, compression)
+    # Round up so an entry never expires before its full TTL has passed
+    expires_at = math.ceil(now + ttl_seconds) if ttl_seconds is not None else None
+    created_at = datetime.utcnow().isoformat()
+    return (key, blob, encoding, kind, created_at, ttl_seconds, expires_at, len(blob), int(now))
+
+
+_INSERT_SQL = """
+    INSERT OR REPLACE INTO cache_entries
+        (key, value, encoding, kind, created_at, ttl_seconds, expires_at, size_bytes, last_access)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _chunks(keys: list[str]) -> Iterator[list[str]]:
+    for start in range(0, len(keys), _KEY_CHUNK_SIZE):
+        yield keys[start : start + _KEY_CHUNK_SIZE]
+
+
+def _check_keys(keys: Iterable[str]) -> list[str]:
+    """Validate bulk-operation keys like GetCacheInput does for single keys."""
+    keys = [*keys]  # the module-level name "list" is the CLI command
+    invalid = [k for k in keys if not isinstance(k, str) or not 1 <= len(k) <= _MAX_KEY_LENGTH]
+    if invalid:
+        raise ValidationException(
+            [
+                {
+                    "loc": ("keys",),
+                    "msg": f"Keys must be 1-{_MAX_KEY_LENGTH} characters: {invalid[:3]}",
+                }
+            ]
+        )
+    return keys
+
+
+def _read_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("SELECT version FROM cache_version WHERE id = 1").fetchone()[0]
+
+
+def _l1_cache() -> TTLCache | None:
+    """Return the L1 tier, clearing it first if another connection changed the cache.
+
+    The check runs at most every L1_CHECK_INTERVAL seconds. PRAGMA
+    data_version only changes when another connection commits, so the
+    cache_version counter is read just in that case, to ignore commits
+    that did not touch cache_entries.
+    """
+    global _l1_checked_at, _l1_data_version, _l1_version
+    if _l1 is None or _ctx is None:
+        return None
+    with _l1_lock:
+        now = time.monotonic()
+        if now - _l1_checked_at < L1_CHECK_INTERVAL:
+            return _l1
+        _l1_checked_at = now
+        data_version = _ctx.conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != _l1_data_version:
+            _l1_data_version = data_version
+            version = _read_version(_ctx.conn)
+            if version != _l1_version:
+                _l1_version = version
+                _l1.clear()
+    return _l1
+
+
+def _l1_written() -> TTLCache | None:
+    """Return the L1 tier after this connection committed changes to cache_entries.
+
+    Our own commits bump cache_version without changing PRAGMA data_version.
+    If no other connection committed since the last check, the new version
+    is adopted so those commits do not clear the L1 tier at the next check.
+    """
+    global _l1_version
+    if _l1 is None or _ctx is None:
+        return None
+    with _l1_lock:
+        if _ctx.conn.execute("PRAGMA data_version").fetchone()[0] == _l1_data_version:
+            _l1_version = _read_version(_ctx.conn)
+    return _l1
+
+
+def _l1_ttl(expires_at: int | None, now: float) -> float | None:
+    """L1 time-to-live matching the stored expiry of an entry."""
+    return None if expires_at is None else max(expires_at - now, 0.0)
+
+
+def _record_access(accessed: Mapping[str, int], hits: int, misses: int) -> None:
+    """Buffer the result of a lookup and flush the buffer when it is due.
+
+    Args:
+        accessed: Hit keys whose stored last_access is stale, mapped to the new value.
+        hits: Number of keys that were found.
+        misses: Number of keys that were not found.
+    """
+    global _pending_hits, _pending_misses
+    with _access_lock:
+        _pending_access.update(accessed)
+        _pending_hits += hits
+        _pending_misses += misses
+        due = (
+            len(_pending_access) >= ACCESS_FLUSH_SIZE
+            or time.monotonic() - _last_flush >= ACCESS_FLUSH_INTERVAL
+        )
+    if due:
+        flush_access()
+
+
+def _add_stats(conn: sqlite3.Connection, counters: Mapping[str, int]) -> None:
+    conn.executemany(
+        """
+        INSERT INTO cache_stats (name, value) VALUES (?, ?)
+        ON CONFLICT(name) DO UPDATE SET value = value + excluded.value
+    """,
+        [(name, value) for name, value in counters.items() if value],
+    )
+
+
+def flush_access() -> int:
+    """
+    Write buffered last_access updates and hit/miss counts (callable API).
+
+    Called automatically by reads once ACCESS_FLUSH_SIZE updates are pending
+    or ACCESS_FLUSH_INTERVAL has passed, and before eviction. Access data is
+    advisory, so a batch that cannot be written (e.g. the database is locked)
+    is dropped rather than retried.
+
+    Returns:
+        Number of last_access updates written.
+    """
+    global _pending_access, _pending_hits, _pending_misses, _last_flush
+    if _ctx is None:
+        raise RuntimeError("Context not initialized")
+
+    with _access_lock:
+        accessed, hits, misses = _pending_access, _pending_hits, _pending_misses
+        _pending_access, _pending_hits, _pending_misses = {}, 0, 0
+        _last_flush = time.monotonic()
+    if not accessed and not misses:
+        return 0
+
+    try:
+        _ctx.conn.executemany(
+            "UPDATE cache_entries SET last_access = ? "
+            "WHERE key = ? AND (last_access IS NULL OR last_access <= ?)",
+            [(ts, key, ts - ACCESS_RESOLUTION) for key, ts in accessed.items()],
+        )
+        _add_stats(_ctx.conn, {"hits": hits, "misses": misses})
+        _ctx.conn.commit()
+    except sqlite3.Error as e:
+        _ctx.conn.rollback()
+        logger.warning(f"Dropped {len(accessed)} cache access updates: {e}")
+        return 0
+    return len(accessed)
+
+
 @validate_input
 def set_cache(key: str, value: str, ttl_seconds: int | None = None, kind: str = "general") -> None:
     """
@@ -58,21 +344,17 @@ def set_cache(key: str, value: str, ttl_seconds: int | None = None, kind: str =
     if _ctx is None:
         raise RuntimeError("Context not initialized")
 
-    # Convert value to bytes for BLOB storage
-    value_bytes = value.encode("utf-8")
-
-    _ctx.conn.execute(
-        """
-        INSERT OR REPLACE INTO cache_entries (key, value, kind, created_at, ttl_seconds)
-        VALUES (?, ?, ?, ?, ?)
-    """,
-        (key, value_bytes, kind, datetime.utcnow().isoformat(), ttl_seconds),
-    )
+    now = time.time()
+    row = _entry_row(key, value, ttl_seconds, kind, DEFAULT_COMPRESSION, now)
+    _ctx.conn.execute(_INSERT_SQL, row)
     _ctx.conn.commit()
+    l1 = _l1_written()
+    if l1 is not None:
+        l1.set(key, value, _l1_ttl(row[6], now))
 
 
 @validate_input
-def get_cache(key: str) -> str | None:
+def get_cache(key: str) -> str | bytes | None:
     """
     Get a cache entry (callable API).
 
@@ -88,66 +370,373 @@ def get_cache(key: str) -> str | None:
     if _ctx is None:
         raise RuntimeError("Context not initialized")
 
+    # Expired rows are left for prune_expired(), and access times are
+    # buffered, so reads do not write on every call
+    now = time.time()
+    l1 = _l1_cache()
+    if l1 is not None:
+        value = l1.get(key)
+        if value is not None:
+            _record_access({key: int(now)}, 1, 0)
+            return value
+
     cur = _ctx.conn.execute(
         """
-        SELECT value, created_at, ttl_seconds
+        SELECT value, encoding, last_access, expires_at
         FROM cache_entries
-        WHERE key = ?
+        WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)
     """,
-        (key,),
+        (key, now),
     )
 
     row = cur.fetchone()
     if not row:
+        _record_access({}, 0, 1)
         return None
 
-    value_bytes, created_at, ttl_seconds = row
+    value = _decode_value(row[0], row[1])
+    if l1 is not None:
+        l1.set(key, value, _l1_ttl(row[3], now))
+    stale = row[2] is None or now - row[2] >= ACCESS_RESOLUTION
+    _record_access({key: int(now)} if stale else {}, 1, 0)
+    return value
+
+
+def mget(keys: Iterable[str]) -> dict[str, str | bytes]:
+    """
+    Get several cache entries in one query per 500 keys (callable API).
+
+    Args:
+        keys: Cache keys (1-500 chars each).
+
+    Returns:
+        Mapping of found, unexpired keys to their values (str or bytes, as stored).
+
+    Raises:
+        ValidationException: If a key is invalid.
+    """
+    if _ctx is None:
+        raise RuntimeError("Context not initialized")
+
+    now = time.time()
+    keys = [*dict.fromkeys(_check_keys(keys))]
+    l1 = _l1_cache()
+    found: dict[str, str | bytes] = l1.get_many(keys) if l1 is not None else {}
+    accessed = dict.fromkeys(found, int(now))
+    missing = [key for key in keys if key not in found]
+    for chunk in _chunks(missing):
+        placeholders = ",".join("?" * len(chunk))
+        cur = _ctx.conn.execute(
+            f"""
+            SELECT key, value, encoding, last_access, expires_at
+            FROM cache_entries
+            WHERE key IN ({placeholders}) AND (expires_at IS NULL OR expires_at > ?)
+        """,
+            (*chunk, now),
+        )
+        for key, blob, encoding, last_access, expires_at in cur:
+            value = found[key] = _decode_value(blob, encoding)
+            if l1 is not None:
+                l1.set(key, value, _l1_ttl(expires_at, now))
+            if last_access is None or now - last_access >= ACCESS_RESOLUTION:
+                accessed[key] = int(now)
+    _record_access(accessed, len(found), len(keys) - len(found))
+    return found
+
+
+def mset(
+    entries: Mapping[str, str | bytes],
+    ttl_seconds: int | None = None,
+    kind: str = "general",
+    compression: str | None = DEFAULT_COMPRESSION,
+) -> int:
+    """
+    Set several cache entries in a single transaction (callable API).
+
+    Values may be str or bytes and are returned as the same type. Values of
+    at least COMPRESS_THRESHOLD bytes are compressed transparently.
+
+    Args:
+        entries: Mapping of keys (1-500 chars) to values.
+        ttl_seconds: Time-to-live in seconds for every entry (optional).
+        kind: Cache kind for organization.
+        compression: "zlib", "lz4" (requires the lz4 package) or None.
+
+    Returns:
+        Number of entries written.
+
+    Raises:
+        ValidationException: If a key is invalid.
+        ValueError: If the compression is unknown or unavailable.
+    """
+    if _ctx is None:
+        raise RuntimeError("Context not initialized")
+
+    _check_keys(entries)
+    now = time.time()
+    rows = [
+        _entry_row(key, value, ttl_seconds, kind, compression, now)
+        for key, value in entries.items()
+    ]
+    try:
+        _ctx.conn.executemany(_INSERT_SQL, rows)
+        _ctx.conn.commit()
+    except Exception:
+        _ctx.conn.rollback()
+        raise
+    l1 = _l1_written()
+    if l1 is not None:
+        values = {
+            key: value if isinstance(value, str) else bytes(value) for key, value in entries.items()
+        }
+        l1.set_many(values, _l1_ttl(rows[0][6], now) if rows else None)
+    return len(rows)
+
+
+def mdelete(keys: Iterable[str]) -> int:
+    """
+    Delete several cache entries in a single transaction (callable API).
+
+    Args:
+        keys: Cache keys (1-500 chars each).
+
+    Returns:
+        Number of entries deleted.
 
-    # Check if expired
-    if ttl_seconds is not None:
-        created = datetime.fromisoformat(created_at)
-        expiry = created + timedelta(seconds=ttl_seconds)
-        if datetime.utcnow() > expiry:
-            # Delete expired entry
-            _ctx.conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
-            _ctx.conn.commit()
-            return None
+    Raises:
+        ValidationException: If a key is invalid.
+    """
+    if _ctx is None:
+        raise RuntimeError("Context not initialized")
 
-    return value_bytes.decode("utf-8")
+    keys = _check_keys(keys)
+    deleted = 0
+    try:
+        for chunk in _chunks(keys):
+            placeholders = ",".join("?" * len(chunk))
+            cur = _ctx.conn.execute(
+                f"DELETE FROM cache_entries WHERE key IN ({placeholders})", chunk
+            )
+            deleted += cur.rowcount
+        _ctx.conn.commit()
+    except Exception:
+        _ctx.conn.rollback()
+        raise
+    l1 = _l1_written()
+    if l1 is not None:
+        for key in keys:
+            l1.delete(key)
+    return deleted
 
 
+def invalidate_kind(kind: str) -> int:
+    """
+    Delete every cache entry of a kind, e.g. all embeddings (callable API).
+
+    Args:
+        kind: Cache kind.
+
+    Returns:
+        Number of entries deleted.
+    """
+    if _ctx is None:
+        raise RuntimeError("Context not initialized")
+
+    cur = _ctx.conn.execute("DELETE FROM cache_entries WHERE kind = ?", (kind,))
+    _ctx.conn.commit()
+    # The L1 tier does not know kinds
+    l1 = _l1_written()
+    if l1 is not None:
+        l1.clear()
+    return cur.rowcount
+
+
+@maintenance(interval=PRUNE_INTERVAL)
 def prune_expired() -> int:
     """
     Remove expired cache entries.
 
+    Deletes in batches of PRUNE_BATCH_SIZE rows, committing after each batch
+    so concurrent writers are not blocked for long. Run periodically by the daemon.
+
     Returns:
         Number of entries deleted.
     """
     if _ctx is None:
         raise RuntimeError("Context not initialized")
 
-    cur = _ctx.conn.execute("""
-        SELECT key, created_at, ttl_seconds
-        FROM cache_entries
-        WHERE ttl_seconds IS NOT NULL
-    """)
+    now = time.time()
+    deleted = 0
+    while True:
+        cur = _ctx.conn.execute(
+            """
+            DELETE FROM cache_entries
+            WHERE rowid IN (
+                SELECT rowid FROM cache_entries WHERE expires_at <= ? LIMIT ?
+            )
+        """,
+            (now, PRUNE_BATCH_SIZE),
+        )
+        _ctx.conn.commit()
+        deleted += cur.rowcount
+        if cur.rowcount < PRUNE_BATCH_SIZE:
+            if deleted:
+                _l1_written()
+            return deleted
 
-    expired_keys = []
-    now = datetime.utcnow()
 
-    for row in cur:
-        key, created_at, ttl_seconds = row
-        created = datetime.fromisoformat(created_at)
-        expiry = created + timedelta(seconds=ttl_seconds)
-        if now > expiry:
-            expired_keys.append(key)
-
-    if expired_keys:
-        placeholders = ",".join("?" * len(expired_keys))
-        _ctx.conn.execute(f"DELETE FROM cache_entries WHERE key IN ({placeholders})", expired_keys)
+def set_budget(max_bytes: int | None, kind: str | None = None) -> None:
+    """
+    Set the byte budget of the whole cache or of one kind (callable API).
+
+    Budgets are stored in the database, so they apply to every process and
+    are enforced by evict_to_budget().
+
+    Args:
+        max_bytes: Budget in bytes of stored values; None removes the budget
+            (the global budget then falls back to MAX_BYTES).
+        kind: Cache kind, or None for the global budget.
+
+    Raises:
+        ValueError: If max_bytes is negative.
+    """
+    if _ctx is None:
+        raise RuntimeError("Context not initialized")
+    if max_bytes is not None and max_bytes < 0:
+        raise ValueError("max_bytes must not be negative")
+
+    name = GLOBAL_BUDGET if kind is None else kind
+    if max_bytes is None:
+        _ctx.conn.execute("DELETE FROM cache_budgets WHERE kind = ?", (name,))
+    else:
+        _ctx.conn.execute(
+            "INSERT OR REPLACE INTO cache_budgets (kind, max_bytes) VALUES (?, ?)",
+            (name, max_bytes),
+        )
+    _ctx.conn.commit()
+
+
+def get_budgets() -> dict[str, int]:
+    """
+    Get the byte budgets in force (callable API).
+
+    Returns:
+        Mapping of kind to budget; GLOBAL_BUDGET ("*") is the whole-cache budget.
+    """
+    if _ctx is None:
+        raise RuntimeError("Context not initialized")
+
+    budgets = {GLOBAL_BUDGET: MAX_BYTES}
+    budgets.update(_ctx.conn.execute("SELECT kind, max_bytes FROM cache_budgets"))
+    return budgets
+
+
+def _evict_lru(conn: sqlite3.Connection, max_bytes: int, kind: str | None) -> tuple[int, int]:
+    """Delete least recently used entries until at most max_bytes remain.
+
+    Only entries of kind are considered when it is given. Each batch of
+    EVICT_BATCH_SIZE candidates is deleted in its own transaction.
+
+    Returns:
+        Number of entries and bytes evicted.
+    """
+    where, params = ("WHERE kind = ?", (kind,)) if kind is not None else ("", ())
+    total = conn.execute(
+        f"SELECT COALESCE(SUM(size_bytes), 0) FROM cache_entries {where}", params
+    ).fetchone()[0]
+    excess = total - max_bytes
+    evicted = freed = 0
+    while excess > 0:
+        candidates = conn.execute(
+            f"SELECT rowid, size_bytes FROM cache_entries {where} ORDER BY last_access LIMIT ?",
+            (*params, EVICT_BATCH_SIZE),
+        ).fetchall()
+        if not candidates:
+            break
+        victims = []
+        for rowid, size in candidates:
+            if excess <= 0:
+                break
+            victims.append(rowid)
+            excess -= size
+            freed += size
+        placeholders = ",".join("?" * len(victims))
+        conn.execute(f"DELETE FROM cache_entries WHERE rowid IN ({placeholders})", victims)
+        conn.commit()
+        evicted += len(victims)
+    return evicted, freed
+
+
+@maintenance(interval=EVICT_INTERVAL)
+def evict_to_budget() -> int:
+    """
+    Evict least recently used entries until every byte budget is met.
+
+    Pending access updates are flushed and expired entries pruned first.
+    Per-kind budgets are enforced before the global one. Run periodically
+    by the daemon.
+
+    Returns:
+        Number of entries evicted.
+    """
+    if _ctx is None:
+        raise RuntimeError("Context not initialized")
+
+    flush_access()
+    prune_expired()
+    budgets = get_budgets()
+    global_budget = budgets.pop(GLOBAL_BUDGET)
+    evicted = freed = 0
+    for kind, max_bytes in budgets.items():
+        count, size = _evict_lru(_ctx.conn, max_bytes, kind)
+        evicted, freed = evicted + count, freed + size
+    count, size = _evict_lru(_ctx.conn, global_budget, None)
+    evicted, freed = evicted + count, freed + size
+
+    if evicted:
+        _add_stats(_ctx.conn, {"evictions": evicted, "evicted_bytes": freed})
         _ctx.conn.commit()
+        l1 = _l1_written()
+        if l1 is not None:
+            l1.clear()
+        logger.info(f"Evicted {evicted} cache entries ({freed} bytes)")
+    return evicted
+
+
+def get_stats() -> dict[str, Any]:
+    """
+    Get cache size and cumulative hit/eviction counters (callable API).
+
+    Returns:
+        Dict with entries, bytes, max_bytes, hits, misses, hit_ratio,
+        evictions and evicted_bytes, plus l1_entries and l1_hit_ratio for
+        this process when the L1 tier is enabled.
+    """
+    if _ctx is None:
+        raise RuntimeError("Context not initialized")
 
-    return len(expired_keys)
+    flush_access()
+    entries, size = _ctx.conn.execute(
+        "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM cache_entries"
+    ).fetchone()
+    counters = dict(_ctx.conn.execute("SELECT name, value FROM cache_stats"))
+    hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+    lookups = hits + misses
+    result: dict[str, Any] = {
+        "entries": entries,
+        "bytes": size,
+        "max_bytes": get_budgets()[GLOBAL_BUDGET],
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": hits / lookups if lookups else 0.0,
+        "evictions": counters.get("evictions", 0),
+        "evicted_bytes": counters.get("evicted_bytes", 0),
+    }
+    if _l1 is not None:
+        l1_stats = _l1.stats()
+        result["l1_entries"] = l1_stats.size
+        result["l1_hit_ratio"] = l1_stats.hit_ratio
+    return result
 
 
 @app.command()
@@ -186,7 +775,7 @@ def list(kind: str | None = typer.Option(None, help="Filter by kind")) -> None:
         console.print("[red]Context not initialized[/red]")
         return
 
-    query = "SELECT key, kind, created_at, ttl_seconds FROM cache_entries"
+    query = "SELECT key, kind, created_at, ttl_seconds, expires_at FROM cache_entries"
     params: tuple[Any, ...] = ()
 
     if kind:
@@ -204,15 +793,13 @@ def list(kind: str | None = typer.Option(None, help="Filter by kind")) -> None:
     table.add_column("TTL", style="magenta")
     table.add_column("Status", style="green")
 
-    now = datetime.utcnow()
+    now = time.time()
     for row in cur:
-        key_val, kind_val, created_at, ttl_seconds = row
+        key_val, kind_val, created_at, ttl_seconds, expires_at = row
         status = "✓ Valid"
 
-        if ttl_seconds is not None:
-            created = datetime.fromisoformat(created_at)
-            expiry = created + timedelta(seconds=ttl_seconds)
-            remaining = (expiry - now).total_seconds()
+        if expires_at is not None:
+            remaining = expires_at - now
 
             if remaining <= 0:
                 status = "✗ Expired"
@@ -243,10 +830,77 @@ def prune(expired_only: bool = typer.Option(True, help="Only remove expired entr
 
         _ctx.conn.execute("DELETE FROM cache_entries")
         _ctx.conn.commit()
+        l1 = _l1_written()
+        if l1 is not None:
+            l1.clear()
 
         console.print(f"[green]Cleared all {count} cache entries[/green]")
 
 
+@app.command()
+def invalidate(kind: str) -> None:
+    """Delete all cache entries of a kind."""
+    if _ctx is None:
+        console.print("[red]Context not initialized[/red]")
+        return
+
+    deleted = invalidate_kind(kind)
+    console.print(f"[green]Invalidated {deleted} '{kind}' cache entries[/green]")
+
+
+@app.command()
+def budget(
+    max_bytes: int | None = typer.Argument(None, help="Budget in bytes (omit to show budgets)"),
+    kind: str | None = typer.Option(None, help="Cache kind (default: whole cache)"),
+    clear: bool = typer.Option(False, "--clear", help="Remove the budget"),
+) -> None:
+    """Show or set the byte budgets enforced by LRU eviction."""
+    if _ctx is None:
+        console.print("[red]Context not initialized[/red]")
+        return
+
+    if max_bytes is not None or clear:
+        try:
+            set_budget(None if clear else max_bytes, kind)
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            return
+
+    table = Table(title="Cache Budgets")
+    table.add_column("Kind", style="yellow")
+    table.add_column("Max Bytes", style="magenta", justify="right")
+    for kind_name, limit in get_budgets().items():
+        table.add_row("(all)" if kind_name == GLOBAL_BUDGET else kind_name, f"{limit:,}")
+    console.print(table)
+
+
+@app.command()
+def evict() -> None:
+    """Evict least recently used entries over the byte budgets now."""
+    if _ctx is None:
+        console.print("[red]Context not initialized[/red]")
+        return
+
+    evicted = evict_to_budget()
+    console.print(f"[green]Evicted {evicted} cache entries[/green]")
+
+
+@app.command()
+def stats() -> None:
+    """Show cache size, hit ratio and eviction statistics."""
+    if _ctx is None:
+        console.print("[red]Context not initialized[/red]")
+        return
+
+    data = get_stats()
+    console.print(f"Entries:       {data['entries']:,}")
+    console.print(f"Size:          {data['bytes']:,} / {data['max_bytes']:,} bytes")
+    console.print(
+        f"Hit ratio:     {data['hit_ratio']:.1%} ({data['hits']:,} hits, {data['misses']:,} misses)"
+    )
+    console.print(f"Evictions:     {data['evictions']:,} ({data['evicted_bytes']:,} bytes)")
+
+
 @app.command()
 def warmup(
     project_id: str = typer.Option(..., help="Project ID to warmup"),
@@ -281,6 +935,9 @@ def delete(key: str) -> None:
 
     cur = _ctx.conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
     _ctx.conn.commit()
+    l1 = _l1_written()
+    if l1 is not None:
+        l1.delete(key)
 
     if cur.rowcount > 0:
         console.print(f"[green]Cache entry '{key}' deleted[/green]")
@@ -1,11 +1,30 @@
 """Tests for cache skill."""
 
+import sqlite3
+import time
 from datetime import datetime, timedelta
+from pathlib import Path
 
 import pytest
-from glorious_skill_cache.skill import get_cache, init_context, prune_expired, set_cache
+from glorious_cache import skill
+from glorious_cache.skill import (
+    evict_to_budget,
+    flush_access,
+    get_budgets,
+    get_cache,
+    get_stats,
+    init_context,
+    invalidate_kind,
+    mdelete,
+    mget,
+    mset,
+    prune_expired,
+    set_budget,
+    set_cache,
+)
 
 from glorious_agents.core.context import SkillContext
+from glorious_agents.core.validation import ValidationException
 
 
 @pytest.fixture
@@ -16,18 +35,11 @@ def cache_context(tmp_path):
     db_path = tmp_path / "test.db"
     conn = sqlite3.connect(str(db_path))
 
-    # Initialize schema
-    schema_sql = """
-    CREATE TABLE IF NOT EXISTS cache_entries (
-        key TEXT PRIMARY KEY,
-        value BLOB NOT NULL,
-        kind TEXT,
-        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-        ttl_seconds INTEGER,
-        meta JSON
-    );
-    """
-    conn.executescript(schema_sql)
+    # Initialize schema the way the skill loader does
+    package_dir = Path(skill.__file__).parent
+    conn.executescript((package_dir / "schema.sql").read_text())
+    for migration in sorted((package_dir / "migrations").glob("*.sql")):
+        conn.executescript(migration.read_text())
     conn.commit()
 
     ctx = SkillContext(conn, {})
@@ -69,10 +81,10 @@ def test_cache_expiration(cache_context):
 
     cache_context.conn.execute(
         """
-        INSERT INTO cache_entries (key, value, kind, created_at, ttl_seconds)
-        VALUES (?, ?, ?, ?, ?)
+        INSERT INTO cache_entries (key, value, kind, created_at, ttl_seconds, expires_at)
+        VALUES (?, ?, ?, ?, ?, ?)
     """,
-        ("expired-key", b"expired-value", "test", past_time, 5),
+        ("expired-key", b"expired-value", "test", past_time, 5, int(time.time()) - 5),
     )
     cache_context.conn.commit()
 
@@ -80,6 +92,10 @@ def test_cache_expiration(cache_context):
     result = get_cache("expired-key")
     assert result is None
 
+    # Reads do not delete; the row stays until pruned
+    count = cache_context.conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+    assert count == 1
+
 
 def test_cache_kinds(cache_context):
     """Test cache with different kinds."""
@@ -96,10 +112,10 @@ def test_prune_expired(cache_context):
     past_time = (datetime.utcnow() - timedelta(seconds=10)).isoformat()
     cache_context.conn.execute(
         """
-        INSERT INTO cache_entries (key, value, kind, created_at, ttl_seconds)
-        VALUES (?, ?, ?, ?, ?)
+        INSERT INTO cache_entries (key, value, kind, created_at, ttl_seconds, expires_at)
+        VALUES (?, ?, ?, ?, ?, ?)
     """,
-        ("expired1", b"value1", "test", past_time, 5),
+        ("expired1", b"value1", "test", past_time, 5, int(time.time()) - 5),
     )
 
     # Add valid entry
@@ -131,3 +147,250 @@ def test_large_value(cache_context):
 
     result = get_cache("large-key")
     assert result == large_value
+
+
+def test_prune_expired_in_batches(cache_context, monkeypatch):
+    """Test that pruning deletes all expired rows across several batches."""
+    monkeypatch.setattr(skill, "PRUNE_BATCH_SIZE", 2)
+    for i in range(5):
+        set_cache(f"key{i}", "value", ttl_seconds=1)
+    set_cache("permanent", "value")
+
+    later = time.time() + 10
+    monkeypatch.setattr(skill.time, "time", lambda: later)
+
+    assert prune_expired() == 5
+    assert get_cache("permanent") == "value"
+
+
+def test_prune_expired_is_maintenance_job():
+    """Test that the daemon schedules pruning."""
+    from glorious_agents.core.maintenance import get_maintenance_interval
+
+    assert get_maintenance_interval(prune_expired) == skill.PRUNE_INTERVAL
+
+
+def test_mset_and_mget(cache_context):
+    """Test bulk set and get of text and bytes values."""
+    assert mset({"a": "text", "b": b"\x00\x01binary"}, ttl_seconds=60, kind="tool") == 2
+
+    assert mget(["a", "b", "missing"]) == {"a": "text", "b": b"\x00\x01binary"}
+    assert get_cache("b") == b"\x00\x01binary"
+
+
+def test_large_values_are_compressed(cache_context):
+    """Test that values above the threshold are stored compressed and read back intact."""
+    text = "embedding " * 2000
+    blob = bytes(range(256)) * 100
+    mset({"text": text, "blob": blob})
+
+    rows = dict(cache_context.conn.execute("SELECT key, encoding FROM cache_entries").fetchall())
+    assert rows == {"text": "text+zlib", "blob": "bytes+zlib"}
+    stored = cache_context.conn.execute(
+        "SELECT length(value) FROM cache_entries WHERE key = 'text'"
+    ).fetchone()[0]
+    assert stored < len(text)
+    assert mget(["text", "blob"]) == {"text": text, "blob": blob}
+
+
+def test_mset_without_compression(cache_context):
+    """Test that compression can be turned off per call."""
+    mset({"raw": "x" * 10000}, compression=None)
+
+    encoding = cache_context.conn.execute("SELECT encoding FROM cache_entries").fetchone()[0]
+    assert encoding == "text"
+
+
+def test_mset_rejects_invalid_keys(cache_context):
+    """Test that bulk writes validate keys before writing anything."""
+    with pytest.raises(ValidationException):
+        mset({"ok": "value", "": "value"})
+
+    assert mget(["ok"]) == {}
+
+
+def test_mdelete(cache_context):
+    """Test deleting several keys at once."""
+    mset({f"k{i}": "v" for i in range(5)})
+
+    assert mdelete(["k0", "k1", "missing"]) == 2
+    assert sorted(mget([f"k{i}" for i in range(5)])) == ["k2", "k3", "k4"]
+
+
+def test_invalidate_kind(cache_context):
+    """Test deleting all entries of a kind."""
+    mset({"e1": b"1", "e2": b"2"}, kind="embeddings")
+    set_cache("other", "value", kind="ast")
+
+    assert invalidate_kind("embeddings") == 2
+    assert mget(["e1", "e2", "other"]) == {"other": "value"}
+
+
+def test_entries_record_size_and_access_time(cache_context):
+    """Test that writes store the value size and an initial access time."""
+    before = int(time.time())
+    mset({"small": "abc", "blob": b"\x00" * 10}, compression=None)
+
+    rows = cache_context.conn.execute(
+        "SELECT key, size_bytes, last_access FROM cache_entries ORDER BY key"
+    ).fetchall()
+    assert [(key, size) for key, size, _ in rows] == [("blob", 10), ("small", 3)]
+    assert all(last_access >= before for _, _, last_access in rows)
+
+
+def test_access_updates_are_batched(cache_context, monkeypatch):
+    """Test that reads buffer last_access updates until a flush."""
+    monkeypatch.setattr(skill, "ACCESS_FLUSH_SIZE", 3)
+    monkeypatch.setattr(skill, "ACCESS_RESOLUTION", 0)
+    mset({f"k{i}": "v" for i in range(3)})
+    cache_context.conn.execute("UPDATE cache_entries SET last_access = 0")
+    cache_context.conn.commit()
+
+    def stale_rows() -> int:
+        return cache_context.conn.execute(
+            "SELECT COUNT(*) FROM cache_entries WHERE last_access = 0"
+        ).fetchone()[0]
+
+    get_cache("k0")
+    get_cache("k1")
+    assert stale_rows() == 3
+
+    get_cache("k2")
+    assert stale_rows() == 0
+
+
+def test_evict_to_global_budget_removes_least_recently_used(cache_context, monkeypatch):
+    """Test that eviction deletes the oldest-accessed entries until under budget."""
+    monkeypatch.setattr(skill, "EVICT_BATCH_SIZE", 2)
+    mset({f"k{i}": "x" * 100 for i in range(5)}, compression=None)
+    for i in range(5):
+        cache_context.conn.execute(
+            "UPDATE cache_entries SET last_access = ? WHERE key = ?", (1000 + i, f"k{i}")
+        )
+    cache_context.conn.commit()
+    set_budget(250)
+
+    assert evict_to_budget() == 3
+    assert sorted(mget([f"k{i}" for i in range(5)])) == ["k3", "k4"]
+
+
+def test_per_kind_budget_only_evicts_that_kind(cache_context):
+    """Test that a kind budget leaves other kinds alone."""
+    mset({"e1": "x" * 100, "e2": "x" * 100}, kind="embeddings", compression=None)
+    mset({"a1": "x" * 100}, kind="ast", compression=None)
+    cache_context.conn.execute("UPDATE cache_entries SET last_access = 1 WHERE key = 'e1'")
+    cache_context.conn.commit()
+    set_budget(150, kind="embeddings")
+
+    assert get_budgets() == {skill.GLOBAL_BUDGET: skill.MAX_BYTES, "embeddings": 150}
+    assert evict_to_budget() == 1
+    assert sorted(mget(["e1", "e2", "a1"])) == ["a1", "e2"]
+
+    set_budget(None, kind="embeddings")
+    assert get_budgets() == {skill.GLOBAL_BUDGET: skill.MAX_BYTES}
+
+
+def test_set_budget_rejects_negative(cache_context):
+    """Test that budgets must not be negative."""
+    with pytest.raises(ValueError, match="negative"):
+        set_budget(-1)
+
+
+def test_stats_track_hit_ratio_and_evictions(cache_context):
+    """Test cumulative hit, miss and eviction counters."""
+    mset({"a": "x" * 100, "b": "x" * 100}, compression=None)
+    get_cache("a")
+    get_cache("missing")
+    mget(["a", "b", "nope"])
+    set_budget(100)
+    evict_to_budget()
+
+    stats = get_stats()
+    assert stats["hits"] == 3
+    assert stats["misses"] == 2
+    assert stats["hit_ratio"] == pytest.approx(0.6)
+    assert stats["evictions"] == 1
+    assert stats["evicted_bytes"] == 100
+    assert stats["entries"] == 1
+    assert stats["bytes"] == 100
+    assert stats["max_bytes"] == 100
+    assert flush_access() == 0
+
+
+def test_evict_to_budget_is_maintenance_job():
+    """Test that the daemon schedules eviction."""
+    from glorious_agents.core.maintenance import get_maintenance_interval
+
+    assert get_maintenance_interval(evict_to_budget) == skill.EVICT_INTERVAL
+
+
+def _other_connection(ctx: SkillContext) -> sqlite3.Connection:
+    """Open a second connection to the cache database, like another process would."""
+    path = ctx.conn.execute("PRAGMA database_list").fetchone()[2]
+    return sqlite3.connect(path)
+
+
+def test_hot_keys_are_served_from_l1(cache_context):
+    """Test that repeated reads are answered by the in-process tier."""
+    set_cache("hot", "value")
+
+    for _ in range(3):
+        assert get_cache("hot") == "value"
+
+    assert skill._l1 is not None
+    assert skill._l1.stats().hits == 3
+    assert get_stats()["l1_entries"] == 1
+
+
+def test_l1_is_invalidated_by_other_connections(cache_context, monkeypatch):
+    """Test that writes by another process are seen once the check interval passes."""
+    set_cache("shared", "old")
+    assert get_cache("shared") == "old"
+
+    other = _other_connection(cache_context)
+    other.execute("UPDATE cache_entries SET value = ? WHERE key = 'shared'", (b"new",))
+    other.commit()
+    other.close()
+
+    # Within the check interval the L1 value may still be served
+    assert get_cache("shared") == "old"
+
+    monkeypatch.setattr(skill, "L1_CHECK_INTERVAL", 0)
+    assert get_cache("shared") == "new"
+
+
+def test_l1_survives_unrelated_commits(cache_context, monkeypatch):
+    """Test that commits to other tables do not clear the in-process tier."""
+    monkeypatch.setattr(skill, "L1_CHECK_INTERVAL", 0)
+    set_cache("key", "value")
+    get_cache("key")
+
+    other = _other_connection(cache_context)
+    other.execute("CREATE TABLE unrelated (id INTEGER)")
+    other.commit()
+    other.close()
+
+    assert get_cache("key") == "value"
+    assert skill._l1 is not None
+    assert skill._l1.stats().hits == 2
+
+
+def test_l1_ttl_matches_stored_expiry(cache_context):
+    """Test that L1 entries expire no later than their rows."""
+    set_cache("short", "value", ttl_seconds=5)
+
+    assert skill._l1 is not None
+    l1_remaining = skill._l1._cache["short"][1] - time.monotonic()
+    expires_at = cache_context.conn.execute("SELECT expires_at FROM cache_entries").fetchone()[0]
+    assert l1_remaining == pytest.approx(expires_at - time.time(), abs=0.1)
+
+
+def test_l1_can_be_disabled(cache_context, monkeypatch):
+    """Test that an L1 size of 0 turns the in-process tier off."""
+    monkeypatch.setattr(skill, "L1_MAX_SIZE", 0)
+    init_context(cache_context)
+
+    set_cache("key", "value")
+    assert get_cache("key") == "value"
+    assert skill._l1 is None
+    assert "l1_entries" not in get_stats()
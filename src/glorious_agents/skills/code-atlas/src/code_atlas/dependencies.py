@@ -5,11 +5,28 @@ Provides factory functions for creating service instances with proper dependenci
 
 from pathlib import Path
 
+from glorious_agents.core.context import EventBus
+
 from .service import CodeAtlasService
 
 # Module-level service instance for reuse
 _service_instance: CodeAtlasService | None = None
 
+# Event bus of the skill context, set by the skill's init_context
+_event_bus: EventBus | None = None
+
+
+def set_event_bus(event_bus: EventBus | None) -> None:
+    """Set the event bus services publish scan events to.
+
+    Args:
+        event_bus: Event bus from the skill context
+    """
+    global _event_bus
+    _event_bus = event_bus
+    if _service_instance is not None:
+        _service_instance.event_bus = event_bus
+
 
 def get_atlas_service(
     index_path: Path | str = "code_index.json",
@@ -30,6 +47,7 @@ def get_atlas_service(
         _service_instance = CodeAtlasService(
             index_path=index_path,
             cache_path=cache_path,
+            event_bus=_event_bus,
         )
 
     return _service_instance
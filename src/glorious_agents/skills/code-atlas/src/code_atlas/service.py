@@ -4,6 +4,7 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+from glorious_agents.core.context import TOPIC_SCAN_READY, EventBus
 from glorious_agents.core.search import SearchResult
 
 from .cache import FileCache
@@ -23,15 +24,18 @@ class CodeAtlasService:
         self,
         index_path: Path | str = "code_index.json",
         cache_path: Path | str = ".code_atlas_cache.json",
+        event_bus: EventBus | None = None,
     ) -> None:
         """Initialize service with dependencies.
 
         Args:
             index_path: Path to code index file
             cache_path: Path to cache file
+            event_bus: Optional event bus for publishing events
         """
         self.index_path = Path(index_path)
         self.cache_path = Path(cache_path)
+        self.event_bus = event_bus
         self.repository = CodeIndexRepository(index_path)
         self._cache: FileCache | None = None
 
@@ -83,6 +87,9 @@ class CodeAtlasService:
         # Save to repository
         self.repository.save(index_data)
 
+        if self.event_bus:
+            self.event_bus.publish(TOPIC_SCAN_READY, {"index_path": str(self.index_path)})
+
         return index_data
 
     def find_entity(self, name: str) -> dict[str, Any] | None:
@@ -8,8 +8,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from glorious_agents.core.context import TOPIC_SCAN_READY
+from glorious_agents.core.rpc_cache import cacheable
+
 from code_atlas.cli import app
-from code_atlas.dependencies import get_atlas_service
+from code_atlas.dependencies import get_atlas_service, set_event_bus
 
 if TYPE_CHECKING:
     from glorious_agents.core.context import SkillContext
@@ -31,8 +34,11 @@ def init_context(ctx: SkillContext) -> None:
     """
     global _ctx
     _ctx = ctx
+    # Scans publish TOPIC_SCAN_READY, which invalidates cached search results
+    set_event_bus(ctx.event_bus)
 
 
+@cacheable(ttl=60, invalidate_on=[TOPIC_SCAN_READY])
 def search(query: str, limit: int = 10) -> list[SearchResult]:
     """Universal search API for code atlas.
 
@@ -3,8 +3,11 @@
 import tempfile
 from pathlib import Path
 
+from glorious_agents.core.context import TOPIC_SCAN_READY, EventBus
+
 from code_atlas.query import CodeIndex
 from code_atlas.scanner import ASTScanner
+from code_atlas.service import CodeAtlasService
 
 
 def test_scan_and_query_integration() -> None:
@@ -94,3 +97,20 @@ def complex_function(x, y, z):
             deps = ci.dependencies(file_info["path"])
             assert "imports" in deps
             assert "imported_by" in deps
+
+
+def test_scan_publishes_scan_ready() -> None:
+    """Test that a finished scan publishes the event that invalidates cached searches."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / "module.py").write_text("def f():\n    return 1\n", encoding="utf-8")
+
+        events: list[dict] = []
+        bus = EventBus()
+        bus.subscribe(TOPIC_SCAN_READY, events.append)
+
+        index_path = tmppath / "code_index.json"
+        service = CodeAtlasService(index_path=index_path, cache_path=tmppath / "cache.json", event_bus=bus)
+        service.scan_directory(tmppath)
+
+        assert events == [{"index_path": str(index_path)}]
@@ -1,7 +1,13 @@
 """Database adapters for issue tracker."""
 
 from issue_tracker.adapters.db.engine import create_db_engine, get_database_path
-from issue_tracker.adapters.db.repositories import CommentRepository, IssueGraphRepository, IssueRepository
+from issue_tracker.adapters.db.repositories import (
+    CommentRepository,
+    IssueGraphRepository,
+    IssueReadRepository,
+    IssueRepository,
+    IssueRow,
+)
 from issue_tracker.adapters.db.unit_of_work import UnitOfWork
 
 __all__ = [
@@ -11,4 +17,6 @@ __all__ = [
     "IssueRepository",
     "CommentRepository",
     "IssueGraphRepository",
+    "IssueReadRepository",
+    "IssueRow",
 ]
@@ -0,0 +1,64 @@
+"""Add issue_changes log maintained by triggers
+
+Revision ID: issue_changes_001
+Revises: sync_state_001
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "issue_changes_001"
+down_revision: str | Sequence[str] | None = "sync_state_001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Frozen copy of the triggers as of this revision; later model changes need a new revision.
+# (table, event, SQL expression of the changed issue's ID)
+TRIGGERS = (
+    ("issues", "INSERT", "NEW.id"),
+    ("issues", "UPDATE", "NEW.id"),
+    ("issues", "DELETE", "OLD.id"),
+    ("issue_labels", "INSERT", "NEW.issue_id"),
+    ("issue_labels", "DELETE", "OLD.issue_id"),
+    ("comments", "INSERT", "NEW.issue_id"),
+    ("comments", "UPDATE", "NEW.issue_id"),
+    ("comments", "DELETE", "OLD.issue_id"),
+    ("dependencies", "INSERT", "NEW.from_issue_id"),
+    ("dependencies", "DELETE", "OLD.from_issue_id"),
+)
+
+
+def _trigger_name(table: str, event: str) -> str:
+    return f"issue_changes_{table}_{event.lower()}"
+
+
+def upgrade() -> None:
+    """Create the issue_changes table and its triggers."""
+    op.create_table(
+        "issue_changes",
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("issue_id", sqlmodel.sql.sqltypes.AutoString(length=50), nullable=False),
+        sa.PrimaryKeyConstraint("seq"),
+        sqlite_autoincrement=True,
+    )
+    for table, event, issue_id in TRIGGERS:
+        op.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {_trigger_name(table, event)}
+            AFTER {event} ON {table}
+            BEGIN
+                INSERT INTO issue_changes(issue_id) VALUES ({issue_id});
+            END;
+        """)
+
+
+def downgrade() -> None:
+    """Drop the issue_changes triggers and table."""
+    for table, event, _ in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {_trigger_name(table, event)};")
+    op.drop_table("issue_changes")
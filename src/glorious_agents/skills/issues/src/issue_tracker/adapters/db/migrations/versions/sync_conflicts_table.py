@@ -0,0 +1,42 @@
+"""Add sync_conflicts table for merge conflicts
+
+Revision ID: sync_conflicts_001
+Revises: issue_changes_001
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "sync_conflicts_001"
+down_revision: str | Sequence[str] | None = "issue_changes_001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the sync_conflicts table."""
+    op.create_table(
+        "sync_conflicts",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("issue_id", sqlmodel.sql.sqltypes.AutoString(length=50), nullable=False),
+        sa.Column("base_hash", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True),
+        sa.Column("local_hash", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True),
+        sa.Column("remote_hash", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True),
+        sa.Column("remote_record", sa.String(), nullable=True),
+        sa.Column("detected_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sqlite_autoincrement=True,
+    )
+    op.create_index(op.f("ix_sync_conflicts_issue_id"), "sync_conflicts", ["issue_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the sync_conflicts table."""
+    op.drop_index(op.f("ix_sync_conflicts_issue_id"), table_name="sync_conflicts")
+    op.drop_table("sync_conflicts")
@@ -0,0 +1,34 @@
+"""Add sync_state table for persistent export hashes
+
+Revision ID: sync_state_001
+Revises: fts5_search_001
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "sync_state_001"
+down_revision: str | Sequence[str] | None = "fts5_search_001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the sync_state table."""
+    op.create_table(
+        "sync_state",
+        sa.Column("issue_id", sqlmodel.sql.sqltypes.AutoString(length=50), nullable=False),
+        sa.Column("content_hash", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+        sa.PrimaryKeyConstraint("issue_id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the sync_state table."""
+    op.drop_table("sync_state")
@@ -14,6 +14,11 @@ __all__ = [
     "CommentModel",
     "DependencyModel",
     "EpicModel",
+    "SyncStateModel",
+    "IssueChangeModel",
+    "ISSUE_CHANGE_TRIGGERS",
+    "issue_change_trigger_sql",
+    "SyncConflictModel",
 ]
 
 
@@ -125,3 +130,81 @@ class EpicModel(SQLModel, table=True):
     start_date: datetime | None = None
     target_date: datetime | None = None
     completed_date: datetime | None = None
+
+
+class SyncStateModel(SQLModel, table=True):
+    """Content hash of each issue as last exported to JSONL.
+
+    Rows outlive their issues until the next export drops them from the file,
+    so issue_id is deliberately not a foreign key.
+    """
+
+    __tablename__ = "sync_state"
+
+    issue_id: str = Field(primary_key=True, max_length=50)
+    content_hash: str = Field(max_length=64)
+
+
+class IssueChangeModel(SQLModel, table=True):
+    """Change log of issues, filled by triggers on issues and their child tables.
+
+    The sync daemon exports the issues logged up to a watermark, then deletes
+    those rows. AUTOINCREMENT keeps seq growing even after the log is emptied.
+    """
+
+    __tablename__ = "issue_changes"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    seq: int | None = Field(default=None, primary_key=True)
+    issue_id: str = Field(max_length=50)
+
+
+# Triggers that fill issue_changes: (table, event, expression of the issue ID)
+ISSUE_CHANGE_TRIGGERS = (
+    ("issues", "INSERT", "NEW.id"),
+    ("issues", "UPDATE", "NEW.id"),
+    ("issues", "DELETE", "OLD.id"),
+    ("issue_labels", "INSERT", "NEW.issue_id"),
+    ("issue_labels", "DELETE", "OLD.issue_id"),
+    ("comments", "INSERT", "NEW.issue_id"),
+    ("comments", "UPDATE", "NEW.issue_id"),
+    ("comments", "DELETE", "OLD.issue_id"),
+    ("dependencies", "INSERT", "NEW.from_issue_id"),
+    ("dependencies", "DELETE", "OLD.from_issue_id"),
+)
+
+
+def issue_change_trigger_sql(table: str, event: str, issue_id: str) -> tuple[str, str]:
+    """Build the name and CREATE statement of one issue_changes trigger.
+
+    Args:
+        table: Table the trigger fires on
+        event: INSERT, UPDATE or DELETE
+        issue_id: SQL expression of the changed issue's ID
+
+    Returns:
+        Tuple of (trigger name, idempotent CREATE TRIGGER statement)
+    """
+    name = f"issue_changes_{table}_{event.lower()}"
+    return name, (
+        f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON {table} BEGIN "
+        f"INSERT INTO issue_changes(issue_id) VALUES ({issue_id}); END"
+    )
+
+
+class SyncConflictModel(SQLModel, table=True):
+    """Issue changed both locally and in the pulled JSONL since the last sync.
+
+    The local version is kept; the remote record is stored here for review.
+    """
+
+    __tablename__ = "sync_conflicts"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id: int | None = Field(default=None, primary_key=True)
+    issue_id: str = Field(max_length=50, index=True)
+    base_hash: str | None = Field(default=None, max_length=64)  # as last synced
+    local_hash: str | None = Field(default=None, max_length=64)  # None if deleted locally
+    remote_hash: str | None = Field(default=None, max_length=64)  # None if deleted remotely
+    remote_record: str | None = Field(default=None, sa_column=Column(String))  # JSON
+    detected_at: datetime
@@ -2,6 +2,15 @@
 
 from issue_tracker.adapters.db.repositories.comment_repository import CommentRepository
 from issue_tracker.adapters.db.repositories.issue_graph_repository import IssueGraphRepository
+from issue_tracker.adapters.db.repositories.issue_read_repository import IssueReadRepository, IssueRow
 from issue_tracker.adapters.db.repositories.issue_repository import IssueRepository
+from issue_tracker.adapters.db.repositories.sync_state_repository import SyncStateRepository
 
-__all__ = ["IssueRepository", "CommentRepository", "IssueGraphRepository"]
+__all__ = [
+    "IssueRepository",
+    "CommentRepository",
+    "IssueGraphRepository",
+    "IssueReadRepository",
+    "IssueRow",
+    "SyncStateRepository",
+]
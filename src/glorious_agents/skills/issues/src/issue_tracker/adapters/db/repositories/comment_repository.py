@@ -1,7 +1,10 @@
 """Comment repository implementation with SQLModel."""
 
 import logging
+from collections.abc import Sequence
 
+from glorious_agents.core.repository import BULK_BATCH_SIZE
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import Session, select
 
 from issue_tracker.adapters.db.models import CommentModel
@@ -58,6 +61,22 @@ class CommentRepository:
         logger.debug("Repository: comment saved: id=%s", saved_comment.id)
         return saved_comment
 
+    def upsert_many(self, comments: Sequence[Comment]) -> None:
+        """Insert or update many comments with batched INSERT ... ON CONFLICT statements.
+
+        Args:
+            comments: Comment entities to write; existing IDs get new text and updated_at
+        """
+        rows = [self._entity_to_model(comment).model_dump() for comment in comments]
+        statement = sqlite_insert(CommentModel.__table__)
+        statement = statement.on_conflict_do_update(
+            index_elements=["id"],
+            set_={"content": statement.excluded.content, "updated_at": statement.excluded.updated_at},
+        )
+        for start in range(0, len(rows), BULK_BATCH_SIZE):
+            self.session.execute(statement, rows[start : start + BULK_BATCH_SIZE])
+        logger.debug("Repository: upserted %d comments", len(rows))
+
     def delete(self, comment_id: str) -> bool:
         """Delete comment by ID.
 
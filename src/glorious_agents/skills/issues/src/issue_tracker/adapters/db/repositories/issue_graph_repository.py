@@ -1,5 +1,9 @@
 """Issue graph repository for dependency management."""
 
+from collections.abc import Sequence
+
+from glorious_agents.core.repository import BULK_BATCH_SIZE
+from sqlalchemy import insert
 from sqlmodel import Session, or_, select
 
 from issue_tracker.adapters.db.models import DependencyModel
@@ -37,6 +41,34 @@ class IssueGraphRepository:
         self.session.refresh(model)
         return self._model_to_entity(model)
 
+    def add_many(self, dependencies: Sequence[Dependency]) -> int:
+        """Add many dependency edges with batched INSERT OR IGNORE statements.
+
+        Edges already stored with the same endpoints and type, and repeats
+        within ``dependencies``, are skipped; existing edges are left unchanged.
+
+        Args:
+            dependencies: Dependency entities to persist
+
+        Returns:
+            Number of edges added
+        """
+        edges = {(dep.from_issue_id, dep.to_issue_id, dep.dependency_type.value): dep for dep in dependencies}
+        from_ids = sorted({from_id for from_id, _, _ in edges})
+        for start in range(0, len(from_ids), BULK_BATCH_SIZE):
+            statement = select(DependencyModel.from_issue_id, DependencyModel.to_issue_id, DependencyModel.type).where(
+                DependencyModel.from_issue_id.in_(from_ids[start : start + BULK_BATCH_SIZE])  # type: ignore[attr-defined]
+            )
+            for edge in self.session.exec(statement):
+                edges.pop(tuple(edge), None)
+
+        rows = [self._entity_to_model(dependency).model_dump() for dependency in edges.values()]
+        for start in range(0, len(rows), BULK_BATCH_SIZE):
+            self.session.execute(
+                insert(DependencyModel.__table__).prefix_with("OR IGNORE"), rows[start : start + BULK_BATCH_SIZE]
+            )
+        return len(rows)
+
     def remove_dependency(self, from_issue_id: str, to_issue_id: str, dependency_type: DependencyType) -> bool:
         """Remove a dependency edge.
 
@@ -175,11 +207,11 @@ class IssueGraphRepository:
         Returns:
             DependencyModel for database persistence
         """
-        # Generate ID from issue IDs + type to allow multiple relationship types between same issues
+        # Generate ID from the full issue IDs + type to allow multiple relationship types between same issues
         dep_id = (
             str(dependency.id)
             if dependency.id
-            else f"{dependency.from_issue_id[:8]}{dependency.to_issue_id[:8]}{dependency.dependency_type.value[:5]}"
+            else f"{dependency.from_issue_id}:{dependency.to_issue_id}:{dependency.dependency_type.value}"
         )
         return DependencyModel(
             id=dep_id,
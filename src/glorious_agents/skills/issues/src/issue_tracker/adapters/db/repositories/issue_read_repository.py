@@ -0,0 +1,236 @@
+"""Read-only issue projections for list, export, sync and stats paths.
+
+IssueRepository loads IssueModel ORM instances into the session's identity
+map and converts each one into an Issue entity. The queries here select only
+the needed columns as plain row tuples, which bypass the identity map, and
+wrap each in a slotted IssueRow with the same attributes as Issue.
+"""
+
+import logging
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from glorious_agents.core.repository import iter_keyset
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from issue_tracker.adapters.db.models import IssueLabelModel, IssueModel
+from issue_tracker.domain.entities.issue import IssuePriority, IssueStatus, IssueType
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["IssueReadRepository", "IssueRow"]
+
+# Columns of IssueRow in constructor order; description and labels are optional
+_COLUMNS = (
+    IssueModel.id,
+    IssueModel.project_id,
+    IssueModel.title,
+    IssueModel.status,
+    IssueModel.priority,
+    IssueModel.type,
+    IssueModel.assignee,
+    IssueModel.epic_id,
+    IssueModel.created_at,
+    IssueModel.updated_at,
+    IssueModel.closed_at,
+)
+
+# Database values of enum columns mapped back to their enums
+_ENUM_COLUMNS: dict[str, type[Enum]] = {
+    "status": IssueStatus,
+    "priority": IssuePriority,
+    "type": IssueType,
+}
+
+
+class IssueRow:
+    """Read-only snapshot of an issue with Issue-compatible attributes.
+
+    Use it wherever an Issue is only read (formatting, export, filtering).
+    To change an issue, load it through IssueRepository.
+    """
+
+    __slots__ = (
+        "id",
+        "project_id",
+        "title",
+        "description",
+        "status",
+        "priority",
+        "type",
+        "assignee",
+        "epic_id",
+        "labels",
+        "created_at",
+        "updated_at",
+        "closed_at",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        project_id: str,
+        title: str,
+        status: IssueStatus,
+        priority: IssuePriority,
+        type: IssueType,
+        assignee: str | None,
+        epic_id: str | None,
+        created_at: datetime,
+        updated_at: datetime,
+        closed_at: datetime | None,
+        description: str = "",
+        labels: list[str] | None = None,
+    ) -> None:
+        self.id = id
+        self.project_id = project_id
+        self.title = title
+        self.status = status
+        self.priority = priority
+        self.type = type
+        self.assignee = assignee
+        self.epic_id = epic_id
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.closed_at = closed_at
+        self.description = description
+        self.labels = labels if labels is not None else []
+
+    def __repr__(self) -> str:
+        return f"IssueRow(id={self.id!r}, title={self.title!r}, status={self.status.value!r})"
+
+
+class IssueReadRepository:
+    """Projection queries over issues that never touch the identity map."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize repository with database session.
+
+        Args:
+            session: SQLModel database session for queries
+        """
+        self.session = session
+
+    def iter_rows(
+        self,
+        batch_size: int = 500,
+        order_by: str = "created_at",
+        with_description: bool = True,
+        with_labels: bool = True,
+        **filters: Any,
+    ) -> Iterator[IssueRow]:
+        """Stream issues as IssueRows, keyset-paginated on (order_by, id).
+
+        Args:
+            batch_size: Issues fetched per query
+            order_by: Indexed, non-null column to order by; ties are broken by id
+            with_description: Load descriptions (otherwise they are "")
+            with_labels: Batch-load labels per page (otherwise they are [])
+            **filters: Column equality filters, e.g. status=IssueStatus.OPEN;
+                enum values are unwrapped
+
+        Yields:
+            IssueRows in ascending order_by order
+
+        Raises:
+            ValueError: If order_by or a filter is not an issue column
+        """
+        _check_columns(order_by, *filters)
+        columns = [*_COLUMNS, IssueModel.description] if with_description else [*_COLUMNS]
+        statement = _filtered(select(*columns), filters)
+
+        logger.debug("Read repository: streaming issue rows: order_by=%s, filters=%s", order_by, filters)
+        pages = iter_keyset(self.session, statement, getattr(IssueModel, order_by), IssueModel.id, batch_size)
+        for page in pages:
+            yield from self._to_rows(page, with_description, with_labels)
+
+    def get_rows(
+        self,
+        issue_ids: Sequence[str],
+        with_description: bool = True,
+        with_labels: bool = True,
+    ) -> list[IssueRow]:
+        """Fetch several issues in one query, e.g. to hydrate search results.
+
+        Args:
+            issue_ids: Issue identifiers
+            with_description: Load descriptions (otherwise they are "")
+            with_labels: Load labels (otherwise they are [])
+
+        Returns:
+            IssueRows in the order of issue_ids; unknown IDs are skipped
+        """
+        if not issue_ids:
+            return []
+        columns = [*_COLUMNS, IssueModel.description] if with_description else [*_COLUMNS]
+        statement = select(*columns).where(IssueModel.id.in_(issue_ids))  # type: ignore[attr-defined]
+        rows = {row.id: row for row in self._to_rows(self.session.exec(statement).all(), with_description, with_labels)}
+        return [rows[issue_id] for issue_id in issue_ids if issue_id in rows]
+
+    def count_by(self, field: str, **filters: Any) -> dict[Any, int]:
+        """Count issues grouped by a column with GROUP BY.
+
+        Args:
+            field: Column to group by (status, priority and type keys are enums)
+            **filters: Column equality filters, as for iter_rows()
+
+        Returns:
+            Mapping of column value to number of issues
+
+        Raises:
+            ValueError: If field or a filter is not an issue column
+        """
+        _check_columns(field, *filters)
+        column = getattr(IssueModel, field)
+        statement = _filtered(select(column, func.count()), filters).group_by(column)
+        enum = _ENUM_COLUMNS.get(field)
+        return {(enum(value) if enum else value): count for value, count in self.session.exec(statement)}
+
+    def _to_rows(self, rows: Sequence[Any], with_description: bool, with_labels: bool) -> list[IssueRow]:
+        """Wrap column tuples in IssueRows, batch-loading labels for all of them."""
+        labels: dict[str, list[str]] = {}
+        if with_labels and rows:
+            label_rows = self.session.exec(
+                select(IssueLabelModel.issue_id, IssueLabelModel.label_name).where(
+                    IssueLabelModel.issue_id.in_([row[0] for row in rows])  # type: ignore[attr-defined]
+                )
+            )
+            for issue_id, label_name in label_rows:
+                labels.setdefault(issue_id, []).append(label_name)
+
+        return [
+            IssueRow(
+                row[0],
+                row[1],
+                row[2],
+                IssueStatus(row[3]),
+                IssuePriority(row[4]),
+                IssueType(row[5]),
+                row[6],
+                row[7],
+                row[8],
+                row[9],
+                row[10],
+                description=(row[11] or "") if with_description else "",
+                labels=labels.get(row[0], []),
+            )
+            for row in rows
+        ]
+
+
+def _check_columns(*names: str) -> None:
+    unknown = [name for name in names if not hasattr(IssueModel, name)]
+    if unknown:
+        raise ValueError(f"Unknown issue fields: {unknown}")
+
+
+def _filtered(statement: Any, filters: dict[str, Any]) -> Any:
+    """Add equality filters to a statement, unwrapping enum values."""
+    for name, value in filters.items():
+        if isinstance(value, Enum):
+            value = value.value
+        statement = statement.where(getattr(IssueModel, name) == value)
+    return statement
@@ -1,8 +1,15 @@
 """Issue repository implementation with SQLModel."""
 
 import logging
-from collections.abc import Sequence
-
+from collections.abc import Collection, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from glorious_agents.core.repository import BULK_BATCH_SIZE, iter_keyset
+from sqlalchemy import case, delete, insert, text, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import Session, select
 
 from issue_tracker.adapters.db.models import IssueLabelModel, IssueModel
@@ -191,6 +198,286 @@ class IssueRepository:
         models = self.session.exec(statement).all()
         return self._models_to_entities(models)
 
+    def iter_all(self, batch_size: int = 500, order_by: str = "created_at", **filters: Any) -> Iterator[Issue]:
+        """Iterate over all matching issues without loading them at once.
+
+        Unlike the list_* methods this is not truncated at a limit. Pages are
+        fetched with keyset predicates on (order_by, id) instead of OFFSET,
+        labels are batch-loaded per page, and page rows are expunged from the
+        session, so memory stays flat over 100k+ issues.
+
+        Args:
+            batch_size: Issues fetched per query
+            order_by: Indexed, non-null column to order by (e.g. created_at,
+                updated_at, priority, id); ties are broken by id
+            **filters: Column equality filters, e.g. status=IssueStatus.OPEN,
+                assignee="alice"; enum values are unwrapped
+
+        Yields:
+            Issue entities in ascending order_by order
+
+        Raises:
+            ValueError: If order_by or a filter is not an issue column
+        """
+        unknown = [name for name in (order_by, *filters) if not hasattr(IssueModel, name)]
+        if unknown:
+            raise ValueError(f"Unknown issue fields: {unknown}")
+
+        statement = select(IssueModel)
+        for name, value in filters.items():
+            if isinstance(value, Enum):
+                value = value.value
+            statement = statement.where(getattr(IssueModel, name) == value)
+
+        logger.debug("Repository: iterating issues: order_by=%s, filters=%s", order_by, filters)
+        pages = iter_keyset(self.session, statement, getattr(IssueModel, order_by), IssueModel.id, batch_size)
+        for page in pages:
+            yield from self._models_to_entities(page)
+
+    def bulk_update(self, issue_ids: Sequence[str], now: datetime, **values: Any) -> list[str]:
+        """Set columns on many issues with chunked UPDATE ... RETURNING statements.
+
+        Args:
+            issue_ids: Issues to update; unknown IDs are ignored
+            now: Value for updated_at
+            **values: Columns to set, e.g. priority=IssuePriority.HIGH; enum values are unwrapped
+
+        Returns:
+            IDs of the issues that were updated
+
+        Raises:
+            ValueError: If a value is not an issue column
+        """
+        unknown = [name for name in values if not hasattr(IssueModel, name)]
+        if unknown:
+            raise ValueError(f"Unknown issue fields: {unknown}")
+        columns = {name: value.value if isinstance(value, Enum) else value for name, value in values.items()}
+        columns["updated_at"] = now
+        return self._update_returning(issue_ids, columns)
+
+    def bulk_transition(
+        self,
+        issue_ids: Sequence[str],
+        target_status: IssueStatus,
+        from_statuses: Collection[IssueStatus],
+        now: datetime,
+    ) -> list[str]:
+        """Move many issues to a status with chunked UPDATE ... RETURNING statements.
+
+        Only issues currently in one of from_statuses are changed. closed_at is
+        set when closing and cleared when an archived issue is reopened, in the
+        same statement, as Issue.transition() does for a single issue.
+
+        Args:
+            issue_ids: Issues to transition; unknown IDs are ignored
+            target_status: Status to set
+            from_statuses: Current statuses that may move to target_status
+            now: Value for updated_at (and closed_at when closing)
+
+        Returns:
+            IDs of the issues that were transitioned
+        """
+        columns: dict[str, Any] = {"status": target_status.value, "updated_at": now}
+        if target_status == IssueStatus.CLOSED:
+            columns["closed_at"] = now
+        elif target_status == IssueStatus.OPEN:
+            columns["closed_at"] = case(
+                (IssueModel.status == IssueStatus.ARCHIVED.value, None), else_=IssueModel.closed_at
+            )
+        condition = IssueModel.status.in_([status.value for status in from_statuses])  # type: ignore[attr-defined]
+        return self._update_returning(issue_ids, columns, condition)
+
+    def bulk_add_labels(self, issue_ids: Sequence[str], labels: Sequence[str], now: datetime) -> list[str]:
+        """Add labels to many issues with chunked, set-based statements.
+
+        Labels an issue already has are left alone.
+
+        Args:
+            issue_ids: Issues to label; unknown IDs are ignored
+            labels: Label names to add
+            now: Value for updated_at
+
+        Returns:
+            IDs of the issues that were found and labeled
+        """
+        updated = self._update_returning(issue_ids, {"updated_at": now})
+        rows = [
+            {"issue_id": issue_id, "label_name": label, "created_at": now} for issue_id in updated for label in labels
+        ]
+        for start in range(0, len(rows), BULK_BATCH_SIZE):
+            self.session.execute(
+                insert(IssueLabelModel.__table__).prefix_with("OR IGNORE"), rows[start : start + BULK_BATCH_SIZE]
+            )
+        return updated
+
+    def bulk_remove_labels(self, issue_ids: Sequence[str], labels: Sequence[str], now: datetime) -> list[str]:
+        """Remove labels from many issues with chunked, set-based statements.
+
+        Args:
+            issue_ids: Issues to update; unknown IDs are ignored
+            labels: Label names to remove
+            now: Value for updated_at
+
+        Returns:
+            IDs of the issues that were found
+        """
+        updated = self._update_returning(issue_ids, {"updated_at": now})
+        for start in range(0, len(updated), BULK_BATCH_SIZE):
+            self.session.execute(
+                delete(IssueLabelModel).where(
+                    IssueLabelModel.issue_id.in_(updated[start : start + BULK_BATCH_SIZE]),  # type: ignore[attr-defined]
+                    IssueLabelModel.label_name.in_(labels),  # type: ignore[attr-defined]
+                )
+            )
+        return updated
+
+    def existing_ids(self, issue_ids: Sequence[str]) -> set[str]:
+        """Return which of the given issue IDs exist, with chunked IN queries.
+
+        Args:
+            issue_ids: Issue identifiers to look up
+
+        Returns:
+            Subset of issue_ids present in the database
+        """
+        ids = list(dict.fromkeys(issue_ids))
+        found: set[str] = set()
+        for start in range(0, len(ids), BULK_BATCH_SIZE):
+            statement = select(IssueModel.id).where(
+                IssueModel.id.in_(ids[start : start + BULK_BATCH_SIZE])  # type: ignore[attr-defined]
+            )
+            found.update(self.session.exec(statement))
+        return found
+
+    def delete_many(self, issue_ids: Sequence[str]) -> int:
+        """Delete many issues and their labels with chunked, set-based statements.
+
+        Like delete(), comments and dependencies are left in place. Models
+        already in the session are not expunged.
+
+        Args:
+            issue_ids: Issues to delete; unknown IDs are ignored
+
+        Returns:
+            Number of issues deleted
+        """
+        ids = list(dict.fromkeys(issue_ids))
+        deleted = 0
+        for start in range(0, len(ids), BULK_BATCH_SIZE):
+            chunk = ids[start : start + BULK_BATCH_SIZE]
+            self.session.execute(delete(IssueLabelModel.__table__).where(IssueLabelModel.issue_id.in_(chunk)))  # type: ignore[attr-defined]
+            result = self.session.execute(delete(IssueModel.__table__).where(IssueModel.id.in_(chunk)))  # type: ignore[attr-defined]
+            deleted += result.rowcount  # type: ignore[attr-defined]
+        logger.debug("Repository: deleted %d issues", deleted)
+        return deleted
+
+    def upsert_many(self, issues: Sequence[Issue], keep_labels: Collection[str] = ()) -> None:
+        """Insert or update many issues and their labels with batched statements.
+
+        Issues are written with INSERT ... ON CONFLICT(id) DO UPDATE, which
+        keeps the created_at of existing rows. Labels of each issue are
+        replaced by issue.labels unless its ID is in keep_labels. Statements
+        target the tables rather than the models, which skips the ORM's
+        per-row bulk bookkeeping; unlike save(), models already in the session
+        are not refreshed.
+
+        Args:
+            issues: Issue entities to write
+            keep_labels: IDs of issues whose stored labels are left unchanged
+        """
+        if not issues:
+            return
+        rows = [self._entity_to_row(issue) for issue in issues]
+        statement = sqlite_insert(IssueModel.__table__)
+        statement = statement.on_conflict_do_update(
+            index_elements=["id"],
+            set_={column: statement.excluded[column] for column in rows[0] if column not in ("id", "created_at")},
+        )
+        for start in range(0, len(rows), BULK_BATCH_SIZE):
+            self.session.execute(statement, rows[start : start + BULK_BATCH_SIZE])
+
+        replaced = [issue for issue in issues if issue.id not in keep_labels]
+        for start in range(0, len(replaced), BULK_BATCH_SIZE):
+            self.session.execute(
+                delete(IssueLabelModel).where(
+                    IssueLabelModel.issue_id.in_(  # type: ignore[attr-defined]
+                        [issue.id for issue in replaced[start : start + BULK_BATCH_SIZE]]
+                    )
+                )
+            )
+        now = utcnow_naive()
+        label_rows = [
+            {"issue_id": issue.id, "label_name": label, "created_at": now}
+            for issue in replaced
+            for label in issue.labels
+        ]
+        for start in range(0, len(label_rows), BULK_BATCH_SIZE):
+            self.session.execute(
+                insert(IssueLabelModel.__table__).prefix_with("OR IGNORE"), label_rows[start : start + BULK_BATCH_SIZE]
+            )
+        logger.debug("Repository: upserted %d issues, replaced labels of %d", len(rows), len(replaced))
+
+    @contextmanager
+    def deferred_search_index(self) -> Iterator[None]:
+        """Suspend per-row FTS5 trigger maintenance for a bulk write.
+
+        When the issues_fts index and its triggers exist, the triggers are
+        dropped for the duration of the block and the index is rebuilt with
+        one INSERT ... SELECT afterwards. Everything runs in the session's
+        transaction, so a rollback restores the triggers and the old index.
+        Without an FTS index this is a no-op.
+        """
+        triggers = self.session.execute(
+            text("SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'issues_fts_%'")
+        ).all()
+        if not triggers:
+            yield
+            return
+
+        # DELETE opens the transaction before the DDL, which would otherwise autocommit
+        self.session.execute(text("DELETE FROM issues_fts"))
+        for name, _ in triggers:
+            self.session.execute(text(f'DROP TRIGGER "{name}"'))
+        yield
+        self.session.execute(
+            text(
+                "INSERT INTO issues_fts(rowid, id, title, description) "
+                "SELECT rowid, id, title, COALESCE(description, '') FROM issues"
+            )
+        )
+        for _, sql in triggers:
+            self.session.execute(text(sql))
+        logger.debug("Repository: rebuilt search index after bulk write")
+
+    def _update_returning(self, issue_ids: Sequence[str], columns: dict[str, Any], condition: Any = None) -> list[str]:
+        """Run UPDATE ... WHERE id IN (...) RETURNING id per chunk of IDs.
+
+        Chunks stay under SQLite's bound-parameter limit. Issue models already
+        in the session for updated rows are expired so later reads see the new
+        values.
+        """
+        ids = list(dict.fromkeys(issue_ids))
+        updated: list[str] = []
+        for start in range(0, len(ids), BULK_BATCH_SIZE):
+            statement = (
+                update(IssueModel)
+                .where(IssueModel.id.in_(ids[start : start + BULK_BATCH_SIZE]))  # type: ignore[attr-defined]
+                .values(**columns)
+                .returning(IssueModel.id)
+                .execution_options(synchronize_session=False)
+            )
+            if condition is not None:
+                statement = statement.where(condition)
+            updated.extend(self.session.execute(statement).scalars())
+
+        updated_set = set(updated)
+        for obj in list(self.session.identity_map.values()):
+            if isinstance(obj, IssueModel) and obj.id in updated_set:
+                self.session.expire(obj)
+        if updated:
+            logger.debug("Repository: bulk updated %d of %d issues: columns=%s", len(updated), len(ids), [*columns])
+        return updated
+
     def _entity_to_model(self, issue: Issue) -> IssueModel:
         """Convert Issue entity to database model.
 
@@ -200,20 +487,31 @@ class IssueRepository:
         Returns:
             IssueModel for database persistence
         """
-        return IssueModel(
-            id=issue.id,
-            project_id=getattr(issue, "project_id", "default"),
-            title=issue.title,
-            description=issue.description or "",
-            status=issue.status.value,
-            priority=issue.priority.value,
-            type=issue.type.value,
-            assignee=issue.assignee,
-            epic_id=issue.epic_id,
-            created_at=issue.created_at,
-            updated_at=issue.updated_at,
-            closed_at=issue.closed_at,
-        )
+        return IssueModel(**self._entity_to_row(issue))
+
+    def _entity_to_row(self, issue: Issue) -> dict[str, Any]:
+        """Convert Issue entity to column values for Core insert statements.
+
+        Args:
+            issue: Issue entity to convert
+
+        Returns:
+            Mapping of issues table column names to values
+        """
+        return {
+            "id": issue.id,
+            "project_id": getattr(issue, "project_id", "default"),
+            "title": issue.title,
+            "description": issue.description or "",
+            "status": issue.status.value,
+            "priority": issue.priority.value,
+            "type": issue.type.value,
+            "assignee": issue.assignee,
+            "epic_id": issue.epic_id,
+            "created_at": issue.created_at,
+            "updated_at": issue.updated_at,
+            "closed_at": issue.closed_at,
+        }
 
     def _model_to_entity(self, model: IssueModel) -> Issue:
         """Convert database model to Issue entity.
@@ -0,0 +1,145 @@
+"""Sync state repository: export hashes, merge conflicts and the issue change log."""
+
+import logging
+from collections.abc import Collection, Mapping, Sequence
+
+from glorious_agents.core.repository import BULK_BATCH_SIZE
+from sqlalchemy import delete, func, insert, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session, select
+
+from issue_tracker.adapters.db.models import (
+    ISSUE_CHANGE_TRIGGERS,
+    IssueChangeModel,
+    SyncConflictModel,
+    SyncStateModel,
+    issue_change_trigger_sql,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["SyncStateRepository"]
+
+
+class SyncStateRepository:
+    """Repository for JSONL sync state: content hashes, merge conflicts and the change log."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize repository with database session.
+
+        Args:
+            session: SQLModel database session for queries
+        """
+        self.session = session
+
+    def ensure_tables(self) -> None:
+        """Create the sync_state and sync_conflicts tables in databases initialized before they existed."""
+        for model in (SyncStateModel, SyncConflictModel):
+            model.__table__.create(self.session.connection(), checkfirst=True)  # type: ignore[attr-defined]
+
+    def ensure_change_tracking(self) -> None:
+        """Create the issue_changes table and its triggers if they are missing."""
+        IssueChangeModel.__table__.create(self.session.connection(), checkfirst=True)  # type: ignore[attr-defined]
+        for trigger in ISSUE_CHANGE_TRIGGERS:
+            _, create = issue_change_trigger_sql(*trigger)
+            self.session.execute(text(create))
+
+    def latest_change(self) -> int:
+        """Return the sequence number of the newest logged change.
+
+        A single index lookup, cheap enough to poll for new changes. Sequence
+        numbers are never reused, so a value above one seen earlier means the
+        issues changed since, even if the log was pruned in between.
+
+        Returns:
+            Highest seq in the log, or 0 when the log is empty
+        """
+        return self.session.exec(select(func.max(IssueChangeModel.seq))).one() or 0
+
+    def get_changes(self) -> tuple[int, set[str]]:
+        """Read the change log up to its current end.
+
+        Returns:
+            Tuple of (watermark, IDs of issues changed up to and including it);
+            the watermark is 0 when the log is empty
+        """
+        watermark = self.latest_change()
+        if not watermark:
+            return 0, set()
+        rows = self.session.exec(
+            select(IssueChangeModel.issue_id).distinct().where(IssueChangeModel.seq <= watermark)  # type: ignore[operator]
+        )
+        return watermark, set(rows.all())
+
+    def acknowledge_changes(self, watermark: int) -> None:
+        """Delete the change log up to a watermark once its changes are exported.
+
+        Args:
+            watermark: Watermark returned by get_changes()
+        """
+        self.session.execute(delete(IssueChangeModel.__table__).where(IssueChangeModel.seq <= watermark))  # type: ignore[operator]
+        logger.debug("Repository: acknowledged issue changes up to seq=%d", watermark)
+
+    def get_hashes(self) -> dict[str, str]:
+        """Load all exported content hashes.
+
+        Returns:
+            Mapping of issue ID to content hash
+        """
+        rows = self.session.exec(select(SyncStateModel.issue_id, SyncStateModel.content_hash))
+        return dict(rows.all())
+
+    def save_hashes(self, hashes: Mapping[str, str]) -> None:
+        """Insert or replace content hashes with batched INSERT ... ON CONFLICT statements.
+
+        Args:
+            hashes: Mapping of issue ID to content hash
+        """
+        rows = [{"issue_id": issue_id, "content_hash": digest} for issue_id, digest in hashes.items()]
+        statement = sqlite_insert(SyncStateModel.__table__)
+        statement = statement.on_conflict_do_update(
+            index_elements=["issue_id"], set_={"content_hash": statement.excluded.content_hash}
+        )
+        for start in range(0, len(rows), BULK_BATCH_SIZE):
+            self.session.execute(statement, rows[start : start + BULK_BATCH_SIZE])
+        logger.debug("Repository: saved %d sync hashes", len(rows))
+
+    def delete_hashes(self, issue_ids: Collection[str]) -> None:
+        """Delete the content hashes of issues no longer exported.
+
+        Args:
+            issue_ids: Issue identifiers to forget
+        """
+        ids = list(issue_ids)
+        for start in range(0, len(ids), BULK_BATCH_SIZE):
+            self.session.execute(
+                delete(SyncStateModel.__table__).where(
+                    SyncStateModel.issue_id.in_(ids[start : start + BULK_BATCH_SIZE])  # type: ignore[attr-defined]
+                )
+            )
+        logger.debug("Repository: deleted %d sync hashes", len(ids))
+
+    def add_conflicts(self, conflicts: Sequence[SyncConflictModel]) -> None:
+        """Record merge conflicts with batched inserts.
+
+        Args:
+            conflicts: Conflicts to record; their id is assigned by the database
+        """
+        rows = [conflict.model_dump(exclude={"id"}) for conflict in conflicts]
+        for start in range(0, len(rows), BULK_BATCH_SIZE):
+            self.session.execute(insert(SyncConflictModel.__table__), rows[start : start + BULK_BATCH_SIZE])
+        logger.debug("Repository: recorded %d sync conflicts", len(rows))
+
+    def list_conflicts(self, issue_id: str | None = None) -> list[SyncConflictModel]:
+        """List recorded merge conflicts, oldest first.
+
+        Args:
+            issue_id: Only conflicts of this issue
+
+        Returns:
+            Conflict models
+        """
+        statement = select(SyncConflictModel).order_by(SyncConflictModel.id)  # type: ignore[arg-type]
+        if issue_id is not None:
+            statement = statement.where(SyncConflictModel.issue_id == issue_id)
+        return list(self.session.exec(statement).all())
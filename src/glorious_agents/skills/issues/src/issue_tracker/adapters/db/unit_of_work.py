@@ -5,7 +5,12 @@ from types import TracebackType
 
 from sqlmodel import Session
 
-from issue_tracker.adapters.db.repositories import CommentRepository, IssueGraphRepository, IssueRepository
+from issue_tracker.adapters.db.repositories import (
+    CommentRepository,
+    IssueGraphRepository,
+    IssueReadRepository,
+    IssueRepository,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +55,7 @@ class UnitOfWork:
         self._issues: IssueRepository | None = None
         self._comments: CommentRepository | None = None
         self._graph: IssueGraphRepository | None = None
+        self._issue_reads: IssueReadRepository | None = None
 
     def __enter__(self) -> "UnitOfWork":
         """Begin transaction.
@@ -135,6 +141,17 @@ class UnitOfWork:
             self._graph = IssueGraphRepository(self.session)
         return self._graph
 
+    @property
+    def issue_reads(self) -> IssueReadRepository:
+        """Lazy-load read-only issue projection repository.
+
+        Returns:
+            Issue read repository instance for list, export and stats queries
+        """
+        if self._issue_reads is None:
+            self._issue_reads = IssueReadRepository(self.session)
+        return self._issue_reads
+
     def close(self) -> None:
         """Close the underlying session.
 
@@ -2,11 +2,15 @@
 
 import builtins
 import json
+from collections.abc import Iterable, Iterator
 from datetime import UTC
+from itertools import islice
+from pathlib import Path
 from typing import Any
 
 import typer
 
+from issue_tracker.cli.bulk import bulk_failures, select_bulk_issue_ids
 from issue_tracker.cli.commands import comments_app, dependencies_app, epics_app, instructions_app, labels_app
 from issue_tracker.cli.formatters import format_datetime_iso, format_priority_emoji, issue_to_dict
 from issue_tracker.domain import (
@@ -472,62 +476,64 @@ def list_issues(
         priority_filter = IssuePriority(priority) if priority is not None else None
         label_filters = [lbl.strip() for lbl in label.split(",")] if label else []
 
-        # Get issues from service
-        issues = service.list_issues(
+        # Stream read-only rows; descriptions and labels only when shown or filtered on
+        issues: Iterable[Any] = service.iter_issue_rows(
             status=status_filter,
             priority=priority_filter,
             issue_type=type_filter,
             assignee=assignee,
             epic_id=epic,
-            limit=limit,
-            offset=0,
+            with_description=json_output or bool(desc_contains) or empty_description,
+            with_labels=json_output or bool(label_filters) or no_labels,
         )
 
         # Apply additional filters not supported by service layer
         if label_filters:
-            issues = [i for i in issues if any(lbl in i.labels for lbl in label_filters)]
+            issues = (i for i in issues if any(lbl in i.labels for lbl in label_filters))
         if priority_min is not None:
-            issues = [i for i in issues if int(i.priority) >= priority_min]
+            issues = (i for i in issues if int(i.priority) >= priority_min)
         if priority_max is not None:
-            issues = [i for i in issues if int(i.priority) <= priority_max]
+            issues = (i for i in issues if int(i.priority) <= priority_max)
         if no_assignee:
-            issues = [i for i in issues if not i.assignee]
+            issues = (i for i in issues if not i.assignee)
         if no_labels:
-            issues = [i for i in issues if not i.labels]
+            issues = (i for i in issues if not i.labels)
 
         # Text search filters
         if title_contains:
-            issues = [i for i in issues if title_contains.lower() in i.title.lower()]
+            issues = (i for i in issues if title_contains.lower() in i.title.lower())
         if desc_contains:
-            issues = [i for i in issues if i.description and desc_contains.lower() in i.description.lower()]
+            issues = (i for i in issues if i.description and desc_contains.lower() in i.description.lower())
         if notes_contains:
-            issues = [
+            issues = (
                 i for i in issues if hasattr(i, "notes") and i.notes and notes_contains.lower() in i.notes.lower()
-            ]
+            )
         if empty_description:
-            issues = [i for i in issues if not i.description or i.description.strip() == ""]
+            issues = (i for i in issues if not i.description or i.description.strip() == "")
 
-        # Date range filters
+        # Date range filters (each bound gets its own name; the generators are lazy)
         from datetime import datetime
 
         if created_after:
-            cutoff = datetime.fromisoformat(created_after).replace(tzinfo=None)
-            issues = [i for i in issues if i.created_at.replace(tzinfo=None) > cutoff]
+            created_after_cutoff = datetime.fromisoformat(created_after).replace(tzinfo=None)
+            issues = (i for i in issues if i.created_at.replace(tzinfo=None) > created_after_cutoff)
         if created_before:
-            cutoff = datetime.fromisoformat(created_before).replace(tzinfo=None)
-            issues = [i for i in issues if i.created_at.replace(tzinfo=None) < cutoff]
+            created_before_cutoff = datetime.fromisoformat(created_before).replace(tzinfo=None)
+            issues = (i for i in issues if i.created_at.replace(tzinfo=None) < created_before_cutoff)
         if updated_after:
-            cutoff = datetime.fromisoformat(updated_after).replace(tzinfo=None)
-            issues = [i for i in issues if i.updated_at.replace(tzinfo=None) > cutoff]
+            updated_after_cutoff = datetime.fromisoformat(updated_after).replace(tzinfo=None)
+            issues = (i for i in issues if i.updated_at.replace(tzinfo=None) > updated_after_cutoff)
         if updated_before:
-            cutoff = datetime.fromisoformat(updated_before).replace(tzinfo=None)
-            issues = [i for i in issues if i.updated_at.replace(tzinfo=None) < cutoff]
+            updated_before_cutoff = datetime.fromisoformat(updated_before).replace(tzinfo=None)
+            issues = (i for i in issues if i.updated_at.replace(tzinfo=None) < updated_before_cutoff)
         if closed_after:
-            cutoff = datetime.fromisoformat(closed_after).replace(tzinfo=None)
-            issues = [i for i in issues if i.closed_at and i.closed_at.replace(tzinfo=None) > cutoff]
+            closed_after_cutoff = datetime.fromisoformat(closed_after).replace(tzinfo=None)
+            issues = (i for i in issues if i.closed_at and i.closed_at.replace(tzinfo=None) > closed_after_cutoff)
         if closed_before:
-            cutoff = datetime.fromisoformat(closed_before).replace(tzinfo=None)
-            issues = [i for i in issues if i.closed_at and i.closed_at.replace(tzinfo=None) < cutoff]
+            closed_before_cutoff = datetime.fromisoformat(closed_before).replace(tzinfo=None)
+            issues = (i for i in issues if i.closed_at and i.closed_at.replace(tzinfo=None) < closed_before_cutoff)
+
+        issues = islice(issues, limit) if limit is not None else issues
 
         # Convert to dicts
         issue_dicts = []
@@ -592,17 +598,15 @@ def search(
             if json_output:
                 # Get full issue details for JSON output
                 service = get_issue_service()
+                rows = {row.id: row for row in service.get_issue_rows([result.issue_id for result in results])}
                 issue_results = []
                 for result in results:
-                    try:
-                        issue = service.get_issue(result.issue_id)
-                        if issue:
-                            issue_dict = issue_to_dict(issue)
-                            issue_dict["search_rank"] = result.rank
-                            issue_dict["snippet"] = result.snippet
-                            issue_results.append(issue_dict)
-                    except Exception:
-                        continue
+                    row = rows.get(result.issue_id)
+                    if row:
+                        issue_dict = issue_to_dict(row)
+                        issue_dict["search_rank"] = result.rank
+                        issue_dict["snippet"] = result.snippet
+                        issue_results.append(issue_dict)
 
                 typer.echo(json.dumps(issue_results))
             else:
@@ -977,59 +981,21 @@ def bulk_close(
     try:
         service = get_issue_service()
 
-        # Get issues either from IDs or filters - best-effort approach
-        issues_to_process = []
-        failures = []
-
-        if issue_ids:
-            for iid in issue_ids:
-                try:
-                    issue = service.get_issue(iid)
-                    if issue is None:
-                        failures.append({"id": iid, "error": f"Issue not found: {iid}"})
-                    else:
-                        issues_to_process.append(issue)
-                except Exception as e:
-                    failures.append({"id": iid, "error": str(e)})
-        else:
-            # Apply filters
-            status_filter = IssueStatus(status) if status else None
-            type_filter = IssueType(type) if type else None
-            priority_filter = IssuePriority(priority) if priority is not None else None
-
-            issues_to_process = service.list_issues(
-                status=status_filter,
-                priority=priority_filter,
-                issue_type=type_filter,
-                assignee=assignee,
-            )
-
-            # Additional filter by labels
-            if label_filter:
-                filter_labels = [lbl.strip() for lbl in label_filter.split(",")]
-                issues_to_process = [i for i in issues_to_process if any(lbl in i.labels for lbl in filter_labels)]
-
-        if not issues_to_process and not failures:
+        target_ids = select_bulk_issue_ids(service, issue_ids, status, type, priority, assignee, label_filter)
+        if not target_ids:
             typer.echo("No issues found matching criteria", err=True)
             raise typer.Exit(1)
 
-        # Process each issue with error handling
-        successes = []
-        for issue in issues_to_process:
-            try:
-                closed_issue = service.close_issue(issue.id)
-                successes.append(
-                    {
-                        "id": closed_issue.id,
-                        "status": closed_issue.status.value,
-                        "closed_at": format_datetime_iso(closed_issue.closed_at),
-                    }
-                )
-            except Exception as e:
-                failures.append({"id": issue.id, "error": str(e)})
-
+        # One set-based UPDATE per chunk of IDs instead of a get + save per issue
+        closed_ids, failed_ids = service.bulk_close(target_ids)
         service.uow.session.commit()
 
+        successes = [
+            {"id": row.id, "status": row.status.value, "closed_at": format_datetime_iso(row.closed_at)}
+            for row in service.get_issue_rows(closed_ids)
+        ]
+        failures = bulk_failures(service, failed_ids, "cannot be closed")
+
         # Return results
         if json_output:
             typer.echo(json.dumps({"successes": successes, "failures": failures}))
@@ -1076,71 +1042,31 @@ def bulk_update(
             typer.echo(f"Error: Invalid status '{new_status}'", err=True)
             raise typer.Exit(1)
 
-        # Get issues either from IDs or filters - best-effort approach
-        issues_to_process = []
-        failures = []
-
-        if issue_ids:
-            for iid in issue_ids:
-                try:
-                    issue = service.get_issue(iid)
-                    if issue is None:
-                        failures.append({"id": iid, "error": f"Issue not found: {iid}"})
-                    else:
-                        issues_to_process.append(issue)
-                except Exception as e:
-                    failures.append({"id": iid, "error": str(e)})
-        else:
-            # Apply filters
-            status_filter = IssueStatus(status) if status else None
-            type_filter = IssueType(type) if type else None
-            priority_filter = IssuePriority(priority) if priority is not None else None
-
-            issues_to_process = service.list_issues(
-                status=status_filter,
-                priority=priority_filter,
-                issue_type=type_filter,
-                assignee=assignee,
-            )
-
-            # Additional filter by labels
-            if label_filter:
-                filter_labels = [lbl.strip() for lbl in label_filter.split(",")]
-                issues_to_process = [i for i in issues_to_process if any(lbl in i.labels for lbl in filter_labels)]
-
-        if not issues_to_process and not failures:
+        target_ids = select_bulk_issue_ids(service, issue_ids, status, type, priority, assignee, label_filter)
+        if not target_ids:
             typer.echo("No issues found matching criteria", err=True)
             raise typer.Exit(1)
 
-        # Process each issue with error handling
-        successes = []
-        for issue in issues_to_process:
-            try:
-                # Update status if requested
-                if new_status:
-                    issue = service.transition_issue(issue.id, IssueStatus(new_status))
-
-                # Update other fields if requested
-                if new_priority is not None or new_assignee:
-                    issue = service.update_issue(
-                        issue_id=issue.id,
-                        priority=IssuePriority(new_priority) if new_priority is not None else None,
-                        assignee=new_assignee,
-                    )
-
-                successes.append(
-                    {
-                        "id": issue.id,
-                        "status": issue.status.value,
-                        "priority": int(issue.priority),
-                        "assignee": issue.assignee,
-                    }
-                )
-            except Exception as e:
-                failures.append({"id": issue.id, "error": str(e)})
-
+        # Each change is one set-based UPDATE per chunk; later changes only apply where earlier ones did
+        failed_ids: builtins.list[str] = []
+        failure_reason = "not updated"
+        if new_status:
+            target_ids, failed_ids = service.bulk_update_status(target_ids, IssueStatus(new_status))
+            failure_reason = f"cannot transition to {new_status}"
+        if new_priority is not None:
+            target_ids, failed = service.bulk_update_priority(target_ids, IssuePriority(new_priority))
+            failed_ids += failed
+        if new_assignee:
+            target_ids, failed = service.bulk_assign(target_ids, new_assignee)
+            failed_ids += failed
         service.uow.session.commit()
 
+        successes = [
+            {"id": row.id, "status": row.status.value, "priority": int(row.priority), "assignee": row.assignee}
+            for row in service.get_issue_rows(target_ids)
+        ]
+        failures = bulk_failures(service, failed_ids, failure_reason)
+
         # Return results
         if json_output:
             typer.echo(json.dumps({"successes": successes, "failures": failures}))
@@ -1375,35 +1301,23 @@ def stats(
     try:
         service = get_issue_service()
 
-        # Get all issues
-        all_issues = service.list_issues()
+        # Count with GROUP BY queries instead of loading every issue
+        by_status = service.count_issues_by("status")
+        by_assignee: dict[str, int] = {}
+        for assignee, count in service.count_issues_by("assignee").items():
+            assignee_key = assignee if assignee else "unassigned"
+            by_assignee[assignee_key] = by_assignee.get(assignee_key, 0) + count
 
-        # Calculate stats
         stats_data: dict[str, Any] = {
-            "total": len(all_issues),
-            "by_status": {},
-            "by_priority": {},
-            "by_type": {},
-            "by_assignee": {},
+            "total": sum(by_status.values()),
+            "by_status": {status.value: count for status, count in by_status.items()},
+            "by_priority": {
+                str(int(priority)): count for priority, count in service.count_issues_by("priority").items()
+            },
+            "by_type": {issue_type.value: count for issue_type, count in service.count_issues_by("type").items()},
+            "by_assignee": by_assignee,
         }
 
-        for issue in all_issues:
-            # Group by status
-            status_key = issue.status.value if hasattr(issue.status, "value") else str(issue.status)
-            stats_data["by_status"][status_key] = stats_data["by_status"].get(status_key, 0) + 1
-
-            # Group by priority
-            priority_key = str(issue.priority.value if hasattr(issue.priority, "value") else issue.priority)
-            stats_data["by_priority"][priority_key] = stats_data["by_priority"].get(priority_key, 0) + 1
-
-            # Group by type
-            type_key = issue.type.value if hasattr(issue.type, "value") else str(issue.type)
-            stats_data["by_type"][type_key] = stats_data["by_type"].get(type_key, 0) + 1
-
-            # Group by assignee
-            assignee_key = issue.assignee if issue.assignee else "unassigned"
-            stats_data["by_assignee"][assignee_key] = stats_data["by_assignee"].get(assignee_key, 0) + 1
-
         if json_output:
             typer.echo(json.dumps(stats_data))
         else:
@@ -1495,22 +1409,12 @@ def bulk_create(
             raise typer.Exit(1)
 
         # Parse markdown file - simple parsing: lines starting with # are titles
-        content = file_path.read_text()
-        titles = [line.strip("# ").strip() for line in content.split("\n") if line.startswith("# ")]
-
-        # Create issues using service
-        created = []
-        for title in titles:
-            issue = service.create_issue(
-                title=title,
-                description=None,
-                issue_type=IssueType(type),
-                priority=IssuePriority(priority),
-                assignee=None,
-                labels=[],
-            )
-            created.append({"id": issue.id, "title": issue.title})
+        with open(file_path, encoding="utf-8") as f:
+            titles = (line.strip("# ").strip() for line in f if line.startswith("# "))
+            issues = service.create_issues(titles, issue_type=IssueType(type), priority=IssuePriority(priority))
+        service.uow.session.commit()
 
+        created = [{"id": issue.id, "title": issue.title} for issue in issues]
         if json_output:
             typer.echo(json.dumps(created))
         else:
@@ -1728,7 +1632,7 @@ def sync(
         # Trigger sync via IPC
         import asyncio
 
-        client = IPCClient(config.get_socket_path())
+        client = IPCClient(config.get_socket_path(), timeout=config.ipc_timeout)
         response = asyncio.run(client.send_request({"method": "sync"}))
 
         if "error" in response:
@@ -1826,7 +1730,7 @@ def health(
             health_data = {"healthy": False, "error": "Daemon not running"}
         else:
             try:
-                client = IPCClient(config.get_socket_path())
+                client = IPCClient(config.get_socket_path(), timeout=config.ipc_timeout)
                 health_data = asyncio.run(client.send_request({"method": "health"}))
             except Exception as e:
                 health_data = {"healthy": False, "error": str(e)}
@@ -1987,21 +1891,21 @@ def export(
         from pathlib import Path
 
         service = get_issue_service()
-        issues = service.list_issues()
 
         output_path = Path(output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write JSONL (one JSON object per line)
+        # Write JSONL (one JSON object per line), streaming rows from the database
+        exported = 0
         with open(output_path, "w", encoding="utf-8") as f:
-            for issue in issues:
+            for issue in service.iter_issue_rows():
                 issue_dict = {
                     "id": issue.id,
                     "title": issue.title,
                     "description": issue.description,
-                    "status": issue.status.value if hasattr(issue.status, "value") else str(issue.status),
-                    "priority": issue.priority.value if hasattr(issue.priority, "value") else int(issue.priority),
-                    "type": issue.type.value if hasattr(issue.type, "value") else str(issue.type),
+                    "status": issue.status.value,
+                    "priority": int(issue.priority),
+                    "type": issue.type.value,
                     "assignee": issue.assignee,
                     "epic_id": issue.epic_id,
                     "labels": issue.labels,
@@ -2011,11 +1915,12 @@ def export(
                     "project_id": issue.project_id,
                 }
                 f.write(json.dumps(issue_dict) + "\n")
+                exported += 1
 
         if json_output:
-            typer.echo(json.dumps({"exported": len(issues), "file": str(output_path)}))
+            typer.echo(json.dumps({"exported": exported, "file": str(output_path)}))
         else:
-            typer.echo(f"✓ Exported {len(issues)} issues to {output_path}")
+            typer.echo(f"✓ Exported {exported} issues to {output_path}")
     except Exception as e:
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(1)
@@ -2039,126 +1944,55 @@ def import_issues(
             typer.echo(f"Error: File not found: {input_path}", err=True)
             raise typer.Exit(1)
 
-        # Parse JSONL
-        issues_data = []
-        with open(input_path, encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    issues_data.append(json.loads(line))
+        def report_progress(progress: Any) -> None:
+            if not json_output:
+                typer.echo(f"  ... {progress.processed} issues processed", err=True)
 
-        new_count = 0
-        updated_count = 0
-        error_count = 0
+        # Parse JSONL lazily; the service reads and writes it in batches
+        result = service.import_issues(_iter_jsonl(input_path), dry_run=dry_run, on_progress=report_progress)
+        for error in result.errors:
+            typer.echo(f"Warning: Failed to import {error}", err=True)
 
         if dry_run:
-            # Just analyze what would change
-            for issue_data in issues_data:
-                existing = service.get_issue(issue_data["id"])
-                if existing:
-                    updated_count += 1
-                else:
-                    new_count += 1
-
             if json_output:
                 typer.echo(
                     json.dumps(
                         {
                             "dry_run": True,
-                            "new": new_count,
-                            "updated": updated_count,
-                            "total": len(issues_data),
+                            "new": result.new,
+                            "updated": result.updated,
+                            "total": result.processed,
                         }
                     )
                 )
             else:
-                typer.echo(f"Dry run: Would import {len(issues_data)} issues")
-                typer.echo(f"  New: {new_count}")
-                typer.echo(f"  Updates: {updated_count}")
+                typer.echo(f"Dry run: Would import {result.processed} issues")
+                typer.echo(f"  New: {result.new}")
+                typer.echo(f"  Updates: {result.updated}")
         else:
-            # Actually import
-
-            from issue_tracker.domain import IssuePriority, IssueStatus, IssueType
-
-            for issue_data in issues_data:
-                try:
-                    # Convert string values back to enums
-                    status_str = issue_data.get("status", "open")
-                    status = IssueStatus[status_str.upper()] if isinstance(status_str, str) else status_str
-
-                    priority_val = issue_data.get("priority", 2)
-                    priority = IssuePriority(priority_val) if isinstance(priority_val, int) else priority_val
-
-                    type_str = issue_data.get("type", "task")
-                    issue_type = IssueType[type_str.upper()] if isinstance(type_str, str) else type_str
-
-                    existing = service.get_issue(issue_data["id"])
-                    if existing:
-                        # Update existing
-                        service.update_issue(
-                            issue_data["id"],
-                            title=issue_data.get("title"),
-                            description=issue_data.get("description"),
-                            priority=priority,
-                            assignee=issue_data.get("assignee"),
-                            epic_id=issue_data.get("epic_id"),
-                        )
-
-                        # Update status if changed (requires transition)
-                        if status != existing.status:
-                            service.transition_issue(issue_data["id"], status)
-
-                        # Update labels if provided
-                        if "labels" in issue_data:
-                            updated_issue = service.get_issue(issue_data["id"])
-                            if updated_issue:
-                                # Remove labels not in new set
-                                for label in updated_issue.labels:
-                                    if label not in issue_data["labels"]:
-                                        updated_issue = updated_issue.remove_label(label)
-                                # Add labels from new set
-                                for label in issue_data["labels"]:
-                                    if label not in updated_issue.labels:
-                                        updated_issue = updated_issue.add_label(label)
-                                service.uow.issues.save(updated_issue)
-
-                        updated_count += 1
-                    else:
-                        # Create new with custom ID
-                        service.create_issue(
-                            title=issue_data["title"],
-                            description=issue_data.get("description", ""),
-                            priority=priority,
-                            issue_type=issue_type,
-                            assignee=issue_data.get("assignee"),
-                            epic_id=issue_data.get("epic_id"),
-                            labels=issue_data.get("labels", []),
-                            custom_id=issue_data["id"],
-                        )
-                        new_count += 1
-                except Exception as e:
-                    typer.echo(f"Warning: Failed to import {issue_data.get('id', 'unknown')}: {e}", err=True)
-                    error_count += 1
-
-            # Commit all changes
+            # Commit the whole import as one transaction
             service.uow.session.commit()
 
             if json_output:
                 typer.echo(
                     json.dumps(
                         {
-                            "imported": new_count + updated_count,
-                            "new": new_count,
-                            "updated": updated_count,
-                            "errors": error_count,
+                            "imported": result.new + result.updated,
+                            "new": result.new,
+                            "updated": result.updated,
+                            "errors": len(result.errors),
+                            "skipped_dependencies": result.skipped_dependencies,
                         }
                     )
                 )
             else:
-                typer.echo(f"✓ Imported {new_count + updated_count} issues")
-                typer.echo(f"  New: {new_count}")
-                typer.echo(f"  Updated: {updated_count}")
-                if error_count > 0:
-                    typer.echo(f"  Errors: {error_count}")
+                typer.echo(f"✓ Imported {result.new + result.updated} issues")
+                typer.echo(f"  New: {result.new}")
+                typer.echo(f"  Updated: {result.updated}")
+                if result.errors:
+                    typer.echo(f"  Errors: {len(result.errors)}")
+                if result.skipped_dependencies:
+                    typer.echo(f"  Skipped dependencies (already present): {result.skipped_dependencies}")
 
             if dedupe_after:
                 typer.echo("\nRunning duplicate detection...")
@@ -2172,6 +2006,14 @@ def import_issues(
         raise typer.Exit(1)
 
 
+def _iter_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the JSON objects of a JSONL file one line at a time, skipping blank lines."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
 # Cleanup command
 @app.command()
 def cleanup(
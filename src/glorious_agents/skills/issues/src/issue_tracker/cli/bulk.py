@@ -0,0 +1,47 @@
+"""Target selection and failure reporting shared by the bulk commands."""
+
+from typing import Any
+
+from issue_tracker.domain import IssuePriority, IssueStatus, IssueType
+
+__all__ = ["bulk_failures", "select_bulk_issue_ids"]
+
+
+def select_bulk_issue_ids(
+    service: Any,
+    issue_ids: list[str] | None,
+    status: str | None,
+    type: str | None,
+    priority: int | None,
+    assignee: str | None,
+    label_filter: str | None,
+) -> list[str]:
+    """Resolve the targets of a bulk command: the given IDs, or the IDs of issues matching the filters."""
+    if issue_ids:
+        return [*dict.fromkeys(issue_ids)]
+
+    rows = service.iter_issue_rows(
+        status=IssueStatus(status) if status else None,
+        priority=IssuePriority(priority) if priority is not None else None,
+        issue_type=IssueType(type) if type else None,
+        assignee=assignee,
+        with_description=False,
+        with_labels=bool(label_filter),
+    )
+    if label_filter:
+        filter_labels = [lbl.strip() for lbl in label_filter.split(",")]
+        rows = (row for row in rows if any(lbl in row.labels for lbl in filter_labels))
+    return [row.id for row in rows]
+
+
+def bulk_failures(service: Any, failed_ids: list[str], reason: str) -> list[dict[str, str]]:
+    """Describe why bulk targets were skipped: missing issues, or issues the change did not apply to."""
+    if not failed_ids:
+        return []
+    statuses = {row.id: row.status.value for row in service.get_issue_rows(failed_ids)}
+    return [
+        {"id": iid, "error": f"Issue {iid} ({statuses[iid]}) {reason}"}
+        if iid in statuses
+        else {"id": iid, "error": f"Issue not found: {iid}"}
+        for iid in failed_ids
+    ]
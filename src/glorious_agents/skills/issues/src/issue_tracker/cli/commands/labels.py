@@ -5,7 +5,7 @@ import json
 
 import typer
 
-from issue_tracker.domain import IssuePriority, IssueStatus, IssueType
+from issue_tracker.cli.bulk import bulk_failures, select_bulk_issue_ids
 
 app = typer.Typer(name="labels", help="Manage issue labels")
 
@@ -265,55 +265,18 @@ def bulk_add(
         service = get_issue_service()
         label_list = [label.strip() for label in labels.split(",")]
 
-        # Get issues either from IDs or filters - best-effort approach
-        issues_to_process = []
-        failures = []
-
-        if issue_ids:
-            for iid in issue_ids:
-                try:
-                    issue = service.get_issue(iid)
-                    if issue is None:
-                        failures.append({"id": iid, "error": f"Issue not found: {iid}"})
-                    else:
-                        issues_to_process.append(issue)
-                except Exception as e:
-                    failures.append({"id": iid, "error": str(e)})
-        else:
-            # Apply filters
-            status_filter = IssueStatus(status) if status else None
-            type_filter = IssueType(type) if type else None
-            priority_filter = IssuePriority(priority) if priority is not None else None
-
-            issues_to_process = service.list_issues(
-                status=status_filter,
-                priority=priority_filter,
-                issue_type=type_filter,
-                assignee=assignee,
-            )
-
-            # Additional filter by labels
-            if label_filter:
-                filter_labels = [lbl.strip() for lbl in label_filter.split(",")]
-                issues_to_process = [i for i in issues_to_process if any(lbl in i.labels for lbl in filter_labels)]
-
-        if not issues_to_process and not failures:
+        target_ids = select_bulk_issue_ids(service, issue_ids, status, type, priority, assignee, label_filter)
+        if not target_ids:
             typer.echo("No issues found matching criteria", err=True)
             raise typer.Exit(1)
 
-        # Process each issue with error handling
-        successes = []
-        for issue in issues_to_process:
-            try:
-                for label_name in label_list:
-                    issue = issue.add_label(label_name)
-                service.uow.issues.save(issue)
-                successes.append({"id": issue.id, "labels": issue.labels})
-            except Exception as e:
-                failures.append({"id": issue.id, "error": str(e)})
-
+        # Set-based label changes for all targets instead of a get + save per issue
+        updated_ids, failed_ids = service.bulk_add_labels(target_ids, label_list)
         service.uow.session.commit()
 
+        successes = [{"id": row.id, "labels": row.labels} for row in service.get_issue_rows(updated_ids)]
+        failures = bulk_failures(service, failed_ids, "not updated")
+
         # Return results
         if json_output:
             typer.echo(json.dumps({"successes": successes, "failures": failures}))
@@ -355,55 +318,18 @@ def bulk_remove(
         service = get_issue_service()
         label_list = [label.strip() for label in labels.split(",")]
 
-        # Get issues either from IDs or filters - best-effort approach
-        issues_to_process = []
-        failures = []
-
-        if issue_ids:
-            for iid in issue_ids:
-                try:
-                    issue = service.get_issue(iid)
-                    if issue is None:
-                        failures.append({"id": iid, "error": f"Issue not found: {iid}"})
-                    else:
-                        issues_to_process.append(issue)
-                except Exception as e:
-                    failures.append({"id": iid, "error": str(e)})
-        else:
-            # Apply filters
-            status_filter = IssueStatus(status) if status else None
-            type_filter = IssueType(type) if type else None
-            priority_filter = IssuePriority(priority) if priority is not None else None
-
-            issues_to_process = service.list_issues(
-                status=status_filter,
-                priority=priority_filter,
-                issue_type=type_filter,
-                assignee=assignee,
-            )
-
-            # Additional filter by labels
-            if label_filter:
-                filter_labels = [lbl.strip() for lbl in label_filter.split(",")]
-                issues_to_process = [i for i in issues_to_process if any(lbl in i.labels for lbl in filter_labels)]
-
-        if not issues_to_process and not failures:
+        target_ids = select_bulk_issue_ids(service, issue_ids, status, type, priority, assignee, label_filter)
+        if not target_ids:
             typer.echo("No issues found matching criteria", err=True)
             raise typer.Exit(1)
 
-        # Process each issue with error handling
-        successes = []
-        for issue in issues_to_process:
-            try:
-                for label_name in label_list:
-                    issue = issue.remove_label(label_name)
-                service.uow.issues.save(issue)
-                successes.append({"id": issue.id, "labels": issue.labels})
-            except Exception as e:
-                failures.append({"id": issue.id, "error": str(e)})
-
+        # Set-based label changes for all targets instead of a get + save per issue
+        updated_ids, failed_ids = service.bulk_remove_labels(target_ids, label_list)
         service.uow.session.commit()
 
+        successes = [{"id": row.id, "labels": row.labels} for row in service.get_issue_rows(updated_ids)]
+        failures = bulk_failures(service, failed_ids, "not updated")
+
         # Return results
         if json_output:
             typer.echo(json.dumps({"successes": successes, "failures": failures}))
@@ -112,6 +112,11 @@ def get_engine() -> Engine:
         cursor.execute("PRAGMA busy_timeout=30000")  # 30 second timeout
         cursor.close()
 
+    # Count lock contention for the daemon /metrics endpoint
+    from glorious_agents.core.metrics import track_sqlite_busy
+
+    track_sqlite_busy(engine)
+
     # Register engine for cleanup
     _engine_registry[db_url] = engine
 
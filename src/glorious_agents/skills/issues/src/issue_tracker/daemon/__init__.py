@@ -2,6 +2,7 @@
 
 from issue_tracker.daemon.config import DaemonConfig
 from issue_tracker.daemon.ipc_server import IPCServer
+from issue_tracker.daemon.scheduler import SyncScheduler
 from issue_tracker.daemon.service import (
     IssuesDaemonService,
     is_daemon_running,
@@ -17,6 +18,7 @@ __all__ = [
     "DaemonService",  # Deprecated, use IssuesDaemonService
     "IssuesDaemonService",
     "SyncEngine",
+    "SyncScheduler",
     "IPCServer",
     "DaemonConfig",
     "start_daemon",
@@ -22,6 +22,10 @@ class DaemonConfig:
     export_path: str
     git_integration: bool
     workspace_path: Path
+    ipc_transport: str = "auto"  # "auto", "unix" or "tcp"
+    ipc_timeout: float = 5.0
+    sync_debounce_seconds: float = 1.0  # quiet time after an issue change before syncing
+    sync_max_latency_seconds: float = 10.0  # longest a change waits while edits keep arriving
 
     @classmethod
     def default(cls, workspace_path: Path) -> "DaemonConfig":
@@ -39,6 +43,10 @@ class DaemonConfig:
             export_path=str(data_dir / "issues.jsonl"),
             git_integration=os.environ.get("ISSUES_GIT_ENABLED", "false").lower() == "true",
             workspace_path=workspace_path,
+            ipc_transport=os.environ.get("ISSUES_IPC_TRANSPORT", "auto"),
+            ipc_timeout=float(os.environ.get("ISSUES_IPC_TIMEOUT", "5")),
+            sync_debounce_seconds=float(os.environ.get("ISSUES_SYNC_DEBOUNCE", "1")),
+            sync_max_latency_seconds=float(os.environ.get("ISSUES_SYNC_MAX_LATENCY", "10")),
         )
 
     @classmethod
@@ -75,6 +83,14 @@ class DaemonConfig:
                     ).lower()
                     == "true",
                     workspace_path=workspace_path,
+                    ipc_transport=os.environ.get("ISSUES_IPC_TRANSPORT", data.get("ipc_transport", "auto")),
+                    ipc_timeout=float(os.environ.get("ISSUES_IPC_TIMEOUT", str(data.get("ipc_timeout", 5)))),
+                    sync_debounce_seconds=float(
+                        os.environ.get("ISSUES_SYNC_DEBOUNCE", str(data.get("sync_debounce_seconds", 1)))
+                    ),
+                    sync_max_latency_seconds=float(
+                        os.environ.get("ISSUES_SYNC_MAX_LATENCY", str(data.get("sync_max_latency_seconds", 10)))
+                    ),
                 )
         return cls.default(workspace_path)
 
@@ -98,6 +114,10 @@ class DaemonConfig:
             "sync_interval_seconds": self.sync_interval_seconds,
             "export_path": self.export_path,
             "git_integration": self.git_integration,
+            "ipc_transport": self.ipc_transport,
+            "ipc_timeout": self.ipc_timeout,
+            "sync_debounce_seconds": self.sync_debounce_seconds,
+            "sync_max_latency_seconds": self.sync_max_latency_seconds,
         }
         with open(config_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
@@ -0,0 +1,29 @@
+"""Conversion between issues and the records in the sync JSONL file."""
+
+from typing import Any
+
+from issue_tracker.domain.records import issue_from_record
+
+__all__ = ["issue_from_record", "issue_to_record"]
+
+
+def issue_to_record(issue: Any) -> dict[str, Any]:
+    """Convert an Issue or IssueRow into the dictionary written to JSONL.
+
+    Labels and project IDs are not synced; the record always has empty labels.
+    issue_from_record() is the inverse.
+    """
+    return {
+        "id": issue.id,
+        "title": issue.title,
+        "description": issue.description,
+        "status": issue.status.value,
+        "priority": int(issue.priority),
+        "type": issue.type.value,
+        "assignee": issue.assignee or "",
+        "labels": [],
+        "epic_id": issue.epic_id,
+        "created_at": issue.created_at.isoformat() if issue.created_at else None,
+        "updated_at": issue.updated_at.isoformat() if issue.updated_at else None,
+        "closed_at": issue.closed_at.isoformat() if issue.closed_at else None,
+    }
@@ -0,0 +1,193 @@
+"""Debounced scheduling of daemon sync cycles."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+from glorious_agents.core.metrics import get_metrics
+
+__all__ = ["SyncScheduler"]
+
+logger = logging.getLogger(__name__)
+
+SYNC_RUNS = get_metrics().counter("glorious_issues_sync_runs_total", "Issue sync cycles run by the daemon", ["result"])
+SYNC_COALESCED = get_metrics().counter(
+    "glorious_issues_sync_coalesced_changes_total", "Issue changes folded into scheduled sync cycles"
+)
+SYNC_LAG = get_metrics().histogram(
+    "glorious_issues_sync_lag_seconds",
+    "Seconds from the first unsynced issue change to the end of the sync cycle that included it",
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+
+
+class SyncScheduler:
+    """Runs a sync callback after bursts of issue changes settle.
+
+    notify() reports changes. A cycle starts once no change was reported for
+    ``debounce`` seconds, or ``max_latency`` seconds after the oldest unsynced
+    change, whichever comes first, so a burst of edits becomes one sync (and
+    one commit) while a steady stream of edits still syncs regularly.
+    request() asks for a cycle without a change, e.g. to check the remote;
+    it runs as soon as the scheduler is idle and never cuts a debounce short.
+
+    The callback is blocking and runs in the default executor, one cycle at
+    a time; changes reported while it runs are synced by the next cycle.
+    notify() and request() must be called from the event loop thread.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[], Any],
+        debounce: float = 1.0,
+        max_latency: float = 10.0,
+        name: str = "issues_sync",
+    ) -> None:
+        """Initialize scheduler.
+
+        Args:
+            callback: Blocking function running one sync cycle
+            debounce: Seconds without changes before a cycle starts
+            max_latency: Upper bound in seconds on how long a change waits
+            name: Scheduler name for logging
+
+        Raises:
+            ValueError: If debounce is negative or above max_latency
+        """
+        if debounce < 0 or max_latency < debounce:
+            raise ValueError("Need 0 <= debounce <= max_latency")
+        self.callback = callback
+        self.debounce = debounce
+        self.max_latency = max_latency
+        self.name = name
+
+        # Changes reported since the last cycle started
+        self.pending = 0
+        # Monotonic times of the oldest and newest unsynced change
+        self._first_change: float | None = None
+        self._last_change = 0.0
+        self._requested = False
+
+        # Monotonic end time and change lag of the last finished cycle
+        self.last_run: float | None = None
+        self.last_lag: float | None = None
+
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def lag(self) -> float:
+        """Seconds the oldest unsynced change has been waiting, or 0."""
+        return 0.0 if self._first_change is None else time.monotonic() - self._first_change
+
+    def notify(self, count: int = 1) -> None:
+        """Report issue changes, (re)starting the debounce window.
+
+        Args:
+            count: Number of changes reported
+        """
+        now = time.monotonic()
+        if self._first_change is None:
+            self._first_change = now
+        self._last_change = now
+        self.pending += count
+        self._wakeup.set()
+
+    def request(self) -> None:
+        """Ask for a cycle even though no change was reported."""
+        self._requested = True
+        self._wakeup.set()
+
+    def _due_at(self) -> float | None:
+        """Monotonic time the next cycle is due, or None if nothing is waiting."""
+        if self._first_change is not None:
+            return min(self._last_change + self.debounce, self._first_change + self.max_latency)
+        if self._requested:
+            return time.monotonic()
+        return None
+
+    async def _run_loop(self) -> None:
+        """Wait for due cycles and run them one at a time."""
+        loop = asyncio.get_running_loop()
+        while not self._stopping:
+            due_at = self._due_at()
+            timeout = None if due_at is None else due_at - time.monotonic()
+            if timeout is None or timeout > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except TimeoutError:
+                    pass
+                continue
+
+            # Everything reported so far goes into this cycle
+            first_change, coalesced = self._first_change, self.pending
+            self._first_change = None
+            self.pending = 0
+            self._requested = False
+
+            result = "success"
+            try:
+                await loop.run_in_executor(None, self.callback)
+            except Exception as e:
+                result = "error"
+                logger.error(f"Error in scheduled sync '{self.name}': {e}", exc_info=True)
+
+            self.last_run = time.monotonic()
+            SYNC_RUNS.labels(result).inc()
+            if first_change is not None:
+                self.last_lag = self.last_run - first_change
+                SYNC_LAG.observe(self.last_lag)
+                SYNC_COALESCED.inc(coalesced)
+                logger.debug(f"Synced {coalesced} coalesced changes after {self.last_lag:.2f}s")
+
+    async def start(self) -> None:
+        """Start the scheduler.
+
+        Raises:
+            RuntimeError: If the scheduler is already running
+        """
+        if self._task is not None and not self._task.done():
+            raise RuntimeError(f"Scheduler '{self.name}' is already running")
+
+        self._stopping = False
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info(f"Sync scheduler '{self.name}' started (debounce: {self.debounce}s, max: {self.max_latency}s)")
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Stop the scheduler, letting a running cycle finish.
+
+        Args:
+            timeout: Maximum seconds to wait for a running cycle
+        """
+        if self._task is None:
+            return
+
+        self._stopping = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._task, timeout=timeout)
+        except TimeoutError:
+            logger.warning(f"Scheduler '{self.name}' didn't stop within {timeout}s, cancelling")
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+        logger.info(f"Sync scheduler '{self.name}' stopped")
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the scheduler is active.
+
+        Returns:
+            True if the scheduler loop is running
+        """
+        return self._task is not None and not self._task.done()
@@ -4,26 +4,38 @@ import asyncio
 import logging
 import os
 import sys
+import threading
 import time
+from collections.abc import Iterable, Iterator
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from glorious_agents.core.daemon import BaseDaemonService, PeriodicTask
+from glorious_agents.core.metrics import get_metrics
 
 from issue_tracker.daemon.config import DaemonConfig
+from issue_tracker.daemon.records import issue_to_record
+from issue_tracker.daemon.scheduler import SyncScheduler
 from issue_tracker.daemon.sync_engine import SyncEngine
 
 __all__ = ["IssuesDaemonService"]
 
 logger = logging.getLogger(__name__)
 
+# Longest interval between probes of the issue change log for new changes
+CHANGE_POLL_SECONDS = 0.5
+
 
 class IssuesDaemonService(BaseDaemonService):
     """Issues-specific daemon extending core infrastructure.
 
-    Provides background sync for issue tracking with Git integration.
+    Provides background sync for issue tracking with Git integration, and
+    runs ``issues`` commands forwarded by the CLI against warm services.
     """
 
+    cli_prog_name = "issues"
+
     def __init__(self, config: DaemonConfig) -> None:
         """Initialize issues daemon service.
 
@@ -38,39 +50,78 @@ class IssuesDaemonService(BaseDaemonService):
             daemon_mode=config.daemon_mode,  # type: ignore[arg-type]
             auto_start=config.auto_start_daemon,
             log_level="INFO",
+            ipc_transport=config.ipc_transport,  # type: ignore[arg-type]
+            ipc_timeout=config.ipc_timeout,
         )
         super().__init__(core_config)
 
         # Store issues-specific config
         self.issues_config = config
 
-        # Initialize sync engine
+        # Database engine (reused across syncs to prevent memory leak)
+        self._engine = None
+
+        # Initialize sync engine; export hashes persist in the issues database
         self.sync_engine = SyncEngine(
             workspace_path=config.workspace_path,
             export_path=Path(config.export_path),
             git_enabled=config.git_integration,
+            engine=self._get_engine(),
         )
 
-        # Database engine (reused across syncs to prevent memory leak)
-        self._engine = None
+        # Sync cycles, debounced after changes found in the issue change log
+        self._scheduler = SyncScheduler(
+            self._perform_sync,
+            debounce=config.sync_debounce_seconds,
+            max_latency=config.sync_max_latency_seconds,
+        )
 
-        # Periodic sync task
+        # Periodic probe of the change log that feeds the scheduler
         self._sync_task: PeriodicTask | None = None
 
+        # Highest change log seq handed to the scheduler
+        self._seen_change = 0
+
+        # Set once change tracking is installed and a full export succeeded
+        self._change_tracking = False
+
+        # Manual and scheduled syncs never run concurrently
+        self._sync_lock = threading.Lock()
+        self._last_sync: datetime | None = None
+        self._last_sync_failed = False
+
     async def on_startup(self) -> None:
         """Initialize issues-specific resources.
 
-        Starts the periodic sync task if enabled.
+        Starts the sync scheduler and the change log probe if sync is enabled.
         """
         logger.info("Starting issues daemon")
 
-        # Start periodic sync if enabled
         if self.issues_config.sync_enabled:
-            self._sync_task = PeriodicTask(
-                interval=self.issues_config.sync_interval_seconds, callback=self._perform_sync, name="issues_sync"
-            )
+            await self._scheduler.start()
+
+            # The first cycle exports every issue, including changes logged so far
+            try:
+                self._seen_change = await asyncio.to_thread(self._latest_change, True)
+            except Exception as e:
+                logger.warning(f"Issue change log unavailable, retrying after the first sync: {e}")
+                self._seen_change = 0
+            self._scheduler.request()
+
+            # Probe at least twice per debounce window, so a burst keeps extending it
+            poll_interval = min(CHANGE_POLL_SECONDS, max(self.issues_config.sync_debounce_seconds / 2, 0.05))
+            self._sync_task = PeriodicTask(interval=poll_interval, callback=self._poll_changes, name="issues_sync_poll")
             await self._sync_task.start()
-            logger.info(f"Sync task started (interval: {self.issues_config.sync_interval_seconds}s)")
+            get_metrics().register_collector(
+                "glorious_issues_sync_pending_seconds",
+                "Seconds the oldest unsynced issue change has been waiting",
+                self._collect_sync_lag,
+            )
+            logger.info(
+                f"Sync scheduler started (debounce: {self.issues_config.sync_debounce_seconds}s, "
+                f"max latency: {self.issues_config.sync_max_latency_seconds}s, "
+                f"remote check interval: {self.issues_config.sync_interval_seconds}s)"
+            )
 
     async def on_shutdown(self) -> None:
         """Cleanup issues-specific resources.
@@ -79,10 +130,12 @@ class IssuesDaemonService(BaseDaemonService):
         """
         logger.info("Shutting down issues daemon")
 
-        # Stop sync task
+        # Stop the change log probe, then let a running sync finish
         if self._sync_task:
             await self._sync_task.stop()
             self._sync_task = None
+            get_metrics().unregister_collector("glorious_issues_sync_pending_seconds")
+        await self._scheduler.stop()
 
         # CRITICAL: Dispose database engine to prevent memory leak
         if self._engine:
@@ -93,13 +146,25 @@ class IssuesDaemonService(BaseDaemonService):
 
     def get_health_info(self) -> dict[str, Any]:
         """Return issues-specific health information."""
+        last_lag = self._scheduler.last_lag
         return {
             "sync_enabled": self.issues_config.sync_enabled,
             "sync_interval": self.issues_config.sync_interval_seconds,
+            "sync_debounce": self.issues_config.sync_debounce_seconds,
+            "sync_max_latency": self.issues_config.sync_max_latency_seconds,
             "git_enabled": self.issues_config.git_integration,
-            "last_sync": getattr(self.sync_engine, "last_sync", None),
+            "last_sync": self._last_sync.isoformat() if self._last_sync else None,
+            "sync_pending_changes": self._scheduler.pending,
+            "sync_lag_seconds": round(self._scheduler.lag, 3),
+            "last_sync_lag_seconds": round(last_lag, 3) if last_lag is not None else None,
         }
 
+    def get_cli_app(self) -> Any:
+        """Return the issues CLI app for forwarded commands."""
+        from issue_tracker.cli.app import app
+
+        return app
+
     def handle_command(self, request: dict[str, Any]) -> dict[str, Any]:
         """Handle issues-specific IPC commands.
 
@@ -123,22 +188,68 @@ class IssuesDaemonService(BaseDaemonService):
     def _trigger_sync(self) -> dict[str, Any]:
         """Trigger immediate sync."""
         try:
-            issues = self._get_issues_from_db()
-            stats = self.sync_engine.sync(issues)
+            stats = self._sync_changes()
             return {"status": "success", "stats": stats}
         except Exception as e:
             logger.error(f"Sync failed: {e}", exc_info=True)
             return {"status": "error", "error": str(e)}
 
-    async def _perform_sync(self) -> None:
-        """Perform sync operation (called by PeriodicTask)."""
+    def _perform_sync(self) -> None:
+        """Perform sync operation (called by SyncScheduler in a worker thread)."""
         try:
-            issues = self._get_issues_from_db()
-            stats = self.sync_engine.sync(issues)
+            stats = self._sync_changes()
             logger.info(f"Sync complete: {stats}")
         except Exception as e:
             logger.error(f"Error in sync: {e}", exc_info=True)
 
+    async def _poll_changes(self) -> None:
+        """Hand new change log entries to the scheduler (called by PeriodicTask).
+
+        Without new changes, a cycle is requested every sync_interval_seconds
+        while git is enabled, to pick up remote changes, or after a failed
+        cycle, to retry it.
+        """
+        try:
+            latest = await asyncio.to_thread(self._latest_change)
+        except Exception as e:
+            logger.debug(f"Change log probe failed: {e}")
+            return
+
+        if latest > self._seen_change:
+            self._scheduler.notify(latest - self._seen_change)
+            self._seen_change = latest
+        elif self._scheduler.pending == 0 and (self.issues_config.git_integration or self._last_sync_failed):
+            last_run = self._scheduler.last_run
+            if last_run is not None and time.monotonic() - last_run >= self.issues_config.sync_interval_seconds:
+                self._scheduler.request()
+
+    def _latest_change(self, ensure_tracking: bool = False) -> int:
+        """Return the newest seq in the issue change log, or 0 if it is empty.
+
+        Blocking; the event loop calls it through asyncio.to_thread.
+
+        Args:
+            ensure_tracking: First create the change log and its triggers if
+                missing (databases initialized before they existed)
+
+        Returns:
+            Highest seq in the change log
+        """
+        from sqlmodel import Session
+
+        from issue_tracker.adapters.db.repositories import SyncStateRepository
+
+        with Session(self._get_engine()) as session:
+            repo = SyncStateRepository(session)
+            if ensure_tracking:
+                repo.ensure_change_tracking()
+                session.commit()
+            return repo.latest_change()
+
+    def _collect_sync_lag(self) -> Iterable[tuple[dict[str, str], float]]:
+        """Metrics collector for the age of the oldest unsynced change."""
+        return [({}, self._scheduler.lag)]
+
     def _get_engine(self):
         """Get or create a reusable database engine.
 
@@ -154,40 +265,92 @@ class IssuesDaemonService(BaseDaemonService):
             self._engine = create_engine(f"sqlite:///{self.issues_config.database_path}")
         return self._engine
 
-    def _get_issues_from_db(self) -> list[dict[str, Any]]:
-        """Get all issues from database.
+    def _sync_changes(self) -> dict[str, Any]:
+        """Run one sync cycle driven by the issue change log.
+
+        The first cycle installs the change-tracking triggers and exports every
+        issue. Later cycles read the change log up to a watermark and export
+        only the issues logged there; with an empty log, no issues are read and
+        export and commit are skipped. The log is pruned up to the watermark
+        once the cycle succeeded. Cycles are serialized, so a manual sync waits
+        for a scheduled one.
 
         Returns:
-            List of issue dictionaries
+            Sync statistics
         """
-        try:
-            from sqlmodel import Session, select
+        from sqlmodel import Session
 
-            from issue_tracker.adapters.db.models import IssueModel  # type: ignore[attr-defined]
+        from issue_tracker.adapters.db.repositories import SyncStateRepository
 
+        with self._sync_lock:
+            self._last_sync_failed = True
             engine = self._get_engine()
             with Session(engine) as session:
-                issues = session.exec(select(IssueModel)).all()
-                return [
-                    {
-                        "id": issue.id,
-                        "title": issue.title,
-                        "description": issue.description or "",
-                        "status": issue.status,
-                        "priority": issue.priority,
-                        "type": issue.type,
-                        "assignee": issue.assignee or "",
-                        "labels": [],
-                        "epic_id": issue.epic_id,
-                        "created_at": issue.created_at.isoformat() if issue.created_at else None,
-                        "updated_at": issue.updated_at.isoformat() if issue.updated_at else None,
-                        "closed_at": issue.closed_at.isoformat() if issue.closed_at else None,
-                    }
-                    for issue in issues
-                ]
-        except Exception as e:
-            logger.error(f"Failed to get issues from database: {e}")
-            return []
+                repo = SyncStateRepository(session)
+                if not self._change_tracking:
+                    repo.ensure_change_tracking()
+                watermark, changed_ids = repo.get_changes()
+                session.commit()
+
+            if not self._change_tracking:
+                stats = self.sync_engine.sync(self._get_issues_from_db())
+            elif changed_ids:
+                issues, removed_ids = self._get_changed_issues(changed_ids)
+                stats = self.sync_engine.sync(issues, removed_ids)
+            else:
+                stats = self.sync_engine.sync(None)
+
+            if not stats["errors"]:
+                self._change_tracking = True
+                if watermark:
+                    with Session(engine) as session:
+                        SyncStateRepository(session).acknowledge_changes(watermark)
+                        session.commit()
+            self._last_sync = datetime.now()
+            self._last_sync_failed = bool(stats["errors"])
+        return stats
+
+    def _get_issues_from_db(self) -> Iterator[dict[str, Any]]:
+        """Stream all issues from the database.
+
+        Errors propagate to the caller, so a failed read never exports an
+        empty issue list over the JSONL file.
+
+        Yields:
+            Issue dictionaries
+        """
+        from sqlmodel import Session
+
+        from issue_tracker.adapters.db.repositories import IssueReadRepository
+
+        engine = self._get_engine()
+        with Session(engine) as session:
+            # Column projection rows, not ORM instances; labels are not synced
+            for row in IssueReadRepository(session).iter_rows(with_labels=False):
+                yield issue_to_record(row)
+
+    def _get_changed_issues(self, issue_ids: set[str]) -> tuple[list[dict[str, Any]], set[str]]:
+        """Load the issues named in the change log.
+
+        Args:
+            issue_ids: IDs of changed issues
+
+        Returns:
+            Tuple of (issue dictionaries, IDs of issues that no longer exist)
+        """
+        from glorious_agents.core.repository import BULK_BATCH_SIZE
+        from sqlmodel import Session
+
+        from issue_tracker.adapters.db.repositories import IssueReadRepository
+
+        ids = sorted(issue_ids)
+        issues: list[dict[str, Any]] = []
+        with Session(self._get_engine()) as session:
+            repo = IssueReadRepository(session)
+            for start in range(0, len(ids), BULK_BATCH_SIZE):
+                rows = repo.get_rows(ids[start : start + BULK_BATCH_SIZE], with_labels=False)
+                issues.extend(issue_to_record(row) for row in rows)
+        return issues, issue_ids - {issue["id"] for issue in issues}
 
 
 def _kill_existing_daemon(workspace_path: Path) -> None:
@@ -1,110 +1,492 @@
 """Sync engine for JSONL export/import and git operations."""
 
+import hashlib
 import json
 import logging
+import os
 import subprocess
+import tempfile
+from collections.abc import Collection, Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-__all__ = ["SyncEngine"]
+__all__ = ["ExportStats", "MergeStats", "SyncEngine", "content_hash"]
 
 logger = logging.getLogger(__name__)
 
+# Every exported line starts with this prefix, so its ID can be read without parsing JSON
+_ID_PREFIX = b'{"id": "'
+
+# Pulled records compared against the database per query during a merge
+MERGE_BATCH_SIZE = 500
+
+
+def content_hash(issue: dict[str, Any]) -> str:
+    """Return a stable BLAKE2b hash of an issue record.
+
+    The record is serialized as canonical JSON (sorted keys, no whitespace), so
+    the hash is the same across processes, unlike the randomized built-in hash().
+
+    Args:
+        issue: Issue dictionary as exported
+
+    Returns:
+        32-character hex digest
+    """
+    canonical = json.dumps(issue, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass
+class ExportStats:
+    """Outcome of an incremental JSONL export."""
+
+    exported: int = 0  # records serialized because they are new or changed
+    skipped: int = 0  # unchanged records whose previous line was copied
+    removed: int = 0  # previous lines dropped because their issue is gone
+    bytes_written: int = 0  # size of the rewritten file; 0 if it was left alone
+
+
+@dataclass
+class MergeStats:
+    """Outcome of merging the pulled JSONL file into the database."""
+
+    read: int = 0  # records in the file
+    unchanged: int = 0  # records equal to the last-synced base or to the local issue
+    applied: int = 0  # remote changes and additions written to the database
+    deleted: int = 0  # issues deleted remotely and unchanged locally
+    conflicts: int = 0  # issues changed on both sides, recorded in sync_conflicts
+    invalid: int = 0  # records that are not valid issues
+    changed_ids: set[str] = field(default_factory=set)  # issues written or deleted by the merge
+
 
 class SyncEngine:
     """Handles synchronization between database and git repository."""
 
-    def __init__(self, workspace_path: Path, export_path: Path, git_enabled: bool = True) -> None:
+    def __init__(
+        self, workspace_path: Path, export_path: Path, git_enabled: bool = True, engine: Any | None = None
+    ) -> None:
         """Initialize sync engine.
 
         Args:
             workspace_path: Workspace root directory
             export_path: Path to JSONL export file
             git_enabled: Whether git integration is enabled
+            engine: SQLAlchemy engine of the issues database, used to persist
+                export hashes in the sync_state table; without one they are
+                kept in memory and every new engine re-exports everything
         """
         self.workspace_path = workspace_path
         self.export_path = export_path
         self.git_enabled = git_enabled
-        self._last_export: dict[str, Any] = {}
-
-    def export_to_jsonl(self, issues: list[dict[str, Any]]) -> tuple[int, int]:
+        self.engine = engine
+        # Content hash per issue ID as last exported or merged; loaded lazily from sync_state
+        self._last_export: dict[str, str] | None = None
+        # (inode, size, mtime) of the export file as last written or merged
+        self._synced_signature: tuple[int, int, int] | None = None
+        # (remote, remote ref, remote-tracking ref) of the checked-out branch; looked up lazily
+        self._upstream: tuple[str, str, str] | None = None
+        # Set while a commit has not been pushed, so a failed push is retried
+        self._push_pending = False
+
+    def export_to_jsonl(self, issues: Iterable[dict[str, Any]]) -> tuple[int, int]:
         """Export issues to JSONL format.
 
         Args:
-            issues: List of issue dictionaries
+            issues: Issue dictionaries, e.g. streamed from the database
 
         Returns:
             Tuple of (exported_count, skipped_count)
         """
-        exported = 0
-        skipped = 0
+        stats = self.export_changes(issues)
+        return stats.exported, stats.skipped
+
+    def export_changes(
+        self, issues: Iterable[dict[str, Any]], removed_ids: Collection[str] | None = None
+    ) -> ExportStats:
+        """Incrementally rewrite the JSONL file.
+
+        Without removed_ids, issues is every issue and the file ends up holding
+        exactly those. With removed_ids (a partial export, e.g. from a change
+        log), issues holds only the changed issues and all other lines are kept.
+
+        Only issues whose content hash differs from the last export are
+        serialized; every other line is copied byte for byte in its existing
+        position, and new issues are appended, so git diffs show only real
+        changes. The new file is written to a temporary file and renamed over
+        the old one, and is not rewritten at all when nothing changed.
 
+        Args:
+            issues: Issue dictionaries, e.g. streamed from the database
+            removed_ids: IDs of deleted issues, for a partial export
+
+        Returns:
+            Export statistics
+        """
+        stats = ExportStats()
         try:
             self.export_path.parent.mkdir(parents=True, exist_ok=True)
+            previous_hashes = self._load_hashes()
+            file_ids, line_count = self._index_export_file()
 
-            # Collect issues that need to be written
-            issues_to_write: list[dict[str, Any]] = []
+            changed_lines: dict[str, bytes] = {}
+            changed: dict[str, str] = {}
+            exported_ids: set[str] = set()
             for issue in issues:
-                # Check if issue changed since last export
                 issue_id = issue.get("id")
-                issue_hash = hash(json.dumps(issue, sort_keys=True))
-
-                if issue_id and self._last_export.get(issue_id) == issue_hash:
-                    skipped += 1
+                if not issue_id:
+                    logger.warning(f"Skipping issue without an id: {issue}")
+                    continue
+                exported_ids.add(issue_id)
+                issue_hash = content_hash(issue)
+                if previous_hashes.get(issue_id) == issue_hash and issue_id in file_ids:
+                    stats.skipped += 1
                     continue
 
-                issues_to_write.append(issue)
-                if issue_id:
-                    self._last_export[issue_id] = issue_hash
-                exported += 1
-
-            # Only write file if there are changes
-            if issues_to_write:
-                with open(self.export_path, "w", encoding="utf-8") as f:
-                    for issue in issues_to_write:
-                        f.write(json.dumps(issue) + "\n")
-            elif self.export_path.exists():
-                # Touch file to update mtime even when all skipped
-                self.export_path.touch()
-
-            logger.info(f"Exported {exported} issues to {self.export_path} ({skipped} skipped)")
-            return exported, skipped
+                changed_lines[issue_id] = (json.dumps(issue) + "\n").encode("utf-8")
+                changed[issue_id] = issue_hash
+                stats.exported += 1
+
+            if removed_ids is None:
+                # Lines of issues never synced from here are remote additions awaiting a merge
+                removed = previous_hashes.keys() - exported_ids
+                # Blank, invalid or duplicate lines are dropped by a full export
+                untidy = line_count != len(file_ids)
+            else:
+                removed = set(removed_ids) - exported_ids
+                untidy = False
+            stats.removed = len(removed & file_ids)
+
+            if changed_lines or stats.removed or untidy:
+                stats.bytes_written = self._rewrite_export_file(changed_lines, removed)
+                self._synced_signature = self._file_signature()
+            self._save_hashes(changed, [issue_id for issue_id in removed if issue_id in previous_hashes])
+
+            logger.info(
+                f"Exported {stats.exported} issues to {self.export_path} "
+                f"({stats.skipped} unchanged, {stats.removed} removed, {stats.bytes_written} bytes written)"
+            )
+            return stats
 
         except Exception as e:
             logger.error(f"Failed to export issues: {e}")
             raise
 
+    def _index_export_file(self) -> tuple[set[str], int]:
+        """Collect the issue IDs in the export file.
+
+        Returns:
+            Tuple of (issue IDs, number of non-blank lines)
+        """
+        issue_ids: set[str] = set()
+        line_count = 0
+        if not self.export_path.exists():
+            return issue_ids, line_count
+
+        with open(self.export_path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    line_count += 1
+                    issue_id = _line_issue_id(line)
+                    if issue_id:
+                        issue_ids.add(issue_id)
+        return issue_ids, line_count
+
+    def _rewrite_export_file(self, changed_lines: dict[str, bytes], removed: set[str]) -> int:
+        """Atomically replace the export file via a temporary file and rename.
+
+        Previous lines are copied in order, except that changed issues get
+        their new line and removed issues, lines without an issue ID and
+        repeated IDs are dropped. New issues are appended.
+
+        Args:
+            changed_lines: New line per changed issue ID
+            removed: IDs of issues to drop
+
+        Returns:
+            Number of bytes written
+        """
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{self.export_path.name}.", suffix=".tmp", dir=self.export_path.parent)
+        written = 0
+        seen: set[str] = set()
+        try:
+            with os.fdopen(fd, "wb") as out:
+                if self.export_path.exists():
+                    with open(self.export_path, "rb") as previous:
+                        for line in previous:
+                            issue_id = _line_issue_id(line) if line.strip() else None
+                            if issue_id is None or issue_id in removed or issue_id in seen:
+                                continue
+                            seen.add(issue_id)
+                            if issue_id in changed_lines:
+                                line = changed_lines[issue_id]
+                            elif not line.endswith(b"\n"):
+                                line += b"\n"
+                            out.write(line)
+                            written += len(line)
+
+                for issue_id, line in changed_lines.items():
+                    if issue_id not in seen:
+                        out.write(line)
+                        written += len(line)
+                out.flush()
+                os.fsync(out.fileno())
+            os.replace(tmp_name, self.export_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return written
+
+    def _load_hashes(self) -> dict[str, str]:
+        """Return the hashes of the last export, loading them from sync_state once."""
+        if self._last_export is None:
+            self._last_export = {}
+            if self.engine is not None:
+                from sqlmodel import Session
+
+                from issue_tracker.adapters.db.repositories import SyncStateRepository
+
+                with Session(self.engine) as session:
+                    repo = SyncStateRepository(session)
+                    repo.ensure_tables()
+                    self._last_export = repo.get_hashes()
+                    session.commit()
+        return self._last_export
+
+    def _save_hashes(self, changed: dict[str, str], stale: list[str]) -> None:
+        """Record new hashes and forget those of issues no longer exported."""
+        hashes = self._load_hashes()
+        hashes.update(changed)
+        for issue_id in stale:
+            del hashes[issue_id]
+
+        if self.engine is not None and (changed or stale):
+            from sqlmodel import Session
+
+            from issue_tracker.adapters.db.repositories import SyncStateRepository
+
+            with Session(self.engine) as session:
+                repo = SyncStateRepository(session)
+                repo.save_hashes(changed)
+                repo.delete_hashes(stale)
+                session.commit()
+
     def import_from_jsonl(self) -> list[dict[str, Any]]:
         """Import issues from JSONL format.
 
         Returns:
             List of issue dictionaries
         """
+        try:
+            issues = list(self.iter_jsonl())
+            logger.info(f"Imported {len(issues)} issues from {self.export_path}")
+            return issues
+
+        except Exception as e:
+            logger.error(f"Failed to import issues: {e}")
+            raise
+
+    def iter_jsonl(self) -> Iterator[dict[str, Any]]:
+        """Stream the records of the JSONL file, skipping invalid lines.
+
+        Yields:
+            Issue dictionaries
+        """
         if not self.export_path.exists():
             logger.info(f"No export file found at {self.export_path}")
-            return []
+            return
+
+        with open(self.export_path, encoding="utf-8") as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Skipping invalid JSON on line {line_num}: {e}")
+
+    def merge_from_jsonl(self, batch_size: int = MERGE_BATCH_SIZE) -> MergeStats:
+        """Three-way merge the JSONL file into the database.
+
+        Each record is compared by content hash with the last-synced base (the
+        hash in sync_state) and with the local issue:
+
+        - equal to the base or to the local issue: nothing to do
+        - local issue unchanged since the base (or new on both counts): the
+          record is upserted
+        - changed on both sides: the local issue is kept and the record is
+          stored in sync_conflicts for review
+
+        Issues in the base but no longer in the file were deleted remotely and
+        are deleted locally unless they changed here too. The file is streamed
+        in batches and all writes happen in one transaction. Nothing is read
+        when the file is unchanged since it was last exported or merged.
+
+        Args:
+            batch_size: Records compared against the database per query
+
+        Returns:
+            Merge statistics
+
+        Raises:
+            ValueError: If the engine has no database
+        """
+        if self.engine is None:
+            raise ValueError("Merging requires a database engine")
+
+        stats = MergeStats()
+        signature = self._file_signature()
+        if signature is None or signature == self._synced_signature:
+            return stats
 
+        from sqlmodel import Session
+
+        from issue_tracker.adapters.db.repositories import SyncStateRepository
+
+        base = self._load_hashes()
+        new_base: dict[str, str] = {}
+        dropped: list[str] = []
         try:
-            issues = []
-            with open(self.export_path, encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
+            with Session(self.engine) as session:
+                seen: set[str] = set()
+                batch: list[dict[str, Any]] = []
+                for record in self.iter_jsonl():
+                    issue_id = record.get("id") if isinstance(record, dict) else None
+                    if not isinstance(issue_id, str) or issue_id in seen:
+                        stats.invalid += 1
                         continue
-                    try:
-                        issue = json.loads(line)
-                        issues.append(issue)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Skipping invalid JSON on line {line_num}: {e}")
-
-            logger.info(f"Imported {len(issues)} issues from {self.export_path}")
-            return issues
+                    seen.add(issue_id)
+                    batch.append(record)
+                    if len(batch) >= batch_size:
+                        self._merge_batch(session, batch, base, new_base, stats)
+                        batch = []
+                if batch:
+                    self._merge_batch(session, batch, base, new_base, stats)
+                stats.read = len(seen)
+
+                if seen:
+                    gone = [issue_id for issue_id in base if issue_id not in seen]
+                    dropped = self._merge_deletions(session, gone, base, batch_size, stats)
+                elif base:
+                    logger.warning(f"{self.export_path} has no issues; not deleting {len(base)} local issues")
+
+                state = SyncStateRepository(session)
+                state.save_hashes(new_base)
+                state.delete_hashes(dropped)
+                session.commit()
 
         except Exception as e:
-            logger.error(f"Failed to import issues: {e}")
+            logger.error(f"Failed to merge issues: {e}")
             raise
 
+        base.update(new_base)
+        for issue_id in dropped:
+            del base[issue_id]
+        self._synced_signature = signature
+        logger.info(
+            f"Merged {self.export_path}: {stats.applied} applied, {stats.deleted} deleted, "
+            f"{stats.conflicts} conflicts, {stats.unchanged} unchanged"
+        )
+        return stats
+
+    def _merge_batch(
+        self,
+        session: Any,
+        records: list[dict[str, Any]],
+        base: dict[str, str],
+        new_base: dict[str, str],
+        stats: MergeStats,
+    ) -> None:
+        """Merge one batch of pulled records; see merge_from_jsonl()."""
+        from issue_tracker.adapters.db.repositories import IssueReadRepository, IssueRepository
+        from issue_tracker.daemon.records import issue_from_record, issue_to_record
+        from issue_tracker.domain.exceptions import DomainError
+
+        rows = IssueReadRepository(session).get_rows([record["id"] for record in records], with_labels=False)
+        local_rows = {row.id: row for row in rows}
+        upserts = []
+        conflicts = []
+        for record in records:
+            issue_id = record["id"]
+            remote_hash = content_hash(record)
+            base_hash = base.get(issue_id)
+            row = local_rows.get(issue_id)
+            local_hash = content_hash(issue_to_record(row)) if row else None
+
+            if remote_hash in (base_hash, local_hash):
+                stats.unchanged += 1
+                if remote_hash != base_hash:
+                    new_base[issue_id] = remote_hash
+            elif local_hash == base_hash:
+                try:
+                    upserts.append(issue_from_record(record, project_id=row.project_id if row else "default"))
+                except (KeyError, TypeError, ValueError, DomainError) as e:
+                    logger.warning(f"Skipping invalid issue {issue_id}: {e}")
+                    stats.invalid += 1
+                    continue
+                new_base[issue_id] = remote_hash
+                stats.applied += 1
+                stats.changed_ids.add(issue_id)
+            else:
+                conflicts.append(_conflict(issue_id, base_hash, local_hash, remote_hash, record))
+
+        # Labels are not synced, so local labels are kept
+        IssueRepository(session).upsert_many(upserts, keep_labels={issue.id for issue in upserts})
+        self._record_conflicts(session, conflicts, stats)
+
+    def _merge_deletions(
+        self, session: Any, issue_ids: list[str], base: dict[str, str], batch_size: int, stats: MergeStats
+    ) -> list[str]:
+        """Apply remote deletions of issues unchanged locally.
+
+        Returns:
+            IDs whose base hash is dropped
+        """
+        from issue_tracker.adapters.db.repositories import IssueReadRepository, IssueRepository
+        from issue_tracker.daemon.records import issue_to_record
+
+        dropped: list[str] = []
+        deletions: list[str] = []
+        conflicts = []
+        reads = IssueReadRepository(session)
+        for start in range(0, len(issue_ids), batch_size):
+            chunk = issue_ids[start : start + batch_size]
+            local_rows = {row.id: row for row in reads.get_rows(chunk, with_labels=False)}
+            for issue_id in chunk:
+                row = local_rows.get(issue_id)
+                local_hash = content_hash(issue_to_record(row)) if row else None
+                if local_hash is None or local_hash == base[issue_id]:
+                    dropped.append(issue_id)
+                    if row:
+                        deletions.append(issue_id)
+                else:
+                    conflicts.append(_conflict(issue_id, base[issue_id], local_hash, None, None))
+
+        stats.deleted = IssueRepository(session).delete_many(deletions)
+        stats.changed_ids.update(deletions)
+        self._record_conflicts(session, conflicts, stats)
+        return dropped
+
+    @staticmethod
+    def _record_conflicts(session: Any, conflicts: list[Any], stats: MergeStats) -> None:
+        from issue_tracker.adapters.db.repositories import SyncStateRepository
+
+        for conflict in conflicts:
+            logger.warning(f"Sync conflict on {conflict.issue_id}: changed locally and remotely; keeping local")
+        SyncStateRepository(session).add_conflicts(conflicts)
+        stats.conflicts += len(conflicts)
+
+    def _file_signature(self) -> tuple[int, int, int] | None:
+        """Return (inode, size, mtime) of the export file, or None if it is missing."""
+        try:
+            stat = self.export_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
     def git_commit(self, message: str | None = None) -> bool:
         """Commit changes to git.
 
@@ -173,6 +555,103 @@ class SyncEngine:
             logger.error(f"Unexpected error during git commit: {e}")
             return False
 
+    def git_remote_changed(self) -> bool:
+        """Check whether the upstream branch moved since it was last fetched.
+
+        Compares the branch head reported by ``git ls-remote`` with the local
+        remote-tracking ref, which pull and push keep current, so an unchanged
+        remote costs one ls-remote instead of a fetch and rebase.
+
+        Returns:
+            True if the remote moved or could not be checked; False if it is
+            unchanged or there is no upstream to pull from
+        """
+        if not self.git_enabled:
+            return False
+
+        try:
+            upstream = self._upstream or self._get_upstream()
+            if upstream is None:
+                return False
+            remote, remote_ref, tracking_ref = upstream
+
+            result = subprocess.run(  # noqa: S603, S607
+                ["git", "ls-remote", remote, remote_ref],  # noqa: S607
+                cwd=self.workspace_path,
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=30,
+            )
+            if result.returncode != 0:
+                logger.warning(f"Git ls-remote failed: {result.stderr}")
+                self._upstream = None
+                return True
+            remote_head = next(
+                (line.split("\t")[0] for line in result.stdout.splitlines() if line.endswith(f"\t{remote_ref}")), None
+            )
+
+            result = subprocess.run(  # noqa: S603, S607
+                ["git", "rev-parse", "--verify", "--quiet", tracking_ref],  # noqa: S607
+                cwd=self.workspace_path,
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=5,
+            )
+            local_head = result.stdout.strip() if result.returncode == 0 else None
+
+        except subprocess.TimeoutExpired:
+            logger.error("Git remote check timed out")
+            return True
+        except Exception as e:
+            logger.error(f"Unexpected error during git remote check: {e}")
+            return True
+
+        if remote_head is not None and remote_head == local_head:
+            logger.debug(f"Remote {remote} {remote_ref} unchanged at {remote_head}")
+            return False
+        return True
+
+    def _get_upstream(self) -> tuple[str, str, str] | None:
+        """Look up and cache the upstream of the checked-out branch.
+
+        Returns:
+            Tuple of (remote, remote ref, remote-tracking ref), or None if the
+            workspace is not a git repository or the branch has no upstream
+        """
+        result = subprocess.run(  # noqa: S603, S607
+            ["git", "rev-parse", "--symbolic-full-name", "HEAD"],  # noqa: S607
+            cwd=self.workspace_path,
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=5,
+        )
+        branch = result.stdout.strip()
+        if result.returncode != 0 or not branch.startswith("refs/heads/"):
+            return None
+
+        result = subprocess.run(  # noqa: S603, S607
+            [  # noqa: S607
+                "git",
+                "for-each-ref",
+                "--format=%(upstream:remotename)%09%(upstream:remoteref)%09%(upstream)",
+                branch,
+            ],
+            cwd=self.workspace_path,
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=5,
+        )
+        fields = result.stdout.strip().split("\t")
+        if result.returncode != 0 or len(fields) != 3 or not all(fields):
+            return None
+
+        self._upstream = (fields[0], fields[1], fields[2])
+        return self._upstream
+
     def git_pull(self) -> bool:
         """Pull changes from remote.
 
@@ -195,6 +674,14 @@ class SyncEngine:
                 return True
 
             logger.warning(f"Git pull failed: {result.stderr.decode()}")
+            # Never leave conflict markers in the file for the merge to read
+            subprocess.run(  # noqa: S607
+                ["git", "rebase", "--abort"],  # noqa: S607
+                cwd=self.workspace_path,
+                capture_output=True,
+                check=False,
+                timeout=30,
+            )
             return False
 
         except subprocess.TimeoutExpired:
@@ -241,11 +728,27 @@ class SyncEngine:
             logger.error(f"Unexpected error during git push: {e}")
             return False
 
-    def sync(self, issues: list[dict[str, Any]]) -> dict[str, Any]:
-        """Perform full sync cycle: export → commit → pull → import → push.
+    def sync(
+        self, issues: Iterable[dict[str, Any]] | None, removed_ids: Collection[str] | None = None
+    ) -> dict[str, Any]:
+        """Perform full sync cycle: pull → merge → export → commit → push.
+
+        Remote changes are merged before the export, so the merge base is still
+        the last-synced state and local edits are detected as such. A partial
+        export may have been loaded before the merge, so issues the merge wrote
+        or deleted are left out of it; they are exported from the database in
+        the next cycle.
+
+        Pull is skipped when ``git ls-remote`` shows the upstream branch is
+        unchanged (see git_remote_changed()), and push only runs while a commit
+        is waiting to be sent.
 
         Args:
-            issues: Current issues from database
+            issues: Current issues from database, streamed lazily so they are
+                read after the merge, or only the changed ones with removed_ids
+                (see export_changes()); None skips export and commit when
+                nothing changed locally
+            removed_ids: IDs of deleted issues, for a partial export
 
         Returns:
             Sync statistics
@@ -253,33 +756,53 @@ class SyncEngine:
         stats: dict[str, Any] = {
             "exported": 0,
             "skipped": 0,
+            "removed": 0,
+            "bytes_written": 0,
             "imported": 0,
+            "deleted": 0,
+            "conflicts": 0,
             "committed": False,
+            "remote_changed": False,
             "pulled": False,
             "pushed": False,
             "errors": [],
         }
 
         try:
-            # Export current state
-            exported, skipped = self.export_to_jsonl(issues)
-            stats["exported"] = exported
-            stats["skipped"] = skipped
-
-            # Commit if there are changes
-            if exported > 0:
-                stats["committed"] = self.git_commit()
-
-            # Pull remote changes
-            stats["pulled"] = self.git_pull()
-
-            # Import any updates
-            imported_issues = self.import_from_jsonl()
-            stats["imported"] = len(imported_issues)
-
-            # Push local changes
-            if stats["committed"]:
+            # Pull remote changes, unless the remote branch is unchanged
+            stats["remote_changed"] = self.git_remote_changed()
+            if stats["remote_changed"]:
+                stats["pulled"] = self.git_pull()
+
+            # Merge remote changes into the database
+            merged: set[str] = set()
+            if self.engine is not None:
+                merge = self.merge_from_jsonl()
+                stats["imported"] = merge.applied
+                stats["deleted"] = merge.deleted
+                stats["conflicts"] = merge.conflicts
+                merged = merge.changed_ids
+            else:
+                stats["imported"] = len(self.import_from_jsonl())
+
+            # Export local changes and commit if the file was rewritten
+            if issues is not None:
+                if merged and removed_ids is not None:
+                    issues = [issue for issue in issues if issue["id"] not in merged]
+                    removed_ids = set(removed_ids) - merged
+                export = self.export_changes(issues, removed_ids)
+                stats["exported"] = export.exported
+                stats["skipped"] = export.skipped
+                stats["removed"] = export.removed
+                stats["bytes_written"] = export.bytes_written
+                if export.bytes_written > 0:
+                    stats["committed"] = self.git_commit()
+                    self._push_pending = self._push_pending or stats["committed"]
+
+            # Push local commits, including ones an earlier push failed to send
+            if self._push_pending:
                 stats["pushed"] = self.git_push()
+                self._push_pending = not stats["pushed"]
 
             return stats
 
@@ -287,3 +810,34 @@ class SyncEngine:
             logger.error(f"Sync failed: {e}")
             stats["errors"].append(str(e))
             return stats
+
+
+def _line_issue_id(line: bytes) -> str | None:
+    """Read the issue ID of an exported line, parsing JSON only if the fast path fails."""
+    if line.startswith(_ID_PREFIX):
+        end = line.find(b'"', len(_ID_PREFIX))
+        if end != -1 and b"\\" not in line[len(_ID_PREFIX) : end]:
+            return line[len(_ID_PREFIX) : end].decode("utf-8")
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    issue_id = record.get("id") if isinstance(record, dict) else None
+    return issue_id if isinstance(issue_id, str) else None
+
+
+def _conflict(
+    issue_id: str, base_hash: str | None, local_hash: str | None, remote_hash: str | None, record: Any
+) -> Any:
+    """Build a SyncConflictModel; remote_hash and record are None for a remote deletion."""
+    from issue_tracker.adapters.db.models import SyncConflictModel
+    from issue_tracker.domain.utils import utcnow_naive
+
+    return SyncConflictModel(
+        issue_id=issue_id,
+        base_hash=base_hash,
+        local_hash=local_hash,
+        remote_hash=remote_hash,
+        remote_record=json.dumps(record) if record is not None else None,
+        detected_at=utcnow_naive(),
+    )
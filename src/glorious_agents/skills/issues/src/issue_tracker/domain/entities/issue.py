@@ -36,6 +36,21 @@ class IssueType(str, Enum):
     CHORE = "chore"
 
 
+# Allowed status transitions, see Issue.transition()
+VALID_TRANSITIONS: dict[IssueStatus, frozenset[IssueStatus]] = {
+    IssueStatus.OPEN: frozenset(
+        {IssueStatus.IN_PROGRESS, IssueStatus.BLOCKED, IssueStatus.RESOLVED, IssueStatus.ARCHIVED}
+    ),
+    IssueStatus.IN_PROGRESS: frozenset(
+        {IssueStatus.OPEN, IssueStatus.BLOCKED, IssueStatus.RESOLVED, IssueStatus.ARCHIVED}
+    ),
+    IssueStatus.BLOCKED: frozenset({IssueStatus.OPEN, IssueStatus.RESOLVED, IssueStatus.ARCHIVED}),
+    IssueStatus.RESOLVED: frozenset({IssueStatus.CLOSED, IssueStatus.ARCHIVED}),
+    IssueStatus.CLOSED: frozenset({IssueStatus.ARCHIVED}),
+    IssueStatus.ARCHIVED: frozenset({IssueStatus.OPEN}),
+}
+
+
 @dataclass
 class Issue:
     """Issue entity for tracking work items.
@@ -133,37 +148,7 @@ class Issue:
         Raises:
             InvalidTransitionError: If transition is not allowed
         """
-        valid_transitions = {
-            IssueStatus.OPEN: {
-                IssueStatus.IN_PROGRESS,
-                IssueStatus.BLOCKED,
-                IssueStatus.RESOLVED,
-                IssueStatus.ARCHIVED,
-            },
-            IssueStatus.IN_PROGRESS: {
-                IssueStatus.OPEN,
-                IssueStatus.BLOCKED,
-                IssueStatus.RESOLVED,
-                IssueStatus.ARCHIVED,
-            },
-            IssueStatus.BLOCKED: {
-                IssueStatus.OPEN,
-                IssueStatus.RESOLVED,
-                IssueStatus.ARCHIVED,
-            },
-            IssueStatus.RESOLVED: {
-                IssueStatus.CLOSED,
-                IssueStatus.ARCHIVED,
-            },
-            IssueStatus.CLOSED: {
-                IssueStatus.ARCHIVED,
-            },
-            IssueStatus.ARCHIVED: {
-                IssueStatus.OPEN,
-            },
-        }
-
-        if target_status not in valid_transitions[self.status]:
+        if target_status not in VALID_TRANSITIONS[self.status]:
             raise InvalidTransitionError(
                 message=f"Cannot transition from {self.status.value} to {target_status.value}",
                 entity_id=str(self.id),
@@ -318,4 +303,4 @@ class Issue:
         )
 
 
-__all__ = ["Issue", "IssueStatus", "IssueType"]
+__all__ = ["Issue", "IssueStatus", "IssueType", "VALID_TRANSITIONS"]
@@ -0,0 +1,49 @@
+"""Parsing of issue records from JSONL exports and the sync file."""
+
+from datetime import datetime
+from typing import Any
+
+from issue_tracker.domain.entities.issue import Issue, IssuePriority, IssueStatus, IssueType
+from issue_tracker.domain.utils import parse_utc_naive, utcnow_naive
+
+__all__ = ["issue_from_record"]
+
+
+def issue_from_record(record: dict[str, Any], now: datetime | None = None, project_id: str = "default") -> Issue:
+    """Build an Issue from an exported record, accepting enum names or values.
+
+    Used by both `import` and the daemon's JSONL merge so the two read records
+    the same way.
+
+    Args:
+        record: Issue record as written by export or the sync file
+        now: Timestamp for missing created_at/updated_at, and closed_at of
+            closed issues without one; defaults to the current time
+        project_id: Project of the issue if the record does not carry one
+
+    Returns:
+        Issue entity with the record's labels
+
+    Raises:
+        KeyError: If id or title is missing
+        ValueError: If an enum value or timestamp is invalid
+        DomainError: If the record violates an issue invariant
+    """
+    now = now or utcnow_naive()
+    status = IssueStatus(str(record.get("status") or "open").lower())
+    closed_at = parse_utc_naive(record.get("closed_at"))
+    return Issue(
+        id=record["id"],
+        project_id=record.get("project_id") or project_id,
+        title=record["title"],
+        description=record.get("description") or "",
+        status=status,
+        priority=IssuePriority(int(record.get("priority", IssuePriority.MEDIUM))),
+        type=IssueType(str(record.get("type") or "task").lower()),
+        assignee=record.get("assignee") or None,
+        epic_id=record.get("epic_id"),
+        labels=list(record.get("labels") or []),
+        created_at=parse_utc_naive(record.get("created_at")) or now,
+        updated_at=parse_utc_naive(record.get("updated_at")) or now,
+        closed_at=closed_at or (now if status == IssueStatus.CLOSED else None),
+    )
@@ -1,8 +1,9 @@
 """Domain utilities."""
 
 from datetime import UTC, datetime
+from typing import Any
 
-__all__ = ["utcnow_naive"]
+__all__ = ["parse_utc_naive", "utcnow_naive"]
 
 
 def utcnow_naive() -> datetime:
@@ -12,3 +13,16 @@ def utcnow_naive() -> datetime:
     This centralizes the conversion to avoid DRY violations.
     """
     return datetime.now(UTC).replace(tzinfo=None)
+
+
+def parse_utc_naive(value: Any) -> datetime | None:
+    """Parse an ISO timestamp (as written by export) into a naive UTC datetime.
+
+    Accepts datetimes, a trailing "Z" and offsets; empty values give None.
+    """
+    if not value:
+        return None
+    parsed = value if isinstance(value, datetime) else datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(UTC).replace(tzinfo=None)
+    return parsed
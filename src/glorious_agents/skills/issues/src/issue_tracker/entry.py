@@ -0,0 +1,43 @@
+"""Console entry point for the ``issues`` command.
+
+Forwards the invocation to a running issues daemon when one is available, so
+commands run against warm services instead of paying startup costs; falls
+back to running the CLI in-process. Keep imports here light - anything heavy
+defeats the purpose of forwarding.
+"""
+
+import sys
+
+__all__ = ["main"]
+
+# Commands that manage the daemon, talk to it themselves, or need a terminal
+LOCAL_COMMANDS = frozenset({"daemons", "init", "sync", "edit"})
+
+
+def main() -> None:
+    """Run an ``issues`` command, forwarding it to the daemon when possible."""
+    from glorious_agents.forwarding import (
+        DAEMON_PID_FILE,
+        DAEMON_SOCKET_FILE,
+        forward,
+        ipc_endpoint,
+        should_forward,
+    )
+
+    argv = sys.argv[1:]
+    if should_forward(argv, LOCAL_COMMANDS):
+        from glorious_agents.config import config
+
+        endpoint = ipc_endpoint(config.DATA_FOLDER / DAEMON_PID_FILE, config.DATA_FOLDER / DAEMON_SOCKET_FILE)
+        if endpoint is not None:
+            exit_code = forward(endpoint, argv)
+            if exit_code is not None:
+                sys.exit(exit_code)
+
+    from issue_tracker.cli.__main__ import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 """Business logic services."""
 
 from issue_tracker.services.issue_graph_service import IssueGraphService
-from issue_tracker.services.issue_service import IssueService
+from issue_tracker.services.issue_service import ImportResult, IssueService
 from issue_tracker.services.issue_stats_service import IssueStatsService
 from issue_tracker.services.search_service import SearchService
 
-__all__ = ["IssueService", "IssueGraphService", "IssueStatsService", "SearchService"]
+__all__ = ["ImportResult", "IssueService", "IssueGraphService", "IssueStatsService", "SearchService"]
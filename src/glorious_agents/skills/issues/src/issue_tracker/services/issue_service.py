@@ -5,15 +5,40 @@ between repositories and enforcing business rules.
 """
 
 import logging
-
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import Any
+
+from issue_tracker.adapters.db.repositories import IssueRow
 from issue_tracker.adapters.db.unit_of_work import UnitOfWork
 from issue_tracker.domain.entities.comment import Comment
 from issue_tracker.domain.entities.dependency import Dependency, DependencyType
-from issue_tracker.domain.entities.issue import Issue, IssuePriority, IssueStatus, IssueType
+from issue_tracker.domain.entities.issue import VALID_TRANSITIONS, Issue, IssuePriority, IssueStatus, IssueType
+from issue_tracker.domain.exceptions import DomainError, InvariantViolationError
 from issue_tracker.domain.ports import Clock, IdentifierService
+from issue_tracker.domain.records import issue_from_record
+from issue_tracker.domain.utils import parse_utc_naive
 
 logger = logging.getLogger(__name__)
 
+# Records written per batch by import_issues() and create_issues()
+IMPORT_BATCH_SIZE = 1000
+
+
+@dataclass
+class ImportResult:
+    """Outcome of IssueService.import_issues()."""
+
+    processed: int = 0
+    new: int = 0
+    updated: int = 0
+    errors: list[str] = field(default_factory=list)
+    # Dependencies not added because the same edge already exists
+    skipped_dependencies: int = 0
+
 
 class IssueService:
     """Service for issue management operations.
@@ -317,6 +342,69 @@ class IssueService:
         else:
             return self.uow.issues.list_all(limit, offset)
 
+    def iter_issue_rows(
+        self,
+        status: IssueStatus | None = None,
+        priority: IssuePriority | None = None,
+        assignee: str | None = None,
+        epic_id: str | None = None,
+        issue_type: IssueType | None = None,
+        with_description: bool = True,
+        with_labels: bool = True,
+    ) -> Iterator[IssueRow]:
+        """Stream read-only issue rows matching all given filters.
+
+        Unlike list_issues(), filters are combined and nothing is truncated.
+        Rows are column projections, so use this for listing, export and
+        sync rather than for changes.
+
+        Args:
+            status: Filter by status
+            priority: Filter by priority
+            assignee: Filter by assignee
+            epic_id: Filter by epic
+            issue_type: Filter by type
+            with_description: Load descriptions (otherwise they are "")
+            with_labels: Load labels (otherwise they are [])
+
+        Yields:
+            Matching issue rows, oldest first
+        """
+        filters: dict[str, Any] = {}
+        if status:
+            filters["status"] = status
+        if priority is not None:
+            filters["priority"] = priority
+        if assignee:
+            filters["assignee"] = assignee
+        if epic_id:
+            filters["epic_id"] = epic_id
+        if issue_type:
+            filters["type"] = issue_type
+        return self.uow.issue_reads.iter_rows(with_description=with_description, with_labels=with_labels, **filters)
+
+    def get_issue_rows(self, issue_ids: Sequence[str]) -> list[IssueRow]:
+        """Fetch read-only rows for several issues in one query.
+
+        Args:
+            issue_ids: Issue identifiers
+
+        Returns:
+            Rows in the order of issue_ids, skipping unknown IDs
+        """
+        return self.uow.issue_reads.get_rows(issue_ids)
+
+    def count_issues_by(self, field: str) -> dict[Any, int]:
+        """Count issues grouped by a field (status, priority, type, assignee, ...).
+
+        Args:
+            field: Issue column to group by
+
+        Returns:
+            Mapping of field value to number of issues
+        """
+        return self.uow.issue_reads.count_by(field)
+
     def add_comment(self, issue_id: str, author: str, text: str) -> Comment | None:
         """Add comment to issue.
 
@@ -436,83 +524,301 @@ class IssueService:
         """
         return self.uow.graph.get_blocked_by(issue_id)
 
-    def bulk_update_status(self, issue_ids: list[str], new_status: IssueStatus) -> tuple[list[Issue], list[str]]:
-        """Update status for multiple issues in a single transaction.
+    def bulk_update_status(self, issue_ids: list[str], new_status: IssueStatus) -> tuple[list[str], list[str]]:
+        """Update status for multiple issues with set-based statements.
+
+        Issues whose current status cannot transition to new_status (see
+        VALID_TRANSITIONS) are left unchanged and reported as failed.
 
         Args:
             issue_ids: List of issue IDs to update
             new_status: New status to apply
 
         Returns:
-            Tuple of (successfully updated issues, failed issue IDs)
+            Tuple of (updated issue IDs, failed issue IDs)
         """
         logger.debug("Bulk updating status for %d issues: new_status=%s", len(issue_ids), new_status.value)
-        updated: list[Issue] = []
-        failed: list[str] = []
+        from_statuses = [status for status, targets in VALID_TRANSITIONS.items() if new_status in targets]
+        updated = self.uow.issues.bulk_transition(issue_ids, new_status, from_statuses, self.clock.now())
+        return self._bulk_result("status update", issue_ids, updated)
 
-        for issue_id in issue_ids:
-            try:
-                issue = self.transition_issue(issue_id, new_status)
-                if issue:
-                    updated.append(issue)
-                else:
-                    failed.append(issue_id)
-            except Exception as e:
-                logger.error("Failed to transition issue: id=%s, error=%s", issue_id, str(e))
-                failed.append(issue_id)
-
-        logger.info("Bulk status update completed: updated=%d, failed=%d", len(updated), len(failed))
-        return updated, failed
+    def bulk_close(self, issue_ids: list[str]) -> tuple[list[str], list[str]]:
+        """Close multiple issues with set-based statements.
 
-    def bulk_update_priority(self, issue_ids: list[str], new_priority: IssuePriority) -> tuple[list[Issue], list[str]]:
-        """Update priority for multiple issues in a single transaction.
+        Like close_issue(), issues that could be resolved first are closed
+        directly; closed or archived issues are reported as failed.
+
+        Args:
+            issue_ids: List of issue IDs to close
+
+        Returns:
+            Tuple of (closed issue IDs, failed issue IDs)
+        """
+        logger.debug("Bulk closing %d issues", len(issue_ids))
+        from_statuses = [status for status, targets in VALID_TRANSITIONS.items() if IssueStatus.RESOLVED in targets] + [
+            IssueStatus.RESOLVED
+        ]
+        updated = self.uow.issues.bulk_transition(issue_ids, IssueStatus.CLOSED, from_statuses, self.clock.now())
+        return self._bulk_result("close", issue_ids, updated)
+
+    def bulk_update_priority(self, issue_ids: list[str], new_priority: IssuePriority) -> tuple[list[str], list[str]]:
+        """Update priority for multiple issues with set-based statements.
 
         Args:
             issue_ids: List of issue IDs to update
             new_priority: New priority to apply
 
         Returns:
-            Tuple of (successfully updated issues, failed issue IDs)
+            Tuple of (updated issue IDs, failed issue IDs)
         """
-        updated: list[Issue] = []
-        failed: list[str] = []
+        updated = self.uow.issues.bulk_update(issue_ids, self.clock.now(), priority=new_priority)
+        return self._bulk_result("priority update", issue_ids, updated)
 
-        for issue_id in issue_ids:
-            try:
-                issue = self.update_issue(issue_id, priority=new_priority)
-                if issue:
-                    updated.append(issue)
-                else:
-                    failed.append(issue_id)
-            except Exception:
-                failed.append(issue_id)
+    def bulk_assign(self, issue_ids: list[str], assignee: str) -> tuple[list[str], list[str]]:
+        """Assign multiple issues to a user with set-based statements.
 
+        Args:
+            issue_ids: List of issue IDs to assign
+            assignee: Username to assign issues to
+
+        Returns:
+            Tuple of (updated issue IDs, failed issue IDs)
+        """
+        updated = self.uow.issues.bulk_update(issue_ids, self.clock.now(), assignee=assignee)
+        return self._bulk_result("assign", issue_ids, updated)
+
+    def bulk_add_labels(self, issue_ids: list[str], labels: list[str]) -> tuple[list[str], list[str]]:
+        """Add labels to multiple issues with set-based statements.
+
+        Args:
+            issue_ids: List of issue IDs to label
+            labels: Label names to add
+
+        Returns:
+            Tuple of (updated issue IDs, failed issue IDs)
+
+        Raises:
+            InvariantViolationError: If a label is empty
+        """
+        names = self._clean_labels(labels)
+        updated = self.uow.issues.bulk_add_labels(issue_ids, names, self.clock.now())
+        return self._bulk_result("label add", issue_ids, updated)
+
+    def bulk_remove_labels(self, issue_ids: list[str], labels: list[str]) -> tuple[list[str], list[str]]:
+        """Remove labels from multiple issues with set-based statements.
+
+        Args:
+            issue_ids: List of issue IDs to update
+            labels: Label names to remove
+
+        Returns:
+            Tuple of (updated issue IDs, failed issue IDs)
+
+        Raises:
+            InvariantViolationError: If a label is empty
+        """
+        names = self._clean_labels(labels)
+        updated = self.uow.issues.bulk_remove_labels(issue_ids, names, self.clock.now())
+        return self._bulk_result("label remove", issue_ids, updated)
+
+    @staticmethod
+    def _clean_labels(labels: list[str]) -> list[str]:
+        """Strip and deduplicate label names, rejecting empty ones like Issue.add_label()."""
+        if any(not label or not label.strip() for label in labels):
+            raise InvariantViolationError("Label cannot be empty")
+        return list(dict.fromkeys(label.strip() for label in labels))
+
+    @staticmethod
+    def _bulk_result(operation: str, issue_ids: list[str], updated: list[str]) -> tuple[list[str], list[str]]:
+        """Split requested IDs into updated and failed ones and log the outcome."""
+        updated_set = set(updated)
+        failed = [issue_id for issue_id in dict.fromkeys(issue_ids) if issue_id not in updated_set]
+        logger.info("Bulk %s completed: updated=%d, failed=%d", operation, len(updated), len(failed))
         return updated, failed
 
-    def bulk_assign(self, issue_ids: list[str], assignee: str) -> tuple[list[Issue], list[str]]:
-        """Assign multiple issues to a user in a single transaction.
+    def import_issues(
+        self,
+        records: Iterable[dict[str, Any]],
+        dry_run: bool = False,
+        batch_size: int = IMPORT_BATCH_SIZE,
+        on_progress: Callable[[ImportResult], None] | None = None,
+    ) -> ImportResult:
+        """Create or update issues from exported records in batches.
+
+        Records (e.g. parsed JSONL lines) are consumed lazily. Per batch the
+        existing IDs are fetched with one chunked IN query and issues, labels
+        and comments are upserted with batched statements; dependencies are
+        added once every issue is in. Records are restored as given, including
+        status, without transition rules. A record without a "labels" key
+        keeps the stored labels. Imports larger than one batch suspend the
+        FTS triggers and rebuild the search index once at the end. Nothing is
+        committed; the caller commits the whole import as one transaction.
 
         Args:
-            issue_ids: List of issue IDs to assign
-            assignee: Username to assign issues to
+            records: Issue dictionaries in export format, optionally with
+                "comments" and "dependencies" lists
+            dry_run: Only count new and updated issues without writing
+            batch_size: Records per batch
+            on_progress: Called with the running result after each batch
 
         Returns:
-            Tuple of (successfully updated issues, failed issue IDs)
+            Counts of processed, new and updated issues, skipped dependencies
+            and per-record errors
         """
-        updated: list[Issue] = []
-        failed: list[str] = []
+        result = ImportResult()
+        dependencies: list[Dependency] = []
+        records_iter = iter(records)
+        with ExitStack() as stack:
+            while batch := list(islice(records_iter, batch_size)):
+                if result.processed == 0 and len(batch) == batch_size and not dry_run:
+                    stack.enter_context(self.uow.issues.deferred_search_index())
+                self._import_batch(batch, dry_run, result, dependencies)
+                if on_progress:
+                    on_progress(result)
+
+            if dependencies:
+                known = self.uow.issues.existing_ids([dep.to_issue_id for dep in dependencies])
+                for dep in dependencies:
+                    if dep.to_issue_id not in known:
+                        result.errors.append(f"{dep.from_issue_id}: unknown dependency target {dep.to_issue_id}")
+                valid = [dep for dep in dependencies if dep.to_issue_id in known]
+                result.skipped_dependencies = len(valid) - self.uow.graph.add_many(valid)
+
+        logger.info(
+            "Import completed: processed=%d, new=%d, updated=%d, errors=%d, skipped_dependencies=%d, dry_run=%s",
+            result.processed,
+            result.new,
+            result.updated,
+            len(result.errors),
+            result.skipped_dependencies,
+            dry_run,
+        )
+        return result
+
+    def create_issues(
+        self,
+        titles: Iterable[str],
+        issue_type: IssueType = IssueType.TASK,
+        priority: IssuePriority = IssuePriority.MEDIUM,
+        project_id: str = "default",
+        batch_size: int = IMPORT_BATCH_SIZE,
+    ) -> list[Issue]:
+        """Create many open issues with generated IDs in batched inserts.
+
+        Like import_issues(), creating more than one batch suspends the FTS
+        triggers and rebuilds the search index once. Nothing is committed.
+
+        Args:
+            titles: Issue titles, consumed lazily
+            issue_type: Type of every issue
+            priority: Priority of every issue
+            project_id: Project identifier (default: "default")
+            batch_size: Issues per batch
 
-        for issue_id in issue_ids:
+        Returns:
+            Created issue entities in title order
+        """
+        created: list[Issue] = []
+        titles_iter = iter(titles)
+        with ExitStack() as stack:
+            while batch := list(islice(titles_iter, batch_size)):
+                if not created and len(batch) == batch_size:
+                    stack.enter_context(self.uow.issues.deferred_search_index())
+                now = self.clock.now()
+                issues = [
+                    Issue(
+                        id=self.id_service.generate("issue"),
+                        project_id=project_id,
+                        title=title,
+                        description="",
+                        priority=priority,
+                        type=issue_type,
+                        created_at=now,
+                        updated_at=now,
+                    )
+                    for title in batch
+                ]
+                self.uow.issues.upsert_many(issues)
+                created.extend(issues)
+
+        logger.info("Bulk create completed: created=%d", len(created))
+        return created
+
+    def _import_batch(
+        self,
+        records: list[dict[str, Any]],
+        dry_run: bool,
+        result: ImportResult,
+        dependencies: list[Dependency],
+    ) -> None:
+        """Validate and write one batch of import records, updating result in place."""
+        existing = self.uow.issues.existing_ids([record["id"] for record in records if record.get("id")])
+        now = self.clock.now()
+        issues: list[Issue] = []
+        keep_labels: set[str] = set()
+        comments: list[Comment] = []
+
+        for record in records:
+            result.processed += 1
             try:
-                issue = self.update_issue(issue_id, assignee=assignee)
-                if issue:
-                    updated.append(issue)
-                else:
-                    failed.append(issue_id)
-            except Exception:
-                failed.append(issue_id)
+                issue = issue_from_record(record, now)
+                issue_comments = [
+                    self._comment_from_record(issue.id, comment, now) for comment in record.get("comments") or []
+                ]
+                issue_dependencies = self._dependencies_from_record(issue.id, record.get("dependencies"), now)
+            except (KeyError, TypeError, ValueError, DomainError) as e:
+                logger.warning("Skipping invalid import record: id=%s, error=%s", record.get("id"), e)
+                result.errors.append(f"{record.get('id', 'unknown')}: {e}")
+                continue
+
+            if issue.id in existing:
+                result.updated += 1
+            else:
+                result.new += 1
+                existing.add(issue.id)
+            issues.append(issue)
+            if "labels" not in record:
+                keep_labels.add(issue.id)
+            comments.extend(issue_comments)
+            dependencies.extend(issue_dependencies)
+
+        if dry_run:
+            dependencies.clear()
+            return
+        self.uow.issues.upsert_many(issues, keep_labels=keep_labels)
+        if comments:
+            self.uow.comments.upsert_many(comments)
+
+    def _comment_from_record(self, issue_id: str, record: dict[str, Any], now: datetime) -> Comment:
+        """Build a Comment from a record in `show --comments --json` format."""
+        created_at = parse_utc_naive(record.get("created_at")) or now
+        return Comment(
+            id=record.get("id") or self.id_service.generate("comment"),
+            issue_id=issue_id,
+            author=record["author"],
+            text=record["text"],
+            created_at=created_at,
+            updated_at=parse_utc_naive(record.get("updated_at")) or created_at,
+        )
 
-        return updated, failed
+    @staticmethod
+    def _dependencies_from_record(issue_id: str, records: Any, now: datetime) -> list[Dependency]:
+        """Build outgoing Dependencies from a list of {"id", "type"} records.
+
+        The {"depends_on": [...]} mapping written by `show --deps --json` is
+        accepted too.
+        """
+        if isinstance(records, dict):
+            records = records.get("depends_on")
+        return [
+            Dependency(
+                from_issue_id=issue_id,
+                to_issue_id=record.get("to_issue_id") or record["id"],
+                dependency_type=DependencyType(record.get("type") or DependencyType.DEPENDS_ON),
+                created_at=now,
+            )
+            for record in records or []
+        ]
 
     def set_epic(self, issue_id: str, epic_id: str) -> Issue | None:
         """Set the epic for an issue.
@@ -593,4 +899,4 @@ class IssueService:
         return child_epic_ids
 
 
-__all__ = ["IssueService"]
+__all__ = ["ImportResult", "IssueService"]
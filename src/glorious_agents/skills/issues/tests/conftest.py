@@ -444,6 +444,28 @@ def mock_service() -> MagicMock:
 
         return issues
 
+    def iter_issue_rows_wrapper(**kwargs):
+        """Wrapper for iter_issue_rows; Issue entities stand in for rows."""
+        kwargs.pop("with_description", None)
+        kwargs.pop("with_labels", None)
+        return iter(list_issues_wrapper(**kwargs))
+
+    def get_issue_rows_wrapper(issue_ids):
+        """Wrapper for get_issue_rows that returns stored issues in order."""
+        return [_issue_store[issue_id] for issue_id in issue_ids if issue_id in _issue_store]
+
+    def count_issues_by_wrapper(field: str):
+        """Wrapper for count_issues_by that groups stored issues."""
+        counts: dict = {}
+        for issue in _issue_store.values():
+            value = getattr(issue, field)
+            counts[value] = counts.get(value, 0) + 1
+        return counts
+
+    def create_issues_wrapper(titles, issue_type=IssueType.TASK, priority=IssuePriority.MEDIUM, **kwargs):
+        """Wrapper for create_issues that creates each issue via create_issue_wrapper."""
+        return [create_issue_wrapper(title=title, issue_type=issue_type, priority=priority) for title in titles]
+
     def transition_issue_wrapper(issue_id: str, new_status: IssueStatus):
         """Wrapper for transition_issue that updates status in store."""
         if issue_id in _issue_store:
@@ -459,12 +481,16 @@ def mock_service() -> MagicMock:
 
     # Configure side_effects with state tracking
     service.create_issue.side_effect = create_issue_wrapper
+    service.create_issues.side_effect = create_issues_wrapper
     service.get_issue.side_effect = get_issue_wrapper
     service.update_issue.side_effect = update_issue_wrapper
     service.transition_issue.side_effect = transition_issue_wrapper
     service.close_issue.side_effect = close_issue_wrapper
     service.reopen_issue.side_effect = reopen_issue_wrapper
     service.list_issues.side_effect = list_issues_wrapper
+    service.iter_issue_rows.side_effect = iter_issue_rows_wrapper
+    service.get_issue_rows.side_effect = get_issue_rows_wrapper
+    service.count_issues_by.side_effect = count_issues_by_wrapper
     service.delete_issue.return_value = None
     service.add_label_to_issue.side_effect = add_label_wrapper
     service.remove_label_from_issue.side_effect = remove_label_wrapper
@@ -796,6 +822,18 @@ def integration_cli_runner(tmp_path: Path) -> CliRunner:
     old_daemon_env = os.environ.get("ISSUES_AUTO_START_DAEMON")
     os.environ["ISSUES_AUTO_START_DAEMON"] = "false"
 
+    # Give each test its own database instead of the project's .agent folder
+    from glorious_agents.config import reset_config
+
+    from issue_tracker.cli.dependencies import dispose_all_engines, get_db_url, get_issues_folder
+
+    old_data_folder = os.environ.get("DATA_FOLDER")
+    os.environ["DATA_FOLDER"] = str(workspace / ".agent")
+    reset_config()
+    dispose_all_engines()
+    get_db_url.cache_clear()
+    get_issues_folder.cache_clear()
+
     try:
         # Don't inject mocks for integration tests
         from issue_tracker.cli.app import set_service
@@ -827,11 +865,15 @@ def integration_cli_runner(tmp_path: Path) -> CliRunner:
         else:
             os.environ["ISSUES_AUTO_START_DAEMON"] = old_daemon_env
 
+        if old_data_folder is None:
+            os.environ.pop("DATA_FOLDER", None)
+        else:
+            os.environ["DATA_FOLDER"] = old_data_folder
+        reset_config()
+
         # CRITICAL: Dispose ALL cached engines to prevent memory leak
         # Each test creates a new workspace with different DB path
         # Without this, engines accumulate: 29 tests = 145MB leaked on Linux
-        from issue_tracker.cli.dependencies import dispose_all_engines, get_db_url, get_issues_folder
-
         # Dispose all engines in registry (not just current one)
         dispose_all_engines()
 
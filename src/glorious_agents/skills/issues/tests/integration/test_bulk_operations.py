@@ -4,10 +4,12 @@ Tests bulk operations and batch processing:
 - Bulk create from markdown
 - Bulk close multiple issues
 - Bulk label operations
+- JSONL import of new and existing issues
 - Best-effort error handling
 """
 
 import json
+import uuid
 from pathlib import Path
 
 from typer.testing import CliRunner
@@ -162,6 +164,63 @@ Description for issue 3
         assert len(data["failures"]) == 1
         assert data["failures"][0]["id"] == "issue-nonexistent"
 
+    def test_import_creates_and_updates_issues(self, integration_cli_runner: CliRunner, tmp_path: Path):
+        """Test importing a JSONL file with new, existing and invalid records."""
+        runner = integration_cli_runner
+
+        result = runner.invoke(app, ["create", "Existing task", "--json"])
+        assert result.exit_code == 0
+        existing = json.loads(result.stdout)
+
+        suffix = uuid.uuid4().hex[:8]
+        imported_id = f"issue-imp{suffix}"
+        input_file = tmp_path / "issues.jsonl"
+        records = [
+            {"id": existing["id"], "title": "Renamed task", "status": "in_progress", "labels": ["imported"]},
+            {
+                "id": imported_id,
+                "title": "Imported bug",
+                "type": "bug",
+                "priority": 0,
+                "comments": [{"id": f"comment-imp{suffix}", "author": "alice", "text": "From the export"}],
+                "dependencies": [{"id": existing["id"], "type": "blocks"}],
+            },
+            {"id": f"issue-bad{suffix}"},
+        ]
+        input_file.write_text("\n".join(json.dumps(record) for record in records) + "\n")
+
+        result = runner.invoke(app, ["import", "-i", str(input_file), "--json"])
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == {
+            "imported": 2,
+            "new": 1,
+            "updated": 1,
+            "errors": 1,
+            "skipped_dependencies": 0,
+        }
+
+        result = runner.invoke(app, ["show", existing["id"], "--json"])
+        shown = json.loads(result.stdout)
+        shown = shown[0] if isinstance(shown, list) else shown
+        assert shown["title"] == "Renamed task"
+        assert shown["status"] == "in_progress"
+        assert shown["labels"] == ["imported"]
+
+        result = runner.invoke(app, ["show", imported_id, "--comments", "--json"])
+        shown = json.loads(result.stdout)
+        shown = shown[0] if isinstance(shown, list) else shown
+        assert shown["type"] == "bug"
+        assert [comment["text"] for comment in shown["comments"]] == ["From the export"]
+
+        result = runner.invoke(app, ["dependencies", "list", imported_id, "--json"])
+        assert json.loads(result.stdout) == [{"from": imported_id, "type": "blocks", "to": existing["id"]}]
+
+        # Importing the same file again keeps the edge once and reports it as skipped
+        result = runner.invoke(app, ["import", "-i", str(input_file), "--json"])
+        assert json.loads(result.stdout)["skipped_dependencies"] == 1
+        result = runner.invoke(app, ["dependencies", "list", imported_id, "--json"])
+        assert len(json.loads(result.stdout)) == 1
+
 
 class TestErrorRecovery:
     """Test error handling and recovery patterns."""
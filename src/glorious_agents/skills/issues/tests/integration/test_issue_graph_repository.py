@@ -214,6 +214,37 @@ class TestGraphRepositoryDependencies:
 
         assert removed is False
 
+    def test_add_many_keeps_edges_with_shared_id_prefixes(self, test_session: Session) -> None:
+        """Test that bulk-added edges between similar IDs do not collide, and existing edges are skipped."""
+        issue_repo = IssueRepository(test_session)
+        graph_repo = IssueGraphRepository(test_session)
+        now = datetime.now(UTC).replace(tzinfo=None)
+        for issue_id in ("issue-aa1111", "issue-bb2222", "issue-aa3333", "issue-bb4444"):
+            issue_repo.save(
+                Issue(
+                    id=issue_id,
+                    project_id=TEST_PROJECT_ID,
+                    title=issue_id,
+                    description="",
+                    type=IssueType.TASK,
+                    status=IssueStatus.OPEN,
+                    priority=IssuePriority.MEDIUM,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+        edges = [
+            Dependency(from_issue_id="issue-aa1111", to_issue_id="issue-bb2222", dependency_type=DependencyType.BLOCKS),
+            Dependency(from_issue_id="issue-aa3333", to_issue_id="issue-bb4444", dependency_type=DependencyType.BLOCKS),
+        ]
+
+        assert graph_repo.add_many(edges) == 2
+        assert graph_repo.add_many([*edges, edges[0]]) == 0
+        test_session.commit()
+
+        assert [dep.to_issue_id for dep in graph_repo.get_dependencies("issue-aa1111")] == ["issue-bb2222"]
+        assert [dep.to_issue_id for dep in graph_repo.get_dependencies("issue-aa3333")] == ["issue-bb4444"]
+
 
 class TestGraphRepositoryCycleDetection:
     """Test cycle detection algorithms."""
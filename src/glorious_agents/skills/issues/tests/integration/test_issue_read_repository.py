@@ -0,0 +1,94 @@
+"""Integration tests for IssueReadRepository with real database."""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlmodel import Session
+
+from issue_tracker.adapters.db.repositories.issue_read_repository import IssueReadRepository, IssueRow
+from issue_tracker.adapters.db.repositories.issue_repository import IssueRepository
+from issue_tracker.domain.entities.issue import Issue, IssueStatus, IssueType
+from issue_tracker.domain.value_objects import IssuePriority
+
+# Test constants
+TEST_PROJECT_ID = "PRJ-001"
+
+
+class TestIssueReadRepository:
+    """Test projection queries with real database."""
+
+    @pytest.fixture(autouse=True)
+    def setup_test_issues(self, test_session: Session) -> None:
+        """Create a set of test issues for read queries."""
+        repo = IssueRepository(test_session)
+        now = datetime.now(UTC).replace(tzinfo=None)
+
+        for issue_id, status, priority, issue_type, assignee, labels in [
+            ("ISS-R01", IssueStatus.OPEN, IssuePriority.HIGH, IssueType.TASK, "alice", ["backend", "urgent"]),
+            ("ISS-R02", IssueStatus.CLOSED, IssuePriority.MEDIUM, IssueType.BUG, "bob", []),
+            ("ISS-R03", IssueStatus.OPEN, IssuePriority.LOW, IssueType.TASK, None, ["frontend"]),
+        ]:
+            repo.save(
+                Issue(
+                    id=issue_id,
+                    project_id=TEST_PROJECT_ID,
+                    title=f"Issue {issue_id}",
+                    description=f"Description {issue_id}",
+                    type=issue_type,
+                    status=status,
+                    priority=priority,
+                    assignee=assignee,
+                    labels=labels,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+        test_session.commit()
+        test_session.expunge_all()
+
+    def test_iter_rows(self, test_session: Session) -> None:
+        """Test streaming rows with enums, labels and descriptions."""
+        repo = IssueReadRepository(test_session)
+
+        rows = list(repo.iter_rows(batch_size=2, order_by="id"))
+
+        assert [row.id for row in rows] == ["ISS-R01", "ISS-R02", "ISS-R03"]
+        assert isinstance(rows[0], IssueRow)
+        assert rows[0].status == IssueStatus.OPEN
+        assert rows[0].priority == IssuePriority.HIGH
+        assert rows[0].type == IssueType.TASK
+        assert rows[0].description == "Description ISS-R01"
+        assert sorted(rows[0].labels) == ["backend", "urgent"]
+        assert rows[1].labels == []
+        # Rows are projections, not ORM instances
+        assert len(test_session.identity_map) == 0
+
+    def test_iter_rows_with_filters_and_without_columns(self, test_session: Session) -> None:
+        """Test filters and skipping descriptions and labels."""
+        repo = IssueReadRepository(test_session)
+
+        rows = list(repo.iter_rows(with_description=False, with_labels=False, status=IssueStatus.OPEN))
+
+        assert {row.id for row in rows} == {"ISS-R01", "ISS-R03"}
+        assert all(row.description == "" and row.labels == [] for row in rows)
+
+        with pytest.raises(ValueError, match="Unknown issue fields"):
+            list(repo.iter_rows(colour="red"))
+
+    def test_get_rows_preserves_order(self, test_session: Session) -> None:
+        """Test fetching several rows in the requested order."""
+        repo = IssueReadRepository(test_session)
+
+        rows = repo.get_rows(["ISS-R03", "ISS-MISSING", "ISS-R01"])
+
+        assert [row.id for row in rows] == ["ISS-R03", "ISS-R01"]
+        assert rows[0].labels == ["frontend"]
+        assert repo.get_rows([]) == []
+
+    def test_count_by(self, test_session: Session) -> None:
+        """Test GROUP BY counts keyed by enum members."""
+        repo = IssueReadRepository(test_session)
+
+        assert repo.count_by("status") == {IssueStatus.OPEN: 2, IssueStatus.CLOSED: 1}
+        assert repo.count_by("assignee") == {"alice": 1, "bob": 1, None: 1}
+        assert repo.count_by("type", status=IssueStatus.OPEN) == {IssueType.TASK: 2}
@@ -3,7 +3,7 @@
 from datetime import UTC, datetime
 
 import pytest
-from sqlmodel import Session
+from sqlmodel import Session, text
 
 from issue_tracker.adapters.db.repositories.issue_repository import IssueRepository
 from issue_tracker.domain.entities.issue import Issue, IssueStatus, IssueType
@@ -315,6 +315,169 @@ class TestIssueRepositoryQueries:
         assert len(features) == 1
         assert features[0].id == "ISS-Q03"
 
+    def test_iter_all(self, test_session: Session) -> None:
+        """Test streaming every issue across keyset pages."""
+        repo = IssueRepository(test_session)
+
+        issues = list(repo.iter_all(batch_size=2, order_by="id"))
+
+        assert [issue.id for issue in issues] == ["ISS-Q01", "ISS-Q02", "ISS-Q03", "ISS-Q04", "ISS-Q05"]
+        assert sorted(issues[0].labels) == ["backend", "urgent"]
+
+    def test_iter_all_with_filters(self, test_session: Session) -> None:
+        """Test streaming with enum and column filters."""
+        repo = IssueRepository(test_session)
+
+        open_tasks = repo.iter_all(batch_size=1, status=IssueStatus.OPEN, type=IssueType.TASK)
+        assert {issue.id for issue in open_tasks} == {"ISS-Q01", "ISS-Q04"}
+
+        by_priority = [issue.priority for issue in repo.iter_all(batch_size=2, order_by="priority")]
+        assert by_priority == sorted(by_priority)
+
+        with pytest.raises(ValueError, match="Unknown issue fields"):
+            list(repo.iter_all(colour="red"))
+
+    def test_bulk_update(self, test_session: Session) -> None:
+        """Test set-based column updates report only existing issues."""
+        repo = IssueRepository(test_session)
+        assert repo.get("ISS-Q01") is not None  # Loads the model into the session
+        now = datetime.now(UTC).replace(tzinfo=None)
+
+        updated = repo.bulk_update(["ISS-Q01", "ISS-Q04", "ISS-MISSING"], now, priority=IssuePriority.CRITICAL)
+        test_session.commit()
+
+        assert sorted(updated) == ["ISS-Q01", "ISS-Q04"]
+        assert repo.get("ISS-Q01").priority == IssuePriority.CRITICAL  # type: ignore[union-attr]
+        assert repo.get("ISS-Q02").priority == IssuePriority.MEDIUM  # type: ignore[union-attr]
+
+        with pytest.raises(ValueError, match="Unknown issue fields"):
+            repo.bulk_update(["ISS-Q01"], now, colour="red")
+
+    def test_bulk_transition(self, test_session: Session) -> None:
+        """Test that only issues in an allowed source status are transitioned."""
+        repo = IssueRepository(test_session)
+        now = datetime.now(UTC).replace(tzinfo=None)
+
+        updated = repo.bulk_transition(
+            ["ISS-Q01", "ISS-Q02", "ISS-Q05"],
+            IssueStatus.CLOSED,
+            [IssueStatus.OPEN, IssueStatus.BLOCKED],
+            now,
+        )
+        test_session.commit()
+
+        assert sorted(updated) == ["ISS-Q01", "ISS-Q05"]
+        closed = repo.get("ISS-Q01")
+        assert closed is not None
+        assert closed.status == IssueStatus.CLOSED
+        assert closed.closed_at is not None
+
+    def test_bulk_add_and_remove_labels(self, test_session: Session) -> None:
+        """Test set-based label changes, ignoring labels an issue already has."""
+        repo = IssueRepository(test_session)
+        now = datetime.now(UTC).replace(tzinfo=None)
+
+        added = repo.bulk_add_labels(["ISS-Q01", "ISS-Q04", "ISS-MISSING"], ["backend", "triaged"], now)
+        test_session.commit()
+
+        assert sorted(added) == ["ISS-Q01", "ISS-Q04"]
+        assert sorted(repo.get("ISS-Q01").labels) == ["backend", "triaged", "urgent"]  # type: ignore[union-attr]
+        assert sorted(repo.get("ISS-Q04").labels) == ["backend", "triaged"]  # type: ignore[union-attr]
+
+        repo.bulk_remove_labels(["ISS-Q01", "ISS-Q04"], ["backend"], now)
+        test_session.commit()
+
+        assert sorted(repo.get("ISS-Q01").labels) == ["triaged", "urgent"]  # type: ignore[union-attr]
+        assert repo.get("ISS-Q04").labels == ["triaged"]  # type: ignore[union-attr]
+
+
+class TestIssueRepositoryBulkWrites:
+    """Test batched upserts used by import and bulk-create."""
+
+    @staticmethod
+    def _issue(issue_id: str, title: str, labels: list[str] | None = None) -> Issue:
+        now = datetime.now(UTC).replace(tzinfo=None)
+        return Issue(
+            id=issue_id,
+            project_id=TEST_PROJECT_ID,
+            title=title,
+            description="",
+            labels=labels or [],
+            created_at=now,
+            updated_at=now,
+        )
+
+    def test_upsert_many_inserts_and_updates(self, test_session: Session) -> None:
+        """Test that upserts keep created_at and replace or keep labels."""
+        repo = IssueRepository(test_session)
+        original = repo.save(self._issue("ISS-U01", "Original", ["old"]))
+        repo.save(self._issue("ISS-U02", "Kept labels", ["keep"]))
+        test_session.commit()
+
+        repo.upsert_many(
+            [
+                self._issue("ISS-U01", "Renamed", ["new"]),
+                self._issue("ISS-U02", "Kept labels too"),
+                self._issue("ISS-U03", "Brand new", ["fresh"]),
+            ],
+            keep_labels={"ISS-U02"},
+        )
+        test_session.commit()
+        test_session.expire_all()
+
+        assert repo.existing_ids(["ISS-U01", "ISS-U03", "ISS-MISSING"]) == {"ISS-U01", "ISS-U03"}
+        renamed = repo.get("ISS-U01")
+        assert renamed is not None
+        assert renamed.title == "Renamed"
+        assert renamed.labels == ["new"]
+        assert renamed.created_at == original.created_at
+        assert repo.get("ISS-U02").labels == ["keep"]  # type: ignore[union-attr]
+        assert repo.get("ISS-U03").labels == ["fresh"]  # type: ignore[union-attr]
+
+    def test_deferred_search_index_rebuilds_fts(self, test_session: Session) -> None:
+        """Test that FTS triggers are suspended, restored, and the index rebuilt."""
+        repo = IssueRepository(test_session)
+        test_session.execute(text("CREATE VIRTUAL TABLE issues_fts USING fts5(id UNINDEXED, title, description)"))
+        test_session.execute(
+            text(
+                "CREATE TRIGGER issues_fts_insert AFTER INSERT ON issues BEGIN "
+                "INSERT INTO issues_fts(rowid, id, title, description) "
+                "VALUES (NEW.rowid, NEW.id, NEW.title, COALESCE(NEW.description, '')); END"
+            )
+        )
+        test_session.commit()
+        triggers = "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'issues_fts_%'"
+
+        with repo.deferred_search_index():
+            assert test_session.execute(text(triggers)).scalar() == 0
+            repo.upsert_many([self._issue("ISS-F01", "Searchable widget")])
+        test_session.commit()
+
+        assert test_session.execute(text(triggers)).scalar() == 1
+        matches = test_session.execute(text("SELECT id FROM issues_fts WHERE issues_fts MATCH 'widget'")).all()
+        assert [row[0] for row in matches] == ["ISS-F01"]
+
+        # A rolled-back bulk write restores the triggers as well
+        with repo.deferred_search_index():
+            repo.upsert_many([self._issue("ISS-F02", "Discarded")])
+        test_session.rollback()
+
+        assert test_session.execute(text(triggers)).scalar() == 1
+        assert repo.existing_ids(["ISS-F02"]) == set()
+
+    def test_delete_many_removes_issues_and_labels(self, test_session: Session) -> None:
+        """Test set-based deletion of issues with their labels."""
+        repo = IssueRepository(test_session)
+        repo.upsert_many([self._issue(f"ISS-D0{i}", f"Delete {i}", ["gone"]) for i in range(3)])
+        test_session.commit()
+
+        assert repo.delete_many(["ISS-D00", "ISS-D01", "ISS-MISSING"]) == 2
+        test_session.commit()
+
+        assert repo.existing_ids(["ISS-D00", "ISS-D01", "ISS-D02"]) == {"ISS-D02"}
+        labels = test_session.execute(text("SELECT issue_id FROM issue_labels WHERE label_name = 'gone'")).all()
+        assert [row[0] for row in labels] == ["ISS-D02"]
+
 
 class TestIssueRepositoryTransactions:
     """Test transaction handling."""
@@ -0,0 +1,97 @@
+"""Integration tests for SyncStateRepository."""
+
+from datetime import UTC, datetime
+
+from sqlmodel import Session
+
+from issue_tracker.adapters.db.models import SyncConflictModel
+from issue_tracker.adapters.db.repositories.comment_repository import CommentRepository
+from issue_tracker.adapters.db.repositories.issue_repository import IssueRepository
+from issue_tracker.adapters.db.repositories.sync_state_repository import SyncStateRepository
+from issue_tracker.domain.entities.comment import Comment
+from issue_tracker.domain.entities.issue import Issue
+
+
+def _issue(issue_id: str) -> Issue:
+    return Issue(id=issue_id, project_id="PRJ-001", title=f"Issue {issue_id}", description="")
+
+
+class TestSyncStateHashes:
+    """Test persistence of export content hashes."""
+
+    def test_save_and_delete_hashes(self, test_session: Session) -> None:
+        """Test that hashes are upserted and deleted by issue ID."""
+        repo = SyncStateRepository(test_session)
+        repo.save_hashes({"ISS-001": "a", "ISS-002": "b"})
+        repo.save_hashes({"ISS-002": "c", "ISS-003": "d"})
+        repo.delete_hashes(["ISS-001"])
+        test_session.commit()
+
+        assert repo.get_hashes() == {"ISS-002": "c", "ISS-003": "d"}
+
+    def test_add_and_list_conflicts(self, test_session: Session) -> None:
+        """Test that conflicts are recorded in order and filtered by issue."""
+        repo = SyncStateRepository(test_session)
+        now = datetime.now(UTC).replace(tzinfo=None)
+        repo.add_conflicts(
+            [
+                SyncConflictModel(issue_id="ISS-001", base_hash="a", local_hash="b", remote_hash="c", detected_at=now),
+                SyncConflictModel(issue_id="ISS-002", base_hash="a", local_hash="b", detected_at=now),
+            ]
+        )
+        test_session.commit()
+
+        assert [conflict.issue_id for conflict in repo.list_conflicts()] == ["ISS-001", "ISS-002"]
+        (conflict,) = repo.list_conflicts("ISS-002")
+        assert conflict.remote_hash is None
+
+
+class TestSyncStateChangeLog:
+    """Test the trigger-maintained issue change log."""
+
+    def test_changes_are_logged_per_issue(self, test_session: Session) -> None:
+        """Test that writes to issues and child tables log the issue ID."""
+        repo = SyncStateRepository(test_session)
+        repo.ensure_change_tracking()
+        repo.ensure_change_tracking()
+        issues = IssueRepository(test_session)
+        issues.save(_issue("ISS-001"))
+        issues.save(_issue("ISS-002"))
+        test_session.commit()
+
+        watermark, changed = repo.get_changes()
+        assert watermark > 0
+        assert repo.latest_change() == watermark
+        assert changed == {"ISS-001", "ISS-002"}
+
+        repo.acknowledge_changes(watermark)
+        test_session.commit()
+        assert repo.get_changes() == (0, set())
+        assert repo.latest_change() == 0
+
+        CommentRepository(test_session).save(
+            Comment(
+                id="COM-001",
+                issue_id="ISS-002",
+                author="testuser",
+                text="Hello",
+                created_at=datetime.now(UTC).replace(tzinfo=None),
+            )
+        )
+        issues.delete("ISS-001")
+        test_session.commit()
+
+        next_watermark, changed = repo.get_changes()
+        assert next_watermark > watermark
+        assert repo.latest_change() == next_watermark
+        assert changed == {"ISS-001", "ISS-002"}
+
+    def test_empty_log_without_tracking(self, test_session: Session) -> None:
+        """Test that writes before tracking is installed are not logged."""
+        IssueRepository(test_session).save(_issue("ISS-001"))
+        test_session.commit()
+
+        repo = SyncStateRepository(test_session)
+        repo.ensure_change_tracking()
+
+        assert repo.get_changes() == (0, set())
@@ -1,7 +1,5 @@
 """Comprehensive unit tests for daemon modules."""
 
-import json
-import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -15,7 +13,6 @@ from issue_tracker.daemon.service import (
     start_daemon,
     stop_daemon,
 )
-from issue_tracker.daemon.sync_engine import SyncEngine
 
 
 class TestDaemonConfig:
@@ -60,241 +57,6 @@ class TestDaemonConfig:
         assert config.sync_enabled is True
 
 
-class TestSyncEngine:
-    """Test sync engine."""
-
-    def test_init(self, tmp_path: Path):
-        """Test sync engine initialization."""
-        export_path = tmp_path / ".issues" / "issues.jsonl"
-        engine = SyncEngine(tmp_path, export_path)
-
-        assert engine.workspace_path == tmp_path
-        assert engine.export_path == export_path
-        assert engine.git_enabled is True
-
-    def test_export_to_jsonl(self, tmp_path: Path):
-        """Test exporting issues to JSONL."""
-        issues_dir = tmp_path / ".issues"
-        export_path = issues_dir / "issues.jsonl"
-        engine = SyncEngine(tmp_path, export_path)
-
-        issues = [
-            {
-                "id": "ISS-1",
-                "title": "Test Issue",
-                "status": "open",
-                "priority": 1,
-            }
-        ]
-
-        exported, skipped = engine.export_to_jsonl(issues)
-
-        assert exported == 1
-        assert skipped == 0
-        assert export_path.exists()
-
-        # Verify content
-        content = export_path.read_text()
-        assert "ISS-1" in content
-        assert "Test Issue" in content
-
-    def test_export_skips_unchanged(self, tmp_path: Path):
-        """Test export skips unchanged issues."""
-        export_path = tmp_path / ".issues" / "issues.jsonl"
-        engine = SyncEngine(tmp_path, export_path)
-
-        issues = [{"id": "ISS-1", "title": "Test"}]
-
-        # First export
-        exported1, skipped1 = engine.export_to_jsonl(issues)
-        assert exported1 == 1
-        assert skipped1 == 0
-
-        # Second export with same data
-        exported2, skipped2 = engine.export_to_jsonl(issues)
-        assert exported2 == 0
-        assert skipped2 == 1
-
-    def test_import_from_jsonl(self, tmp_path: Path):
-        """Test importing from JSONL."""
-        export_path = tmp_path / ".issues" / "issues.jsonl"
-        export_path.parent.mkdir(parents=True)
-        engine = SyncEngine(tmp_path, export_path)
-
-        # Create test file
-        test_data = {"id": "ISS-1", "title": "Imported"}
-        export_path.write_text(json.dumps(test_data) + "\n")
-
-        issues = engine.import_from_jsonl()
-
-        assert len(issues) == 1
-        assert issues[0]["id"] == "ISS-1"
-        assert issues[0]["title"] == "Imported"
-
-    def test_import_nonexistent_file(self, tmp_path: Path):
-        """Test importing when file doesn't exist."""
-        export_path = tmp_path / ".issues" / "issues.jsonl"
-        engine = SyncEngine(tmp_path, export_path)
-
-        issues = engine.import_from_jsonl()
-        assert issues == []
-
-    def test_import_skips_invalid_json(self, tmp_path: Path):
-        """Test import skips invalid JSON lines."""
-        export_path = tmp_path / ".issues" / "issues.jsonl"
-        export_path.parent.mkdir(parents=True)
-        engine = SyncEngine(tmp_path, export_path)
-
-        export_path.write_text('not json\n{"id": "ISS-1"}\n')
-
-        issues = engine.import_from_jsonl()
-        assert len(issues) == 1
-        assert issues[0]["id"] == "ISS-1"
-
-    @patch("subprocess.run")
-    def test_git_commit_success(self, mock_run: MagicMock, tmp_path: Path):
-        """Test successful git commit."""
-        export_path = tmp_path / ".issues" / "issues.jsonl"
-        engine = SyncEngine(tmp_path, export_path)
-
-        # Mock git commands
-        mock_run.side_effect = [
-            Mock(returncode=0),  # rev-parse (is git repo)
-            Mock(returncode=0),  # git add
-            Mock(returncode=1),  # diff --cached (has changes)
-            Mock(returncode=0),  # git commit
-        ]
-
-        result = engine.git_commit("Test commit")
-
-        assert result is True
-        assert mock_run.call_count == 4
-
-    @patch("subprocess.run")
-    def test_git_commit_not_a_repo(self, mock_run: MagicMock, tmp_path: Path):
-        """Test git commit when not in a repo."""
-        export_path = tmp_path / ".issues" / "issues.jsonl"
-        engine = SyncEngine(tmp_path, export_path)
-
-        mock_run.return_value = Mock(returncode=1)
-
-        result = engine.git_commit()
-
-        assert result is False
-
-    @patch("subprocess.run")
-    def test_git_commit_no_changes(self, mock_run: MagicMock, tmp_path: Path):
-        """Test git commit with no changes."""
-        export_path = tmp_path / ".issues" / "issues.jsonl"
-        engine = SyncEngine(tmp_path, export_path)
-
-        mock_run.side_effect = [
-            Mock(returncode=0),  # is git repo
-            Mock(returncode=0),  # git add
-            Mock(returncode=0),  # diff (no changes)
-        ]
-
-        result = engine.git_commit()
-
-        assert result is True
-
-    @patch("subprocess.run")
-    def test_git_commit_error(self, mock_run: MagicMock, tmp_path: Path):
-        """Test git commit with error."""
-        export_path = tmp_path / ".issues" / "issues.jsonl"
-        engine = SyncEngine(tmp_path, export_path)
-
-        mock_run.side_effect = subprocess.CalledProcessError(1, "git")
-
-        result = engine.git_commit()
-
-        assert result is False
-
-    @patch("subprocess.run")
-    def test_git_pull_success(self, mock_run: MagicMock, tmp_path: Path):
-        """Test successful git pull."""
-        export_path = tmp_path / ".issues" / "issues.jsonl"
-        engine = SyncEngine(tmp_path, export_path)
-
-        mock_run.return_value = Mock(returncode=0)
-
-        result = engine.git_pull()
-
-        assert result is True
-        mock_run.assert_called_once()
-
-    @patch("subprocess.run")
-    def test_git_pull_error(self, mock_run: MagicMock, tmp_path: Path):
-        """Test git pull with error."""
-        export_path = tmp_path / ".issues" / "issues.jsonl"
-        engine = SyncEngine(tmp_path, export_path)
-
-        mock_run.return_value = Mock(returncode=1, stderr=b"error")
-
-        result = engine.git_pull()
-
-        assert result is False
-
-    @patch("subprocess.run")
-    def test_git_push_success(self, mock_run: MagicMock, tmp_path: Path):
-        """Test successful git push."""
-        export_path = tmp_path / ".issues" / "issues.jsonl"
-        engine = SyncEngine(tmp_path, export_path)
-
-        mock_run.return_value = Mock(returncode=0)
-
-        result = engine.git_push()
-
-        assert result is True
-
-    @patch("subprocess.run")
-    def test_git_push_no_upstream(self, mock_run: MagicMock, tmp_path: Path):
-        """Test git push with no upstream branch."""
-        export_path = tmp_path / ".issues" / "issues.jsonl"
-        engine = SyncEngine(tmp_path, export_path)
-
-        mock_run.return_value = Mock(returncode=1, stderr=b"no upstream branch")
-
-        result = engine.git_push()
-
-        # Should return True as this is not a fatal error
-        assert result is True
-
-    @patch("subprocess.run")
-    def test_sync_full_cycle(self, mock_run: MagicMock, tmp_path: Path):
-        """Test full sync cycle."""
-        export_path = tmp_path / ".issues" / "issues.jsonl"
-        export_path.parent.mkdir(parents=True)
-        engine = SyncEngine(tmp_path, export_path)
-
-        # Mock all git operations
-        mock_run.side_effect = [
-            Mock(returncode=0),  # rev-parse
-            Mock(returncode=0),  # git add
-            Mock(returncode=1),  # diff (has changes)
-            Mock(returncode=0),  # git commit
-            Mock(returncode=0),  # git pull
-            Mock(returncode=0),  # git push
-        ]
-
-        issues = [{"id": "ISS-1", "title": "Test"}]
-        stats = engine.sync(issues)
-
-        assert stats["exported"] == 1
-        assert stats["committed"] is True
-        assert stats["pulled"] is True
-        assert stats["pushed"] is True
-
-    def test_git_disabled(self, tmp_path: Path):
-        """Test sync with git disabled."""
-        export_path = tmp_path / ".issues" / "issues.jsonl"
-        engine = SyncEngine(tmp_path, export_path, git_enabled=False)
-
-        assert engine.git_commit() is False
-        assert engine.git_pull() is False
-        assert engine.git_push() is False
-
-
 class TestDaemonService:
     """Test daemon service."""
 
@@ -0,0 +1,82 @@
+"""Unit tests for change-driven sync in the issues daemon."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from sqlmodel import SQLModel, create_engine, text
+
+import issue_tracker.adapters.db.models  # noqa: F401
+from issue_tracker.daemon.config import DaemonConfig
+from issue_tracker.daemon.service import IssuesDaemonService
+
+
+def _insert_issue(engine, issue_id: str) -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO issues (id, project_id, title, description, status, priority, type, created_at, updated_at) "
+                "VALUES (:id, 'PRJ', :id, '', 'open', 2, 'task', '2026-01-01 00:00:00', '2026-01-01 00:00:00')"
+            ),
+            {"id": issue_id},
+        )
+
+
+@pytest.fixture
+def isolated_data_folder(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Point DATA_FOLDER and the cached engines at a fresh folder."""
+    from glorious_agents.config import reset_config
+
+    from issue_tracker.cli.dependencies import dispose_all_engines, get_db_url, get_issues_folder
+
+    data_folder = tmp_path / ".agent"
+    monkeypatch.setenv("DATA_FOLDER", str(data_folder))
+    for reset in (reset_config, dispose_all_engines, get_db_url.cache_clear, get_issues_folder.cache_clear):
+        reset()
+    yield data_folder
+    # Dropped caches are rebuilt lazily, after monkeypatch restores the environment
+    for reset in (reset_config, dispose_all_engines, get_db_url.cache_clear, get_issues_folder.cache_clear):
+        reset()
+
+
+class TestDaemonChangeSync:
+    """Test that the daemon syncs changes found in the issue change log."""
+
+    async def test_startup_on_database_without_change_log(
+        self, isolated_data_folder: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a database from before the change log gets it on startup and syncs changes."""
+        db_path = isolated_data_folder / "issues.db"
+        db_path.parent.mkdir(parents=True)
+        db = create_engine(f"sqlite:///{db_path}")
+        tables = [table for name, table in SQLModel.metadata.tables.items() if name != "issue_changes"]
+        SQLModel.metadata.create_all(db, tables=tables)
+        _insert_issue(db, "ISS-1")
+
+        config = DaemonConfig.default(isolated_data_folder.parent)
+        config.database_path = str(db_path)
+        config.git_integration = False
+        export_path = Path(config.export_path)
+        service = IssuesDaemonService(config)
+
+        async def idle() -> None:
+            pass
+
+        # Probes and sync cycles are run by hand below instead of on timers
+        monkeypatch.setattr(service._scheduler, "start", idle)
+        await service.on_startup()
+        await service._sync_task.stop()
+        try:
+            with db.connect() as conn:
+                assert conn.execute(text("SELECT count(*) FROM issue_changes")).scalar_one() == 0
+            service._sync_changes()
+            assert "ISS-1" in export_path.read_text()
+
+            _insert_issue(db, "ISS-2")
+            await service._poll_changes()
+            assert service._scheduler.pending == 1
+            service._sync_changes()
+            assert "ISS-2" in export_path.read_text()
+        finally:
+            await service.on_shutdown()
+            db.dispose()
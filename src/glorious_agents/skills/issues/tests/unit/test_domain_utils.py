@@ -2,7 +2,7 @@
 
 from datetime import UTC, datetime
 
-from issue_tracker.domain.utils import utcnow_naive
+from issue_tracker.domain.utils import parse_utc_naive, utcnow_naive
 
 
 class TestUtcnowNaive:
@@ -110,3 +110,20 @@ class TestUtcnowNaive:
         # Can be parsed back
         parsed = datetime.fromisoformat(iso_str)
         assert parsed == result
+
+
+class TestParseUtcNaive:
+    """Tests for parse_utc_naive function."""
+
+    def test_parses_naive_and_offset_timestamps(self):
+        """Test that offsets and a trailing Z are converted to naive UTC."""
+        expected = datetime(2026, 1, 2, 3, 4, 5)
+        assert parse_utc_naive("2026-01-02T03:04:05") == expected
+        assert parse_utc_naive("2026-01-02T03:04:05Z") == expected
+        assert parse_utc_naive("2026-01-02T05:04:05+02:00") == expected
+        assert parse_utc_naive(datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)) == expected
+
+    def test_empty_values_give_none(self):
+        """Test that missing timestamps parse to None."""
+        assert parse_utc_naive(None) is None
+        assert parse_utc_naive("") is None
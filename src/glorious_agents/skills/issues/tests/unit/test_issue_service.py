@@ -1,13 +1,14 @@
 """Unit tests for IssueService with mocked repositories."""
 
 from datetime import UTC, datetime
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
 from issue_tracker.domain.entities.comment import Comment
 from issue_tracker.domain.entities.dependency import Dependency, DependencyType
 from issue_tracker.domain.entities.issue import Issue, IssuePriority, IssueStatus, IssueType
+from issue_tracker.domain.exceptions import InvariantViolationError
 from issue_tracker.services.issue_service import IssueService
 
 # Test constants
@@ -579,3 +580,143 @@ class TestIssueServiceListing:
         assert len(result) == 1
         assert result[0].type == IssueType.BUG
         mock_uow.issues.list_by_type.assert_called_once_with(IssueType.BUG, 100, 0)
+
+
+class TestIssueServiceBulk:
+    """Test set-based bulk operations."""
+
+    def test_bulk_update_status_passes_valid_source_statuses(self, issue_service: IssueService, mock_uow: Mock) -> None:
+        """Test that only statuses that may transition to the target are updated."""
+        mock_uow.issues.bulk_transition = Mock(return_value=["issue-1"])
+
+        updated, failed = issue_service.bulk_update_status(["issue-1", "issue-2", "issue-1"], IssueStatus.IN_PROGRESS)
+
+        assert updated == ["issue-1"]
+        assert failed == ["issue-2"]
+        _, target, from_statuses, now = mock_uow.issues.bulk_transition.call_args.args
+        assert target == IssueStatus.IN_PROGRESS
+        assert set(from_statuses) == {IssueStatus.OPEN}
+        assert now == TEST_TIMESTAMP
+
+    def test_bulk_close_includes_resolvable_statuses(self, issue_service: IssueService, mock_uow: Mock) -> None:
+        """Test that bulk close accepts every status close_issue() would."""
+        mock_uow.issues.bulk_transition = Mock(return_value=["issue-1", "issue-2"])
+
+        updated, failed = issue_service.bulk_close(["issue-1", "issue-2"])
+
+        assert updated == ["issue-1", "issue-2"]
+        assert failed == []
+        from_statuses = mock_uow.issues.bulk_transition.call_args.args[2]
+        assert set(from_statuses) == {
+            IssueStatus.OPEN,
+            IssueStatus.IN_PROGRESS,
+            IssueStatus.BLOCKED,
+            IssueStatus.RESOLVED,
+        }
+
+    def test_bulk_update_priority(self, issue_service: IssueService, mock_uow: Mock) -> None:
+        """Test bulk priority update reports missing issues as failed."""
+        mock_uow.issues.bulk_update = Mock(return_value=["issue-1"])
+
+        updated, failed = issue_service.bulk_update_priority(["issue-1", "missing"], IssuePriority.CRITICAL)
+
+        assert (updated, failed) == (["issue-1"], ["missing"])
+        mock_uow.issues.bulk_update.assert_called_once_with(
+            ["issue-1", "missing"], TEST_TIMESTAMP, priority=IssuePriority.CRITICAL
+        )
+
+    def test_bulk_add_labels_cleans_names(self, issue_service: IssueService, mock_uow: Mock) -> None:
+        """Test that label names are stripped and deduplicated before insert."""
+        mock_uow.issues.bulk_add_labels = Mock(return_value=["issue-1"])
+
+        issue_service.bulk_add_labels(["issue-1"], [" bug ", "bug", "ui"])
+
+        mock_uow.issues.bulk_add_labels.assert_called_once_with(["issue-1"], ["bug", "ui"], TEST_TIMESTAMP)
+
+    def test_bulk_remove_labels_rejects_empty_label(self, issue_service: IssueService, mock_uow: Mock) -> None:
+        """Test that empty label names are rejected."""
+        with pytest.raises(InvariantViolationError):
+            issue_service.bulk_remove_labels(["issue-1"], ["  "])
+
+        mock_uow.issues.bulk_remove_labels.assert_not_called()
+
+
+class TestIssueServiceImport:
+    """Test batched import and bulk create."""
+
+    @staticmethod
+    def _record(issue_id: str, **extra) -> dict:
+        return {"id": issue_id, "title": f"Title {issue_id}", "status": "open", "priority": 1, "type": "bug", **extra}
+
+    def test_import_issues_counts_new_updated_and_errors(self, issue_service: IssueService, mock_uow: Mock) -> None:
+        """Test that existing IDs are prefetched per batch and invalid records are skipped."""
+        mock_uow.issues.existing_ids = Mock(return_value={"issue-1"})
+        records = [
+            self._record("issue-1", labels=["bug"]),
+            self._record("issue-2"),
+            {"id": "issue-3", "status": "open"},
+        ]
+
+        result = issue_service.import_issues(records)
+
+        assert (result.processed, result.new, result.updated) == (3, 1, 1)
+        assert len(result.errors) == 1
+        assert result.errors[0].startswith("issue-3:")
+        issues = mock_uow.issues.upsert_many.call_args.args[0]
+        assert [issue.id for issue in issues] == ["issue-1", "issue-2"]
+        assert issues[0].priority == IssuePriority.HIGH
+        assert mock_uow.issues.upsert_many.call_args.kwargs["keep_labels"] == {"issue-2"}
+
+    def test_import_issues_dry_run_writes_nothing(self, issue_service: IssueService, mock_uow: Mock) -> None:
+        """Test that a dry run only counts."""
+        mock_uow.issues.existing_ids = Mock(return_value=set())
+
+        result = issue_service.import_issues([self._record("issue-1")], dry_run=True)
+
+        assert result.new == 1
+        mock_uow.issues.upsert_many.assert_not_called()
+        mock_uow.issues.deferred_search_index.assert_not_called()
+
+    def test_import_issues_batches_and_defers_search_index(self, issue_service: IssueService, mock_uow: Mock) -> None:
+        """Test that multi-batch imports report progress and defer FTS work."""
+        mock_uow.issues.existing_ids = Mock(return_value=set())
+        mock_uow.issues.deferred_search_index = MagicMock()
+        progress: list[int] = []
+
+        issue_service.import_issues(
+            (self._record(f"issue-{i}") for i in range(5)),
+            batch_size=2,
+            on_progress=lambda result: progress.append(result.processed),
+        )
+
+        assert progress == [2, 4, 5]
+        assert mock_uow.issues.upsert_many.call_count == 3
+        mock_uow.issues.deferred_search_index.assert_called_once_with()
+
+    def test_import_issues_comments_and_dependencies(self, issue_service: IssueService, mock_uow: Mock) -> None:
+        """Test that comments are upserted and dependencies to unknown issues are reported."""
+        mock_uow.issues.existing_ids = Mock(side_effect=[set(), {"issue-2"}])
+        mock_uow.graph.add_many = Mock(return_value=1)
+        record = self._record(
+            "issue-1",
+            comments=[{"id": "comment-1", "author": "alice", "text": "Hi", "created_at": "2025-11-11T12:00:00Z"}],
+            dependencies={"depends_on": [{"id": "issue-2", "type": "blocks"}, {"id": "issue-9", "type": "blocks"}]},
+        )
+
+        result = issue_service.import_issues([record])
+
+        comment = mock_uow.comments.upsert_many.call_args.args[0][0]
+        assert (comment.id, comment.text, comment.created_at) == ("comment-1", "Hi", TEST_TIMESTAMP)
+        dependencies = mock_uow.graph.add_many.call_args.args[0]
+        assert [(dep.to_issue_id, dep.dependency_type) for dep in dependencies] == [("issue-2", DependencyType.BLOCKS)]
+        assert result.errors == ["issue-1: unknown dependency target issue-9"]
+        assert result.skipped_dependencies == 0
+
+    def test_create_issues(self, issue_service: IssueService, mock_uow: Mock) -> None:
+        """Test bulk creation with generated IDs."""
+        created = issue_service.create_issues(["One", "Two"], issue_type=IssueType.BUG)
+
+        assert [issue.title for issue in created] == ["One", "Two"]
+        assert all(issue.type == IssueType.BUG for issue in created)
+        mock_uow.issues.upsert_many.assert_called_once_with(created)
+        mock_uow.issues.deferred_search_index.assert_not_called()
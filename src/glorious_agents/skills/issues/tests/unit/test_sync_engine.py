@@ -0,0 +1,502 @@
+"""Unit tests for the JSONL sync engine."""
+
+import json
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from issue_tracker.daemon.sync_engine import SyncEngine, content_hash
+
+
+class TestSyncEngine:
+    """Test sync engine."""
+
+    def test_init(self, tmp_path: Path):
+        """Test sync engine initialization."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path)
+
+        assert engine.workspace_path == tmp_path
+        assert engine.export_path == export_path
+        assert engine.git_enabled is True
+
+    def test_export_to_jsonl(self, tmp_path: Path):
+        """Test exporting issues to JSONL."""
+        issues_dir = tmp_path / ".issues"
+        export_path = issues_dir / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path)
+
+        issues = [
+            {
+                "id": "ISS-1",
+                "title": "Test Issue",
+                "status": "open",
+                "priority": 1,
+            }
+        ]
+
+        exported, skipped = engine.export_to_jsonl(issues)
+
+        assert exported == 1
+        assert skipped == 0
+        assert export_path.exists()
+
+        # Verify content
+        content = export_path.read_text()
+        assert "ISS-1" in content
+        assert "Test Issue" in content
+
+    def test_export_skips_unchanged(self, tmp_path: Path):
+        """Test export skips unchanged issues."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path)
+
+        issues = [{"id": "ISS-1", "title": "Test"}]
+
+        # First export
+        exported1, skipped1 = engine.export_to_jsonl(issues)
+        assert exported1 == 1
+        assert skipped1 == 0
+
+        # Second export with same data
+        exported2, skipped2 = engine.export_to_jsonl(issues)
+        assert exported2 == 0
+        assert skipped2 == 1
+
+    def test_export_keeps_unchanged_lines(self, tmp_path: Path):
+        """Test that a partial change rewrites the whole file with every issue."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path)
+        engine.export_to_jsonl([{"id": "ISS-1", "title": "One"}, {"id": "ISS-2", "title": "Two"}])
+        # Unchanged lines are copied as they are in the file
+        lines = export_path.read_text().splitlines()
+        lines[0] = json.dumps({"title": "One", "id": "ISS-1"})
+        export_path.write_text("\n".join(lines) + "\n")
+
+        stats = engine.export_changes([{"id": "ISS-1", "title": "One"}, {"id": "ISS-2", "title": "Changed"}])
+
+        assert (stats.exported, stats.skipped, stats.removed) == (1, 1, 0)
+        assert stats.bytes_written == export_path.stat().st_size
+        assert export_path.read_text().splitlines() == [lines[0], json.dumps({"id": "ISS-2", "title": "Changed"})]
+        assert not list(export_path.parent.glob("*.tmp"))
+
+    def test_export_removes_deleted_issues(self, tmp_path: Path):
+        """Test that issues missing from the export are dropped from the file."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path)
+        engine.export_to_jsonl([{"id": "ISS-1"}, {"id": "ISS-2"}])
+
+        stats = engine.export_changes([{"id": "ISS-2"}])
+
+        assert (stats.exported, stats.skipped, stats.removed) == (0, 1, 1)
+        assert export_path.read_text() == '{"id": "ISS-2"}\n'
+
+        assert engine.export_changes([{"id": "ISS-2"}]).bytes_written == 0
+
+    def test_export_hashes_persist_across_engines(self, tmp_path: Path):
+        """Test that a restarted engine skips issues exported by an earlier one."""
+        from sqlmodel import create_engine
+
+        db = create_engine(f"sqlite:///{tmp_path / 'issues.db'}")
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        issues = [{"id": "ISS-1", "title": "One"}, {"id": "ISS-2", "title": "Two"}]
+        SyncEngine(tmp_path, export_path, engine=db).export_to_jsonl(issues)
+
+        restarted = SyncEngine(tmp_path, export_path, engine=db)
+        stats = restarted.export_changes([issues[0], {"id": "ISS-2", "title": "Changed"}])
+
+        assert (stats.exported, stats.skipped) == (1, 1)
+        assert SyncEngine(tmp_path, export_path, engine=db).export_to_jsonl(issues[:1]) == (0, 1)
+        db.dispose()
+
+    def test_export_failure_keeps_previous_file(self, tmp_path: Path):
+        """Test that an error while streaming issues leaves the old file intact."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path)
+        engine.export_to_jsonl([{"id": "ISS-1"}])
+
+        def broken_issues():
+            yield {"id": "ISS-2"}
+            raise RuntimeError("database went away")
+
+        with pytest.raises(RuntimeError):
+            engine.export_to_jsonl(broken_issues())
+
+        assert export_path.read_text() == '{"id": "ISS-1"}\n'
+        assert not list(export_path.parent.glob("*.tmp"))
+
+    def test_content_hash_is_stable(self):
+        """Test that the content hash ignores key order."""
+        assert content_hash({"id": "ISS-1", "title": "A"}) == content_hash({"title": "A", "id": "ISS-1"})
+        assert content_hash({"id": "ISS-1", "title": "A"}) != content_hash({"id": "ISS-1", "title": "B"})
+
+    def test_import_from_jsonl(self, tmp_path: Path):
+        """Test importing from JSONL."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        export_path.parent.mkdir(parents=True)
+        engine = SyncEngine(tmp_path, export_path)
+
+        # Create test file
+        test_data = {"id": "ISS-1", "title": "Imported"}
+        export_path.write_text(json.dumps(test_data) + "\n")
+
+        issues = engine.import_from_jsonl()
+
+        assert len(issues) == 1
+        assert issues[0]["id"] == "ISS-1"
+        assert issues[0]["title"] == "Imported"
+
+    def test_import_nonexistent_file(self, tmp_path: Path):
+        """Test importing when file doesn't exist."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path)
+
+        issues = engine.import_from_jsonl()
+        assert issues == []
+
+    def test_import_skips_invalid_json(self, tmp_path: Path):
+        """Test import skips invalid JSON lines."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        export_path.parent.mkdir(parents=True)
+        engine = SyncEngine(tmp_path, export_path)
+
+        export_path.write_text('not json\n{"id": "ISS-1"}\n')
+
+        issues = engine.import_from_jsonl()
+        assert len(issues) == 1
+        assert issues[0]["id"] == "ISS-1"
+
+    @patch("subprocess.run")
+    def test_git_commit_success(self, mock_run: MagicMock, tmp_path: Path):
+        """Test successful git commit."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path)
+
+        # Mock git commands
+        mock_run.side_effect = [
+            Mock(returncode=0),  # rev-parse (is git repo)
+            Mock(returncode=0),  # git add
+            Mock(returncode=1),  # diff --cached (has changes)
+            Mock(returncode=0),  # git commit
+        ]
+
+        result = engine.git_commit("Test commit")
+
+        assert result is True
+        assert mock_run.call_count == 4
+
+    @patch("subprocess.run")
+    def test_git_commit_not_a_repo(self, mock_run: MagicMock, tmp_path: Path):
+        """Test git commit when not in a repo."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path)
+
+        mock_run.return_value = Mock(returncode=1)
+
+        result = engine.git_commit()
+
+        assert result is False
+
+    @patch("subprocess.run")
+    def test_git_commit_no_changes(self, mock_run: MagicMock, tmp_path: Path):
+        """Test git commit with no changes."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path)
+
+        mock_run.side_effect = [
+            Mock(returncode=0),  # is git repo
+            Mock(returncode=0),  # git add
+            Mock(returncode=0),  # diff (no changes)
+        ]
+
+        result = engine.git_commit()
+
+        assert result is True
+
+    @patch("subprocess.run")
+    def test_git_commit_error(self, mock_run: MagicMock, tmp_path: Path):
+        """Test git commit with error."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path)
+
+        mock_run.side_effect = subprocess.CalledProcessError(1, "git")
+
+        result = engine.git_commit()
+
+        assert result is False
+
+    @patch("subprocess.run")
+    def test_git_pull_success(self, mock_run: MagicMock, tmp_path: Path):
+        """Test successful git pull."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path)
+
+        mock_run.return_value = Mock(returncode=0)
+
+        result = engine.git_pull()
+
+        assert result is True
+        mock_run.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_git_pull_error(self, mock_run: MagicMock, tmp_path: Path):
+        """Test git pull with error."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path)
+
+        mock_run.return_value = Mock(returncode=1, stderr=b"error")
+
+        result = engine.git_pull()
+
+        assert result is False
+
+    @patch("subprocess.run")
+    def test_git_push_success(self, mock_run: MagicMock, tmp_path: Path):
+        """Test successful git push."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path)
+
+        mock_run.return_value = Mock(returncode=0)
+
+        result = engine.git_push()
+
+        assert result is True
+
+    @patch("subprocess.run")
+    def test_git_push_no_upstream(self, mock_run: MagicMock, tmp_path: Path):
+        """Test git push with no upstream branch."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path)
+
+        mock_run.return_value = Mock(returncode=1, stderr=b"no upstream branch")
+
+        result = engine.git_push()
+
+        # Should return True as this is not a fatal error
+        assert result is True
+
+    @patch("subprocess.run")
+    def test_sync_full_cycle(self, mock_run: MagicMock, tmp_path: Path):
+        """Test full sync cycle."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        export_path.parent.mkdir(parents=True)
+        engine = SyncEngine(tmp_path, export_path)
+
+        # Mock all git operations
+        mock_run.side_effect = [
+            Mock(returncode=0, stdout="refs/heads/main\n"),  # current branch
+            Mock(returncode=0, stdout="origin\trefs/heads/main\trefs/remotes/origin/main\n"),  # upstream
+            Mock(returncode=0, stdout="abc123\trefs/heads/main\n"),  # ls-remote
+            Mock(returncode=0, stdout="def456\n"),  # remote-tracking ref (remote moved)
+            Mock(returncode=0),  # git pull
+            Mock(returncode=0),  # rev-parse
+            Mock(returncode=0),  # git add
+            Mock(returncode=1),  # diff (has changes)
+            Mock(returncode=0),  # git commit
+            Mock(returncode=0),  # git push
+        ]
+
+        issues = [{"id": "ISS-1", "title": "Test"}]
+        stats = engine.sync(issues)
+
+        assert stats["exported"] == 1
+        assert stats["committed"] is True
+        assert stats["remote_changed"] is True
+        assert stats["pulled"] is True
+        assert stats["pushed"] is True
+        assert mock_run.call_args_list[2].args[0] == ["git", "ls-remote", "origin", "refs/heads/main"]
+
+    def test_git_disabled(self, tmp_path: Path):
+        """Test sync with git disabled."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path, git_enabled=False)
+
+        assert engine.git_commit() is False
+        assert engine.git_pull() is False
+        assert engine.git_push() is False
+
+    def test_partial_export_patches_file(self, tmp_path: Path):
+        """Test that a partial export replaces, removes and appends only the given issues."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path)
+        engine.export_to_jsonl([{"id": "ISS-1"}, {"id": "ISS-2"}, {"id": "ISS-3"}])
+
+        stats = engine.export_changes([{"id": "ISS-2", "title": "Changed"}, {"id": "ISS-4"}], removed_ids={"ISS-1"})
+
+        assert (stats.exported, stats.skipped, stats.removed) == (2, 0, 1)
+        assert [json.loads(line)["id"] for line in export_path.read_text().splitlines()] == ["ISS-2", "ISS-3", "ISS-4"]
+        assert engine.export_changes([{"id": "ISS-3"}], removed_ids=()).bytes_written == 0
+
+    def test_sync_without_changes_skips_export(self, tmp_path: Path):
+        """Test that sync(None) neither exports nor commits."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path, git_enabled=False)
+
+        with patch.object(engine, "export_changes") as export_changes:
+            stats = engine.sync(None)
+
+        export_changes.assert_not_called()
+        assert stats["committed"] is False
+        assert not export_path.exists()
+
+    def test_full_export_keeps_unmerged_remote_lines(self, tmp_path: Path):
+        """Test that a full export keeps lines of issues it never exported."""
+        export_path = tmp_path / ".issues" / "issues.jsonl"
+        export_path.parent.mkdir(parents=True)
+        export_path.write_text('{"id": "REMOTE-1"}\n')
+        engine = SyncEngine(tmp_path, export_path)
+
+        stats = engine.export_changes([{"id": "ISS-1"}])
+
+        assert stats.removed == 0
+        assert export_path.read_text() == '{"id": "REMOTE-1"}\n{"id": "ISS-1"}\n'
+
+    def test_merge_from_jsonl_three_way(self, tmp_path: Path):
+        """Test that a merge applies remote-only changes and records conflicts."""
+        from sqlmodel import Session, SQLModel, create_engine, text
+
+        from issue_tracker.adapters.db.repositories import IssueRepository, SyncStateRepository
+        from issue_tracker.daemon.records import issue_to_record
+        from issue_tracker.domain.entities.issue import Issue
+
+        db = create_engine(f"sqlite:///{tmp_path / 'issues.db'}")
+        SQLModel.metadata.create_all(db)
+        with Session(db) as session:
+            repo = IssueRepository(session)
+            for i in range(1, 5):
+                repo.save(Issue(id=f"ISS-{i}", project_id="PRJ", title=f"Issue {i}", description="", labels=["keep"]))
+            session.commit()
+            records = {f"ISS-{i}": issue_to_record(repo.get(f"ISS-{i}")) for i in range(1, 5)}
+        export_path = tmp_path / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path, git_enabled=False, engine=db)
+        engine.export_to_jsonl(records.values())
+
+        # Remotely: ISS-1 and ISS-2 retitled, ISS-3 deleted, ISS-5 added; locally: ISS-2 retitled
+        remote = [
+            dict(records["ISS-1"], title="Remote 1"),
+            dict(records["ISS-2"], title="Remote 2"),
+            records["ISS-4"],
+            dict(records["ISS-4"], id="ISS-5", title="New"),
+        ]
+        export_path.write_text("".join(json.dumps(record) + "\n" for record in remote))
+        with Session(db) as session:
+            session.exec(text("UPDATE issues SET title = 'Local 2' WHERE id = 'ISS-2'"))
+            session.commit()
+
+        stats = engine.merge_from_jsonl(batch_size=2)
+
+        assert (stats.read, stats.applied, stats.deleted, stats.conflicts, stats.unchanged) == (4, 2, 1, 1, 1)
+        assert stats.changed_ids == {"ISS-1", "ISS-3", "ISS-5"}
+        with Session(db) as session:
+            repo = IssueRepository(session)
+            assert repo.get("ISS-1").title == "Remote 1"
+            assert repo.get("ISS-1").labels == ["keep"]
+            assert repo.get("ISS-1").project_id == "PRJ"
+            assert repo.get("ISS-2").title == "Local 2"
+            assert repo.get("ISS-3") is None
+            assert repo.get("ISS-5").title == "New"
+            (conflict,) = SyncStateRepository(session).list_conflicts()
+            assert conflict.issue_id == "ISS-2"
+            assert json.loads(conflict.remote_record)["title"] == "Remote 2"
+
+        # The unchanged file is not read again, and a restarted engine exports only the local change
+        assert engine.merge_from_jsonl().read == 0
+        with Session(db) as session:
+            issues = [issue_to_record(issue) for issue in IssueRepository(session).list_all()]
+        restarted = SyncEngine(tmp_path, export_path, git_enabled=False, engine=db)
+        assert restarted.export_to_jsonl(issues) == (1, 3)
+        db.dispose()
+
+    def test_merge_parses_records_like_import(self, tmp_path: Path):
+        """Test that a merge accepts enum names and closes issues the way import does."""
+        from sqlmodel import Session, SQLModel, create_engine
+
+        from issue_tracker.adapters.db.repositories import IssueRepository
+        from issue_tracker.daemon.records import issue_to_record
+        from issue_tracker.domain.entities.issue import Issue, IssueStatus, IssueType
+
+        db = create_engine(f"sqlite:///{tmp_path / 'issues.db'}")
+        SQLModel.metadata.create_all(db)
+        with Session(db) as session:
+            repo = IssueRepository(session)
+            repo.save(Issue(id="ISS-1", project_id="PRJ", title="Issue 1", description=""))
+            session.commit()
+            record = issue_to_record(repo.get("ISS-1"))
+        export_path = tmp_path / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path, git_enabled=False, engine=db)
+        engine.export_to_jsonl([record])
+        export_path.write_text(json.dumps(dict(record, status="CLOSED", type="BUG", closed_at=None)) + "\n")
+
+        assert engine.merge_from_jsonl().applied == 1
+        with Session(db) as session:
+            issue = IssueRepository(session).get("ISS-1")
+            assert (issue.status, issue.type, issue.project_id) == (IssueStatus.CLOSED, IssueType.BUG, "PRJ")
+            assert issue.closed_at is not None
+        db.dispose()
+
+    def test_sync_merges_before_partial_export(self, tmp_path: Path):
+        """Test that a stale changed issue does not overwrite a merged remote change."""
+        from sqlmodel import Session, SQLModel, create_engine
+
+        from issue_tracker.adapters.db.repositories import IssueRepository
+        from issue_tracker.daemon.records import issue_to_record
+        from issue_tracker.domain.entities.issue import Issue
+
+        db = create_engine(f"sqlite:///{tmp_path / 'issues.db'}")
+        SQLModel.metadata.create_all(db)
+        with Session(db) as session:
+            repo = IssueRepository(session)
+            repo.save(Issue(id="ISS-1", project_id="PRJ", title="Issue 1", description=""))
+            session.commit()
+            stale = issue_to_record(repo.get("ISS-1"))
+        export_path = tmp_path / "issues.jsonl"
+        engine = SyncEngine(tmp_path, export_path, git_enabled=False, engine=db)
+        engine.export_to_jsonl([stale])
+        export_path.write_text(json.dumps(dict(stale, title="Remote 1")) + "\n")
+
+        stats = engine.sync([stale], removed_ids=set())
+
+        assert (stats["imported"], stats["exported"], stats["errors"]) == (1, 0, [])
+        assert json.loads(export_path.read_text())["title"] == "Remote 1"
+        with Session(db) as session:
+            assert IssueRepository(session).get("ISS-1").title == "Remote 1"
+        db.dispose()
+
+    def test_sync_skips_pull_and_push_while_remote_unchanged(self, tmp_path: Path):
+        """Test the ls-remote check against a local bare repository as the remote."""
+        remote = tmp_path / "remote.git"
+        subprocess.run(["git", "init", "--bare", "-q", str(remote)], check=True)
+
+        def clone(name: str) -> Path:
+            path = tmp_path / name
+            subprocess.run(["git", "clone", "-q", str(remote), str(path)], check=True, capture_output=True)
+            subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=path, check=True)
+            subprocess.run(["git", "config", "user.name", "Test User"], cwd=path, check=True)
+            return path
+
+        def commit_and_push(path: Path, name: str) -> None:
+            (path / name).write_text(name)
+            subprocess.run(["git", "add", name], cwd=path, check=True)
+            subprocess.run(["git", "commit", "-q", "-m", name], cwd=path, check=True)
+            subprocess.run(["git", "push", "-q", "origin", "HEAD"], cwd=path, check=True, capture_output=True)
+
+        other = clone("other")
+        commit_and_push(other, "README")
+        local = clone("local")
+        engine = SyncEngine(local, local / "issues.jsonl")
+
+        stats = engine.sync([{"id": "ISS-1", "title": "One"}])
+        assert (stats["remote_changed"], stats["committed"], stats["pushed"]) == (False, True, True)
+
+        stats = engine.sync(None)
+        assert (stats["remote_changed"], stats["pulled"], stats["pushed"]) == (False, False, False)
+
+        subprocess.run(["git", "pull", "-q"], cwd=other, check=True, capture_output=True)
+        commit_and_push(other, "NOTES")
+
+        stats = engine.sync(None)
+        assert (stats["remote_changed"], stats["pulled"]) == (True, True)
+        assert (local / "NOTES").exists()
+        assert engine.sync(None)["remote_changed"] is False
@@ -0,0 +1,100 @@
+"""Unit tests for the debounced sync scheduler."""
+
+import asyncio
+import time
+
+import pytest
+
+from issue_tracker.daemon.scheduler import SyncScheduler
+
+
+@pytest.fixture
+async def runs():
+    """Start times of the callback's runs, and a scheduler factory."""
+    started: list[float] = []
+    schedulers: list[SyncScheduler] = []
+
+    async def make(debounce: float, max_latency: float) -> SyncScheduler:
+        scheduler = SyncScheduler(lambda: started.append(time.monotonic()), debounce, max_latency)
+        await scheduler.start()
+        schedulers.append(scheduler)
+        return scheduler
+
+    yield started, make
+
+    for scheduler in schedulers:
+        await scheduler.stop()
+
+
+class TestSyncScheduler:
+    """Test debouncing, latency bound and lag tracking."""
+
+    async def test_burst_is_coalesced_into_one_run(self, runs):
+        """Test that changes within the debounce window trigger a single cycle."""
+        started, make = runs
+        scheduler = await make(debounce=0.1, max_latency=5.0)
+
+        for _ in range(5):
+            scheduler.notify()
+            await asyncio.sleep(0.02)
+        assert scheduler.pending == 5
+        await asyncio.sleep(0.3)
+
+        assert len(started) == 1
+        assert scheduler.pending == 0
+        assert scheduler.lag == 0.0
+        assert 0.1 <= scheduler.last_lag < 1.0
+
+    async def test_max_latency_bounds_a_steady_stream(self, runs):
+        """Test that changes arriving faster than the debounce still sync."""
+        started, make = runs
+        scheduler = await make(debounce=0.1, max_latency=0.25)
+        first = time.monotonic()
+
+        while time.monotonic() - first < 0.4:
+            scheduler.notify()
+            await asyncio.sleep(0.02)
+
+        assert len(started) == 1
+        assert started[0] - first < 0.35
+
+    async def test_request_runs_without_changes(self, runs):
+        """Test that a request runs a cycle at once and records no lag."""
+        started, make = runs
+        scheduler = await make(debounce=1.0, max_latency=5.0)
+
+        await asyncio.sleep(0.1)
+        assert started == []
+
+        scheduler.request()
+        await asyncio.sleep(0.1)
+
+        assert len(started) == 1
+        assert scheduler.last_run is not None
+        assert scheduler.last_lag is None
+
+    async def test_failing_callback_keeps_scheduler_running(self):
+        """Test that an error in one cycle does not stop later cycles."""
+        calls = []
+
+        def callback() -> None:
+            calls.append(1)
+            raise RuntimeError("sync failed")
+
+        scheduler = SyncScheduler(callback, debounce=0.0, max_latency=0.0)
+        await scheduler.start()
+        try:
+            scheduler.notify()
+            await asyncio.sleep(0.1)
+            scheduler.notify()
+            await asyncio.sleep(0.1)
+        finally:
+            await scheduler.stop()
+
+        assert len(calls) == 2
+        assert not scheduler.is_running
+
+    def test_rejects_debounce_above_max_latency(self):
+        """Test that the latency bound cannot be shorter than the debounce."""
+        with pytest.raises(ValueError):
+            SyncScheduler(lambda: None, debounce=2.0, max_latency=1.0)
@@ -164,7 +164,13 @@ class NotesService:
         Returns:
             True if deleted, False if not found
         """
-        return self.repo.delete(note_id)
+        deleted = self.repo.delete(note_id)
+
+        # Publish event if event bus available
+        if deleted and self.event_bus:
+            self.event_bus.publish("note_deleted", {"id": note_id})
+
+        return deleted
 
     def list_notes(
         self,
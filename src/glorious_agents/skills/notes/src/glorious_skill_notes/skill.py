@@ -1,7 +1,7 @@
 """Notes skill - persistent notes with full-text search."""
 
 import json
-from pathlib import Path
+from collections.abc import Callable
 from typing import Any, Literal
 
 import typer
@@ -9,8 +9,12 @@ from pydantic import Field
 from rich.console import Console
 from rich.table import Table
 
-from glorious_agents.core.context import TOPIC_NOTE_CREATED, SkillContext
-from glorious_agents.core.migrations import run_migrations
+from glorious_agents.core.context import (
+    TOPIC_NOTE_CREATED,
+    TOPIC_NOTE_DELETED,
+    TOPIC_NOTE_UPDATED,
+    SkillContext,
+)
 from glorious_agents.core.search import SearchResult
 from glorious_agents.core.validation import SkillInput, ValidationException, validate_input
 
@@ -20,19 +24,19 @@ from .service import NotesService
 app = typer.Typer(help="Notes management")
 console = Console()
 _ctx: SkillContext | None = None
+_cached_search_notes: Callable[[str], list[dict[str, Any]]] | None = None
 
 ImportanceLevel = Literal[0, 1, 2]  # 0=normal, 1=important, 2=critical
 
 
 def init_context(ctx: SkillContext) -> None:
     """Initialize skill context."""
-    global _ctx
+    global _ctx, _cached_search_notes
     _ctx = ctx
-
-    # Run migrations
-    migrations_dir = Path(__file__).parent / "migrations"
-    if migrations_dir.exists():
-        run_migrations("notes", migrations_dir)
+    # Serve repeated searches from memory until notes change
+    _cached_search_notes = ctx.cached(
+        ttl=30, invalidate_on=[TOPIC_NOTE_CREATED, TOPIC_NOTE_UPDATED, TOPIC_NOTE_DELETED]
+    )(_search_notes)
 
 
 def _get_service() -> NotesService:
@@ -101,6 +105,12 @@ def search_notes(query: str) -> list[dict[str, Any]]:
     Raises:
         ValidationException: If input validation fails.
     """
+    if _cached_search_notes is not None:
+        return _cached_search_notes(query)
+    return _search_notes(query)
+
+
+def _search_notes(query: str) -> list[dict[str, Any]]:
     service = _get_service()
     notes = service.repo.search_fts(query, limit=100)
 
@@ -0,0 +1,71 @@
+"""Unit tests for running forwarded CLI commands in the daemon."""
+
+from pathlib import Path
+
+import pytest
+import typer
+
+from glorious_agents.core.daemon.cli_runner import run_cli
+
+app = typer.Typer()
+
+
+@app.command()
+def greet(name: str, fail: bool = False) -> None:
+    typer.echo(f"Hello {name}")
+    if fail:
+        typer.echo("failing", err=True)
+        raise typer.Exit(3)
+
+
+@app.command()
+def crash() -> None:
+    raise RuntimeError("kaboom")
+
+
+class TestRunCLI:
+    """Test in-process execution of forwarded commands."""
+
+    def test_captures_stdout_and_exit_code(self):
+        result = run_cli(app, ["greet", "World"], cwd=str(Path.cwd()))
+
+        assert result == {
+            "forwarded": True,
+            "exit_code": 0,
+            "stdout": "Hello World\n",
+            "stderr": "",
+        }
+
+    def test_separates_stderr(self):
+        result = run_cli(app, ["greet", "World", "--fail"])
+
+        assert result["exit_code"] == 3
+        assert result["stdout"] == "Hello World\n"
+        assert result["stderr"] == "failing\n"
+
+    def test_usage_error(self):
+        result = run_cli(app, ["greet"])
+
+        assert result["exit_code"] == 2
+        assert "Missing argument" in result["stderr"]
+
+    def test_exception_reported(self):
+        result = run_cli(app, ["crash"])
+
+        assert result["exit_code"] == 1
+        assert "kaboom" in result["stderr"]
+
+    def test_different_cwd_declined(self, tmp_path: Path):
+        """Commands from another directory are declined so the client runs them locally."""
+        result = run_cli(app, ["greet", "World"], cwd=str(tmp_path))
+
+        assert result["forwarded"] is False
+        assert "reason" in result
+
+
+@pytest.mark.parametrize("argv", [["--help"], ["greet", "--help"]])
+def test_help_forwarded(argv: list[str]):
+    result = run_cli(app, argv, prog_name="agent")
+
+    assert result["exit_code"] == 0
+    assert "Usage: agent" in result["stdout"]
@@ -0,0 +1,173 @@
+"""Unit tests for daemon IPC server and client."""
+
+import asyncio
+import stat
+import tempfile
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from glorious_agents.core.daemon.ipc import IPCClient, IPCServer, supports_unix_sockets
+
+
+@pytest.fixture
+def short_dir() -> Generator[Path]:
+    """Temporary directory with a path short enough for AF_UNIX sockets."""
+    with tempfile.TemporaryDirectory(prefix="ipc") as tmp:
+        yield Path(tmp)
+
+
+def _echo(request: dict[str, Any]) -> dict[str, Any]:
+    return {"echo": request.get("data"), "method": request.get("method")}
+
+
+async def _roundtrip(server: IPCServer, client: IPCClient, count: int = 3) -> list[dict[str, Any]]:
+    await server.start()
+    try:
+        return [await client.send_request({"method": "echo", "data": i}) for i in range(count)]
+    finally:
+        await client.close()
+        await server.stop()
+
+
+class TestIPCTransport:
+    """Test IPC round trips over both transports."""
+
+    def test_tcp_roundtrip(self, short_dir: Path):
+        """TCP transport writes a port file and serves requests."""
+        path = short_dir / "daemon.port"
+        server = IPCServer(path, _echo, transport="tcp")
+        client = IPCClient(path)
+
+        async def run() -> list[dict[str, Any]]:
+            await server.start()
+            try:
+                assert path.read_text() == str(server.port)
+                return [await client.send_request({"method": "echo", "data": i}) for i in range(3)]
+            finally:
+                await client.close()
+                await server.stop()
+
+        responses = asyncio.run(run())
+
+        assert [r["echo"] for r in responses] == [0, 1, 2]
+        assert not path.exists()
+
+    @pytest.mark.skipif(not supports_unix_sockets(), reason="Unix sockets not supported")
+    def test_unix_roundtrip(self, short_dir: Path):
+        """Unix transport binds the socket at the configured path."""
+        path = short_dir / "daemon.sock"
+        server = IPCServer(path, _echo, transport="unix")
+        client = IPCClient(path)
+
+        async def run() -> list[dict[str, Any]]:
+            await server.start()
+            try:
+                assert stat.S_ISSOCK(path.stat().st_mode)
+                assert server.port is None
+                return [await client.send_request({"method": "echo", "data": i}) for i in range(3)]
+            finally:
+                await client.close()
+                await server.stop()
+
+        responses = asyncio.run(run())
+
+        assert [r["echo"] for r in responses] == [0, 1, 2]
+        assert not path.exists()
+
+    def test_stale_file_replaced_on_start(self, short_dir: Path):
+        """A leftover socket/port file from a crashed daemon does not block startup."""
+        path = short_dir / "daemon.port"
+        path.write_text("1")
+
+        responses = asyncio.run(_roundtrip(IPCServer(path, _echo), IPCClient(path), count=1))
+
+        assert responses[0]["method"] == "echo"
+
+    def test_client_reconnects_after_restart(self, short_dir: Path):
+        """Client re-resolves the endpoint when the daemon restarts."""
+        path = short_dir / "daemon.port"
+        client = IPCClient(path)
+
+        async def run() -> tuple[dict[str, Any], dict[str, Any]]:
+            first = IPCServer(path, _echo, transport="tcp")
+            await first.start()
+            before = await client.send_request({"method": "one"})
+            await first.stop()
+
+            second = IPCServer(path, _echo, transport="tcp")
+            await second.start()
+            try:
+                after = await client.send_request({"method": "two"})
+            finally:
+                await client.close()
+                await second.stop()
+            return before, after
+
+        before, after = asyncio.run(run())
+
+        assert before["method"] == "one"
+        assert after["method"] == "two"
+
+
+class TestIPCClientErrors:
+    """Test IPC client error handling."""
+
+    def test_missing_endpoint(self, short_dir: Path):
+        """Missing socket/port file raises ConnectionError."""
+        client = IPCClient(short_dir / "missing.port")
+
+        with pytest.raises(ConnectionError, match="Daemon not running"):
+            asyncio.run(client.send_request({"method": "health"}))
+
+    def test_invalid_port_file(self, short_dir: Path):
+        """Garbage in the port file raises ConnectionError."""
+        path = short_dir / "daemon.port"
+        path.write_text("not-a-port")
+        client = IPCClient(path)
+
+        with pytest.raises(ConnectionError, match="Invalid port file"):
+            asyncio.run(client.send_request({"method": "health"}))
+
+    def test_handler_error_returns_error(self, short_dir: Path):
+        """Handler exceptions surface as ConnectionError with the server message."""
+
+        def failing(request: dict[str, Any]) -> dict[str, Any]:
+            raise RuntimeError("boom")
+
+        path = short_dir / "daemon.port"
+
+        with pytest.raises(ConnectionError, match="boom"):
+            asyncio.run(_roundtrip(IPCServer(path, failing), IPCClient(path), count=1))
+
+    def test_timeout_is_configurable(self, short_dir: Path):
+        """Requests exceeding the configured timeout raise ConnectionError."""
+
+        def slow(request: dict[str, Any]) -> dict[str, Any]:
+            import time
+
+            time.sleep(0.5)
+            return {}
+
+        path = short_dir / "daemon.port"
+
+        with pytest.raises(ConnectionError, match="timed out"):
+            asyncio.run(_roundtrip(IPCServer(path, slow), IPCClient(path, timeout=0.1), count=1))
+
+
+class TestIPCMetrics:
+    """Test IPC request instrumentation."""
+
+    def test_requests_recorded(self, short_dir: Path):
+        from glorious_agents.core.metrics import IPC_QUEUE_DEPTH, REQUESTS_TOTAL
+
+        path = short_dir / "daemon.port"
+        counter = REQUESTS_TOTAL.labels("ipc", "", "echo", 200)
+        before = counter.value()
+
+        asyncio.run(_roundtrip(IPCServer(path, _echo), IPCClient(path), count=2))
+
+        assert counter.value() == before + 2
+        assert IPC_QUEUE_DEPTH.labels().value() == 0
@@ -0,0 +1,169 @@
+"""Tests for the TTL cache."""
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from glorious_agents.core.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Controllable monotonic clock."""
+    now = [1000.0]
+    monkeypatch.setattr("glorious_agents.core.cache.time.monotonic", lambda: now[0])
+    return now
+
+
+def test_lru_eviction_counts() -> None:
+    cache = TTLCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert (stats.hits, stats.misses) == (3, 2)
+    assert stats.hit_ratio == pytest.approx(0.6)
+
+
+def test_expiry_uses_monotonic_clock(clock: list[float]) -> None:
+    cache = TTLCache()
+    cache.set("short", "x", ttl=5)
+    cache.set("long", "y", ttl=60)
+    cache.set("forever", "z")
+
+    clock[0] += 10
+
+    assert cache.get("short") is None
+    assert cache.prune_expired() == 0  # "short" was already dropped by the lookup
+    clock[0] += 60
+    assert cache.prune_expired() == 1
+    assert len(cache) == 1
+    assert cache.stats().expirations == 2
+
+
+def test_overwritten_entry_ignores_stale_deadline(clock: list[float]) -> None:
+    cache = TTLCache()
+    cache.set("key", "old", ttl=1)
+    cache.set("key", "new", ttl=100)
+
+    clock[0] += 5
+
+    assert cache.prune_expired() == 0
+    assert cache.get("key") == "new"
+
+
+def test_writes_expire_entries_proactively(clock: list[float]) -> None:
+    cache = TTLCache()
+    cache.set_many({"a": 1, "b": 2}, ttl=1)
+
+    clock[0] += 2
+    cache.set("c", 3)
+
+    assert len(cache) == 1
+
+
+def test_byte_bound_evicts_oldest() -> None:
+    cache = TTLCache(max_size=100, max_bytes=10)
+    cache.set("a", b"1234")
+    cache.set("b", b"1234")
+    cache.set("c", b"1234")
+
+    assert cache.get("a") is None
+    assert cache.get_many(["b", "c"]) == {"b": b"1234", "c": b"1234"}
+    assert cache.stats().bytes == 8
+
+    cache.delete("b")
+    assert cache.stats().bytes == 4
+
+
+def test_oversize_value_is_not_cached() -> None:
+    cache = TTLCache(max_size=100, max_bytes=10)
+    cache.set("a", b"1234")
+    cache.set("b", b"old")
+    cache.set("b", b"12345678901")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.stats().bytes == 4
+    assert cache.stats().evictions == 0
+
+
+def test_get_or_compute_single_flight() -> None:
+    cache = TTLCache()
+    calls = 0
+    release = threading.Event()
+
+    def compute() -> str:
+        nonlocal calls
+        calls += 1
+        release.wait(5)
+        return "value"
+
+    results: list[Any] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ["value"] * 5
+    assert calls == 1
+    assert cache.get_or_compute("k", compute) == "value"
+    assert calls == 1
+
+
+def test_delete_during_compute_drops_result() -> None:
+    cache = TTLCache()
+    started = threading.Event()
+    release = threading.Event()
+
+    def compute() -> str:
+        started.set()
+        release.wait(5)
+        return "stale"
+
+    results: list[Any] = []
+    thread = threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute)))
+    thread.start()
+    assert started.wait(5)
+
+    cache.delete("k")
+    assert cache.get_or_compute("k", lambda: "fresh") == "fresh"
+    release.set()
+    thread.join(5)
+
+    assert results == ["stale"]
+    assert cache.get("k") == "fresh"
+
+
+def test_get_or_compute_propagates_errors() -> None:
+    cache = TTLCache()
+
+    def failing() -> Any:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        cache.get_or_compute("k", failing)
+    assert cache.get_or_compute("k", lambda: 1) == 1
+
+
+def test_clear_resets_size() -> None:
+    cache = TTLCache(max_bytes=100)
+    cache.set("a", b"12", ttl=10)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.stats().bytes == 0
+    assert cache.prune_expired() == 0
@@ -338,3 +338,100 @@ def test_skill_context_cache_concurrent_access() -> None:
         assert len(errors) == 0
     finally:
         ctx.close()
+
+
+@pytest.mark.logic
+def test_cached_memoizes_and_reports_hit_ratio(skill_context: SkillContext) -> None:
+    """Test that cached() serves repeated calls from the context cache."""
+    calls: list[str] = []
+
+    @skill_context.cached(ttl=60)
+    def lookup(name: str, upper: bool = False) -> str:
+        calls.append(name)
+        return name.upper() if upper else name
+
+    assert lookup("a") == "a"
+    assert lookup("a") == "a"
+    assert lookup("a", upper=True) == "A"
+
+    assert calls == ["a", "a"]
+    assert lookup.cache_info() == {"hits": 1, "misses": 2, "hit_ratio": pytest.approx(1 / 3)}
+    assert skill_context.cached_function_stats()[lookup.namespace]["hits"] == 1
+
+
+@pytest.mark.logic
+def test_cached_topic_clears_namespace(skill_context: SkillContext) -> None:
+    """Test that a listed topic invalidates every cached result of the function."""
+    store = {"a": 1, "b": 2}
+
+    @skill_context.cached(invalidate_on=["item_changed"])
+    def get_item(name: str) -> int:
+        return store[name]
+
+    get_item("a")
+    get_item("b")
+    store.update(a=10, b=20)
+    assert get_item("a") == 1
+
+    skill_context.publish("item_changed", {})
+
+    assert (get_item("a"), get_item("b")) == (10, 20)
+
+
+@pytest.mark.logic
+def test_cached_topic_evicts_derived_key(skill_context: SkillContext) -> None:
+    """Test that a key function on a topic evicts only the affected entry."""
+    store = {1: "one", 2: "two"}
+
+    @skill_context.cached(
+        invalidate_on={"item_updated": lambda event: event["id"]},
+        key=lambda item_id: item_id,
+    )
+    def get_item(item_id: int) -> str:
+        return store[item_id]
+
+    get_item(1)
+    get_item(2)
+    store.update({1: "uno", 2: "dos"})
+
+    skill_context.publish("item_updated", {"id": 1})
+
+    assert (get_item(1), get_item(2)) == ("uno", "two")
+
+
+@pytest.mark.logic
+def test_cached_invalidation_during_compute(skill_context: SkillContext) -> None:
+    """Test that a result computed across an invalidation is not cached."""
+    import threading
+
+    store = {1: "one"}
+    started = threading.Event()
+    release = threading.Event()
+
+    @skill_context.cached(
+        invalidate_on={"item_updated": lambda event: event["id"]},
+        key=lambda item_id: item_id,
+    )
+    def get_item(item_id: int) -> str:
+        value = store[item_id]
+        started.set()
+        release.wait(5)
+        return value
+
+    reader = threading.Thread(target=get_item, args=(1,))
+    reader.start()
+    assert started.wait(5)
+
+    store[1] = "uno"
+    skill_context.publish("item_updated", {"id": 1})
+    release.set()
+    reader.join(5)
+
+    assert get_item(1) == "uno"
+
+
+@pytest.mark.logic
+def test_cached_rejects_non_positive_ttl(skill_context: SkillContext) -> None:
+    """Test that cached() validates its ttl."""
+    with pytest.raises(ValueError, match="ttl"):
+        skill_context.cached(ttl=0)
@@ -1,12 +1,15 @@
 """Unit tests for daemon RPC endpoints."""
 
 import sqlite3
+from collections.abc import Iterator
+from datetime import datetime
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
+from glorious_agents.core import serialization
 from glorious_agents.core.context import EventBus, SkillContext
 from glorious_agents.core.daemon_rpc import (
     RPCRequest,
@@ -22,6 +25,7 @@ from glorious_agents.core.daemon_rpc import (
     set_cache,
     verify_api_key,
 )
+from glorious_agents.core.rpc_cache import cacheable, reset_rpc_cache
 
 
 @pytest.fixture
@@ -142,6 +146,76 @@ class TestHealthCheck:
         assert response.status_code == 200
 
 
+# ============================================================================
+# Metrics Endpoint Tests
+# ============================================================================
+
+
+class TestMetrics:
+    """Test /metrics endpoint."""
+
+    def test_prometheus_format_by_default(self, client: TestClient) -> None:
+        """Metrics are exported as Prometheus text with per-route latency."""
+        client.get("/health")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE glorious_daemon_request_duration_seconds histogram" in response.text
+        assert (
+            'glorious_daemon_requests_total{route="/health",skill="",method="",status="200"}'
+            in (response.text)
+        )
+        assert "glorious_daemon_threadpool_threads" in response.text
+
+    def test_json_format(self, client: TestClient) -> None:
+        """?format=json returns the same metrics as JSON."""
+        response = client.get("/metrics", params={"format": "json"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["glorious_daemon_requests_in_flight"]["type"] == "gauge"
+        assert "glorious_eventbus_published_total" in data
+
+    def test_json_via_accept_header(self, client: TestClient) -> None:
+        response = client.get("/metrics", headers={"Accept": "application/json"})
+
+        assert response.headers["content-type"].startswith("application/json")
+
+    def test_rpc_latency_labelled_by_skill_and_method(self, client: TestClient) -> None:
+        """RPC calls are recorded per skill/method, including failures."""
+        with patch("glorious_agents.core.daemon_rpc.get_registry") as mock_get_registry:
+            mock_get_registry.return_value.get_manifest.return_value = None
+            client.post("/rpc/ghost/haunt", json={})
+
+        data = client.get("/metrics", params={"format": "json"}).json()
+        samples = data["glorious_daemon_request_duration_seconds"]["samples"]
+        rpc = [s for s in samples if s["labels"]["skill"] == "ghost"]
+        assert rpc[0]["labels"] == {
+            "route": "/rpc/{skill}/{method}",
+            "skill": "ghost",
+            "method": "haunt",
+        }
+        assert rpc[0]["count"] >= 1
+
+        totals = data["glorious_daemon_requests_total"]["samples"]
+        assert any(
+            s["labels"]["skill"] == "ghost" and s["labels"]["status"] == "404" for s in totals
+        )
+
+    def test_requires_api_key_when_configured(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("GLORIOUS_DAEMON_API_KEY", "secret")
+
+        from glorious_agents.config import reset_config
+
+        reset_config()
+
+        assert client.get("/metrics").status_code == 401
+
+
 # ============================================================================
 # Skills List Endpoint Tests
 # ============================================================================
@@ -1155,6 +1229,289 @@ class TestIntegration:
             assert "test_topic" in response.json()["topics"]
 
 
+# ============================================================================
+# RPC Response Cache Tests
+# ============================================================================
+
+
+class TestRPCResponseCache:
+    """Test read-through caching of @cacheable RPC methods."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self) -> Any:
+        reset_rpc_cache()
+        yield
+        reset_rpc_cache()
+
+    def _mock_skill(
+        self, mock_get_registry: MagicMock, mock_import: MagicMock, calls: list[str]
+    ) -> None:
+        mock_manifest = MagicMock()
+        mock_manifest.entry_point = "notes_skill:main"
+        mock_get_registry.return_value.get_manifest.return_value = mock_manifest
+
+        @cacheable(ttl=60, invalidate_on=["note_created"])
+        def search(query: str) -> list[str]:
+            calls.append(query)
+            return [query.upper()]
+
+        def uncached(query: str) -> str:
+            calls.append(query)
+            return query
+
+        mock_module = MagicMock()
+        mock_module.search = search
+        mock_module.uncached = uncached
+        mock_import.return_value = mock_module
+
+    def test_repeated_call_served_from_cache(
+        self, client: TestClient, mock_ctx: SkillContext
+    ) -> None:
+        calls: list[str] = []
+        with (
+            patch("glorious_agents.core.daemon_rpc.get_registry") as mock_get_registry,
+            patch("glorious_agents.core.daemon_rpc.importlib.import_module") as mock_import,
+            patch("glorious_agents.core.daemon_rpc.get_ctx", return_value=mock_ctx),
+        ):
+            self._mock_skill(mock_get_registry, mock_import, calls)
+
+            first = client.post("/rpc/notes/search", json={"params": {"query": "db"}})
+            second = client.post("/rpc/notes/search", json={"params": {"query": "db"}})
+
+        assert first.headers["X-Cache"] == "miss"
+        assert second.headers["X-Cache"] == "hit"
+        assert second.json()["result"] == ["DB"]
+        assert calls == ["db"]
+
+    def test_event_invalidates(self, client: TestClient, mock_ctx: SkillContext) -> None:
+        calls: list[str] = []
+        with (
+            patch("glorious_agents.core.daemon_rpc.get_registry") as mock_get_registry,
+            patch("glorious_agents.core.daemon_rpc.importlib.import_module") as mock_import,
+            patch("glorious_agents.core.daemon_rpc.get_ctx", return_value=mock_ctx),
+        ):
+            self._mock_skill(mock_get_registry, mock_import, calls)
+
+            client.post("/rpc/notes/search", json={"params": {"query": "db"}})
+            client.post("/events/note_created", json={"id": 7})
+            response = client.post("/rpc/notes/search", json={"params": {"query": "db"}})
+
+        assert response.headers["X-Cache"] == "miss"
+        assert calls == ["db", "db"]
+
+    def test_uncached_method_always_runs(self, client: TestClient, mock_ctx: SkillContext) -> None:
+        calls: list[str] = []
+        with (
+            patch("glorious_agents.core.daemon_rpc.get_registry") as mock_get_registry,
+            patch("glorious_agents.core.daemon_rpc.importlib.import_module") as mock_import,
+            patch("glorious_agents.core.daemon_rpc.get_ctx", return_value=mock_ctx),
+        ):
+            self._mock_skill(mock_get_registry, mock_import, calls)
+
+            client.post("/rpc/notes/uncached", json={"params": {"query": "db"}})
+            response = client.post("/rpc/notes/uncached", json={"params": {"query": "db"}})
+
+        assert "X-Cache" not in response.headers
+        assert calls == ["db", "db"]
+
+    def test_hit_rate_in_metrics(self, client: TestClient, mock_ctx: SkillContext) -> None:
+        calls: list[str] = []
+        with (
+            patch("glorious_agents.core.daemon_rpc.get_registry") as mock_get_registry,
+            patch("glorious_agents.core.daemon_rpc.importlib.import_module") as mock_import,
+            patch("glorious_agents.core.daemon_rpc.get_ctx", return_value=mock_ctx),
+        ):
+            self._mock_skill(mock_get_registry, mock_import, calls)
+            client.post("/rpc/notes/search", json={"params": {"query": "db"}})
+            client.post("/rpc/notes/search", json={"params": {"query": "db"}})
+
+        text = client.get("/metrics").text
+
+        assert (
+            'glorious_daemon_rpc_cache_requests_total{skill="notes",method="search",result="hit"}'
+        ) in text
+
+
+# ============================================================================
+# Content Negotiation Tests
+# ============================================================================
+
+
+@pytest.mark.skipif(not serialization.MSGPACK_AVAILABLE, reason="msgpack not installed")
+class TestContentNegotiation:
+    """Test msgpack/JSON negotiation on /rpc and /events."""
+
+    def _mock_skill(self, mock_get_registry: MagicMock, mock_import: MagicMock) -> None:
+        mock_manifest = MagicMock()
+        mock_manifest.entry_point = "test_skill:main"
+        mock_get_registry.return_value.get_manifest.return_value = mock_manifest
+
+        def echo(blob: bytes, when: str) -> dict[str, Any]:
+            return {"blob": blob, "when": datetime.fromisoformat(when)}
+
+        mock_module = MagicMock()
+        mock_module.echo = echo
+        mock_import.return_value = mock_module
+
+    def test_rpc_msgpack_request_and_response(self, client: TestClient) -> None:
+        """Msgpack bodies are decoded and bytes come back natively."""
+        with (
+            patch("glorious_agents.core.daemon_rpc.get_registry") as mock_get_registry,
+            patch("glorious_agents.core.daemon_rpc.importlib.import_module") as mock_import,
+        ):
+            self._mock_skill(mock_get_registry, mock_import)
+
+            response = client.post(
+                "/rpc/test_skill/echo",
+                content=serialization.encode(
+                    {"params": {"blob": b"\x00\xff", "when": "2025-01-01T00:00:00"}},
+                    serialization.MSGPACK_CONTENT_TYPE,
+                ),
+                headers={
+                    "Content-Type": serialization.MSGPACK_CONTENT_TYPE,
+                    "Accept": serialization.MSGPACK_CONTENT_TYPE,
+                },
+            )
+
+            assert response.status_code == 200
+            assert response.headers["content-type"] == serialization.MSGPACK_CONTENT_TYPE
+            data = serialization.decode(response.content, serialization.MSGPACK_CONTENT_TYPE)
+            assert data["result"]["blob"] == b"\x00\xff"
+            assert data["result"]["when"] == "2025-01-01T00:00:00"
+
+    def test_rpc_json_response_encodes_datetime(self, client: TestClient) -> None:
+        """Non-JSON result types are still serialized for JSON clients."""
+        with (
+            patch("glorious_agents.core.daemon_rpc.get_registry") as mock_get_registry,
+            patch("glorious_agents.core.daemon_rpc.importlib.import_module") as mock_import,
+        ):
+            self._mock_skill(mock_get_registry, mock_import)
+
+            response = client.post(
+                "/rpc/test_skill/echo",
+                json={"params": {"blob": "text", "when": "2025-01-01T00:00:00"}},
+            )
+
+            assert response.status_code == 200
+            assert response.json()["result"]["when"] == "2025-01-01T00:00:00"
+
+    def test_publish_event_msgpack(self, client: TestClient) -> None:
+        """Events can be published with a msgpack body."""
+        with patch("glorious_agents.core.daemon_rpc.get_ctx") as mock_get_ctx:
+            mock_ctx = MagicMock()
+            mock_get_ctx.return_value = mock_ctx
+
+            response = client.post(
+                "/events/test_topic",
+                content=serialization.encode({"raw": b"\x01"}, serialization.MSGPACK_CONTENT_TYPE),
+                headers={"Content-Type": serialization.MSGPACK_CONTENT_TYPE},
+            )
+
+            assert response.status_code == 200
+            assert response.json()["status"] == "published"
+            mock_ctx.publish.assert_called_once_with("test_topic", {"raw": b"\x01"})
+
+    def test_unsupported_content_type(self, client: TestClient) -> None:
+        """Unknown request encodings are rejected with 415."""
+        response = client.post(
+            "/events/test_topic",
+            content=b"<event/>",
+            headers={"Content-Type": "application/xml"},
+        )
+
+        assert response.status_code == 415
+
+    def test_malformed_body(self, client: TestClient) -> None:
+        """Malformed bodies are rejected with 400."""
+        response = client.post(
+            "/rpc/test_skill/echo",
+            content=b"{not json",
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 400
+
+
+# ============================================================================
+# CLI Forwarding Tests
+# ============================================================================
+
+
+class TestCLIForwarding:
+    """Test /cli endpoint for forwarded 'agent' commands."""
+
+    @pytest.fixture
+    def cli_app(self) -> Iterator[Any]:
+        import typer
+
+        app = typer.Typer()
+
+        @app.command()
+        def hello(name: str) -> None:
+            typer.echo(f"hi {name}")
+
+        @app.command()
+        def other() -> None:
+            pass
+
+        daemon_app.state.cli_app = app
+        yield app
+        del daemon_app.state.cli_app
+
+    def test_runs_command(self, client: TestClient, cli_app: Any) -> None:
+        """Forwarded commands run in the daemon and return captured output."""
+        from pathlib import Path
+
+        response = client.post("/cli", json={"argv": ["hello", "bob"], "cwd": str(Path.cwd())})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["forwarded"] is True
+        assert data["exit_code"] == 0
+        assert data["stdout"] == "hi bob\n"
+
+    def test_other_cwd_declined(self, client: TestClient, cli_app: Any, tmp_path: Any) -> None:
+        """Commands from another working directory are declined."""
+        response = client.post("/cli", json={"argv": ["hello", "bob"], "cwd": str(tmp_path)})
+
+        assert response.status_code == 200
+        assert response.json()["forwarded"] is False
+
+    def test_startup_builds_cli_app_without_reloading_skills(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The daemon mounts the skills it loaded itself; forwarded commands never load skills."""
+        import glorious_agents.cli as cli_module
+
+        monkeypatch.setattr(cli_module, "_skills_mounted", False)
+        with (
+            patch("glorious_agents.core.daemon_rpc.load_all_skills") as daemon_load,
+            patch("glorious_agents.core.daemon_rpc.find_maintenance_jobs", return_value=[]),
+            patch("glorious_agents.cli.load_all_skills") as cli_load,
+            TestClient(daemon_app),
+        ):
+            assert daemon_app.state.cli_app is cli_module.app
+
+        daemon_load.assert_called_once_with()
+        cli_load.assert_not_called()
+        del daemon_app.state.cli_app
+
+    def test_declined_before_startup(self, client: TestClient) -> None:
+        """Without the CLI app built at startup, commands run in the client."""
+        from pathlib import Path
+
+        response = client.post("/cli", json={"argv": ["hello", "bob"], "cwd": str(Path.cwd())})
+
+        assert response.status_code == 200
+        assert response.json()["forwarded"] is False
+
+    def test_invalid_request(self, client: TestClient) -> None:
+        """argv must be a list of strings."""
+        response = client.post("/cli", json={"argv": "hello"})
+
+        assert response.status_code == 422
+
+
 # ============================================================================
 # Model Tests
 # ============================================================================
@@ -0,0 +1,146 @@
+"""Tests for batched event delivery."""
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from glorious_agents.core.context import ErrorHandlingMode, EventBus
+from glorious_agents.core.event_dispatch import DispatchMode
+
+
+def test_flushes_when_batch_full() -> None:
+    bus = EventBus()
+    batches: list[list[int]] = []
+    bus.subscribe_batch(
+        "telemetry", lambda batch: batches.append([e["n"] for e in batch]), 3, 60_000
+    )
+
+    for n in range(7):
+        bus.publish("telemetry", {"n": n})
+
+    assert batches == [[0, 1, 2], [3, 4, 5]]
+    bus.close()
+    assert batches[-1] == [6]
+
+
+def test_flushes_after_delay() -> None:
+    bus = EventBus()
+    delivered = threading.Event()
+    batches: list[list[dict[str, Any]]] = []
+
+    def handler(batch: list[dict[str, Any]]) -> None:
+        batches.append(batch)
+        delivered.set()
+
+    bus.subscribe_batch("telemetry", handler, max_items=100, max_delay_ms=20)
+    bus.publish("telemetry", {"n": 1})
+    bus.publish("telemetry", {"n": 2})
+
+    assert delivered.wait(5)
+    assert batches == [[{"n": 1}, {"n": 2}]]
+    bus.close()
+
+
+def test_coalesces_by_key() -> None:
+    """Only the latest update per key survives, in order of latest update."""
+    bus = EventBus()
+    batches: list[list[dict[str, Any]]] = []
+    bus.subscribe_batch(
+        "issue_updated", batches.append, max_items=100, max_delay_ms=60_000, key="id"
+    )
+
+    bus.publish("issue_updated", {"id": "a", "status": "open"})
+    bus.publish("issue_updated", {"id": "b", "status": "open"})
+    bus.publish("issue_updated", {"id": "a", "status": "closed"})
+    bus.publish("issue_updated", {"status": "keyless"})
+    bus.publish("issue_updated", {"status": "keyless"})
+    bus.drain()
+
+    assert batches == [
+        [
+            {"id": "b", "status": "open"},
+            {"id": "a", "status": "closed"},
+            {"status": "keyless"},
+            {"status": "keyless"},
+        ]
+    ]
+    bus.close()
+
+
+def test_key_function() -> None:
+    bus = EventBus()
+    batches: list[list[dict[str, Any]]] = []
+    bus.subscribe_batch(
+        "note_updated", batches.append, max_items=2, key=lambda data: data["id"] % 2
+    )
+
+    for n in range(4):
+        bus.publish("note_updated", {"id": n})
+
+    assert batches == [[{"id": 0}, {"id": 1}], [{"id": 2}, {"id": 3}]]
+    bus.close()
+
+
+def test_works_with_async_dispatch_and_wildcards() -> None:
+    bus = EventBus(dispatch_mode=DispatchMode.ASYNC)
+    seen: list[int] = []
+    bus.subscribe_batch("issue.*", lambda batch: seen.extend(e["n"] for e in batch), 10, 60_000)
+
+    for n in range(25):
+        bus.publish("issue.updated", {"n": n})
+    assert bus.drain(timeout=5)
+
+    assert seen == list(range(25))
+    bus.close()
+
+
+def test_unsubscribe_flushes_pending() -> None:
+    bus = EventBus()
+    batches: list[list[dict[str, Any]]] = []
+    subscription = bus.subscribe_batch("topic", batches.append, max_items=10, max_delay_ms=60_000)
+    bus.publish("topic", {"n": 1})
+
+    assert bus.unsubscribe("topic", subscription) is True
+    bus.publish("topic", {"n": 2})
+
+    assert batches == [[{"n": 1}]]
+    bus.close()
+
+
+def test_handler_errors_follow_error_mode() -> None:
+    bus = EventBus(error_mode=ErrorHandlingMode.COLLECT)
+
+    def failing(batch: list[dict[str, Any]]) -> None:
+        raise ValueError(len(batch))
+
+    bus.subscribe_batch("topic", failing, max_items=2)
+    bus.publish("topic", {})
+    bus.publish("topic", {})
+
+    assert [str(e) for _, e in bus.get_last_errors()] == ["2"]
+    bus.close()
+
+
+def test_invalid_arguments() -> None:
+    bus = EventBus()
+    with pytest.raises(ValueError, match="max_items"):
+        bus.subscribe_batch("topic", lambda batch: None, max_items=0)
+    with pytest.raises(ValueError, match="max_delay_ms"):
+        bus.subscribe_batch("topic", lambda batch: None, max_delay_ms=-1)
+    bus.close()
+
+
+def test_delayed_flush_does_not_run_twice() -> None:
+    """A timer for a batch that was already flushed by size does nothing."""
+    bus = EventBus()
+    batches: list[list[dict[str, Any]]] = []
+    bus.subscribe_batch("topic", batches.append, max_items=2, max_delay_ms=10)
+
+    bus.publish("topic", {"n": 1})
+    bus.publish("topic", {"n": 2})
+    time.sleep(0.05)
+
+    assert batches == [[{"n": 1}, {"n": 2}]]
+    bus.close()
@@ -0,0 +1,232 @@
+"""Tests for asynchronous event bus dispatch."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from glorious_agents.core.context import ErrorHandlingMode, EventBus
+from glorious_agents.core.event_dispatch import DispatchMode, OverflowPolicy
+from glorious_agents.core.metrics import EVENTS_DROPPED
+
+
+def _async_bus(**kwargs: Any) -> EventBus:
+    return EventBus(dispatch_mode=DispatchMode.ASYNC, **kwargs)
+
+
+def test_publish_returns_before_handler_runs() -> None:
+    """Publishing does not wait for slow handlers."""
+    bus = _async_bus()
+    release = threading.Event()
+    received: list[dict[str, Any]] = []
+
+    def slow(data: dict[str, Any]) -> None:
+        release.wait(5)
+        received.append(data)
+
+    bus.subscribe("topic", slow)
+    start = time.perf_counter()
+    bus.publish("topic", {"n": 1})
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    assert received == []
+    release.set()
+    assert bus.drain(timeout=5)
+    assert received == [{"n": 1}]
+    bus.close()
+
+
+def test_handlers_run_on_worker_thread() -> None:
+    bus = _async_bus()
+    threads: list[str] = []
+    bus.subscribe("topic", lambda data: threads.append(threading.current_thread().name))
+
+    bus.publish("topic", {})
+    bus.drain(timeout=5)
+    bus.close()
+
+    assert threads[0].startswith("eventbus-worker")
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_per_topic_order_preserved(workers: int) -> None:
+    bus = _async_bus(workers=workers, queue_size=8)
+    seen: dict[str, list[int]] = {"a": [], "b": [], "c": []}
+    for topic in seen:
+        bus.subscribe(topic, lambda data, topic=topic: seen[topic].append(data["n"]))
+
+    for n in range(200):
+        for topic in seen:
+            bus.publish(topic, {"n": n})
+    assert bus.drain(timeout=10)
+    bus.close()
+
+    assert all(values == list(range(200)) for values in seen.values())
+
+
+def test_block_policy_waits_for_room() -> None:
+    bus = _async_bus(queue_size=1, overflow=OverflowPolicy.BLOCK)
+    release = threading.Event()
+    received: list[int] = []
+
+    def handler(data: dict[str, Any]) -> None:
+        release.wait(5)
+        received.append(data["n"])
+
+    bus.subscribe("topic", handler)
+    bus.publish("topic", {"n": 0})  # picked up by the worker, which then waits
+    time.sleep(0.05)
+    bus.publish("topic", {"n": 1})  # fills the queue
+
+    publisher = threading.Thread(target=bus.publish, args=("topic", {"n": 2}))
+    publisher.start()
+    publisher.join(0.1)
+    assert publisher.is_alive()
+
+    release.set()
+    publisher.join(5)
+    assert bus.drain(timeout=5)
+    bus.close()
+    assert received == [0, 1, 2]
+
+
+def test_drop_oldest_policy() -> None:
+    bus = _async_bus(queue_size=2, overflow=OverflowPolicy.DROP_OLDEST)
+    release = threading.Event()
+    received: list[int] = []
+
+    def handler(data: dict[str, Any]) -> None:
+        release.wait(5)
+        received.append(data["n"])
+
+    bus.subscribe("drops", handler)
+    before = EVENTS_DROPPED.labels("drops").value()
+    bus.publish("drops", {"n": 0})
+    time.sleep(0.05)
+    for n in range(1, 5):
+        bus.publish("drops", {"n": n})
+
+    release.set()
+    assert bus.drain(timeout=5)
+    bus.close()
+
+    assert received == [0, 3, 4]
+    assert EVENTS_DROPPED.labels("drops").value() == before + 2
+
+
+def test_spill_policy_keeps_every_event_in_order(tmp_path: Path) -> None:
+    bus = _async_bus(queue_size=2, overflow=OverflowPolicy.SPILL, spill_dir=tmp_path)
+    release = threading.Event()
+    received: list[int] = []
+
+    def handler(data: dict[str, Any]) -> None:
+        release.wait(5)
+        received.append(data["n"])
+
+    bus.subscribe("topic", handler)
+    for n in range(50):
+        bus.publish("topic", {"n": n})
+
+    assert list(tmp_path.glob("eventbus-*/*.spill"))
+    release.set()
+    assert bus.drain(timeout=5)
+    bus.close()
+
+    assert received == list(range(50))
+    assert not list(tmp_path.iterdir())
+
+
+def test_close_timeout_keeps_spill_until_worker_finishes(tmp_path: Path) -> None:
+    """A worker still busy after close keeps its spill file and delivers every event."""
+    bus = _async_bus(queue_size=2, overflow=OverflowPolicy.SPILL, spill_dir=tmp_path)
+    release = threading.Event()
+    received: list[int] = []
+
+    def handler(data: dict[str, Any]) -> None:
+        release.wait(5)
+        received.append(data["n"])
+
+    bus.subscribe("topic", handler)
+    for n in range(20):
+        bus.publish("topic", {"n": n})
+
+    bus.close(timeout=0.1)
+    assert list(tmp_path.glob("eventbus-*/*.spill"))
+
+    release.set()
+    assert bus.drain(timeout=5)
+    assert received == list(range(20))
+
+
+def test_handler_can_publish_to_full_queue() -> None:
+    """Handlers publishing follow-up events never deadlock on their own queue."""
+    bus = _async_bus(queue_size=1)
+    received: list[str] = []
+
+    def fan_out(data: dict[str, Any]) -> None:
+        for n in range(5):
+            bus.publish("follow_up", {"n": n})
+
+    bus.subscribe("start", fan_out)
+    bus.subscribe("follow_up", lambda data: received.append(data["n"]))
+
+    bus.publish("start", {})
+    assert bus.drain(timeout=5)
+    bus.close()
+
+    assert received == [0, 1, 2, 3, 4]
+
+
+def test_collect_errors_accumulate() -> None:
+    bus = _async_bus(error_mode=ErrorHandlingMode.COLLECT)
+
+    def failing(data: dict[str, Any]) -> None:
+        raise ValueError(data["n"])
+
+    bus.subscribe("topic", failing)
+    bus.publish("topic", {"n": 1})
+    bus.publish("topic", {"n": 2})
+    bus.drain(timeout=5)
+    bus.close()
+
+    assert [str(e) for _, e in bus.get_last_errors()] == ["1", "2"]
+
+
+def test_fail_fast_requires_sync() -> None:
+    with pytest.raises(ValueError, match="FAIL_FAST"):
+        _async_bus(error_mode=ErrorHandlingMode.FAIL_FAST)
+
+
+def test_close_delivers_pending_then_falls_back_to_sync() -> None:
+    bus = _async_bus()
+    received: list[tuple[int, str]] = []
+    bus.subscribe(
+        "topic", lambda data: received.append((data["n"], threading.current_thread().name))
+    )
+
+    bus.publish("topic", {"n": 1})
+    bus.close(timeout=5)
+    bus.publish("topic", {"n": 2})
+
+    assert [n for n, _ in received] == [1, 2]
+    assert received[1][1] == threading.current_thread().name
+
+
+def test_sync_bus_drain_is_noop() -> None:
+    bus = EventBus()
+    assert bus.drain() is True
+    bus.close()
+
+
+def test_drain_from_handler_rejected() -> None:
+    bus = _async_bus(error_mode=ErrorHandlingMode.COLLECT)
+    bus.subscribe("topic", lambda data: bus.drain())
+
+    bus.publish("topic", {})
+    bus.drain(timeout=5)
+    bus.close()
+
+    assert isinstance(bus.get_last_errors()[0][1], RuntimeError)
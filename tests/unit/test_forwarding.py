@@ -0,0 +1,222 @@
+"""Unit tests for forwarding CLI invocations to a running daemon."""
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+import typer
+
+from glorious_agents.core.daemon.cli_runner import run_cli
+from glorious_agents.core.daemon.ipc import IPCServer, supports_unix_sockets
+from glorious_agents.forwarding import (
+    AGENT_DAEMON_INFO_FILE,
+    DaemonEndpoint,
+    agent_daemon_endpoint,
+    forward,
+    ipc_endpoint,
+    should_forward,
+)
+
+cli_app = typer.Typer()
+
+
+@cli_app.command()
+def echo(text: str) -> None:
+    typer.echo(text)
+
+
+@cli_app.command()
+def fail() -> None:
+    typer.echo("bad input", err=True)
+    raise typer.Exit(4)
+
+
+def _cli_handler(request: dict[str, Any]) -> dict[str, Any]:
+    return run_cli(cli_app, request["argv"], request.get("cwd"))
+
+
+@pytest.fixture
+def short_dir() -> Generator[Path]:
+    """Temporary directory with a path short enough for AF_UNIX sockets."""
+    with tempfile.TemporaryDirectory(prefix="fwd") as tmp:
+        yield Path(tmp)
+
+
+@pytest.fixture
+def serve() -> Generator[Callable[..., Path]]:
+    """Start an IPC server on a background event loop."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    servers: list[IPCServer] = []
+
+    def start(
+        socket_path: Path,
+        handler: Callable[[dict[str, Any]], dict[str, Any]] = _cli_handler,
+        transport: str = "tcp",
+    ) -> Path:
+        server = IPCServer(socket_path, handler, transport=transport)  # type: ignore[arg-type]
+        asyncio.run_coroutine_threadsafe(server.start(), loop).result(timeout=5)
+        servers.append(server)
+        return socket_path
+
+    yield start
+
+    for server in servers:
+        asyncio.run_coroutine_threadsafe(server.stop(), loop).result(timeout=5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    loop.close()
+
+
+def _write_pid(path: Path, pid: int | None = None) -> Path:
+    path.write_text(str(pid if pid is not None else os.getpid()))
+    return path
+
+
+class TestShouldForward:
+    """Test which invocations are eligible for forwarding."""
+
+    def test_regular_command(self):
+        assert should_forward(["notes", "list"]) is True
+
+    def test_no_arguments(self):
+        assert should_forward([]) is False
+
+    def test_local_command(self):
+        assert should_forward(["daemon", "--port", "1"], frozenset({"daemon"})) is False
+
+    def test_prompting_command(self):
+        assert should_forward(["template-delete", "bug"]) is False
+        assert should_forward(["issues", "template-delete", "bug"]) is False
+        assert should_forward(["template-delete", "bug", "--force"]) is True
+
+    def test_stdin_argument(self):
+        assert should_forward(["import", "-"]) is False
+
+    def test_disabled_by_env(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("GLORIOUS_FORWARD", "0")
+        assert should_forward(["notes", "list"]) is False
+
+
+class TestEndpointDiscovery:
+    """Test locating running daemons from their files."""
+
+    def test_ipc_endpoint_tcp(self, short_dir: Path):
+        pid_path = _write_pid(short_dir / "daemon.pid")
+        (short_dir / "daemon.port").write_text("4321")
+
+        endpoint = ipc_endpoint(pid_path, short_dir / "daemon.port")
+
+        assert endpoint is not None
+        assert endpoint.port == 4321
+        assert endpoint.unix_socket is None
+        assert endpoint.body == {"method": "cli"}
+
+    def test_ipc_endpoint_missing_files(self, short_dir: Path):
+        assert ipc_endpoint(short_dir / "daemon.pid", short_dir / "daemon.port") is None
+
+    @pytest.mark.skipif(os.name == "nt", reason="PID liveness not checked on Windows")
+    def test_ipc_endpoint_dead_process(self, short_dir: Path):
+        pid_path = _write_pid(short_dir / "daemon.pid", pid=2**22 + 12345)
+        (short_dir / "daemon.port").write_text("4321")
+
+        assert ipc_endpoint(pid_path, short_dir / "daemon.port") is None
+
+    def test_agent_daemon_endpoint(self, short_dir: Path):
+        info = {"pid": os.getpid(), "host": "0.0.0.0", "port": 8765}
+        (short_dir / AGENT_DAEMON_INFO_FILE).write_text(json.dumps(info))
+
+        endpoint = agent_daemon_endpoint(short_dir, api_key="secret")
+
+        assert endpoint == DaemonEndpoint(
+            "/cli", host="127.0.0.1", port=8765, headers={"X-API-Key": "secret"}
+        )
+
+    def test_agent_daemon_endpoint_uds(self, short_dir: Path):
+        info = {"pid": os.getpid(), "uds": "/tmp/agent.sock"}
+        (short_dir / AGENT_DAEMON_INFO_FILE).write_text(json.dumps(info))
+
+        endpoint = agent_daemon_endpoint(short_dir)
+
+        assert endpoint is not None
+        assert endpoint.unix_socket == "/tmp/agent.sock"
+
+    def test_agent_daemon_endpoint_corrupt(self, short_dir: Path):
+        (short_dir / AGENT_DAEMON_INFO_FILE).write_text("{not json")
+
+        assert agent_daemon_endpoint(short_dir) is None
+
+
+class TestForward:
+    """Test forwarding round trips against a live IPC server."""
+
+    def test_forward_tcp(self, short_dir: Path, serve: Callable[..., Path], capsys):
+        socket_path = serve(short_dir / "daemon.port")
+        endpoint = ipc_endpoint(_write_pid(short_dir / "daemon.pid"), socket_path)
+        assert endpoint is not None
+
+        exit_code = forward(endpoint, ["echo", "hello"])
+
+        assert exit_code == 0
+        assert capsys.readouterr().out == "hello\n"
+
+    @pytest.mark.skipif(not supports_unix_sockets(), reason="Unix sockets not supported")
+    def test_forward_unix(self, short_dir: Path, serve: Callable[..., Path], capsys):
+        socket_path = serve(short_dir / "daemon.sock", transport="unix")
+        endpoint = ipc_endpoint(_write_pid(short_dir / "daemon.pid"), socket_path)
+        assert endpoint is not None
+        assert endpoint.unix_socket is not None
+
+        exit_code = forward(endpoint, ["echo", "hello"])
+
+        assert exit_code == 0
+        assert capsys.readouterr().out == "hello\n"
+
+    def test_forward_exit_code_and_stderr(
+        self, short_dir: Path, serve: Callable[..., Path], capsys
+    ):
+        socket_path = serve(short_dir / "daemon.port")
+        endpoint = ipc_endpoint(_write_pid(short_dir / "daemon.pid"), socket_path)
+        assert endpoint is not None
+
+        exit_code = forward(endpoint, ["fail"])
+
+        assert exit_code == 4
+        assert capsys.readouterr().err == "bad input\n"
+
+    def test_declined_falls_back(self, short_dir: Path, serve: Callable[..., Path]):
+        """A daemon that does not accept CLI commands makes the client run locally."""
+        socket_path = serve(
+            short_dir / "daemon.port",
+            handler=lambda request: {"forwarded": False, "reason": "unsupported"},
+        )
+        endpoint = ipc_endpoint(_write_pid(short_dir / "daemon.pid"), socket_path)
+        assert endpoint is not None
+
+        assert forward(endpoint, ["echo", "hello"]) is None
+
+    def test_unreachable_falls_back(self):
+        """A stale endpoint (nothing listening) makes the client run locally."""
+        endpoint = DaemonEndpoint("/", port=1)
+
+        assert forward(endpoint, ["echo", "hello"]) is None
+
+    def test_server_error_not_rerun(self, short_dir: Path, serve: Callable[..., Path], capsys):
+        """Failures after delivery are reported rather than falling back."""
+
+        def broken(request: dict[str, Any]) -> dict[str, Any]:
+            raise RuntimeError("daemon exploded")
+
+        socket_path = serve(short_dir / "daemon.port", handler=broken)
+        endpoint = ipc_endpoint(_write_pid(short_dir / "daemon.pid"), socket_path)
+        assert endpoint is not None
+
+        assert forward(endpoint, ["echo", "hello"]) == 1
+        assert "daemon exploded" in capsys.readouterr().err
@@ -0,0 +1,61 @@
+"""Unit tests for skill maintenance jobs."""
+
+import sys
+import types
+from collections.abc import Iterator
+
+import pytest
+
+from glorious_agents.core.maintenance import (
+    MaintenanceJob,
+    find_maintenance_jobs,
+    get_maintenance_interval,
+    maintenance,
+)
+from glorious_agents.core.registry import SkillManifest, get_registry
+
+
+@pytest.fixture
+def skill_module() -> Iterator[types.ModuleType]:
+    """Register a skill whose module defines one maintenance job."""
+    module = types.ModuleType("fake_maintenance_skill")
+
+    def prune() -> int:
+        return 0
+
+    prune.__module__ = module.__name__
+    module.prune = maintenance(interval=60)(prune)  # type: ignore[attr-defined]
+    # Imported from elsewhere, so not a job of this skill
+    module.imported = maintenance(interval=5)(lambda: None)  # type: ignore[attr-defined]
+    sys.modules[module.__name__] = module
+
+    registry = get_registry()
+    manifest = SkillManifest(
+        name="fake",
+        version="0.1.0",
+        description="Fake skill",
+        entry_point="fake_maintenance_skill:app",
+        origin="local",
+    )
+    registry.add(manifest, None)
+    yield module
+    registry.clear()
+    del sys.modules[module.__name__]
+
+
+def test_interval_recorded() -> None:
+    @maintenance(interval=30)
+    def job() -> None:
+        pass
+
+    assert get_maintenance_interval(job) == 30
+    assert get_maintenance_interval(lambda: None) is None
+
+
+def test_rejects_non_positive_interval() -> None:
+    with pytest.raises(ValueError, match="interval"):
+        maintenance(interval=0)
+
+
+def test_find_jobs_of_registered_skills(skill_module: types.ModuleType) -> None:
+    assert find_maintenance_jobs() == [MaintenanceJob("fake", "prune", 60, skill_module.prune)]
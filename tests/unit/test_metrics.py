@@ -0,0 +1,166 @@
+"""Unit tests for the metrics registry."""
+
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from glorious_agents.core.metrics import (
+    SQLITE_BUSY,
+    MetricsRegistry,
+    get_metrics,
+    process_rss_bytes,
+    track_sqlite_busy,
+)
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+class TestCounters:
+    """Test counters and gauges."""
+
+    def test_counter_labels(self, registry: MetricsRegistry):
+        counter = registry.counter("calls_total", "Calls", ["skill"])
+
+        counter.labels("notes").inc()
+        counter.labels("notes").inc(2)
+        counter.labels("cache").inc()
+
+        assert counter.labels("notes").value() == 3
+        assert counter.labels("cache").value() == 1
+
+    def test_wrong_label_count(self, registry: MetricsRegistry):
+        counter = registry.counter("calls_total", "Calls", ["skill"])
+
+        with pytest.raises(ValueError, match="expects labels"):
+            counter.labels("a", "b")
+
+    def test_unlabelled_requires_no_labels(self, registry: MetricsRegistry):
+        counter = registry.counter("calls_total", "Calls", ["skill"])
+
+        with pytest.raises(ValueError, match="requires labels"):
+            counter.inc()
+
+    def test_counts_from_many_threads(self, registry: MetricsRegistry):
+        """Per-thread shards add up without losing increments."""
+        counter = registry.counter("hits_total", "Hits")
+
+        def work() -> None:
+            for _ in range(10_000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert counter.labels().value() == 80_000
+
+    def test_gauge_inc_dec_across_threads(self, registry: MetricsRegistry):
+        gauge = registry.gauge("in_flight", "In flight")
+        gauge.inc()
+        gauge.inc()
+
+        thread = threading.Thread(target=gauge.dec)
+        thread.start()
+        thread.join()
+
+        assert gauge.labels().value() == 1
+
+    def test_reregistering_returns_same_metric(self, registry: MetricsRegistry):
+        first = registry.counter("calls_total", "Calls", ["skill"])
+
+        assert registry.counter("calls_total", "Calls", ["skill"]) is first
+        with pytest.raises(ValueError, match="registered differently"):
+            registry.gauge("calls_total", "Calls", ["skill"])
+
+
+class TestHistogram:
+    """Test histograms."""
+
+    def test_cumulative_buckets(self, registry: MetricsRegistry):
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=[0.1, 1.0])
+
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        snapshot = histogram.labels().snapshot()
+        assert snapshot["buckets"] == {"0.1": 2, "1": 3, "+Inf": 4}
+        assert snapshot["count"] == 4
+        assert snapshot["sum"] == pytest.approx(2.65)
+
+
+class TestExport:
+    """Test JSON and Prometheus export."""
+
+    def test_snapshot(self, registry: MetricsRegistry):
+        registry.counter("calls_total", "Calls", ["skill"]).labels("notes").inc()
+
+        snapshot = registry.snapshot()
+
+        assert snapshot["calls_total"] == {
+            "type": "counter",
+            "help": "Calls",
+            "samples": [{"labels": {"skill": "notes"}, "value": 1}],
+        }
+
+    def test_prometheus_text(self, registry: MetricsRegistry):
+        registry.counter("calls_total", "Calls", ["skill"]).labels('no"tes').inc()
+        registry.histogram("latency_seconds", "Latency", ["skill"], buckets=[0.5]).labels(
+            "notes"
+        ).observe(0.25)
+
+        text = registry.render_prometheus()
+
+        assert "# TYPE calls_total counter" in text
+        assert 'calls_total{skill="no\\"tes"} 1' in text
+        assert "# TYPE latency_seconds histogram" in text
+        assert 'latency_seconds_bucket{skill="notes",le="0.5"} 1' in text
+        assert 'latency_seconds_bucket{skill="notes",le="+Inf"} 1' in text
+        assert 'latency_seconds_sum{skill="notes"} 0.25' in text
+        assert 'latency_seconds_count{skill="notes"} 1' in text
+
+    def test_collectors(self, registry: MetricsRegistry):
+        registry.register_collector("queue_depth", "Queued", lambda: [({"pool": "io"}, 3.0)])
+
+        assert 'queue_depth{pool="io"} 3' in registry.render_prometheus()
+
+        registry.unregister_collector("queue_depth")
+        assert "queue_depth" not in registry.snapshot()
+
+    def test_failing_collector_skipped(self, registry: MetricsRegistry):
+        def broken() -> list[tuple[dict[str, str], float]]:
+            raise RuntimeError("no stats")
+
+        registry.register_collector("broken", "Broken", broken)
+
+        assert "broken" not in registry.snapshot()
+
+
+class TestBuiltinMetrics:
+    """Test process-wide metrics."""
+
+    def test_rss_reported(self):
+        assert "glorious_process_resident_memory_bytes" in get_metrics().snapshot()
+        rss = process_rss_bytes()
+        assert rss is None or rss > 0
+
+    def test_sqlite_busy_counted(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'busy.db'}", connect_args={"timeout": 0.01})
+        track_sqlite_busy(engine)
+        before = SQLITE_BUSY.labels().value()
+
+        with engine.connect() as writer:
+            writer.execute(text("CREATE TABLE t (x INTEGER)"))
+            writer.commit()
+            writer.execute(text("BEGIN EXCLUSIVE"))
+            with engine.connect() as other, pytest.raises(Exception, match="locked"):
+                other.execute(text("INSERT INTO t VALUES (1)"))
+            writer.rollback()
+        engine.dispose()
+
+        assert SQLITE_BUSY.labels().value() == before + 1
@@ -0,0 +1,138 @@
+"""Unit tests for the migration runner."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from glorious_agents.core.db import get_connection
+from glorious_agents.core.migrations import (
+    apply_skill_schemas,
+    get_current_version,
+    run_migrations,
+    schema_fingerprint,
+)
+
+
+def _tables() -> set[str]:
+    conn = get_connection()
+    try:
+        return {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def migrated_skill(tmp_path: Path) -> Path:
+    """A skill with a base schema and two migrations."""
+    skill_dir = tmp_path / "migrated"
+    (skill_dir / "migrations").mkdir(parents=True)
+    (skill_dir / "schema.sql").write_text(
+        "CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY);"
+    )
+    (skill_dir / "migrations" / "001_add_name.sql").write_text(
+        "ALTER TABLE items ADD COLUMN name TEXT"
+    )
+    (skill_dir / "migrations" / "002_add_tags.sql").write_text("CREATE TABLE tags (name TEXT);")
+    return skill_dir / "schema.sql"
+
+
+@pytest.fixture
+def legacy_skill(tmp_path: Path) -> Path:
+    """A skill with only a schema file."""
+    skill_dir = tmp_path / "legacy"
+    skill_dir.mkdir()
+    schema = skill_dir / "schema.sql"
+    schema.write_text("CREATE TABLE IF NOT EXISTS legacy_items (id INTEGER PRIMARY KEY);")
+    return schema
+
+
+@pytest.mark.logic
+def test_apply_skill_schemas_applies_everything(
+    temp_data_folder: Path, migrated_skill: Path, legacy_skill: Path
+) -> None:
+    """Test one pass over a migrated and a legacy skill."""
+    applied = apply_skill_schemas({"migrated": migrated_skill, "legacy": legacy_skill})
+
+    assert applied == {"migrated": [1, 2]}
+    assert get_current_version("migrated") == 2
+    assert {"items", "tags", "legacy_items"} <= _tables()
+
+
+@pytest.mark.logic
+def test_apply_skill_schemas_skips_unchanged_files(
+    temp_data_folder: Path, migrated_skill: Path, legacy_skill: Path
+) -> None:
+    """Test that a matching fingerprint skips all work until a file changes."""
+    schemas = {"migrated": migrated_skill, "legacy": legacy_skill}
+    apply_skill_schemas(schemas)
+    conn = get_connection()
+    try:
+        conn.execute("DROP TABLE legacy_items")
+        conn.commit()
+    finally:
+        conn.close()
+
+    assert apply_skill_schemas(schemas) == {}
+    assert "legacy_items" not in _tables()
+
+    (migrated_skill.parent / "migrations" / "003_add_index.sql").write_text(
+        "CREATE INDEX idx_tags_name ON tags(name);"
+    )
+    assert apply_skill_schemas(schemas) == {"migrated": [3]}
+    # The legacy schema is unchanged, so it is not executed again
+    assert "legacy_items" not in _tables()
+
+
+@pytest.mark.logic
+def test_apply_skill_schemas_reruns_changed_legacy_schema(
+    temp_data_folder: Path, legacy_skill: Path
+) -> None:
+    """Test that a legacy schema is executed again when its content changes."""
+    apply_skill_schemas({"legacy": legacy_skill})
+
+    legacy_skill.write_text(
+        legacy_skill.read_text() + "\nCREATE TABLE IF NOT EXISTS legacy_more (id INTEGER);"
+    )
+    apply_skill_schemas({"legacy": legacy_skill})
+
+    assert "legacy_more" in _tables()
+
+
+@pytest.mark.logic
+def test_failed_migration_rolls_back_skill(temp_data_folder: Path, migrated_skill: Path) -> None:
+    """Test that a broken migration leaves no partial schema or records."""
+    (migrated_skill.parent / "migrations" / "002_add_tags.sql").write_text("CREATE TABLE broken (")
+
+    with pytest.raises(sqlite3.OperationalError):
+        apply_skill_schemas({"migrated": migrated_skill})
+
+    assert get_current_version("migrated") == 0
+    assert "items" not in _tables()
+
+
+@pytest.mark.logic
+def test_run_migrations_applies_pending_only(temp_data_folder: Path, migrated_skill: Path) -> None:
+    """Test that run_migrations applies only versions above the current one."""
+    migrations_dir = migrated_skill.parent / "migrations"
+    conn = get_connection()
+    try:
+        conn.executescript(migrated_skill.read_text())
+    finally:
+        conn.close()
+
+    assert run_migrations("migrated", migrations_dir) == [1, 2]
+    assert run_migrations("migrated", migrations_dir) == []
+
+
+@pytest.mark.logic
+def test_schema_fingerprint_tracks_files(migrated_skill: Path) -> None:
+    """Test that the fingerprint changes when a migration is added."""
+    before = schema_fingerprint({"migrated": migrated_skill})
+    assert schema_fingerprint({"migrated": migrated_skill}) == before
+
+    (migrated_skill.parent / "migrations" / "003_more.sql").write_text("SELECT 1;")
+
+    assert schema_fingerprint({"migrated": migrated_skill}) != before
@@ -0,0 +1,168 @@
+"""Tests for the durable event outbox."""
+
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine
+from sqlmodel import Field, Session, SQLModel
+
+from glorious_agents.core.context import EventBus
+from glorious_agents.core.outbox import (
+    OutboxConsumer,
+    append,
+    compact,
+    init_outbox,
+)
+from glorious_agents.core.unit_of_work import UnitOfWork
+
+
+class OutboxItem(SQLModel, table=True):
+    """Model written alongside outbox events."""
+
+    __tablename__ = "outbox_test_items"
+
+    id: int | None = Field(default=None, primary_key=True)
+    name: str
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "outbox.db"
+
+
+@pytest.fixture
+def conn(db_path: Path):
+    conn = sqlite3.connect(db_path)
+    yield conn
+    conn.close()
+
+
+def test_append_creates_schema_and_returns_ids(conn: sqlite3.Connection) -> None:
+    first = append(conn, "issue.created", {"id": "a"})
+    second = append(conn, "issue.updated", {"id": "a", "status": "closed"})
+    conn.commit()
+
+    assert second > first
+    events = OutboxConsumer(conn, "reader").poll()
+    assert [(e.topic, e.data) for e in events] == [
+        ("issue.created", {"id": "a"}),
+        ("issue.updated", {"id": "a", "status": "closed"}),
+    ]
+
+
+def test_append_rolls_back_with_transaction(conn: sqlite3.Connection) -> None:
+    init_outbox(conn)
+    conn.commit()
+
+    append(conn, "issue.created", {"id": "a"})
+    conn.rollback()
+
+    assert OutboxConsumer(conn, "reader").poll() == []
+
+
+def test_consumer_resumes_from_acknowledged_position(db_path: Path) -> None:
+    conn = sqlite3.connect(db_path)
+    for n in range(5):
+        append(conn, "topic", {"n": n})
+    conn.commit()
+
+    consumer = OutboxConsumer(conn, "indexer")
+    batch = consumer.poll(limit=3)
+    assert [e.data["n"] for e in batch] == [0, 1, 2]
+    consumer.ack(batch[1].id)
+    conn.close()
+
+    # A new process continues after the last acknowledged event
+    other = sqlite3.connect(db_path)
+    resumed = OutboxConsumer(other, "indexer")
+    assert resumed.position == batch[1].id
+    assert [e.data["n"] for e in resumed.poll()] == [2, 3, 4]
+    assert resumed.lag() == 3
+    resumed.ack()
+    assert resumed.lag() == 0
+    other.close()
+
+
+def test_consumer_from_end_skips_existing_events(conn: sqlite3.Connection) -> None:
+    append(conn, "topic", {"n": 0})
+    conn.commit()
+
+    consumer = OutboxConsumer(conn, "tail", from_end=True)
+    append(conn, "topic", {"n": 1})
+    conn.commit()
+
+    assert [e.data["n"] for e in consumer.poll()] == [1]
+
+
+def test_seek_replays_events(conn: sqlite3.Connection) -> None:
+    for n in range(3):
+        append(conn, "topic", {"n": n})
+    conn.commit()
+    consumer = OutboxConsumer(conn, "replayer")
+    consumer.poll()
+    consumer.ack()
+
+    consumer.seek(0)
+
+    assert [e.data["n"] for e in consumer.poll()] == [0, 1, 2]
+
+
+def test_compact_keeps_events_until_all_consumers_ack(conn: sqlite3.Connection) -> None:
+    fast = OutboxConsumer(conn, "fast")
+    slow = OutboxConsumer(conn, "slow")
+    for n in range(4):
+        append(conn, "topic", {"n": n})
+    conn.commit()
+
+    fast.poll()
+    fast.ack()
+    slow.poll(limit=2)
+    slow.ack()
+
+    assert compact(conn) == 2
+    assert [e.data["n"] for e in slow.poll()] == [2, 3]
+
+    slow.delete()
+    assert compact(conn) == 2
+    assert OutboxConsumer(conn, "late").poll() == []
+
+
+def test_compact_by_age(conn: sqlite3.Connection) -> None:
+    OutboxConsumer(conn, "abandoned")
+    append(conn, "topic", {"n": 0})
+    conn.commit()
+
+    assert compact(conn, max_age_seconds=3600) == 0
+    assert compact(conn, max_age_seconds=-1) == 1
+
+
+def test_unit_of_work_records_event_in_transaction(db_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{db_path}")
+    SQLModel.metadata.create_all(engine, tables=[OutboxItem.__table__])
+    bus = EventBus()
+    published: list[dict[str, Any]] = []
+    bus.subscribe("item_created", published.append)
+
+    with UnitOfWork(Session(engine), bus) as uow:
+        item = uow.get_repository("items", OutboxItem).add(OutboxItem(name="kept"))
+        item_id = item.id
+        uow.record_event("item_created", {"id": item_id})
+
+    def failing_transaction() -> None:
+        with UnitOfWork(Session(engine), bus) as uow:
+            uow.get_repository("items", OutboxItem).add(OutboxItem(name="lost"))
+            uow.record_event("item_created", {"name": "lost"})
+            raise RuntimeError("abort")
+
+    with pytest.raises(RuntimeError):
+        failing_transaction()
+
+    conn = sqlite3.connect(db_path)
+    events = OutboxConsumer(conn, "reader").poll()
+    conn.close()
+    engine.dispose()
+
+    assert [e.data for e in events] == [{"id": item_id}]
+    assert published == [{"id": item_id}]
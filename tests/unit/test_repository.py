@@ -2,9 +2,9 @@
 
 import pytest
 from sqlalchemy import create_engine
-from sqlmodel import Field, Session, SQLModel
+from sqlmodel import Field, Session, SQLModel, select
 
-from glorious_agents.core.repository import BaseRepository
+from glorious_agents.core.repository import BaseRepository, iter_keyset
 
 
 class TestModel(SQLModel, table=True):
@@ -197,3 +197,114 @@ def test_exists(repository, session):
 
     assert repository.exists(entity.id) is True
     assert repository.exists(999) is False
+
+
+def test_add_many_populates_ids(repository, session):
+    """Test bulk insert returning generated IDs."""
+    entities = [TestModel(name=f"bulk{i}", value=i) for i in range(7)]
+
+    result = repository.add_many(entities, batch_size=3)
+
+    assert result == entities
+    assert all(e.id is not None for e in result)
+    assert len({e.id for e in result}) == 7
+    session.commit()
+    assert repository.count() == 7
+
+
+def test_add_many_without_ids(repository, session):
+    """Test bulk insert via executemany without tracking entities."""
+    entities = [TestModel(name=f"bulk{i}", value=i) for i in range(5)]
+
+    repository.add_many(entities, return_ids=False, batch_size=2)
+    session.commit()
+
+    assert all(e.id is None for e in entities)
+    assert sorted(e.value for e in repository.get_all()) == [0, 1, 2, 3, 4]
+    assert repository.count(active=True) == 5
+
+
+def test_update_many(repository, session):
+    """Test set-based update by IDs."""
+    entities = repository.add_many([TestModel(name=f"item{i}", value=i) for i in range(5)])
+    session.commit()
+    ids = [e.id for e in entities[:3]]
+
+    assert repository.update_many(ids, batch_size=2, active=False, value=99) == 3
+    session.commit()
+
+    assert repository.count(active=False) == 3
+    assert session.get(TestModel, ids[0]).value == 99
+    assert session.get(TestModel, entities[4].id).active is True
+
+
+def test_update_many_rejects_unknown_field(repository):
+    """Test that updates of nonexistent fields fail loudly."""
+    with pytest.raises(ValueError, match="Unknown fields"):
+        repository.update_many([1], colour="red")
+
+
+def test_delete_many(repository, session):
+    """Test set-based delete by IDs."""
+    entities = repository.add_many([TestModel(name=f"item{i}", value=i) for i in range(5)])
+    session.commit()
+
+    assert repository.delete_many([e.id for e in entities[:4]] + [999], batch_size=2) == 4
+    session.commit()
+
+    assert [e.name for e in repository.get_all()] == ["item4"]
+
+
+def test_iter_all_pages_with_keyset(repository, session):
+    """Test that iter_all walks every row across pages in key order."""
+    repository.add_many([TestModel(name=f"item{i}", value=i % 3) for i in range(10)])
+    session.commit()
+
+    items = list(repository.iter_all(batch_size=3))
+
+    assert [e.name for e in items] == [f"item{i}" for i in range(10)]
+    assert all(e not in session for e in items)
+
+
+def test_iter_all_order_by_and_filters(repository, session):
+    """Test ordering by a non-unique field with primary key tie-breaking."""
+    repository.add_many([TestModel(name=f"item{i}", value=i % 3) for i in range(10)])
+    session.commit()
+
+    values = [(e.value, e.id) for e in repository.iter_all(batch_size=2, order_by="value")]
+    assert values == sorted(values)
+    assert len(values) == 10
+
+    active = repository.iter_all(batch_size=2, order_by="value", value=1)
+    assert [e.name for e in active] == ["item1", "item4", "item7"]
+
+
+def test_iter_all_keeps_session_objects_attached(repository, session):
+    """Test that entities the session already held are not expunged."""
+    kept = repository.add(TestModel(name="kept"))
+    repository.add_many([TestModel(name=f"item{i}") for i in range(3)])
+    session.commit()
+
+    list(repository.iter_all(batch_size=2))
+
+    assert kept in session
+
+
+def test_iter_all_rejects_unknown_order_field(repository):
+    """Test that ordering by a nonexistent field fails."""
+    with pytest.raises(ValueError, match="Unknown field"):
+        list(repository.iter_all(order_by="colour"))
+
+
+def test_iter_keyset_over_column_select(repository, session):
+    """Test keyset paging over a column projection instead of a model."""
+    repository.add_many([TestModel(name=f"item{i}", value=i % 3) for i in range(7)])
+    session.commit()
+    session.expunge_all()
+
+    statement = select(TestModel.id, TestModel.name, TestModel.value).where(TestModel.value > 0)
+    pages = list(iter_keyset(session, statement, TestModel.value, TestModel.id, batch_size=2))
+
+    rows = [tuple(row) for page in pages for row in page]
+    assert [name for _, name, _ in rows] == ["item1", "item4", "item2", "item5"]
+    assert len(session.identity_map) == 0
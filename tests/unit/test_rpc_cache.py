@@ -0,0 +1,136 @@
+"""Unit tests for the RPC response cache."""
+
+import pytest
+
+from glorious_agents.core.context import EventBus
+from glorious_agents.core.metrics import RPC_CACHE_REQUESTS
+from glorious_agents.core.rpc_cache import (
+    CachePolicy,
+    RPCResponseCache,
+    cacheable,
+    canonical_params,
+    get_cache_policy,
+    get_rpc_cache,
+    reset_rpc_cache,
+)
+
+POLICY = CachePolicy(ttl=60, invalidate_on=("note_created",))
+
+
+@pytest.fixture
+def bus() -> EventBus:
+    return EventBus()
+
+
+@pytest.fixture
+def cache(bus: EventBus) -> RPCResponseCache:
+    cache = RPCResponseCache(max_size=10)
+    cache.bind(bus)
+    return cache
+
+
+class TestCacheable:
+    """Test marking methods as cacheable."""
+
+    def test_policy_recorded(self):
+        @cacheable(ttl=5, invalidate_on=["a", "b"])
+        def lookup(x: int) -> int:
+            return x
+
+        assert get_cache_policy(lookup) == CachePolicy(ttl=5, invalidate_on=("a", "b"))
+        assert lookup(3) == 3
+
+    def test_unmarked_function(self):
+        assert get_cache_policy(lambda: None) is None
+
+    def test_ttl_must_be_positive(self):
+        with pytest.raises(ValueError, match="ttl"):
+            cacheable(ttl=0)
+
+    def test_canonical_params_ignore_order(self):
+        assert canonical_params({"a": 1, "b": [2]}) == canonical_params({"b": [2], "a": 1})
+
+
+class TestRPCResponseCache:
+    """Test lookups, storage and invalidation."""
+
+    def test_miss_then_hit(self, cache: RPCResponseCache):
+        key, hit, _ = cache.lookup("notes", "search", {"q": "x"}, POLICY)
+        assert hit is False
+
+        cache.store(key, ["result"], POLICY)
+
+        assert cache.lookup("notes", "search", {"q": "x"}, POLICY) == (key, True, ["result"])
+
+    def test_none_result_cached(self, cache: RPCResponseCache):
+        key, _, _ = cache.lookup("notes", "search", {}, POLICY)
+        cache.store(key, None, POLICY)
+
+        assert cache.lookup("notes", "search", {}, POLICY)[1] is True
+
+    def test_different_params_miss(self, cache: RPCResponseCache):
+        key, _, _ = cache.lookup("notes", "search", {"q": "x"}, POLICY)
+        cache.store(key, 1, POLICY)
+
+        assert cache.lookup("notes", "search", {"q": "y"}, POLICY)[1] is False
+
+    def test_topic_invalidates(self, cache: RPCResponseCache, bus: EventBus):
+        key, _, _ = cache.lookup("notes", "search", {"q": "x"}, POLICY)
+        cache.store(key, 1, POLICY)
+
+        bus.publish("note_created", {"id": 1})
+
+        assert cache.lookup("notes", "search", {"q": "x"}, POLICY)[1] is False
+
+    def test_result_computed_before_invalidation_not_served(
+        self, cache: RPCResponseCache, bus: EventBus
+    ):
+        """A write landing while a result is computed must not leave that result cached."""
+        key, _, _ = cache.lookup("notes", "search", {}, POLICY)
+        bus.publish("note_created", {"id": 1})
+        cache.store(key, "stale", POLICY)
+
+        assert cache.lookup("notes", "search", {}, POLICY)[1] is False
+
+    def test_unrelated_topic_keeps_entries(self, cache: RPCResponseCache, bus: EventBus):
+        key, _, _ = cache.lookup("notes", "search", {}, POLICY)
+        cache.store(key, 1, POLICY)
+
+        bus.publish("issue_created", {"id": 1})
+
+        assert cache.lookup("notes", "search", {}, POLICY)[1] is True
+
+    def test_rebinding_clears(self, cache: RPCResponseCache):
+        key, _, _ = cache.lookup("notes", "search", {}, POLICY)
+        cache.store(key, 1, POLICY)
+        new_bus = EventBus()
+
+        cache.bind(new_bus)
+
+        assert cache.lookup("notes", "search", {}, POLICY)[1] is False
+        assert new_bus.get_subscriber_count("note_created") == 1
+
+    def test_hits_and_misses_counted(self, cache: RPCResponseCache):
+        hits = RPC_CACHE_REQUESTS.labels("metered", "search", "hit")
+        misses = RPC_CACHE_REQUESTS.labels("metered", "search", "miss")
+        before = (hits.value(), misses.value())
+
+        key, _, _ = cache.lookup("metered", "search", {}, POLICY)
+        cache.store(key, 1, POLICY)
+        cache.lookup("metered", "search", {}, POLICY)
+
+        assert (hits.value(), misses.value()) == (before[0] + 1, before[1] + 1)
+
+
+def test_disabled_by_config(monkeypatch: pytest.MonkeyPatch):
+    from glorious_agents.config import reset_config
+
+    monkeypatch.setenv("GLORIOUS_DAEMON_RPC_CACHE_SIZE", "0")
+    reset_config()
+    reset_rpc_cache()
+    try:
+        assert get_rpc_cache() is None
+    finally:
+        monkeypatch.undo()
+        reset_config()
+        reset_rpc_cache()
@@ -0,0 +1,132 @@
+"""Unit tests for content-negotiated payload serialization."""
+
+from datetime import UTC, datetime
+from enum import Enum
+
+import pytest
+
+from glorious_agents.core import serialization
+from glorious_agents.core.serialization import (
+    JSON_CONTENT_TYPE,
+    MSGPACK_CONTENT_TYPE,
+    UnsupportedContentTypeError,
+    decode,
+    encode,
+    negotiate,
+)
+
+requires_msgpack = pytest.mark.skipif(
+    not serialization.MSGPACK_AVAILABLE, reason="msgpack not installed"
+)
+
+
+class Status(Enum):
+    OPEN = "open"
+
+
+PAYLOAD = {
+    "id": "issue-abc123",
+    "title": "Fix login",
+    "status": Status.OPEN,
+    "labels": ("bug", "auth"),
+    "created_at": datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC),
+    "count": 3,
+    "score": 0.5,
+    "closed_at": None,
+}
+
+
+class TestJSON:
+    """Test JSON encoding."""
+
+    def test_roundtrip_converts_extended_types(self):
+        """Datetimes, enums and tuples are converted to JSON types."""
+        decoded = decode(encode(PAYLOAD, JSON_CONTENT_TYPE), JSON_CONTENT_TYPE)
+
+        assert decoded["status"] == "open"
+        assert decoded["labels"] == ["bug", "auth"]
+        assert decoded["created_at"].startswith("2025-01-02T03:04:05")
+        assert decoded["closed_at"] is None
+
+    def test_bytes_encoded_as_base64(self):
+        """Bytes become base64 strings in JSON."""
+        decoded = decode(encode({"blob": b"\x00\x01"}), JSON_CONTENT_TYPE)
+        assert decoded == {"blob": "AAE="}
+
+    def test_stdlib_fallback(self, monkeypatch: pytest.MonkeyPatch):
+        """Encoding works without orjson."""
+        monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", False)
+
+        data = encode(PAYLOAD, JSON_CONTENT_TYPE)
+
+        assert isinstance(data, bytes)
+        assert decode(data)["title"] == "Fix login"
+
+    def test_unserializable_raises_type_error(self):
+        """Unknown types raise TypeError."""
+        with pytest.raises(TypeError):
+            encode({"obj": object()})
+
+    def test_malformed_payload_raises_value_error(self):
+        """Invalid JSON raises ValueError."""
+        with pytest.raises(ValueError, match="Malformed"):
+            decode(b"{not json", JSON_CONTENT_TYPE)
+
+    def test_missing_content_type_is_json(self):
+        """A missing content type decodes as JSON."""
+        assert decode(b'{"a": 1}', None) == {"a": 1}
+
+    def test_charset_parameter_ignored(self):
+        """Content type parameters do not affect decoding."""
+        assert decode(b'{"a": 1}', "application/json; charset=utf-8") == {"a": 1}
+
+
+@requires_msgpack
+class TestMsgpack:
+    """Test MessagePack encoding."""
+
+    def test_roundtrip_keeps_bytes(self):
+        """Bytes survive a msgpack round trip unchanged."""
+        payload = {**PAYLOAD, "blob": b"\x00\xff"}
+
+        decoded = decode(encode(payload, MSGPACK_CONTENT_TYPE), MSGPACK_CONTENT_TYPE)
+
+        assert decoded["blob"] == b"\x00\xff"
+        assert decoded["status"] == "open"
+        assert decoded["created_at"].startswith("2025-01-02T03:04:05")
+
+    def test_aliases_accepted(self):
+        """Common msgpack media type aliases are recognised."""
+        data = encode({"a": 1}, "application/x-msgpack")
+        assert decode(data, "application/vnd.msgpack") == {"a": 1}
+
+    def test_smaller_than_json(self):
+        """Msgpack payloads are more compact than JSON for typical records."""
+        records = [dict(PAYLOAD, id=f"issue-{i}") for i in range(50)]
+        assert len(encode(records, MSGPACK_CONTENT_TYPE)) < len(encode(records))
+
+
+class TestNegotiation:
+    """Test Accept header negotiation."""
+
+    def test_missing_accept_defaults_to_json(self):
+        assert negotiate(None) == JSON_CONTENT_TYPE
+
+    def test_wildcard_defaults_to_json(self):
+        assert negotiate("*/*") == JSON_CONTENT_TYPE
+
+    @requires_msgpack
+    def test_msgpack_preferred_when_requested(self):
+        assert negotiate("application/msgpack, application/json;q=0.9") == MSGPACK_CONTENT_TYPE
+
+    @requires_msgpack
+    def test_quality_values_respected(self):
+        assert negotiate("application/msgpack;q=0.5, application/json") == JSON_CONTENT_TYPE
+
+    def test_msgpack_unavailable_falls_back(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(serialization, "MSGPACK_AVAILABLE", False)
+        assert negotiate("application/msgpack") == JSON_CONTENT_TYPE
+
+    def test_unsupported_content_type(self):
+        with pytest.raises(UnsupportedContentTypeError):
+            decode(b"<xml/>", "application/xml")
@@ -0,0 +1,134 @@
+"""Tests for wildcard topic matching."""
+
+from typing import Any
+
+import pytest
+
+from glorious_agents.core.context import EventBus
+from glorious_agents.core.topics import TopicTrie, is_pattern
+
+
+def _noop(data: dict[str, Any]) -> None:
+    pass
+
+
+@pytest.mark.parametrize(
+    ("pattern", "topic", "matches"),
+    [
+        ("issue.*", "issue.created", True),
+        ("issue.*", "issue", False),
+        ("issue.*", "issue.created.bulk", False),
+        ("*.created", "note.created", True),
+        ("issue.#", "issue", True),
+        ("issue.#", "issue.created.bulk", True),
+        ("issue.#", "note.created", False),
+        ("#", "anything.at.all", True),
+        ("#.done", "vacuum.done", True),
+        ("#.done", "done", True),
+        ("a.#.z", "a.b.c.z", True),
+        ("a.#.z", "a.z", True),
+        ("a.#.z", "a.b.c", False),
+        ("#.#", "a.b.c", True),
+        ("a.#.#", "a.b.c", True),
+        ("a.#.b.#", "a.b.b.b", True),
+    ],
+)
+def test_pattern_matching(pattern: str, topic: str, matches: bool) -> None:
+    trie = TopicTrie()
+    trie.add(pattern, _noop)
+
+    assert (trie.match(topic) == [_noop]) is matches
+
+
+def test_is_pattern() -> None:
+    assert is_pattern("issue.*")
+    assert is_pattern("#")
+    assert not is_pattern("issue_created")
+    assert not is_pattern("issue.created")
+
+
+def test_match_in_subscription_order() -> None:
+    trie = TopicTrie()
+
+    def first(data: dict[str, Any]) -> None:
+        pass
+
+    def second(data: dict[str, Any]) -> None:
+        pass
+
+    trie.add("#", second)
+    trie.add("issue.*", first)
+
+    assert trie.match("issue.created") == [second, first]
+
+
+def test_remove_prunes_trie() -> None:
+    trie = TopicTrie()
+    trie.add("issue.*.bulk", _noop)
+
+    assert trie.remove("issue.*.bulk", _noop) is True
+    assert trie.remove("issue.*.bulk", _noop) is False
+    assert len(trie) == 0
+    assert trie.match("issue.created.bulk") == []
+
+
+def test_event_bus_wildcard_subscription() -> None:
+    bus = EventBus()
+    received: list[tuple[str, Any]] = []
+    bus.subscribe("issue.created", lambda data: received.append(("exact", data["id"])))
+    bus.subscribe("issue.*", lambda data: received.append(("wildcard", data["id"])))
+    bus.subscribe("#", lambda data: received.append(("all", data["id"])))
+
+    bus.publish("issue.created", {"id": 1})
+    bus.publish("note.created", {"id": 2})
+
+    assert received == [("exact", 1), ("wildcard", 1), ("all", 1), ("all", 2)]
+
+
+def test_event_bus_new_subscription_invalidates_cache() -> None:
+    bus = EventBus()
+    received: list[int] = []
+    bus.publish("issue.updated", {"id": 0})  # resolves and caches an empty list
+
+    bus.subscribe("issue.#", lambda data: received.append(data["id"]))
+    bus.publish("issue.updated", {"id": 1})
+
+    assert received == [1]
+
+
+def test_event_bus_unsubscribe() -> None:
+    bus = EventBus()
+    received: list[int] = []
+
+    def handler(data: dict[str, Any]) -> None:
+        received.append(data["id"])
+
+    bus.subscribe("issue.*", handler)
+    bus.publish("issue.created", {"id": 1})
+
+    assert bus.unsubscribe("issue.*", handler) is True
+    assert bus.unsubscribe("issue.*", handler) is False
+    bus.publish("issue.created", {"id": 2})
+
+    assert received == [1]
+    assert "issue.*" not in bus.get_all_topics()
+
+
+def test_published_wildcard_not_matched_twice() -> None:
+    bus = EventBus()
+    received: list[int] = []
+    bus.subscribe("issue.*", lambda data: received.append(data["id"]))
+
+    bus.publish("issue.*", {"id": 1})
+
+    assert received == [1]
+
+
+def test_handler_for_repeated_multi_wildcard_runs_once() -> None:
+    bus = EventBus()
+    received: list[int] = []
+    bus.subscribe("issue.#.#", lambda data: received.append(data["id"]))
+
+    bus.publish("issue.created.bulk", {"id": 1})
+
+    assert received == [1]